@@ -1,8 +1,17 @@
 """Product Owner Agent package."""
 
-from .product_owner import ProductOwnerAgent
 from .config import get_settings, reload_settings
 
 __version__ = "0.1.0"
 
-__all__ = ["ProductOwnerAgent", "get_settings", "reload_settings"]
\ No newline at end of file
+__all__ = ["ProductOwnerAgent", "get_settings", "reload_settings"]
+
+
+def __getattr__(name):
+    # Loaded on first use: it imports the Claude Agent SDK and every tool,
+    # which commands like `config` and `--help` never need
+    if name == "ProductOwnerAgent":
+        from .product_owner import ProductOwnerAgent
+
+        return ProductOwnerAgent
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,343 @@
+"""Full-text indexed archive of generated reports and charts."""
+
+import json
+import logging
+import re
+import sqlite3
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+from .config import get_settings
+from .vector_index import index_documents
+
+logger = logging.getLogger(__name__)
+
+# Matches the "<name>_YYYYMMDD_HHMMSS.md" filenames written by the tools
+_TIMESTAMPED_NAME = re.compile(r"^(?P<name>.+)_(?P<ts>\d{8}_\d{6})$")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS reports (
+    id INTEGER PRIMARY KEY,
+    path TEXT NOT NULL UNIQUE,
+    kind TEXT NOT NULL,
+    title TEXT NOT NULL,
+    team TEXT,
+    initiative TEXT,
+    sprint TEXT,
+    issue_key TEXT,
+    created_at TEXT NOT NULL,
+    payload TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_reports_created_at ON reports(created_at);
+CREATE INDEX IF NOT EXISTS idx_reports_team ON reports(team);
+CREATE INDEX IF NOT EXISTS idx_reports_initiative ON reports(initiative);
+CREATE INDEX IF NOT EXISTS idx_reports_sprint ON reports(sprint);
+CREATE VIRTUAL TABLE IF NOT EXISTS reports_fts USING fts5(
+    title, body, tokenize = 'porter unicode61'
+);
+"""
+
+
+def to_match_query(text: str) -> str:
+    """
+    Convert free text into a safe FTS5 MATCH expression.
+
+    Each word is quoted so punctuation in user input (dots in "2.0",
+    hyphens in issue keys) cannot break the query syntax. Words are
+    implicitly AND-ed together.
+
+    Args:
+        text: Free-text search terms
+
+    Returns:
+        FTS5 query string
+    """
+    tokens = re.findall(r"\w+", text, flags=re.UNICODE)
+    return " ".join(f'"{token}"' for token in tokens)
+
+
+class ReportArchive:
+    """SQLite FTS5 index over saved reports and charts."""
+
+    def __init__(self, db_path: Optional[Path] = None, create: bool = True):
+        """
+        Open (and create if needed) the archive index.
+
+        Args:
+            db_path: Index location (defaults to REPORT_ARCHIVE_DB)
+            create: Create the database if it does not exist yet (when
+                false, a missing database reads as empty and nothing is written
+                to disk)
+        """
+        if db_path is None:
+            db_path = get_settings().output.report_archive_db
+        self.db_path = Path(db_path)
+        if create or self.db_path.exists():
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            self.conn = sqlite3.connect(str(self.db_path))
+        else:
+            # Nothing stored yet: read from an empty database instead of creating one
+            self.conn = sqlite3.connect(":memory:")
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript(_SCHEMA)
+        self._migrate()
+
+    def _migrate(self) -> None:
+        """Add columns introduced after an archive was first created."""
+        columns = {row["name"] for row in self.conn.execute("PRAGMA table_info(reports)")}
+        if "payload" not in columns:
+            with self.conn:
+                self.conn.execute("ALTER TABLE reports ADD COLUMN payload TEXT")
+
+    def __enter__(self) -> "ReportArchive":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        self.conn.close()
+
+    def add(
+        self,
+        file_path: Path,
+        kind: str,
+        title: str,
+        content: str,
+        team: Optional[str] = None,
+        initiative: Optional[str] = None,
+        sprint: Optional[str] = None,
+        issue_key: Optional[str] = None,
+        created_at: Optional[datetime] = None,
+        payload: Optional[Dict[str, Any]] = None,
+    ) -> int:
+        """
+        Index a report or chart file, replacing any previous entry for it.
+
+        Args:
+            file_path: Path of the saved file
+            kind: Document kind ("report" or "chart")
+            title: Human-readable title
+            content: Full text to index
+            team: Team the document covers
+            initiative: Initiative the document covers
+            sprint: Sprint the document covers
+            issue_key: JIRA issue the document belongs to
+            created_at: Creation time (defaults to now)
+            payload: Structured results the document was generated from
+                (metrics, blockers, forecast), stored as JSON
+
+        Returns:
+            Row ID of the indexed document
+        """
+        path = str(Path(file_path).resolve())
+        created = (created_at or datetime.now()).isoformat(timespec="seconds")
+
+        with self.conn:
+            existing = self.conn.execute(
+                "SELECT id FROM reports WHERE path = ?", (path,)
+            ).fetchone()
+            if existing:
+                self.conn.execute(
+                    "DELETE FROM reports_fts WHERE rowid = ?", (existing["id"],)
+                )
+                self.conn.execute(
+                    "DELETE FROM reports WHERE id = ?", (existing["id"],)
+                )
+
+            cursor = self.conn.execute(
+                """
+                INSERT INTO reports
+                    (path, kind, title, team, initiative, sprint, issue_key, created_at, payload)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                (
+                    path, kind, title, team, initiative, sprint, issue_key, created,
+                    json.dumps(payload) if payload is not None else None,
+                ),
+            )
+            row_id = cursor.lastrowid
+            self.conn.execute(
+                "INSERT INTO reports_fts (rowid, title, body) VALUES (?, ?, ?)",
+                (row_id, title, content),
+            )
+
+        return row_id
+
+    def search(
+        self,
+        query: str = "",
+        kind: Optional[str] = None,
+        team: Optional[str] = None,
+        initiative: Optional[str] = None,
+        sprint: Optional[str] = None,
+        since: Optional[str] = None,
+        until: Optional[str] = None,
+        limit: int = 20,
+    ) -> List[Dict[str, Any]]:
+        """
+        Search archived documents by text and metadata.
+
+        Args:
+            query: Free-text terms (empty to filter on metadata only)
+            kind: Restrict to "report" or "chart"
+            team: Team name (matches any team listed on multi-team charts)
+            initiative: Exact initiative name
+            sprint: Exact sprint name
+            since: Earliest creation date (YYYY-MM-DD)
+            until: Latest creation date (YYYY-MM-DD, inclusive)
+            limit: Maximum number of matches
+
+        Returns:
+            Matches ordered by relevance (or newest first without a query),
+            with any stored payload decoded
+        """
+        clauses = []
+        params: List[Any] = []
+
+        match = to_match_query(query)
+        if match:
+            sql = """
+                SELECT r.*, snippet(reports_fts, 1, '[', ']', '...', 12) AS snippet,
+                       bm25(reports_fts) AS rank
+                FROM reports_fts JOIN reports r ON r.id = reports_fts.rowid
+            """
+            clauses.append("reports_fts MATCH ?")
+            params.append(match)
+            order = "rank, r.created_at DESC"
+        else:
+            sql = "SELECT r.*, '' AS snippet, 0 AS rank FROM reports r"
+            order = "r.created_at DESC"
+
+        for column, value in (
+            ("kind", kind),
+            ("initiative", initiative),
+            ("sprint", sprint),
+        ):
+            if value:
+                clauses.append(f"r.{column} = ? COLLATE NOCASE")
+                params.append(value)
+        if team:
+            # Charts span several teams, stored as a ", "-separated list
+            clauses.append("instr(lower(', ' || r.team || ', '), lower(?)) > 0")
+            params.append(f", {team}, ")
+        if since:
+            clauses.append("r.created_at >= ?")
+            params.append(since)
+        if until:
+            # Compare against the next character after the date so the whole day matches
+            clauses.append("r.created_at < ?")
+            params.append(f"{until}~")
+
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += f" ORDER BY {order} LIMIT ?"
+        params.append(limit)
+
+        matches = []
+        for row in self.conn.execute(sql, params):
+            match_row = dict(row)
+            if match_row["payload"]:
+                match_row["payload"] = json.loads(match_row["payload"])
+            matches.append(match_row)
+        return matches
+
+    def remove_missing(self) -> int:
+        """
+        Drop index entries whose files no longer exist.
+
+        Returns:
+            Number of entries removed
+        """
+        rows = self.conn.execute("SELECT id, path FROM reports").fetchall()
+        stale = [row["id"] for row in rows if not Path(row["path"]).exists()]
+        with self.conn:
+            for row_id in stale:
+                self.conn.execute("DELETE FROM reports_fts WHERE rowid = ?", (row_id,))
+                self.conn.execute("DELETE FROM reports WHERE id = ?", (row_id,))
+        return len(stale)
+
+    def reindex(self, directories: Iterable[Path]) -> int:
+        """
+        Index markdown files in the given directories that are not yet archived.
+
+        Files already in the index keep the metadata recorded when they were
+        saved. For new files, metadata is recovered from the timestamped
+        filenames written by save_report_to_jira and generate_gantt_chart.
+
+        Args:
+            directories: Report and chart directories to scan
+
+        Returns:
+            Number of files indexed
+        """
+        known = {row[0] for row in self.conn.execute("SELECT path FROM reports")}
+        count = 0
+        for directory in directories:
+            directory = Path(directory)
+            if not directory.exists():
+                continue
+            for file_path in sorted(directory.glob("*.md")):
+                if str(file_path.resolve()) in known:
+                    continue
+                kind = "chart" if file_path.name.startswith("gantt_") else "report"
+                title, created_at = _parse_filename(file_path)
+                initiative = None
+                if kind == "chart":
+                    initiative = title[len("gantt_"):].replace("_", " ")
+
+                self.add(
+                    file_path,
+                    kind=kind,
+                    title=title,
+                    content=file_path.read_text(encoding="utf-8", errors="replace"),
+                    initiative=initiative,
+                    created_at=created_at,
+                )
+                count += 1
+        return count
+
+    def count(self) -> int:
+        """Return the number of indexed documents."""
+        return self.conn.execute("SELECT COUNT(*) FROM reports").fetchone()[0]
+
+
+def _parse_filename(file_path: Path):
+    """Split "<name>_YYYYMMDD_HHMMSS.md" into its title and timestamp."""
+    match = _TIMESTAMPED_NAME.match(file_path.stem)
+    if match:
+        try:
+            return match.group("name"), datetime.strptime(
+                match.group("ts"), "%Y%m%d_%H%M%S"
+            )
+        except ValueError:
+            pass
+    return file_path.stem, datetime.fromtimestamp(file_path.stat().st_mtime)
+
+
+def archive_file(file_path: Path, kind: str, title: str, content: str, **metadata) -> None:
+    """
+    Index a freshly written file in the default archive.
+
+    The file is also added to the vector index when VECTOR_DB_ENABLED is
+    set. Indexing is best-effort: failures are logged and never propagate to
+    the tool that wrote the file.
+
+    Args:
+        file_path: Path of the saved file
+        kind: Document kind ("report" or "chart")
+        title: Human-readable title
+        content: Full text to index
+        **metadata: team, initiative, sprint, issue_key and payload values
+    """
+    try:
+        with ReportArchive() as archive:
+            archive.add(file_path, kind=kind, title=title, content=content, **metadata)
+    except Exception as e:
+        logger.warning(f"Failed to index {file_path} in report archive: {e}")
+    index_documents([
+        {"source": str(Path(file_path).resolve()), "text": content, "kind": kind, "title": title}
+    ])
@@ -0,0 +1,320 @@
+"""Concurrent batch translation of many epics sharing one bulk fetch."""
+
+import asyncio
+import logging
+import math
+import re
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from .component_catalog import component_context
+from .config import get_settings
+from .field_profiles import field_profile
+from .tools.translation import build_translation_prompt
+from .translation_cache import TranslationCache, translation_cache_key, translation_context
+from .vector_index import index_documents, retrieve_context
+
+logger = logging.getLogger(__name__)
+
+TRANSLATION_PREAMBLE = (
+    "The epic below has already been fetched from JIRA. "
+    "Do not call any tools; write the technical specification directly from this data.\n\n"
+)
+
+
+def read_epic_keys(path: Path) -> List[str]:
+    """
+    Read epic keys from a file.
+
+    Keys may be separated by newlines, commas or whitespace; "#" starts a
+    comment.
+
+    Args:
+        path: File listing epic keys
+
+    Returns:
+        Epic keys in file order
+    """
+    keys = []
+    for line in Path(path).read_text().splitlines():
+        line = line.split("#", 1)[0]
+        keys.extend(key for key in re.split(r"[\s,]+", line) if key)
+    return keys
+
+
+@dataclass
+class EpicTranslation:
+    """Outcome of one epic's translation in a batch."""
+
+    epic_key: str
+    summary: str = ""
+    output: str = ""
+    output_path: Optional[Path] = None
+    latency: float = 0.0
+    cached: bool = False
+    error: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return a JSON-serializable view of the translation."""
+        return {
+            "epic_key": self.epic_key,
+            "summary": self.summary,
+            "output_path": str(self.output_path) if self.output_path else None,
+            "latency": round(self.latency, 3),
+            "cached": self.cached,
+            "error": self.error,
+        }
+
+
+@dataclass
+class BatchTranslationResult:
+    """All translations in a batch plus aggregate statistics."""
+
+    translations: List[EpicTranslation]
+    stats: Dict[str, Any] = field(default_factory=dict)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return a JSON-serializable view of the batch."""
+        return {
+            "translations": [translation.to_dict() for translation in self.translations],
+            "stats": self.stats,
+        }
+
+
+def _percentile(values: List[float], fraction: float) -> float:
+    """Nearest-rank percentile of a non-empty list."""
+    ordered = sorted(values)
+    rank = max(math.ceil(fraction * len(ordered)), 1)
+    return ordered[rank - 1]
+
+
+def summarize_latencies(translations: List[EpicTranslation], wall_seconds: float) -> Dict[str, Any]:
+    """
+    Compute throughput and latency statistics for a batch.
+
+    Args:
+        translations: Finished translations
+        wall_seconds: Elapsed time for the whole batch
+
+    Returns:
+        Counts, epics per minute and latency percentiles in seconds (cache
+        hits count towards throughput but not latency)
+    """
+    succeeded = sum(1 for t in translations if not t.error)
+    cache_hits = sum(1 for t in translations if t.cached)
+    latencies = [t.latency for t in translations if not t.error and not t.cached]
+    stats: Dict[str, Any] = {
+        "epics": len(translations),
+        "succeeded": succeeded,
+        "failed": len(translations) - succeeded,
+        "cache_hits": cache_hits,
+        "wall_seconds": round(wall_seconds, 2),
+        "epics_per_minute": round(succeeded / wall_seconds * 60, 2) if wall_seconds > 0 else 0.0,
+    }
+    if latencies:
+        stats.update({
+            "latency_mean": round(sum(latencies) / len(latencies), 2),
+            "latency_p50": round(_percentile(latencies, 0.50), 2),
+            "latency_p95": round(_percentile(latencies, 0.95), 2),
+            "latency_max": round(max(latencies), 2),
+        })
+    return stats
+
+
+class BatchTranslator:
+    """
+    Translate many epics in one run.
+
+    All epics are fetched with one JQL query per 100 keys, the shared
+    architecture, component and skills context is applied to each, and the
+    translations run concurrently under a concurrency limit. Each result is
+    written to its own file as soon as it finishes.
+    """
+
+    def __init__(
+        self,
+        agent: Any,
+        client: Any = None,
+        concurrency: Optional[int] = None,
+        cache: Optional[TranslationCache] = None,
+    ):
+        """
+        Initialize the translator.
+
+        Args:
+            agent: ProductOwnerAgent used for translation
+            client: Async JIRA REST client (an AsyncJiraClient is created, and
+                closed after each run, if omitted)
+            concurrency: Maximum translations at once (defaults to TRANSLATION_CONCURRENCY)
+            cache: Translation cache (if omitted and TRANSLATION_CACHE_ENABLED
+                is set, the default cache is opened for each run and closed after it)
+        """
+        self.agent = agent
+        self._owns_client = client is None
+        if client is None:
+            from .tools.jira_tools import AsyncJiraClient
+
+            client = AsyncJiraClient()
+        self.client = client
+        settings = get_settings()
+        self.concurrency = concurrency or settings.agent.translation_concurrency
+        self._owns_cache = cache is None and settings.agent.translation_cache_enabled
+        self.cache = cache
+
+    async def fetch_epics(self, epic_keys: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Fetch all epics with bulk "key in (...)" searches.
+
+        Searches are chunked to keep URLs short and paged past any lower
+        maxResults cap JIRA applies (see AsyncJiraClient.get_issues_bulk).
+
+        Args:
+            epic_keys: Epic keys to fetch
+
+        Returns:
+            Issue data by key (epics that do not exist are missing)
+        """
+        return await self.client.get_issues_bulk(epic_keys, fields=field_profile("translation"))
+
+    async def _translate_one(
+        self,
+        semaphore: asyncio.Semaphore,
+        translation: EpicTranslation,
+        prompt: str,
+        cache_key: str,
+        output_dir: Path,
+        on_result: Optional[Callable[[EpicTranslation], None]],
+    ) -> None:
+        """Translate one epic under the concurrency limit and write its file."""
+        async with semaphore:
+            logger.info(f"Translating {translation.epic_key}")
+            started = time.monotonic()
+            try:
+                translation.output = await self.agent.text_query(prompt)
+            except Exception as e:
+                logger.error(f"Translation of {translation.epic_key} failed: {e}")
+                translation.error = str(e)
+            translation.latency = time.monotonic() - started
+
+        if not translation.error and self.cache is not None and translation.output.strip():
+            self.cache.put(cache_key, translation.epic_key, translation.output)
+        self._finish(translation, output_dir, on_result)
+
+    @staticmethod
+    def _finish(
+        translation: EpicTranslation,
+        output_dir: Path,
+        on_result: Optional[Callable[[EpicTranslation], None]],
+    ) -> None:
+        """Write a finished translation to its file and report it."""
+        if not translation.error:
+            path = output_dir / f"{translation.epic_key}.md"
+            path.write_text(f"# {translation.epic_key}: {translation.summary}\n\n{translation.output}")
+            translation.output_path = path
+        if on_result is not None:
+            on_result(translation)
+
+    async def run(
+        self,
+        epic_keys: List[str],
+        architecture_type: str = "microservices",
+        component_list: str = "",
+        team_skills: str = "",
+        output_dir: Optional[Path] = None,
+        on_result: Optional[Callable[[EpicTranslation], None]] = None,
+        use_cache: bool = True,
+    ) -> BatchTranslationResult:
+        """
+        Translate all epics and write one file per epic.
+
+        Epics whose content and context are unchanged since their last
+        translation are served from the translation cache.
+
+        Args:
+            epic_keys: Epic keys to translate (duplicates are ignored)
+            architecture_type: Shared system architecture type
+            component_list: Shared list of existing components (each epic also
+                gets its relevant components from the OUTSYSTEMS_REPO_PATH catalog)
+            team_skills: Shared list of team skills
+            output_dir: Where "<EPIC-KEY>.md" files go (defaults to TRANSLATION_OUTPUT_DIR)
+            on_result: Called with each translation as soon as it finishes
+            use_cache: Serve unchanged epics from the cache (fresh translations
+                are stored either way)
+
+        Returns:
+            Translations in input order and throughput/latency statistics
+        """
+        started = time.monotonic()
+        epic_keys = list(dict.fromkeys(key.strip().upper() for key in epic_keys if key.strip()))
+        output_dir = Path(output_dir or get_settings().output.translation_output_dir)
+        output_dir.mkdir(parents=True, exist_ok=True)
+
+        try:
+            epics = await self.fetch_epics(epic_keys)
+        finally:
+            if self._owns_client:
+                await self.client.close()
+
+        if self._owns_cache:
+            self.cache = TranslationCache()
+        try:
+            translations = []
+            jobs = []
+            semaphore = asyncio.Semaphore(self.concurrency)
+            for key in epic_keys:
+                issue = epics.get(key)
+                if issue is None:
+                    translation = EpicTranslation(epic_key=key, error="Epic not found")
+                    translations.append(translation)
+                    self._finish(translation, output_dir, on_result)
+                    continue
+
+                fields = issue.get("fields", {})
+                translation = EpicTranslation(epic_key=key, summary=fields.get("summary") or "")
+                translations.append(translation)
+                description = fields.get("description") or ""
+                components = await component_context(f"{translation.summary}\n{description}", component_list)
+                context = translation_context(architecture_type, components, team_skills)
+
+                cache_key = translation_cache_key(translation.summary, description, *context)
+                cached = self.cache.get(cache_key) if use_cache and self.cache is not None else None
+                if cached is not None:
+                    translation.output = cached["output"]
+                    translation.cached = True
+                    self._finish(translation, output_dir, on_result)
+                    continue
+
+                prompt = TRANSLATION_PREAMBLE + build_translation_prompt(
+                    translation.summary, description, *context
+                )
+                related = retrieve_context(f"{translation.summary}\n{description}")
+                if related:
+                    prompt += f"\n\n{related}"
+                jobs.append(self._translate_one(
+                    semaphore, translation, prompt, cache_key, output_dir, on_result
+                ))
+
+            await asyncio.gather(*jobs)
+
+            # Fresh specifications become retrieval context for later translations
+            index_documents([
+                {
+                    "source": str(t.output_path.resolve()),
+                    "text": t.output,
+                    "kind": "spec",
+                    "title": f"{t.epic_key}: {t.summary}",
+                }
+                for t in translations
+                if t.output_path is not None and not t.cached
+            ])
+
+            stats = summarize_latencies(translations, time.monotonic() - started)
+            stats["fetched"] = len(epics)
+            stats["cache_misses"] = len(jobs)
+            return BatchTranslationResult(translations=translations, stats=stats)
+        finally:
+            if self._owns_cache:
+                self.cache.close()
+                self.cache = None
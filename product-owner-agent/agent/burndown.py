@@ -0,0 +1,366 @@
+"""Incremental sprint burndown/burnup series built from issue changelogs."""
+
+import json
+import logging
+import re
+from dataclasses import dataclass
+from datetime import date, datetime, time, timedelta, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+from dateutil.parser import isoparse
+
+from .config import get_settings
+from .field_profiles import STORY_POINTS_FIELD
+from .results import BurndownData
+
+logger = logging.getLogger(__name__)
+
+DONE_STATUSES = ["Done", "Closed", "Resolved"]
+
+# Changelog items report the story point field by display name on some sites
+_STORY_POINT_NAMES = {"story points", "story point estimate"}
+
+
+def _parse_time(value: str) -> datetime:
+    """Parse a JIRA timestamp into naive UTC."""
+    parsed = isoparse(value)
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return parsed
+
+
+def _parse_points(value: Any) -> float:
+    try:
+        return float(value) if value not in (None, "") else 0.0
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def _issue_events(issue: Dict[str, Any]) -> List[Tuple[datetime, str, Any, Any]]:
+    """
+    Extract status and story point changes from an issue's changelog.
+
+    Returns:
+        (timestamp, kind, from_value, to_value) tuples in chronological order,
+        where kind is "status" or "points"
+    """
+    events = []
+    for history in issue.get("changelog", {}).get("histories", []):
+        created = history.get("created")
+        if not created:
+            continue
+        moment = _parse_time(created)
+        for item in history.get("items", []):
+            field_name = (item.get("field") or "").lower()
+            if field_name == "status":
+                events.append((moment, "status", item.get("fromString"), item.get("toString")))
+            elif item.get("fieldId") == STORY_POINTS_FIELD or field_name in _STORY_POINT_NAMES:
+                events.append((
+                    moment,
+                    "points",
+                    _parse_points(item.get("fromString")),
+                    _parse_points(item.get("toString")),
+                ))
+    events.sort(key=lambda event: event[0])
+    return events
+
+
+def _state_as_of(issue: Dict[str, Any], events: List[tuple], cutoff: datetime) -> Dict[str, Any]:
+    """Roll an issue's current fields back through changes made after the cutoff."""
+    fields = issue.get("fields", {})
+    status = (fields.get("status") or {}).get("name", "")
+    points = _parse_points(fields.get(STORY_POINTS_FIELD))
+
+    for moment, kind, old, _new in reversed(events):
+        if moment <= cutoff:
+            break
+        if kind == "status":
+            status = old or ""
+        else:
+            points = old
+
+    created = fields.get("created")
+    return {
+        "points": points,
+        "done": status in DONE_STATUSES,
+        "created": _parse_time(created).isoformat() if created else None,
+    }
+
+
+@dataclass
+class BurndownSeries:
+    """Day-indexed scope and completed points for one sprint."""
+
+    start: date
+    scope: np.ndarray
+    completed: np.ndarray
+    computed_through: int  # Index of the last day with data, -1 if none
+
+    @property
+    def days(self) -> np.ndarray:
+        """Calendar date of each index."""
+        return np.arange(
+            np.datetime64(self.start), np.datetime64(self.start) + len(self.scope)
+        )
+
+    @property
+    def remaining(self) -> np.ndarray:
+        """Points committed but not yet completed, per day."""
+        return self.scope - self.completed
+
+    def ideal_remaining(self) -> np.ndarray:
+        """Straight-line burndown from the day-0 scope to zero."""
+        if len(self.scope) == 0 or self.computed_through < 0:
+            return np.zeros(len(self.scope))
+        return np.linspace(self.scope[0], 0.0, len(self.scope))
+
+    def daily_pace(self) -> float:
+        """
+        Average points completed per day since day 0.
+
+        Measured from the day-0 burnup, so issues already Done when the
+        sprint started do not inflate it.
+        """
+        last = self.computed_through
+        if last <= 0:
+            return 0.0
+        return float((self.completed[last] - self.completed[0]) / last)
+
+    def projected_remaining(self) -> float:
+        """Remaining points at sprint end if the average daily pace holds."""
+        last = self.computed_through
+        if last < 0:
+            return float(self.scope[0]) if len(self.scope) and not np.isnan(self.scope[0]) else 0.0
+        days_left = len(self.scope) - (last + 1)
+        return float(max(self.remaining[last] - self.daily_pace() * days_left, 0.0))
+
+    def to_result(self) -> BurndownData:
+        """Return the computed days of the series as a serializable result."""
+        last = self.computed_through
+        ideal = self.ideal_remaining()
+
+        def values(array: np.ndarray) -> List[float]:
+            return [float(value) for value in array[: last + 1]]
+
+        return BurndownData(
+            start=self.start.isoformat(),
+            total_days=len(self.scope),
+            scope=values(self.scope),
+            completed=values(self.completed),
+            remaining=values(self.remaining),
+            ideal_remaining=float(ideal[last]) if last >= 0 else 0.0,
+            projected_remaining=self.projected_remaining(),
+        )
+
+    def to_context(self) -> str:
+        """
+        Summarize the series as compact numeric prompt context.
+
+        Returns:
+            A few lines of day-indexed numbers instead of raw issue text
+        """
+        last = self.computed_through
+        if last < 0:
+            return "No burndown data yet (sprint has not started)"
+
+        def fmt(values: np.ndarray) -> str:
+            return "[" + ", ".join(f"{value:g}" for value in values[: last + 1]) + "]"
+
+        ideal = self.ideal_remaining()
+        remaining = self.remaining
+        gap = remaining[last] - ideal[last]
+        completed_rate = self.daily_pace()
+        projected = self.projected_remaining()
+        scope_change = self.scope[last] - self.scope[0]
+
+        return "\n".join([
+            f"Day-indexed from {self.start.isoformat()} (day {last + 1} of {len(self.scope)}), story points:",
+            f"- Scope: {fmt(self.scope)}",
+            f"- Completed (burnup): {fmt(self.completed)}",
+            f"- Remaining (burndown): {fmt(remaining)}",
+            f"- Ideal remaining today: {ideal[last]:.1f}; actual {remaining[last]:g} "
+            f"({'behind' if gap > 0 else 'ahead'} by {abs(gap):.1f})",
+            f"- Scope change since start: {scope_change:+g}",
+            f"- Avg completed per day: {completed_rate:.1f}; projected remaining at sprint end: {projected:.1f}",
+        ])
+
+
+class BurndownTracker:
+    """
+    Compute burndown series incrementally and persist them per sprint.
+
+    The first run replays every changelog entry from the sprint start. Each
+    run then saves the per-issue state as of the last fully elapsed day, so
+    the next run only replays changes made after that day.
+    """
+
+    def __init__(self, storage_dir: Optional[Path] = None):
+        """
+        Initialize the tracker.
+
+        Args:
+            storage_dir: Where series are persisted (defaults to BURNDOWN_DIR)
+        """
+        self.storage_dir = Path(storage_dir or get_settings().output.burndown_dir)
+
+    def _path(self, sprint_key: str) -> Path:
+        safe_key = re.sub(r"[^\w.-]+", "_", str(sprint_key))
+        return self.storage_dir / f"sprint_{safe_key}.npz"
+
+    def _load(self, sprint_key: str, start: date, length: int) -> Optional[Dict[str, Any]]:
+        """Load persisted state, discarding it if the sprint dates changed."""
+        path = self._path(sprint_key)
+        if not path.exists():
+            return None
+        try:
+            with np.load(path) as data:
+                meta = json.loads(str(data["meta"]))
+                scope = data["scope"].copy()
+                completed = data["completed"].copy()
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning(f"Ignoring unreadable burndown state {path}: {e}")
+            return None
+        if meta.get("start") != start.isoformat() or len(scope) != length:
+            return None
+        return {"meta": meta, "scope": scope, "completed": completed}
+
+    def _save(self, sprint_key: str, start: date, scope: np.ndarray, completed: np.ndarray,
+              computed_through: int, issues: Dict[str, Dict[str, Any]]) -> None:
+        self.storage_dir.mkdir(parents=True, exist_ok=True)
+        meta = {"start": start.isoformat(), "computed_through": computed_through, "issues": issues}
+        path = self._path(sprint_key)
+        tmp_path = path.with_name(path.stem + ".tmp.npz")
+        np.savez_compressed(tmp_path, scope=scope, completed=completed, meta=np.array(json.dumps(meta)))
+        tmp_path.replace(path)
+
+    def compute(
+        self,
+        sprint_key: str,
+        sprint_start: str,
+        sprint_end: str,
+        issues: List[Dict[str, Any]],
+        today: Optional[date] = None,
+    ) -> BurndownSeries:
+        """
+        Update and return the sprint's burndown series.
+
+        Args:
+            sprint_key: Stable sprint identifier used for persistence
+            sprint_start: Sprint start date or timestamp
+            sprint_end: Sprint end date or timestamp
+            issues: Sprint issues including "changelog" (fetched with expand=changelog)
+            today: Reference day (defaults to the current UTC date)
+
+        Returns:
+            Series covering the sprint, filled through today (or the sprint end)
+        """
+        start = _parse_time(sprint_start).date()
+        end = _parse_time(sprint_end).date()
+        length = max((end - start).days + 1, 1)
+        today = today or datetime.now(timezone.utc).date()
+        today_idx = min((today - start).days, length - 1)
+        # The last fully elapsed day is safe to persist; today may still change
+        persist_idx = min((today - start).days - 1, length - 1)
+
+        stored = self._load(sprint_key, start, length)
+        if stored:
+            scope, completed = stored["scope"], stored["completed"]
+            last_idx = stored["meta"]["computed_through"]
+            # Issues removed from the sprint (or carried over) stop counting
+            keys = {issue.get("key", "") for issue in issues}
+            states = {key: state for key, state in stored["meta"]["issues"].items() if key in keys}
+        else:
+            scope = np.full(length, np.nan)
+            completed = np.full(length, np.nan)
+            last_idx = -1
+            states = {}
+
+        if today_idx < 0:
+            return BurndownSeries(start, scope, completed, -1)
+
+        def day_end(index: int) -> datetime:
+            return datetime.combine(start + timedelta(days=index), time.max)
+
+        # Bucket every change made after the last persisted day by sprint day
+        cutoff = day_end(last_idx) if last_idx >= 0 else datetime.combine(start, time.min)
+        events_by_day: Dict[int, List[tuple]] = {}
+        for issue in issues:
+            key = issue.get("key", "")
+            events = _issue_events(issue)
+            if key not in states:
+                states[key] = _state_as_of(issue, events, cutoff)
+            for event in events:
+                if event[0] <= cutoff:
+                    continue
+                index = max((event[0].date() - start).days, 0)
+                if index <= today_idx:
+                    events_by_day.setdefault(index, []).append((key, event))
+
+        current = {key: dict(state) for key, state in states.items()}
+        for index in range(last_idx + 1, today_idx + 1):
+            for key, (_moment, kind, _old, new) in events_by_day.get(index, []):
+                if kind == "status":
+                    current[key]["done"] = new in DONE_STATUSES
+                else:
+                    current[key]["points"] = new
+
+            end_of_day = day_end(index).isoformat()
+            in_scope = [
+                state for state in current.values()
+                if state["created"] is None or state["created"] <= end_of_day
+            ]
+            scope[index] = sum(state["points"] for state in in_scope)
+            completed[index] = sum(state["points"] for state in in_scope if state["done"])
+
+            if index == persist_idx:
+                self._save(sprint_key, start, scope, completed, index,
+                           {key: dict(state) for key, state in current.items()})
+
+        return BurndownSeries(start, scope, completed, today_idx)
+
+
+def sprint_burndown(
+    sprint_key: str, sprint_start: str, sprint_end: str, issues: List[Dict[str, Any]]
+) -> Tuple[Optional[BurndownSeries], str]:
+    """
+    Compute the sprint's burndown series and its prompt context.
+
+    Sprints without parseable dates or issues without changelogs degrade to a
+    short "not available" note instead of failing the report.
+
+    Args:
+        sprint_key: Stable sprint identifier
+        sprint_start: Sprint start date
+        sprint_end: Sprint end date
+        issues: Sprint issues, ideally including changelogs
+
+    Returns:
+        The series (None when unavailable) and compact numeric context
+    """
+    if not any("changelog" in issue for issue in issues):
+        return None, "Not available (issues were fetched without changelog)"
+    try:
+        series = BurndownTracker().compute(sprint_key, sprint_start, sprint_end, issues)
+    except (ValueError, OverflowError) as e:
+        return None, f"Not available ({e})"
+    return series, series.to_context()
+
+
+def burndown_context(
+    sprint_key: str, sprint_start: str, sprint_end: str, issues: List[Dict[str, Any]]
+) -> str:
+    """
+    Compute the sprint's burndown and return it as prompt context.
+
+    Args:
+        sprint_key: Stable sprint identifier
+        sprint_start: Sprint start date
+        sprint_end: Sprint end date
+        issues: Sprint issues, ideally including changelogs
+
+    Returns:
+        Compact numeric burndown context (see sprint_burndown)
+    """
+    return sprint_burndown(sprint_key, sprint_start, sprint_end, issues)[1]
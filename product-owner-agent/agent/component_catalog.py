@@ -0,0 +1,499 @@
+"""Searchable catalog of the components in the local Outsystems repository."""
+
+import asyncio
+import json
+import logging
+import os
+import re
+import sqlite3
+import threading
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from .config import get_settings
+
+logger = logging.getLogger(__name__)
+
+# Element types in module exports, by lowercase XML tag or JSON "type"
+_ELEMENT_KINDS = {
+    "module": "module",
+    "espace": "module",
+    "entity": "entity",
+    "staticentity": "entity",
+    "serveraction": "server_action",
+    "serviceaction": "server_action",
+    "screen": "screen",
+    "webscreen": "screen",
+    "restapi": "api",
+    "exposedrestapi": "api",
+    "consumedrestapi": "api",
+    "exposedsoapwebservice": "api",
+    "consumedsoapwebservice": "api",
+}
+
+KIND_LABELS = {
+    "module": "module",
+    "entity": "entity",
+    "server_action": "server action",
+    "screen": "screen",
+    "api": "API",
+}
+
+# .oml files are binary; only their module name is indexed
+_SCANNED_SUFFIXES = {".oml", ".xml", ".json"}
+_SKIPPED_DIRS = {"node_modules", "bin", "obj"}
+_MAX_PARSE_BYTES = 5 * 1024 * 1024
+
+_XML_ELEMENT = re.compile(r"<(\w+)\b([^>]*)>")
+_XML_ATTRIBUTE = re.compile(r"(\w+)\s*=\s*\"([^\"]*)\"")
+_CAMEL_BOUNDARY = re.compile(r"(?<=[a-z0-9])(?=[A-Z])|(?<=[A-Z])(?=[A-Z][a-z])")
+
+# Words too common in epics to say anything about components
+_STOPWORDS = {
+    "the", "and", "for", "with", "that", "this", "from", "have", "will", "should",
+    "can", "are", "was", "were", "been", "being", "into", "when", "where", "which",
+    "their", "they", "them", "our", "your", "you", "not", "but", "all", "any",
+    "each", "also", "need", "needs", "want", "wants", "able", "user", "users",
+    "new", "use", "using", "must",
+}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    path TEXT PRIMARY KEY,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS components (
+    id INTEGER PRIMARY KEY,
+    path TEXT NOT NULL,
+    module TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    name TEXT NOT NULL,
+    description TEXT NOT NULL DEFAULT ''
+);
+CREATE INDEX IF NOT EXISTS idx_components_path ON components(path);
+CREATE VIRTUAL TABLE IF NOT EXISTS components_fts USING fts5(
+    name, module, description, tokenize = 'porter unicode61'
+);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+
+def split_identifier(name: str) -> str:
+    """
+    Split a CamelCase or snake_case identifier into words.
+
+    Args:
+        name: Identifier such as "GetCustomerOrders"
+
+    Returns:
+        Space-separated words, e.g. "Get Customer Orders"
+    """
+    return " ".join(_CAMEL_BOUNDARY.sub(" ", name.replace("_", " ")).split())
+
+
+def parse_components(text: str, suffix: str) -> List[Dict[str, str]]:
+    """
+    Extract components from an exported module file.
+
+    XML exports are read element by element ("<ServerAction Name=...>");
+    JSON exports are walked for objects with a "name" and a "type" or
+    "kind" naming an element type.
+
+    Args:
+        text: File content
+        suffix: File extension (".xml" or ".json")
+
+    Returns:
+        Components with kind, name and description
+    """
+    components = []
+    if suffix == ".json":
+        try:
+            data = json.loads(text)
+        except ValueError:
+            return []
+        stack = [data]
+        while stack:
+            node = stack.pop()
+            if isinstance(node, list):
+                stack.extend(reversed(node))
+            elif isinstance(node, dict):
+                element = str(node.get("type") or node.get("kind") or "")
+                kind = _ELEMENT_KINDS.get(element.lower().replace("_", "").replace(" ", ""))
+                if kind and isinstance(node.get("name"), str):
+                    components.append({
+                        "kind": kind,
+                        "name": node["name"],
+                        "description": str(node.get("description") or ""),
+                    })
+                stack.extend(reversed([v for v in node.values() if isinstance(v, (dict, list))]))
+        return components
+
+    for match in _XML_ELEMENT.finditer(text):
+        kind = _ELEMENT_KINDS.get(match.group(1).lower())
+        if not kind:
+            continue
+        attributes = {key.lower(): value for key, value in _XML_ATTRIBUTE.findall(match.group(2))}
+        if attributes.get("name"):
+            components.append({
+                "kind": kind,
+                "name": attributes["name"],
+                "description": attributes.get("description", ""),
+            })
+    return components
+
+
+def to_relevance_query(text: str, max_terms: int = 64) -> str:
+    """
+    Turn free text into an FTS5 query matching any of its significant words.
+
+    Args:
+        text: Epic summary and description
+        max_terms: Cap on distinct words used
+
+    Returns:
+        FTS5 OR query, or "" when the text has no significant words
+    """
+    terms = []
+    for token in re.findall(r"\w+", split_identifier(text), flags=re.UNICODE):
+        token = token.lower()
+        if len(token) > 2 and token not in _STOPWORDS and not token.isdigit() and token not in terms:
+            terms.append(token)
+    return " OR ".join(f'"{term}"' for term in terms[:max_terms])
+
+
+def format_components(components: List[Dict[str, Any]]) -> str:
+    """
+    Format components for the translation prompt's component list.
+
+    Args:
+        components: Components from ComponentCatalog.search()
+
+    Returns:
+        Comma-separated "Module.Name (kind)" entries
+    """
+    entries = []
+    for component in components:
+        label = KIND_LABELS.get(component["kind"], component["kind"])
+        if component["kind"] == "module":
+            entries.append(f"{component['name']} ({label})")
+        else:
+            entries.append(f"{component['module']}.{component['name']} ({label})")
+    return ", ".join(entries)
+
+
+class ComponentCatalog:
+    """
+    SQLite FTS5 index of modules, entities, server actions, screens and APIs.
+
+    The index is updated incrementally: only files whose modification time
+    or size changed since the last scan are parsed again, and components of
+    deleted files are dropped.
+    """
+
+    def __init__(
+        self,
+        db_path: Optional[Path] = None,
+        repo_path: Optional[Path] = None,
+        create: bool = True,
+    ):
+        """
+        Open (and create if needed) the catalog.
+
+        Args:
+            db_path: Index location (defaults to COMPONENT_INDEX_DB)
+            repo_path: Repository to index (defaults to OUTSYSTEMS_REPO_PATH)
+            create: Create the database if it does not exist yet (when
+                false, a missing database reads as empty and nothing is written
+                to disk)
+        """
+        settings = get_settings()
+        self.db_path = Path(db_path or settings.output.component_index_db)
+        repo_path = repo_path or settings.outsystems.repo_path
+        self.repo_path = Path(repo_path).expanduser().resolve() if repo_path else None
+        if create or self.db_path.exists():
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            self.conn = sqlite3.connect(str(self.db_path))
+        else:
+            # Nothing stored yet: read from an empty database instead of creating one
+            self.conn = sqlite3.connect(":memory:")
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript(_SCHEMA)
+
+    def __enter__(self) -> "ComponentCatalog":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        self.conn.close()
+
+    def _meta(self, key: str) -> Optional[str]:
+        row = self.conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row["value"] if row else None
+
+    def _set_meta(self, key: str, value: str) -> None:
+        self.conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, value))
+
+    def _walk(self) -> Iterator[Tuple[str, os.stat_result]]:
+        """Yield (relative path, stat) for every indexable file in the repository."""
+        for root, dirs, files in os.walk(self.repo_path):
+            dirs[:] = [d for d in dirs if not d.startswith(".") and d not in _SKIPPED_DIRS]
+            for name in files:
+                if Path(name).suffix.lower() in _SCANNED_SUFFIXES:
+                    path = Path(root) / name
+                    yield path.relative_to(self.repo_path).as_posix(), path.stat()
+
+    def _module_for(self, relative_path: str, components: List[Dict[str, str]]) -> str:
+        """Module a file belongs to: its declared module, else its top-level directory."""
+        for component in components:
+            if component["kind"] == "module":
+                return component["name"]
+        parts = Path(relative_path).parts
+        return parts[0] if len(parts) > 1 else Path(relative_path).stem
+
+    def _index_file(self, relative_path: str) -> int:
+        """Replace the components of one file; returns how many were indexed."""
+        self._remove_file(relative_path)
+        path = self.repo_path / relative_path
+        suffix = path.suffix.lower()
+        if suffix == ".oml":
+            components = [{"kind": "module", "name": path.stem, "description": ""}]
+        elif path.stat().st_size > _MAX_PARSE_BYTES:
+            logger.warning(f"Skipping {relative_path}: larger than {_MAX_PARSE_BYTES} bytes")
+            components = []
+        else:
+            components = parse_components(path.read_text(errors="replace"), suffix)
+
+        module = self._module_for(relative_path, components)
+        for component in components:
+            cursor = self.conn.execute(
+                "INSERT INTO components (path, module, kind, name, description) VALUES (?, ?, ?, ?, ?)",
+                (relative_path, module, component["kind"], component["name"], component["description"]),
+            )
+            self.conn.execute(
+                "INSERT INTO components_fts (rowid, name, module, description) VALUES (?, ?, ?, ?)",
+                (
+                    cursor.lastrowid,
+                    f"{component['name']} {split_identifier(component['name'])}",
+                    f"{module} {split_identifier(module)}",
+                    component["description"],
+                ),
+            )
+        return len(components)
+
+    def _remove_file(self, relative_path: str) -> None:
+        self.conn.execute(
+            "DELETE FROM components_fts WHERE rowid IN (SELECT id FROM components WHERE path = ?)",
+            (relative_path,),
+        )
+        self.conn.execute("DELETE FROM components WHERE path = ?", (relative_path,))
+
+    def update(self, full: bool = False) -> Dict[str, Any]:
+        """
+        Bring the index up to date with the repository.
+
+        Args:
+            full: Re-parse every file instead of only changed ones
+
+        Returns:
+            Counts of files seen, parsed and removed, and total components
+
+        Raises:
+            ValueError: If no repository is configured
+            FileNotFoundError: If the repository does not exist
+        """
+        if self.repo_path is None:
+            raise ValueError("OUTSYSTEMS_REPO_PATH is not configured")
+        if not self.repo_path.is_dir():
+            raise FileNotFoundError(f"Outsystems repository not found: {self.repo_path}")
+
+        with self.conn:
+            # A different repository shares nothing with the indexed one
+            if full or self._meta("repo_path") != str(self.repo_path):
+                self.conn.execute("DELETE FROM files")
+                self.conn.execute("DELETE FROM components")
+                self.conn.execute("DELETE FROM components_fts")
+
+            known = {
+                row["path"]: (row["mtime_ns"], row["size"])
+                for row in self.conn.execute("SELECT * FROM files")
+            }
+            seen = 0
+            parsed = 0
+            for relative_path, stat in self._walk():
+                seen += 1
+                signature = (stat.st_mtime_ns, stat.st_size)
+                if known.pop(relative_path, None) == signature:
+                    continue
+                self._index_file(relative_path)
+                self.conn.execute(
+                    "INSERT OR REPLACE INTO files (path, mtime_ns, size) VALUES (?, ?, ?)",
+                    (relative_path, *signature),
+                )
+                parsed += 1
+
+            for relative_path in known:
+                self._remove_file(relative_path)
+                self.conn.execute("DELETE FROM files WHERE path = ?", (relative_path,))
+
+            self._set_meta("repo_path", str(self.repo_path))
+            self._set_meta("last_scan", datetime.now().isoformat(timespec="seconds"))
+
+        stats = {
+            "files": seen,
+            "parsed": parsed,
+            "removed": len(known),
+            "components": self.conn.execute("SELECT COUNT(*) FROM components").fetchone()[0],
+        }
+        logger.info(
+            f"Component index updated: {parsed} of {seen} files parsed, "
+            f"{len(known)} removed, {stats['components']} components"
+        )
+        return stats
+
+    def is_stale(self, max_age_minutes: Optional[int] = None) -> bool:
+        """
+        Check whether the index is due for an incremental update.
+
+        Args:
+            max_age_minutes: Allowed age (defaults to COMPONENT_INDEX_REFRESH_MINUTES)
+
+        Returns:
+            True if the index was never built, was built for another
+            repository, or is older than the allowed age
+        """
+        if max_age_minutes is None:
+            max_age_minutes = get_settings().outsystems.component_refresh_minutes
+        last_scan = self._meta("last_scan")
+        if last_scan is None or self._meta("repo_path") != str(self.repo_path):
+            return True
+        age = datetime.now() - datetime.fromisoformat(last_scan)
+        return age > timedelta(minutes=max_age_minutes)
+
+    def search(self, text: str, limit: int = 8, kind: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Find the components most relevant to a piece of text.
+
+        Names weigh most, then module names, then descriptions.
+
+        Args:
+            text: Free text such as an epic summary and description
+            limit: Maximum components returned
+            kind: Only return this kind (e.g. "entity")
+
+        Returns:
+            Components with module, kind, name, description and path, best first
+        """
+        query = to_relevance_query(text)
+        if not query:
+            return []
+        sql = """
+            SELECT c.module, c.kind, c.name, c.description, c.path,
+                   bm25(components_fts, 5.0, 2.0, 1.0) AS rank
+            FROM components_fts
+            JOIN components c ON c.id = components_fts.rowid
+            WHERE components_fts MATCH ?
+        """
+        params: List[Any] = [query]
+        if kind:
+            sql += " AND c.kind = ?"
+            params.append(kind)
+        sql += " ORDER BY rank"
+
+        results = []
+        seen = set()
+        for row in self.conn.execute(sql, params):
+            identity = (row["module"].lower(), row["kind"], row["name"].lower())
+            if identity in seen:
+                continue
+            seen.add(identity)
+            results.append({key: row[key] for key in ("module", "kind", "name", "description", "path")})
+            if len(results) >= limit:
+                break
+        return results
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Summarize the index.
+
+        Returns:
+            repo_path, last_scan, files, components and components by kind
+        """
+        by_kind = {
+            row["kind"]: row["count"]
+            for row in self.conn.execute(
+                "SELECT kind, COUNT(*) AS count FROM components GROUP BY kind ORDER BY kind"
+            )
+        }
+        return {
+            "repo_path": self._meta("repo_path"),
+            "last_scan": self._meta("last_scan"),
+            "files": self.conn.execute("SELECT COUNT(*) FROM files").fetchone()[0],
+            "components": sum(by_kind.values()),
+            "by_kind": by_kind,
+        }
+
+
+# Serializes refreshes, so concurrent lookups against a stale index scan once
+_refresh_lock = threading.Lock()
+
+
+def _find_components(text: str, limit: int) -> List[Dict[str, Any]]:
+    """Search the catalog, refreshing it first if it is stale (blocking)."""
+    with ComponentCatalog() as catalog:
+        if catalog.is_stale():
+            with _refresh_lock:
+                # Another lookup may have refreshed it while this one waited
+                if catalog.is_stale():
+                    catalog.update()
+        return catalog.search(text, limit=limit)
+
+
+async def component_context(text: str, component_list: str = "") -> str:
+    """
+    Add the catalog components relevant to an epic to a component list.
+
+    The index is refreshed incrementally when older than
+    COMPONENT_INDEX_REFRESH_MINUTES, so translations do not pay for a scan.
+    The lookup, and a refresh when one is due, runs in a worker thread so a
+    repository scan never blocks the event loop. Retrieval is best-effort:
+    without OUTSYSTEMS_REPO_PATH or on any error the list is returned
+    unchanged.
+
+    Args:
+        text: Epic summary and description
+        component_list: Components given by the user
+
+    Returns:
+        The given components followed by relevant catalog components
+    """
+    settings = get_settings()
+    if not settings.outsystems.repo_path:
+        return component_list
+    try:
+        found = await asyncio.to_thread(
+            _find_components, text, settings.outsystems.component_context_limit
+        )
+    except Exception as e:
+        logger.warning(f"Component catalog lookup failed: {e}")
+        return component_list
+
+    given = {entry.strip().lower() for entry in component_list.split(",") if entry.strip()}
+    found = [
+        component for component in found
+        if component["name"].lower() not in given
+        and f"{component['module']}.{component['name']}".lower() not in given
+    ]
+    retrieved = format_components(found)
+    if not retrieved:
+        return component_list
+    return f"{component_list}, {retrieved}" if component_list.strip() else retrieved
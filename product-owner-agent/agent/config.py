@@ -1,12 +1,18 @@
 """Configuration management for Product Owner Agent."""
 
 import os
+from functools import cached_property
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional, Type, TypeVar
 
+from dotenv import dotenv_values
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+ENV_FILE = ".env"
+
+ConfigT = TypeVar("ConfigT", bound=BaseSettings)
+
 
 class AtlassianMCPConfig(BaseSettings):
     """Atlassian MCP Server configuration."""
@@ -24,6 +30,33 @@ class AtlassianMCPConfig(BaseSettings):
     )
     site_url: str = Field(..., alias="ATLASSIAN_SITE_URL")
 
+    # REST API credentials (optional - only for bulk paths that bypass MCP)
+    user_email: Optional[str] = Field(None, alias="ATLASSIAN_USER_EMAIL")
+    api_token: Optional[str] = Field(None, alias="ATLASSIAN_API_TOKEN")
+
+    # Connection pool of the REST client
+    pool_limit_per_host: int = Field(10, alias="JIRA_POOL_LIMIT_PER_HOST")
+    keepalive_seconds: float = Field(30.0, alias="JIRA_KEEPALIVE_SECONDS")
+    request_timeout: float = Field(30.0, alias="JIRA_REQUEST_TIMEOUT")
+    search_concurrency: int = Field(4, alias="JIRA_SEARCH_CONCURRENCY")
+    active_sprint_ttl: float = Field(60.0, alias="JIRA_ACTIVE_SPRINT_TTL")
+    upload_concurrency: int = Field(4, alias="JIRA_UPLOAD_CONCURRENCY")
+    coalesce_requests: bool = Field(True, alias="JIRA_COALESCE_REQUESTS")
+
+    # Retries, client-side rate limit and circuit breakers of the REST client
+    max_retries: int = Field(4, alias="JIRA_MAX_RETRIES")
+    retry_backoff: float = Field(0.5, alias="JIRA_RETRY_BACKOFF")
+    retry_max_backoff: float = Field(30.0, alias="JIRA_RETRY_MAX_BACKOFF")
+    rate_limit: float = Field(0.0, alias="JIRA_RATE_LIMIT")
+    rate_burst: int = Field(10, alias="JIRA_RATE_BURST")
+    circuit_failures: int = Field(5, alias="JIRA_CIRCUIT_FAILURES")
+    circuit_reset_seconds: float = Field(30.0, alias="JIRA_CIRCUIT_RESET_SECONDS")
+
+    # Conditional-request response cache of the REST client
+    http_cache_enabled: bool = Field(False, alias="JIRA_HTTP_CACHE_ENABLED")
+    http_cache_max_mb: float = Field(100.0, alias="JIRA_HTTP_CACHE_MAX_MB")
+    http_cache_metadata_ttl: float = Field(3600.0, alias="JIRA_HTTP_CACHE_METADATA_TTL")
+
     # Custom fields (optional - for advanced usage)
     field_technical_spec: str = Field(
         "customfield_10001", alias="JIRA_FIELD_TECHNICAL_SPEC"
@@ -57,6 +90,8 @@ class OutsystemsConfig(BaseSettings):
     )
     repo_path: Optional[str] = Field(None, alias="OUTSYSTEMS_REPO_PATH")
     version: str = Field("11", alias="OUTSYSTEMS_VERSION")
+    component_refresh_minutes: int = Field(60, alias="COMPONENT_INDEX_REFRESH_MINUTES")
+    component_context_limit: int = Field(8, alias="COMPONENT_CONTEXT_LIMIT")
 
 
 class VectorDBConfig(BaseSettings):
@@ -69,8 +104,14 @@ class VectorDBConfig(BaseSettings):
         extra="ignore"
     )
 
+    # Directory of the embedded index (a local path or file:// URL)
     connection: Optional[str] = Field(None, alias="VECTOR_DB_CONNECTION")
     enabled: bool = Field(False, alias="VECTOR_DB_ENABLED")
+    dimensions: int = Field(512, alias="VECTOR_DB_DIMENSIONS")
+    top_k: int = Field(4, alias="VECTOR_DB_TOP_K")
+    min_score: float = Field(0.15, alias="VECTOR_DB_MIN_SCORE")
+    ann_threshold: int = Field(20000, alias="VECTOR_DB_ANN_THRESHOLD")
+    confluence_export_dir: Optional[str] = Field(None, alias="CONFLUENCE_EXPORT_DIR")
 
 
 class AgentConfig(BaseSettings):
@@ -86,8 +127,27 @@ class AgentConfig(BaseSettings):
     report_generation_schedule: str = Field(
         "0 9 * * 1-5", alias="REPORT_GENERATION_SCHEDULE"
     )
+    scheduler_jobs_file: Path = Field(
+        Path("./scheduler_jobs.json"), alias="SCHEDULER_JOBS_FILE"
+    )
+    scheduler_state_file: Path = Field(
+        Path("./reports/.scheduler_state.json"), alias="SCHEDULER_STATE_FILE"
+    )
+    scheduler_max_concurrency: int = Field(2, alias="SCHEDULER_MAX_CONCURRENCY")
+    scheduler_jitter_seconds: float = Field(30.0, alias="SCHEDULER_JITTER_SECONDS")
+    scheduler_catch_up: bool = Field(True, alias="SCHEDULER_CATCH_UP")
     risk_alert_threshold: float = Field(0.7, alias="RISK_ALERT_THRESHOLD")
     dependency_scan_depth: int = Field(3, alias="DEPENDENCY_SCAN_DEPTH")
+    report_concurrency: int = Field(4, alias="REPORT_CONCURRENCY")
+    translation_concurrency: int = Field(4, alias="TRANSLATION_CONCURRENCY")
+    translation_cache_enabled: bool = Field(True, alias="TRANSLATION_CACHE_ENABLED")
+    translation_cache_max_entries: int = Field(500, alias="TRANSLATION_CACHE_MAX_ENTRIES")
+    translation_cache_ttl_days: int = Field(90, alias="TRANSLATION_CACHE_TTL_DAYS")
+    story_creation_concurrency: int = Field(3, alias="STORY_CREATION_CONCURRENCY")
+    duplicate_detection_enabled: bool = Field(True, alias="DUPLICATE_DETECTION_ENABLED")
+    duplicate_threshold: float = Field(0.5, alias="DUPLICATE_THRESHOLD")
+    jira_mirror_enabled: bool = Field(False, alias="JIRA_MIRROR_ENABLED")
+    jira_mirror_max_staleness: float = Field(900.0, alias="JIRA_MIRROR_MAX_STALENESS")
     log_level: str = Field("INFO", alias="LOG_LEVEL")
 
 
@@ -138,35 +198,95 @@ class OutputConfig(BaseSettings):
     chart_output_dir: Path = Field(
         Path("./charts"), alias="CHART_OUTPUT_DIR"
     )
-
-
-class Settings(BaseSettings):
-    """Main settings class combining all configurations."""
-
-    model_config = SettingsConfigDict(
-        env_file=".env",
-        env_file_encoding="utf-8",
-        case_sensitive=False,
-        extra="ignore"
+    report_archive_db: Path = Field(
+        Path("./reports/archive.db"), alias="REPORT_ARCHIVE_DB"
+    )
+    component_index_db: Path = Field(
+        Path("./reports/component_index.db"), alias="COMPONENT_INDEX_DB"
+    )
+    duplicate_index_db: Path = Field(
+        Path("./reports/duplicate_index.db"), alias="DUPLICATE_INDEX_DB"
+    )
+    jira_mirror_db: Path = Field(
+        Path("./reports/jira_mirror.db"), alias="JIRA_MIRROR_DB"
+    )
+    http_cache_db: Path = Field(
+        Path("./reports/http_cache.db"), alias="JIRA_HTTP_CACHE_DB"
+    )
+    burndown_dir: Path = Field(
+        Path("./reports/.burndown"), alias="BURNDOWN_DIR"
+    )
+    delta_state_dir: Path = Field(
+        Path("./reports/.delta"), alias="DELTA_STATE_DIR"
+    )
+    translation_output_dir: Path = Field(
+        Path("./reports/translations"), alias="TRANSLATION_OUTPUT_DIR"
+    )
+    translation_cache_db: Path = Field(
+        Path("./reports/translation_cache.db"), alias="TRANSLATION_CACHE_DB"
     )
 
-    atlassian: AtlassianMCPConfig = Field(default_factory=AtlassianMCPConfig)
-    outsystems: OutsystemsConfig = Field(default_factory=OutsystemsConfig)
-    vector_db: VectorDBConfig = Field(default_factory=VectorDBConfig)
-    agent: AgentConfig = Field(default_factory=AgentConfig)
-    claude: ClaudeConfig = Field(default_factory=ClaudeConfig)
-    notifications: NotificationConfig = Field(default_factory=NotificationConfig)
-    output: OutputConfig = Field(default_factory=OutputConfig)
-
-    def __init__(self, **kwargs):
-        """Initialize settings and create output directories."""
-        super().__init__(**kwargs)
-        self._create_output_dirs()
 
-    def _create_output_dirs(self):
-        """Create output directories if they don't exist."""
-        self.output.report_output_dir.mkdir(parents=True, exist_ok=True)
-        self.output.chart_output_dir.mkdir(parents=True, exist_ok=True)
+class Settings:
+    """
+    Main settings class combining all configurations.
+
+    The .env file is parsed once, when the settings are created; each
+    section is then built on first access from the process environment,
+    which takes precedence, and those parsed values. Commands that only
+    read one section never build or validate the others. Nothing is
+    created on disk: code that writes to an output directory creates it.
+    """
+
+    def __init__(self, env_file: Optional[Path] = ENV_FILE):
+        """
+        Args:
+            env_file: Environment file to read (None to use the process
+                environment only)
+        """
+        env_path = Path(env_file) if env_file else None
+        values = dotenv_values(env_path, encoding="utf-8") if env_path and env_path.is_file() else {}
+        self._env_file_values: Dict[str, str] = {
+            name.lower(): value for name, value in values.items() if value is not None
+        }
+
+    def _build(self, config_class: Type[ConfigT]) -> ConfigT:
+        """Build one section from the process environment and the parsed .env values."""
+        environ = {name.lower() for name in os.environ}
+        values = {}
+        for name, field in config_class.model_fields.items():
+            alias = field.alias or name
+            if alias.lower() in self._env_file_values and alias.lower() not in environ:
+                values[alias] = self._env_file_values[alias.lower()]
+        return config_class(_env_file=None, **values)
+
+    @cached_property
+    def atlassian(self) -> AtlassianMCPConfig:
+        return self._build(AtlassianMCPConfig)
+
+    @cached_property
+    def outsystems(self) -> OutsystemsConfig:
+        return self._build(OutsystemsConfig)
+
+    @cached_property
+    def vector_db(self) -> VectorDBConfig:
+        return self._build(VectorDBConfig)
+
+    @cached_property
+    def agent(self) -> AgentConfig:
+        return self._build(AgentConfig)
+
+    @cached_property
+    def claude(self) -> ClaudeConfig:
+        return self._build(ClaudeConfig)
+
+    @cached_property
+    def notifications(self) -> NotificationConfig:
+        return self._build(NotificationConfig)
+
+    @cached_property
+    def output(self) -> OutputConfig:
+        return self._build(OutputConfig)
 
 
 # Global settings instance
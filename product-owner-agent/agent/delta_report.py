@@ -0,0 +1,454 @@
+"""Delta sprint reports that only regenerate sections whose inputs changed."""
+
+import hashlib
+import json
+import logging
+import re
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from .burndown import BurndownSeries, sprint_burndown
+from .config import get_settings
+from .field_profiles import field_profile
+from .jira_mirror import open_jira_mirror
+from .results import SprintMetrics, SprintReportResult, publish_result
+from .tools.reporting import build_sprint_result, calculate_sprint_metrics
+
+logger = logging.getLogger(__name__)
+
+# Report sections and the snapshot input groups each one is written from
+SECTIONS: List[Tuple[str, List[str]]] = [
+    ("Executive Summary", ["metrics", "blocked"]),
+    ("Team Performance Metrics", ["metrics", "burndown"]),
+    ("Key Achievements", ["completed"]),
+    ("Blockers and Risks", ["blocked", "in_progress"]),
+    ("Recent Updates", ["updates"]),
+    ("Next Sprint Priorities", ["in_progress", "not_started"]),
+]
+
+# Groups whose prompt text changes from day to day without any issue
+# changing are fingerprinted from the issue-driven values they render
+_FINGERPRINTED_AS = {"burndown": "burndown_changes"}
+
+_SECTION_HEADING = re.compile(r"^###\s+(.+?)\s*$", re.MULTILINE)
+
+
+def load_delta_report_prompt() -> str:
+    """Load the delta report prompt template."""
+    prompt_path = Path(__file__).parent.parent / "prompts" / "delta_report.txt"
+    with open(prompt_path, "r") as f:
+        return f.read()
+
+
+def normalize_issue(issue: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Reduce a JIRA issue to the fields the report is written from.
+
+    Args:
+        issue: Raw JIRA issue
+
+    Returns:
+        Flat, JSON-serializable issue summary
+    """
+    fields = issue.get("fields", {})
+    assignee = fields.get("assignee") or {}
+    comments = (fields.get("comment") or {}).get("comments", [])
+    latest = comments[-1] if comments else None
+    return {
+        "key": issue.get("key", ""),
+        "summary": fields.get("summary", ""),
+        "status": (fields.get("status") or {}).get("name", ""),
+        "assignee": assignee.get("displayName", "Unassigned"),
+        "points": fields.get("customfield_10016", 0) or 0,
+        "latest_comment": {
+            "author": (latest.get("author") or {}).get("displayName", "Unknown"),
+            "body": latest.get("body", "")[:200],
+        } if latest else None,
+    }
+
+
+def burndown_changes(series: Optional[BurndownSeries]) -> Optional[Dict[str, Any]]:
+    """
+    The part of a burndown series that only changes when issues change.
+
+    Days after the last scope or burnup change repeat the previous day, so
+    they are left out; the series then stays the same from one calendar
+    day to the next until an issue changes.
+
+    Args:
+        series: Sprint burndown series (None if not available)
+
+    Returns:
+        Start date, scope and completed points through the last changed day
+    """
+    if series is None or series.computed_through < 0:
+        return None
+    last = 0
+    for index in range(1, series.computed_through + 1):
+        day = (series.scope[index], series.completed[index])
+        if day != (series.scope[index - 1], series.completed[index - 1]):
+            last = index
+    return {
+        "start": series.start.isoformat(),
+        "scope": [float(value) for value in series.scope[: last + 1]],
+        "completed": [float(value) for value in series.completed[: last + 1]],
+    }
+
+
+def build_snapshot(
+    issues: List[Dict[str, Any]],
+    burndown: str = "",
+    metrics: Optional[Dict[str, Any]] = None,
+    series: Optional[BurndownSeries] = None,
+) -> Dict[str, Any]:
+    """
+    Snapshot a sprint's normalized issues and computed metrics.
+
+    Args:
+        issues: Raw sprint issues
+        burndown: Burndown context for the sprint
+        metrics: Precomputed metrics for the issues (calculated if omitted)
+        series: Burndown series the context was written from
+
+    Returns:
+        Snapshot with per-section input groups
+    """
+    if metrics is None:
+        metrics = calculate_sprint_metrics(issues)
+    normalized = {issue.get("key", ""): normalize_issue(issue) for issue in issues}
+
+    def group(name: str) -> List[Dict[str, Any]]:
+        # Comments feed only the "updates" group, so a new comment does not
+        # invalidate every section listing the issue
+        return sorted(
+            (
+                {k: v for k, v in normalized[issue.get("key", "")].items() if k != "latest_comment"}
+                for issue in metrics[name]
+            ),
+            key=lambda item: item["key"],
+        )
+
+    return {
+        "issues": normalized,
+        "burndown_changes": burndown_changes(series),
+        "groups": {
+            # Blocked keys are covered by the "blocked" group
+            "metrics": SprintMetrics.from_metrics(metrics).model_dump(
+                mode="json", exclude={"blocked_keys", "velocity"}
+            ),
+            "burndown": burndown,
+            "completed": group("completed"),
+            "in_progress": group("in_progress"),
+            "blocked": group("blocked"),
+            "not_started": group("not_started"),
+            "updates": sorted(
+                (
+                    {"key": item["key"], **item["latest_comment"]}
+                    for item in normalized.values()
+                    if item["latest_comment"]
+                ),
+                key=lambda item: item["key"],
+            ),
+        },
+    }
+
+
+def diff_snapshots(previous: Dict[str, Any], current: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Compare two snapshots issue by issue.
+
+    Args:
+        previous: Earlier snapshot
+        current: New snapshot
+
+    Returns:
+        Added and removed issue keys and, per changed issue, the changed fields
+    """
+    old_issues = previous.get("issues", {})
+    new_issues = current.get("issues", {})
+    changed = {}
+    for key in sorted(set(old_issues) & set(new_issues)):
+        fields = [
+            name for name in new_issues[key]
+            if old_issues[key].get(name) != new_issues[key][name]
+        ]
+        if fields:
+            changed[key] = fields
+    return {
+        "added": sorted(set(new_issues) - set(old_issues)),
+        "removed": sorted(set(old_issues) - set(new_issues)),
+        "changed": changed,
+    }
+
+
+def section_fingerprints(snapshot: Dict[str, Any]) -> Dict[str, str]:
+    """Hash each section's inputs so unchanged sections can be detected."""
+
+    def fingerprinted(group: str) -> Any:
+        if group in _FINGERPRINTED_AS:
+            return snapshot.get(_FINGERPRINTED_AS[group])
+        return snapshot["groups"][group]
+
+    fingerprints = {}
+    for name, inputs in SECTIONS:
+        payload = json.dumps({group: fingerprinted(group) for group in inputs}, sort_keys=True)
+        fingerprints[name] = hashlib.sha256(payload.encode()).hexdigest()
+    return fingerprints
+
+
+def split_sections(text: str) -> Dict[str, str]:
+    """
+    Split generated markdown into sections keyed by "### " heading.
+
+    Args:
+        text: Model output
+
+    Returns:
+        Section name to body (without the heading line)
+    """
+    sections = {}
+    matches = list(_SECTION_HEADING.finditer(text))
+    for index, match in enumerate(matches):
+        end = matches[index + 1].start() if index + 1 < len(matches) else len(text)
+        sections[match.group(1).strip()] = text[match.end():end].strip()
+    return sections
+
+
+def _format_group(name: str, value: Any) -> str:
+    """Render one input group as compact prompt text."""
+    if name == "metrics":
+        return "\n".join(f"- {key.replace('_', ' ')}: {item}" for key, item in value.items())
+    if name == "burndown":
+        return value or "Not available"
+    if name == "updates":
+        return "\n".join(
+            f"- [{item['key']}] {item['author']}: {item['body']}" for item in value
+        ) or "No recent updates"
+    return "\n".join(
+        f"- {item['key']}: {item['summary']} [{item['status']}] "
+        f"(Assignee: {item['assignee']}, SP: {item['points']})"
+        for item in value
+    ) or "None"
+
+
+@dataclass
+class DeltaReportResult:
+    """An assembled delta report and which sections were regenerated."""
+
+    report: str
+    regenerated: List[str] = field(default_factory=list)
+    reused: List[str] = field(default_factory=list)
+    changes: Dict[str, Any] = field(default_factory=dict)
+    result: Optional[SprintReportResult] = None
+
+
+class DeltaReporter:
+    """
+    Regenerate only the report sections whose inputs changed.
+
+    Each run snapshots the sprint's normalized issues and metrics, diffs the
+    snapshot against the previous run's, and asks the model to write only
+    the sections whose input fingerprint changed. Unchanged sections are
+    reused verbatim from the previous report, so model tokens and runtime
+    scale with how much actually changed.
+    """
+
+    def __init__(
+        self,
+        agent: Any,
+        client: Any = None,
+        state_dir: Optional[Path] = None,
+        mirror: Any = None,
+        max_staleness: Optional[float] = None,
+    ):
+        """
+        Initialize the reporter.
+
+        Args:
+            agent: ProductOwnerAgent used for section generation
+            client: Async JIRA REST client (an AsyncJiraClient is created, and
+                closed after each run, if omitted)
+            state_dir: Where previous snapshots and sections are kept (defaults to DELTA_STATE_DIR)
+            mirror: JiraMirror to read the sprint from (the default mirror is
+                opened per run when JIRA_MIRROR_ENABLED or max_staleness is set)
+            max_staleness: Seconds mirrored data may be old before it is
+                resynced (defaults to JIRA_MIRROR_MAX_STALENESS)
+        """
+        self.agent = agent
+        self._owns_client = client is None
+        if client is None:
+            from .tools.jira_tools import AsyncJiraClient
+
+            client = AsyncJiraClient()
+        self.client = client
+        self.state_dir = Path(state_dir or get_settings().output.delta_state_dir)
+        self.mirror = mirror
+        self.max_staleness = max_staleness
+
+    def _state_path(self, sprint_id: Any) -> Path:
+        return self.state_dir / f"sprint_{sprint_id}.json"
+
+    def _load_state(self, sprint_id: Any) -> Optional[Dict[str, Any]]:
+        path = self._state_path(sprint_id)
+        if not path.exists():
+            return None
+        try:
+            return json.loads(path.read_text())
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable delta state {path}: {e}")
+            return None
+
+    def _save_state(self, sprint_id: Any, state: Dict[str, Any]) -> None:
+        self.state_dir.mkdir(parents=True, exist_ok=True)
+        path = self._state_path(sprint_id)
+        tmp_path = path.with_suffix(".json.tmp")
+        tmp_path.write_text(json.dumps(state))
+        tmp_path.replace(path)
+
+    async def fetch(self, board_id: int, sprint_id: int = 0) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
+        """Fetch the sprint and its issues (with changelogs) from the mirror or over REST."""
+        from .tools.jira_tools import search_all
+
+        mirror = self.mirror or open_jira_mirror(required=self.max_staleness is not None)
+        if mirror is not None:
+            try:
+                if sprint_id:
+                    sprint = await mirror.get_sprint(self.client, sprint_id, self.max_staleness)
+                else:
+                    sprint = await mirror.get_active_sprint(self.client, board_id, self.max_staleness)
+                return sprint, await mirror.sprint_issues(self.client, sprint["id"], self.max_staleness)
+            finally:
+                if mirror is not self.mirror:
+                    mirror.close()
+
+        if sprint_id:
+            sprint = await self.client.get_sprint(sprint_id)
+        else:
+            sprint = await self.client.get_active_sprint(board_id)
+        issues = await search_all(
+            self.client,
+            f"sprint = {sprint['id']}",
+            fields=field_profile("sprint-report"),
+            expand=["changelog"],
+        )
+        return sprint, issues
+
+    async def run(self, board_id: int, sprint_id: int = 0, team_name: str = "Team") -> DeltaReportResult:
+        """
+        Produce the sprint report, regenerating only changed sections.
+
+        Args:
+            board_id: JIRA board ID
+            sprint_id: Sprint ID (0 for the board's active sprint)
+            team_name: Team name
+
+        Returns:
+            Assembled report with regenerated/reused section names and the
+            structured sprint result
+        """
+        try:
+            sprint, issues = await self.fetch(board_id, sprint_id)
+        finally:
+            if self._owns_client:
+                await self.client.close()
+        sprint_key = sprint["id"]
+        sprint_name = sprint.get("name", str(sprint_key))
+        sprint_start = sprint.get("startDate", "N/A")
+        sprint_end = sprint.get("endDate", "N/A")
+
+        series, burndown = sprint_burndown(str(sprint_key), sprint_start, sprint_end, issues)
+        metrics = calculate_sprint_metrics(issues)
+        result = build_sprint_result(
+            sprint_name, team_name, sprint_start, sprint_end, metrics, series
+        )
+        publish_result(result)
+
+        snapshot = build_snapshot(issues, burndown, metrics, series)
+        fingerprints = section_fingerprints(snapshot)
+
+        previous = self._load_state(sprint_key) or {}
+        previous_sections = previous.get("sections", {})
+        previous_fingerprints = previous.get("fingerprints", {})
+        changes = diff_snapshots(previous.get("snapshot", {}), snapshot) if previous else {}
+
+        stale = [
+            name for name, _inputs in SECTIONS
+            if previous_fingerprints.get(name) != fingerprints[name] or name not in previous_sections
+        ]
+
+        sections = dict(previous_sections)
+        if stale:
+            logger.info(f"Regenerating {len(stale)}/{len(SECTIONS)} sections: {', '.join(stale)}")
+            generated = split_sections(
+                await self.agent.text_query(
+                    self._build_prompt(stale, snapshot, changes, sprint_name, team_name,
+                                       sprint_start, sprint_end)
+                )
+            )
+            for name in stale:
+                if name in generated:
+                    sections[name] = generated[name]
+                else:
+                    logger.warning(f"Model omitted section '{name}'")
+                    sections.setdefault(name, "_Not available_")
+                    fingerprints[name] = previous_fingerprints.get(name, "")
+
+        report = self._assemble(sections, sprint_name, team_name)
+        self._save_state(sprint_key, {
+            "updated_at": datetime.now().isoformat(timespec="seconds"),
+            "snapshot": snapshot,
+            "fingerprints": fingerprints,
+            "sections": sections,
+        })
+
+        return DeltaReportResult(
+            report=report,
+            regenerated=stale,
+            reused=[name for name, _inputs in SECTIONS if name not in stale],
+            changes=changes,
+            result=result,
+        )
+
+    def _build_prompt(self, stale: List[str], snapshot: Dict[str, Any], changes: Dict[str, Any],
+                      sprint_name: str, team_name: str, sprint_start: str, sprint_end: str) -> str:
+        """Format the prompt with the inputs of the stale sections only."""
+        needed_groups = list(dict.fromkeys(
+            group for name, inputs in SECTIONS if name in stale for group in inputs
+        ))
+        section_data = "\n\n".join(
+            f"### {group.replace('_', ' ').title()}\n{_format_group(group, snapshot['groups'][group])}"
+            for group in needed_groups
+        )
+        sections_list = "\n".join(
+            f"- {name} (from: {', '.join(inputs)})" for name, inputs in SECTIONS if name in stale
+        )
+
+        if changes:
+            change_lines = [f"- Added: {', '.join(changes['added'])}"] if changes["added"] else []
+            if changes["removed"]:
+                change_lines.append(f"- Removed: {', '.join(changes['removed'])}")
+            change_lines.extend(
+                f"- {key}: {', '.join(fields)} changed" for key, fields in changes["changed"].items()
+            )
+            changes_text = "\n".join(change_lines) or "No issue-level changes"
+        else:
+            changes_text = "First report for this sprint"
+
+        return load_delta_report_prompt().format(
+            sprint_name=sprint_name,
+            team_name=team_name,
+            sprint_start=sprint_start,
+            sprint_end=sprint_end,
+            changes=changes_text,
+            sections_list=sections_list,
+            section_data=section_data,
+        )
+
+    @staticmethod
+    def _assemble(sections: Dict[str, str], sprint_name: str, team_name: str) -> str:
+        parts = [f"# Sprint Report: {sprint_name} ({team_name})"]
+        for name, _inputs in SECTIONS:
+            parts.append(f"### {name}\n{sections.get(name, '_Not available_')}")
+        return "\n\n".join(parts) + "\n"
@@ -0,0 +1,508 @@
+"""Near-duplicate detection of proposed stories against a project's backlog."""
+
+import hashlib
+import logging
+import re
+import sqlite3
+from datetime import datetime, timedelta
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+import numpy as np
+
+from .config import get_settings
+from .field_profiles import field_profile
+
+logger = logging.getLogger(__name__)
+
+# 128 MinHash permutations split into 32 LSH bands of 4 rows: issues whose
+# token sets have Jaccard similarity s share a band with probability
+# 1 - (1 - s^4)^32, i.e. ~0.87 at s = 0.5 and ~0.07 at s = 0.2
+NUM_PERM = 128
+BANDS = 32
+ROWS = NUM_PERM // BANDS
+
+# Largest prime below 2**32; token hashes and coefficients stay below it so
+# a * x + b never overflows uint64
+_PRIME = np.uint64(4294967291)
+_rng = np.random.default_rng(20240611)
+_A = _rng.integers(1, int(_PRIME), NUM_PERM, dtype=np.uint64)
+_B = _rng.integers(0, int(_PRIME), NUM_PERM, dtype=np.uint64)
+
+_FNV_OFFSET = np.uint64(0xCBF29CE484222325)
+_FNV_PRIME = np.uint64(0x100000001B3)
+
+# Description words that count towards an issue's token set, so long
+# descriptions do not drown the summary
+_DESCRIPTION_WORDS = 60
+
+# Overlap when syncing "updated since", covering clock and time zone skew
+# between this machine and the JIRA site
+_SYNC_OVERLAP = timedelta(days=1)
+
+_PAGE_SIZE = 100
+
+# Issues hashed per vectorized MinHash step, bounding the (tokens x NUM_PERM)
+# intermediate to a few MB
+_MINHASH_CHUNK = 256
+
+# Keys per "IN (...)" lookup, below SQLite's host parameter limit
+_KEY_CHUNK = 500
+
+_WORD = re.compile(r"[a-z0-9]+")
+
+# Function words and user-story boilerplate ("As a user I want to ...")
+_STOPWORDS = frozenset(
+    "a an and are as at be by can for from i in into is it of on or should so "
+    "that the their this to user users want we when will with".split()
+)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS issues (
+    issue_key TEXT PRIMARY KEY,
+    project TEXT NOT NULL,
+    summary TEXT NOT NULL,
+    updated TEXT NOT NULL,
+    signature BLOB NOT NULL
+);
+CREATE INDEX IF NOT EXISTS issues_project ON issues (project);
+CREATE TABLE IF NOT EXISTS buckets (
+    band INTEGER NOT NULL,
+    bucket INTEGER NOT NULL,
+    issue_key TEXT NOT NULL,
+    PRIMARY KEY (band, bucket, issue_key)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+
+def _plain_text(value: Any) -> str:
+    """Flatten a description given as a string or an ADF document."""
+    if value is None:
+        return ""
+    if isinstance(value, str):
+        return value
+    if isinstance(value, dict):
+        return " ".join(filter(None, [value.get("text", "")] + [
+            _plain_text(child) for child in value.get("content", [])
+        ]))
+    if isinstance(value, list):
+        return " ".join(_plain_text(child) for child in value)
+    return str(value)
+
+
+def tokens(summary: str, description: Any = "") -> Set[str]:
+    """
+    Token set compared between stories.
+
+    Words are lowercased, stopwords dropped and plurals folded; only the
+    first words of the description are used.
+
+    Args:
+        summary: Story or issue summary
+        description: Description as text or an ADF document
+
+    Returns:
+        Set of normalized words
+    """
+    words = _WORD.findall((summary or "").lower())
+    words += _WORD.findall(_plain_text(description).lower())[:_DESCRIPTION_WORDS]
+    result = set()
+    for word in words:
+        if word in _STOPWORDS or len(word) < 2:
+            continue
+        if len(word) > 3 and word.endswith("s") and not word.endswith("ss"):
+            word = word[:-1]
+        result.add(word)
+    return result
+
+
+@lru_cache(maxsize=65536)
+def _token_hash(token: str) -> int:
+    return int.from_bytes(hashlib.blake2b(token.encode(), digest_size=4).digest(), "little") % int(_PRIME)
+
+
+def minhash_many(token_sets: List[Set[str]]) -> np.ndarray:
+    """
+    MinHash signatures of several token sets at once.
+
+    Args:
+        token_sets: Token sets from tokens()
+
+    Returns:
+        (n, NUM_PERM) uint32 array; rows of empty sets are all maximal
+    """
+    signatures = np.full((len(token_sets), NUM_PERM), np.iinfo(np.uint32).max, dtype=np.uint32)
+    for start in range(0, len(token_sets), _MINHASH_CHUNK):
+        chunk = token_sets[start:start + _MINHASH_CHUNK]
+        rows = [row for row, token_set in enumerate(chunk) if token_set]
+        if not rows:
+            continue
+        hashes = np.fromiter(
+            (_token_hash(token) for row in rows for token in chunk[row]), dtype=np.uint64
+        )
+        offsets = np.cumsum([0] + [len(chunk[row]) for row in rows[:-1]])
+        permuted = (hashes[:, None] * _A + _B) % _PRIME
+        signatures[start + np.array(rows)] = np.minimum.reduceat(permuted, offsets, axis=0)
+    return signatures
+
+
+def minhash(token_set: Set[str]) -> np.ndarray:
+    """
+    MinHash signature of a token set.
+
+    Args:
+        token_set: Tokens from tokens()
+
+    Returns:
+        uint32 array of NUM_PERM minimum hash values (all maximal for no tokens)
+    """
+    return minhash_many([token_set])[0]
+
+
+def band_buckets(signatures: np.ndarray) -> np.ndarray:
+    """
+    Hash each band of one or more signatures into 64-bit LSH bucket ids.
+
+    Args:
+        signatures: Signature, or (n, NUM_PERM) array of signatures
+
+    Returns:
+        int64 array of shape (BANDS,) or (n, BANDS)
+    """
+    bands = signatures.reshape(-1, BANDS, ROWS).astype(np.uint64)
+    # FNV-1a over the band's values, seeded with the band number so equal
+    # values in different bands land in different buckets
+    buckets = np.broadcast_to(_FNV_OFFSET ^ np.arange(BANDS, dtype=np.uint64), bands.shape[:2])
+    for row in range(ROWS):
+        buckets = (buckets ^ bands[:, :, row]) * _FNV_PRIME
+    buckets = buckets.view(np.int64)
+    return buckets[0] if signatures.ndim == 1 else buckets
+
+
+def similarity(first: np.ndarray, second: np.ndarray) -> float:
+    """Estimated Jaccard similarity of two signatures."""
+    return float(np.count_nonzero(first == second)) / NUM_PERM
+
+
+class DuplicateIndex:
+    """
+    MinHash/LSH index of backlog issue summaries and descriptions.
+
+    Each issue is stored with its signature and LSH band buckets, so a
+    proposed story is checked with one indexed lookup per band plus a
+    signature comparison against the few issues sharing a bucket, regardless
+    of backlog size. Issues are updated incrementally: an issue is rehashed
+    only when its "updated" timestamp changed.
+    """
+
+    def __init__(self, db_path: Optional[Path] = None, create: bool = True):
+        """
+        Open (and create if needed) the index.
+
+        Args:
+            db_path: Index location (defaults to DUPLICATE_INDEX_DB)
+            create: Create the database if it does not exist yet (when
+                false, a missing database reads as empty and nothing is written
+                to disk)
+        """
+        settings = get_settings()
+        self.db_path = Path(db_path or settings.output.duplicate_index_db)
+        if create or self.db_path.exists():
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            self.conn = sqlite3.connect(str(self.db_path))
+        else:
+            # Nothing stored yet: read from an empty database instead of creating one
+            self.conn = sqlite3.connect(":memory:")
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript(_SCHEMA)
+
+    def __enter__(self) -> "DuplicateIndex":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        self.conn.close()
+
+    def _meta(self, key: str) -> Optional[str]:
+        row = self.conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row["value"] if row else None
+
+    def _set_meta(self, key: str, value: str) -> None:
+        self.conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, value))
+
+    def update(self, issues: Iterable[Dict[str, Any]], project_key: Optional[str] = None) -> int:
+        """
+        Add or refresh issues from a fetched issue set.
+
+        Args:
+            issues: Issues in the REST API shape ({"key", "fields": {"summary",
+                "description", "updated", "project"}})
+            project_key: Project of issues without a project field
+
+        Returns:
+            Number of issues (re)hashed; unchanged issues are skipped
+        """
+        issues = {
+            issue["key"]: issue for issue in issues
+            if issue.get("key") and (issue.get("fields") or {}).get("summary") is not None
+        }
+        known = self._stored(list(issues))
+        changed = []
+        for key, issue in issues.items():
+            fields = issue["fields"]
+            updated = fields.get("updated") or ""
+            if updated and key in known and known[key][0] == updated:
+                continue
+            project = (fields.get("project") or {}).get("key") or project_key or key.split("-")[0]
+            changed.append((key, project.upper(), fields["summary"], updated, fields.get("description")))
+        if not changed:
+            return 0
+
+        signatures = minhash_many([tokens(row[2], row[4]) for row in changed])
+        buckets = band_buckets(signatures).tolist()
+        with self.conn:
+            self._delete_buckets({key: known[key][1] for key, *_ in changed if key in known})
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO issues (issue_key, project, summary, updated, signature) "
+                "VALUES (?, ?, ?, ?, ?)",
+                [(*row[:4], signature.tobytes()) for row, signature in zip(changed, signatures)],
+            )
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO buckets (band, bucket, issue_key) VALUES (?, ?, ?)",
+                (
+                    (band, bucket, row[0])
+                    for row, issue_buckets in zip(changed, buckets)
+                    for band, bucket in enumerate(issue_buckets)
+                ),
+            )
+        return len(changed)
+
+    def _stored(self, keys: List[str]) -> Dict[str, tuple]:
+        """Stored (updated, signature) of the given issues."""
+        known = {}
+        for start in range(0, len(keys), _KEY_CHUNK):
+            chunk = keys[start:start + _KEY_CHUNK]
+            placeholders = ", ".join("?" for _ in chunk)
+            known.update(
+                (row["issue_key"], (row["updated"], row["signature"]))
+                for row in self.conn.execute(
+                    "SELECT issue_key, updated, signature FROM issues "
+                    f"WHERE issue_key IN ({placeholders})",
+                    chunk,
+                )
+            )
+        return known
+
+    def _delete_buckets(self, signatures: Dict[str, bytes]) -> None:
+        """Remove issues' bucket entries, located by their stored signatures."""
+        if not signatures:
+            return
+        stored = np.stack([np.frombuffer(blob, dtype=np.uint32) for blob in signatures.values()])
+        self.conn.executemany(
+            "DELETE FROM buckets WHERE band = ? AND bucket = ? AND issue_key = ?",
+            (
+                (band, bucket, key)
+                for key, issue_buckets in zip(signatures, band_buckets(stored).tolist())
+                for band, bucket in enumerate(issue_buckets)
+            ),
+        )
+
+    def remove(self, keys: Iterable[str]) -> int:
+        """
+        Drop issues, e.g. after they were deleted in JIRA.
+
+        Returns:
+            Number of issues removed
+        """
+        known = self._stored(list(keys))
+        with self.conn:
+            self._delete_buckets({key: signature for key, (_, signature) in known.items()})
+            self.conn.executemany("DELETE FROM issues WHERE issue_key = ?", [(key,) for key in known])
+        return len(known)
+
+    def clear(self, project_key: str) -> None:
+        """Drop a project's issues and sync state."""
+        project = project_key.upper()
+        keys = [
+            row["issue_key"]
+            for row in self.conn.execute("SELECT issue_key FROM issues WHERE project = ?", (project,))
+        ]
+        self.remove(keys)
+        with self.conn:
+            self.conn.execute("DELETE FROM meta WHERE key = ?", (f"last_sync:{project}",))
+
+    def find_similar(
+        self,
+        summary: str,
+        description: Any = "",
+        project_key: Optional[str] = None,
+        threshold: Optional[float] = None,
+        limit: int = 3,
+    ) -> List[Dict[str, Any]]:
+        """
+        Find indexed issues similar to a story.
+
+        Args:
+            summary: Story title
+            description: Story description
+            project_key: Only match issues of this project
+            threshold: Minimum estimated similarity (defaults to DUPLICATE_THRESHOLD)
+            limit: Maximum matches
+
+        Returns:
+            Matches ({"key", "summary", "similarity"}), most similar first
+        """
+        if threshold is None:
+            threshold = get_settings().agent.duplicate_threshold
+        token_set = tokens(summary, description)
+        if not token_set:
+            return []
+        signature = minhash(token_set)
+        # One primary-key probe per band; the project is checked afterwards so
+        # SQLite never walks the project's issues
+        params: List[int] = []
+        for band, bucket in enumerate(band_buckets(signature).tolist()):
+            params += [band, bucket]
+        bands = " OR ".join("(band = ? AND bucket = ?)" for _ in range(BANDS))
+        query = (
+            "SELECT issue_key, project, summary, signature FROM issues WHERE issue_key IN "
+            f"(SELECT issue_key FROM buckets WHERE {bands})"
+        )
+
+        project = project_key.upper() if project_key else None
+        matches = []
+        for row in self.conn.execute(query, params):
+            if project and row["project"] != project:
+                continue
+            score = similarity(signature, np.frombuffer(row["signature"], dtype=np.uint32))
+            if score >= threshold:
+                matches.append({
+                    "key": row["issue_key"],
+                    "summary": row["summary"],
+                    "similarity": round(score, 2),
+                })
+        matches.sort(key=lambda match: -match["similarity"])
+        return matches[:limit]
+
+    def sync_since(self, project_key: str) -> Optional[datetime]:
+        """
+        Time from which a project's issues must be fetched again.
+
+        Returns:
+            Last sync time minus an overlap, or None if never synced
+        """
+        last_sync = self._meta(f"last_sync:{project_key.upper()}")
+        if not last_sync:
+            return None
+        return datetime.fromisoformat(last_sync) - _SYNC_OVERLAP
+
+    def mark_synced(self, project_key: str, started: datetime) -> None:
+        """Record a completed sync that started at the given time."""
+        with self.conn:
+            self._set_meta(f"last_sync:{project_key.upper()}", started.isoformat(timespec="seconds"))
+
+    async def sync(self, client: Any, project_key: str, full: bool = False) -> Dict[str, Any]:
+        """
+        Fetch a project's issues updated since the last sync and index them.
+
+        Args:
+            client: AsyncJiraClient
+            project_key: Project to sync
+            full: Drop the project and fetch every issue again, which also
+                removes issues deleted in JIRA
+
+        Returns:
+            fetched and changed issue counts and the project's indexed total
+        """
+        if full:
+            self.clear(project_key)
+        started = datetime.now()
+        issues = await fetch_project_issues(client, project_key, self.sync_since(project_key))
+        changed = self.update(issues, project_key)
+        self.mark_synced(project_key, started)
+        return {
+            "fetched": len(issues),
+            "changed": changed,
+            "issues": self.count(project_key),
+        }
+
+    def count(self, project_key: Optional[str] = None) -> int:
+        """Number of indexed issues, optionally for one project."""
+        if project_key:
+            return self.conn.execute(
+                "SELECT COUNT(*) FROM issues WHERE project = ?", (project_key.upper(),)
+            ).fetchone()[0]
+        return self.conn.execute("SELECT COUNT(*) FROM issues").fetchone()[0]
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Summarize the index.
+
+        Returns:
+            issues, issues by project and each project's last sync time
+        """
+        by_project = {
+            row["project"]: row["count"]
+            for row in self.conn.execute(
+                "SELECT project, COUNT(*) AS count FROM issues GROUP BY project ORDER BY project"
+            )
+        }
+        last_sync = {
+            row["key"].split(":", 1)[1]: row["value"]
+            for row in self.conn.execute("SELECT key, value FROM meta WHERE key LIKE 'last_sync:%'")
+        }
+        return {"issues": sum(by_project.values()), "by_project": by_project, "last_sync": last_sync}
+
+
+def open_duplicate_index() -> Optional[DuplicateIndex]:
+    """
+    Open the duplicate index when detection is enabled.
+
+    Returns:
+        The index, or None if DUPLICATE_DETECTION_ENABLED is false or it cannot be opened
+    """
+    if not get_settings().agent.duplicate_detection_enabled:
+        return None
+    try:
+        return DuplicateIndex()
+    except Exception as e:
+        logger.warning(f"Duplicate index unavailable: {e}")
+        return None
+
+
+async def fetch_project_issues(
+    client: Any, project_key: str, since: Optional[datetime] = None
+) -> List[Dict[str, Any]]:
+    """
+    Fetch a project's issues, pages in parallel, for the duplicate index.
+
+    Args:
+        client: AsyncJiraClient
+        project_key: Project to fetch
+        since: Only fetch issues updated at or after this time
+
+    Returns:
+        Issues with summary, description and updated fields
+    """
+    from .tools.jira_tools import search_all
+
+    jql = f"project = {project_key}"
+    if since is not None:
+        jql += f' AND updated >= "{since.strftime("%Y-%m-%d %H:%M")}"'
+    jql += " ORDER BY key ASC"
+
+    return await search_all(
+        client,
+        jql,
+        fields=field_profile("duplicates"),
+        page_size=_PAGE_SIZE,
+    )
@@ -0,0 +1,82 @@
+"""Named JIRA field projections for each analysis.
+
+JIRA returns every field of an issue (often 100+ custom fields, rendered
+descriptions and comment threads) unless a request lists the ones it
+wants. Each analysis reads only a handful, so every fetch path names a
+profile here and asks for exactly those fields; responses shrink
+severalfold and parse accordingly faster.
+
+Profiles are derived from what the consuming code reads. Custom field IDs
+that differ per site (the team field) come from settings, so profiles are
+resolved when a request is made rather than at import time.
+"""
+
+from typing import Dict, List, Optional
+
+from .config import get_settings
+
+STORY_POINTS_FIELD = "customfield_10016"
+
+
+def field_profiles() -> Dict[str, List[str]]:
+    """
+    Fields read by each analysis, keyed by profile name.
+
+    Returns:
+        Field lists by profile:
+        - dependency: build_dependency_graph (nodes and issue links)
+        - gantt: generate_gantt_chart (team sections and task status)
+        - sprint-report: calculate_sprint_metrics, format_task_details,
+          format_updates and the burndown replay (with expand=changelog)
+        - translation: the epic text handed to the model
+        - duplicates: the duplicate index signatures and incremental sync
+        - labels: idempotency label lookups during story creation
+        - links: issue links only
+    """
+    team_field = get_settings().atlassian.field_team_assignment
+    return {
+        "dependency": [
+            "summary", "status", "assignee", "duedate", "issuelinks", STORY_POINTS_FIELD, team_field,
+        ],
+        "gantt": ["summary", "status", team_field],
+        "sprint-report": ["summary", "status", "assignee", STORY_POINTS_FIELD, "comment", "created"],
+        "translation": ["summary", "description"],
+        "duplicates": ["summary", "description", "updated", "project"],
+        "labels": ["labels"],
+        "links": ["issuelinks"],
+    }
+
+
+def field_profile(name: str) -> List[str]:
+    """
+    Resolve a profile name to its field list.
+
+    Args:
+        name: Profile name (see field_profiles)
+
+    Returns:
+        Field IDs to request
+
+    Raises:
+        ValueError: If the profile does not exist
+    """
+    profiles = field_profiles()
+    if name not in profiles:
+        raise ValueError(f"Unknown field profile '{name}' (expected one of: {', '.join(profiles)})")
+    return list(profiles[name])
+
+
+def resolve_fields(fields: Optional[List[str]] = None, profile: Optional[str] = None) -> Optional[List[str]]:
+    """
+    Pick the fields for a request: explicit fields win, then the profile.
+
+    Args:
+        fields: Explicit field list
+        profile: Profile name
+
+    Returns:
+        Field IDs, or None for every field
+    """
+    if fields is not None:
+        return fields
+    return field_profile(profile) if profile else None
@@ -0,0 +1,374 @@
+"""On-disk HTTP response cache with conditional revalidation for the REST clients."""
+
+import hashlib
+import json
+import logging
+import re
+import sqlite3
+import time
+import zlib
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Mapping, Optional
+
+from .config import get_settings
+
+logger = logging.getLogger(__name__)
+
+# Endpoints whose bodies rarely change: served from the cache without a
+# request until JIRA_HTTP_CACHE_METADATA_TTL has passed, then revalidated
+_METADATA_ENDPOINTS = [
+    re.compile(pattern)
+    for pattern in (
+        r"^/rest/api/[23]/project(/[^/]+)?$",
+        r"^/rest/api/[23]/issuetype(/[^/]+)?$",
+        r"^/rest/api/[23]/issueLinkType(/[^/]+)?$",
+        r"^/rest/api/[23]/(field|priority|resolution|status)$",
+        r"^/rest/agile/1\.0/sprint/\d+$",
+    )
+]
+
+# Share of the size bound kept when a store pushes the cache over it
+_EVICT_TO = 0.9
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    cache_key TEXT PRIMARY KEY,
+    endpoint TEXT NOT NULL,
+    etag TEXT,
+    last_modified TEXT,
+    body BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    stored_at REAL NOT NULL,
+    fresh_until REAL NOT NULL,
+    last_used_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_responses_last_used ON responses(last_used_at);
+CREATE TABLE IF NOT EXISTS counters (
+    name TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+"""
+
+
+def metadata_ttl(endpoint: str) -> float:
+    """
+    Seconds a response of an endpoint may be reused without revalidation.
+
+    Args:
+        endpoint: Request path, e.g. "/rest/api/2/issuetype"
+
+    Returns:
+        JIRA_HTTP_CACHE_METADATA_TTL for metadata endpoints, else 0
+    """
+    if any(pattern.match(endpoint) for pattern in _METADATA_ENDPOINTS):
+        return get_settings().atlassian.http_cache_metadata_ttl
+    return 0.0
+
+
+@dataclass
+class CachedResponse:
+    """A stored response body and the validators it was served with."""
+
+    key: str
+    body: str
+    etag: Optional[str]
+    last_modified: Optional[str]
+    fresh: bool
+
+    def conditional_headers(self) -> Dict[str, str]:
+        """If-None-Match/If-Modified-Since headers that revalidate the body."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class ResponseCache:
+    """
+    SQLite store of GET response bodies keyed by URL, query and account.
+
+    Bodies are kept zlib-compressed with their ETag and Last-Modified
+    validators; stale entries are revalidated with a conditional request,
+    so an unchanged resource costs a 304 instead of a full download. The
+    least recently used entries are evicted beyond JIRA_HTTP_CACHE_MAX_MB.
+    Hit, miss and bytes-saved counts persist across runs.
+
+    The database is opened on first use; close() releases it, and a closed
+    cache reopens on its next use.
+    """
+
+    def __init__(
+        self,
+        db_path: Optional[Path] = None,
+        max_bytes: Optional[int] = None,
+        create: bool = True,
+    ):
+        """
+        Open (and create if needed) the cache.
+
+        Args:
+            db_path: Cache location (defaults to JIRA_HTTP_CACHE_DB)
+            max_bytes: Size bound of the stored bodies (defaults to JIRA_HTTP_CACHE_MAX_MB)
+            create: Create the database if it does not exist yet (when
+                false, a missing database reads as empty and nothing is written
+                to disk)
+        """
+        settings = get_settings()
+        self.db_path = Path(db_path or settings.output.http_cache_db)
+        self.max_bytes = max_bytes or int(settings.atlassian.http_cache_max_mb * 1024 * 1024)
+        self.create = create
+        self._conn: Optional[sqlite3.Connection] = None
+        # Stored bytes as last seen; other processes' writes are picked up on eviction
+        self._size = 0
+
+    def __enter__(self) -> "ResponseCache":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        """The database connection, opened on first use."""
+        if self._conn is None:
+            if self.create or self.db_path.exists():
+                self.db_path.parent.mkdir(parents=True, exist_ok=True)
+                conn = sqlite3.connect(str(self.db_path))
+            else:
+                # Nothing stored yet: read from an empty database instead of creating one
+                conn = sqlite3.connect(":memory:")
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(_SCHEMA)
+            self._conn = conn
+            self._size = self._stored_bytes()
+        return self._conn
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def _stored_bytes(self) -> int:
+        return self.conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+
+    @staticmethod
+    def key(url: str, params: Optional[Mapping[str, Any]] = None, scope: str = "") -> str:
+        """
+        Hash a request into a cache key.
+
+        Args:
+            url: Absolute request URL
+            params: Query parameters
+            scope: Account the response was served to, so users never share bodies
+
+        Returns:
+            Hex digest identifying the request
+        """
+        query = sorted((str(name), str(value)) for name, value in (params or {}).items())
+        return hashlib.sha256(json.dumps([scope, url, query]).encode()).hexdigest()
+
+    def _count(self, name: str, amount: int = 1) -> None:
+        self.conn.execute(
+            "INSERT INTO counters (name, value) VALUES (?, ?) "
+            "ON CONFLICT(name) DO UPDATE SET value = value + excluded.value",
+            (name, amount),
+        )
+
+    def lookup(self, key: str) -> Optional[CachedResponse]:
+        """
+        Find a stored response.
+
+        Args:
+            key: Key from ResponseCache.key()
+
+        Returns:
+            The response (fresh if it may be used without revalidation), or None
+        """
+        row = self.conn.execute(
+            "SELECT etag, last_modified, body, fresh_until FROM responses WHERE cache_key = ?",
+            (key,),
+        ).fetchone()
+        if row is None:
+            return None
+        return CachedResponse(
+            key=key,
+            body=zlib.decompress(row["body"]).decode(),
+            etag=row["etag"],
+            last_modified=row["last_modified"],
+            fresh=row["fresh_until"] > time.time(),
+        )
+
+    def hit(self, entry: CachedResponse) -> None:
+        """Record a response served without a request."""
+        with self.conn:
+            self._count("fresh_hits")
+            self._count("bytes_saved", len(entry.body.encode()))
+            self.conn.execute(
+                "UPDATE responses SET last_used_at = ? WHERE cache_key = ?", (time.time(), entry.key)
+            )
+
+    def revalidated(self, entry: CachedResponse, endpoint: str, headers: Mapping[str, str]) -> None:
+        """
+        Record a 304 and extend the entry's freshness.
+
+        Args:
+            entry: The revalidated response
+            endpoint: Request path, for the metadata TTL
+            headers: Headers of the 304 response (may carry new validators)
+        """
+        now = time.time()
+        with self.conn:
+            self._count("revalidated")
+            self._count("bytes_saved", len(entry.body.encode()))
+            self.conn.execute(
+                """
+                UPDATE responses
+                SET etag = COALESCE(?, etag), last_modified = COALESCE(?, last_modified),
+                    fresh_until = ?, last_used_at = ?
+                WHERE cache_key = ?
+                """,
+                (
+                    headers.get("ETag"),
+                    headers.get("Last-Modified"),
+                    now + metadata_ttl(endpoint),
+                    now,
+                    entry.key,
+                ),
+            )
+
+    def store(self, key: str, endpoint: str, body: str, headers: Mapping[str, str]) -> bool:
+        """
+        Record a full download and keep the body if it can be reused.
+
+        Args:
+            key: Key from ResponseCache.key()
+            endpoint: Request path
+            body: Response body
+            headers: Response headers
+
+        Returns:
+            True if the body was stored (it had validators or a metadata TTL)
+        """
+        etag, last_modified = headers.get("ETag"), headers.get("Last-Modified")
+        ttl = metadata_ttl(endpoint)
+        with self.conn:
+            self._count("misses")
+            previous = self.conn.execute(
+                "SELECT size FROM responses WHERE cache_key = ?", (key,)
+            ).fetchone()
+            if previous is not None:
+                self._size -= previous["size"]
+            if not (etag or last_modified or ttl):
+                self.conn.execute("DELETE FROM responses WHERE cache_key = ?", (key,))
+                return False
+            now = time.time()
+            compressed = zlib.compress(body.encode())
+            self._size += len(compressed)
+            self.conn.execute(
+                """
+                INSERT OR REPLACE INTO responses
+                    (cache_key, endpoint, etag, last_modified, body, size,
+                     stored_at, fresh_until, last_used_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                (key, endpoint, etag, last_modified, compressed, len(compressed), now, now + ttl, now),
+            )
+        if self._size > self.max_bytes:
+            # Trim below the bound so the next few stores do not evict again
+            self.evict(int(self.max_bytes * _EVICT_TO))
+        return True
+
+    def evict(self, target: Optional[int] = None) -> int:
+        """
+        Drop the least recently used entries beyond a size.
+
+        Args:
+            target: Bytes to keep (defaults to the size bound)
+
+        Returns:
+            Number of entries removed
+        """
+        with self.conn:
+            removed = self.conn.execute(
+                """
+                DELETE FROM responses WHERE cache_key IN (
+                    SELECT cache_key FROM (
+                        SELECT cache_key, SUM(size) OVER (
+                            ORDER BY last_used_at DESC, stored_at DESC
+                            ROWS UNBOUNDED PRECEDING
+                        ) AS running
+                        FROM responses
+                    ) WHERE running > ?
+                )
+                """,
+                (self.max_bytes if target is None else target,),
+            ).rowcount
+        self._size = self._stored_bytes()
+        return removed
+
+    def clear(self, reset_stats: bool = False) -> int:
+        """
+        Remove every stored response.
+
+        Args:
+            reset_stats: Also zero the hit, miss and bytes-saved counters
+
+        Returns:
+            Number of entries removed
+        """
+        with self.conn:
+            removed = self.conn.execute("DELETE FROM responses").rowcount
+            if reset_stats:
+                self.conn.execute("DELETE FROM counters")
+        self._size = 0
+        return removed
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Return cache size and effectiveness.
+
+        Returns:
+            entries, size_bytes, max_bytes, fresh_hits, revalidated, misses,
+            hit_rate (percent) and bytes_saved (uncompressed bodies not downloaded)
+        """
+        counters = {
+            row["name"]: row["value"] for row in self.conn.execute("SELECT * FROM counters")
+        }
+        entries, size = self.conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses"
+        ).fetchone()
+        fresh_hits = counters.get("fresh_hits", 0)
+        revalidated = counters.get("revalidated", 0)
+        misses = counters.get("misses", 0)
+        lookups = fresh_hits + revalidated + misses
+        return {
+            "entries": entries,
+            "size_bytes": size,
+            "max_bytes": self.max_bytes,
+            "fresh_hits": fresh_hits,
+            "revalidated": revalidated,
+            "misses": misses,
+            "hit_rate": round((fresh_hits + revalidated) / lookups * 100, 1) if lookups else 0.0,
+            "bytes_saved": counters.get("bytes_saved", 0),
+        }
+
+
+def open_response_cache() -> Optional[ResponseCache]:
+    """
+    Open the default response cache if JIRA_HTTP_CACHE_ENABLED is set.
+
+    Returns:
+        The cache, or None if it is disabled or cannot be opened
+    """
+    if not get_settings().atlassian.http_cache_enabled:
+        return None
+    try:
+        return ResponseCache()
+    except Exception as e:
+        logger.warning(f"HTTP response cache unavailable: {e}")
+        return None
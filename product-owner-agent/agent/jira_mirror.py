@@ -0,0 +1,682 @@
+"""Incremental local JIRA mirror in SQLite.
+
+Reports, dependency analyses and Gantt charts read the same issues run
+after run. The mirror keeps them on disk: issues are normalized into an
+indexed table (plus the mirrored fields as JSON), with their links and
+changelogs in tables of their own, and each synced scope (a project, a
+board's active sprint, a sprint's membership) records when it was last
+refreshed. Readers declare how stale the data may be; within that window
+they are served from disk with no JIRA round trip at all, and past it the
+scope is refreshed incrementally before reading:
+
+- projects refetch only issues updated since the last sync
+  (``updated >= lastSync``), so deletions need a full sync
+- sprints refetch their membership with only the "updated" field, then
+  the full data of issues whose timestamp changed
+"""
+
+import asyncio
+import json
+import logging
+import sqlite3
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+from .config import get_settings
+from .field_profiles import STORY_POINTS_FIELD, field_profiles
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS issues (
+    issue_key TEXT PRIMARY KEY,
+    project TEXT NOT NULL,
+    summary TEXT,
+    status TEXT,
+    assignee TEXT,
+    team TEXT,
+    story_points REAL,
+    duedate TEXT,
+    created TEXT,
+    updated TEXT,
+    fields TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_issues_project ON issues (project, updated);
+CREATE INDEX IF NOT EXISTS idx_issues_status ON issues (status);
+CREATE INDEX IF NOT EXISTS idx_issues_team ON issues (team);
+
+CREATE TABLE IF NOT EXISTS issue_links (
+    issue_key TEXT NOT NULL,
+    direction TEXT NOT NULL,
+    other_key TEXT NOT NULL,
+    link_type TEXT NOT NULL,
+    link_id TEXT,
+    PRIMARY KEY (issue_key, direction, other_key, link_type)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_links_other ON issue_links (other_key);
+
+CREATE TABLE IF NOT EXISTS changelog (
+    issue_key TEXT NOT NULL,
+    history_id TEXT NOT NULL,
+    seq INTEGER NOT NULL,
+    created TEXT NOT NULL,
+    author TEXT,
+    field TEXT,
+    field_id TEXT,
+    from_string TEXT,
+    to_string TEXT,
+    PRIMARY KEY (issue_key, history_id, seq)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_changelog_created ON changelog (created);
+
+CREATE TABLE IF NOT EXISTS sprints (
+    sprint_id INTEGER PRIMARY KEY,
+    board_id INTEGER,
+    state TEXT,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_sprints_board ON sprints (board_id, state);
+
+CREATE TABLE IF NOT EXISTS sprint_issues (
+    sprint_id INTEGER NOT NULL,
+    issue_key TEXT NOT NULL,
+    PRIMARY KEY (sprint_id, issue_key)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_sprint_issues_key ON sprint_issues (issue_key);
+
+CREATE TABLE IF NOT EXISTS sync_state (
+    scope TEXT PRIMARY KEY,
+    synced_at TEXT NOT NULL,
+    issues INTEGER NOT NULL DEFAULT 0
+);
+"""
+
+# Overlap when syncing "updated since", covering clock and time zone skew
+# between this machine and the JIRA site (JQL dates use the user's zone)
+_SYNC_OVERLAP = timedelta(days=1)
+
+# Keys per "IN (...)" lookup, below SQLite's host parameter limit
+_KEY_CHUNK = 500
+
+
+def mirror_fields() -> List[str]:
+    """Fields the mirror stores: every analysis profile plus sync bookkeeping."""
+    fields = [name for profile in field_profiles().values() for name in profile]
+    return list(dict.fromkeys(fields + ["updated", "project"]))
+
+
+def _name(value: Any) -> Optional[str]:
+    """Display text of a field that may be a plain value or an option/user object."""
+    if isinstance(value, dict):
+        return value.get("value") or value.get("name") or value.get("displayName")
+    return None if value in (None, "") else str(value)
+
+
+def _points(value: Any) -> Optional[float]:
+    try:
+        return float(value) if value not in (None, "") else None
+    except (TypeError, ValueError):
+        return None
+
+
+def _issue_key_order(key: str) -> tuple:
+    project, _, number = key.partition("-")
+    return (project, int(number) if number.isdigit() else 0, key)
+
+
+class JiraMirror:
+    """
+    SQLite mirror of JIRA issues, links, changelogs and sprints.
+
+    Every write path takes issues in the REST API shape; every read path
+    returns them in that shape again, so analyses work unchanged on
+    mirrored data.
+    """
+
+    def __init__(self, db_path: Optional[Path] = None):
+        """
+        Open (and create if needed) the mirror.
+
+        Args:
+            db_path: Mirror location (defaults to JIRA_MIRROR_DB)
+        """
+        settings = get_settings()
+        self.db_path = Path(db_path or settings.output.jira_mirror_db)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(self.db_path))
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript(_SCHEMA)
+
+    def __enter__(self) -> "JiraMirror":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        self.conn.close()
+
+    # Sync bookkeeping
+
+    def synced_at(self, scope: str) -> Optional[datetime]:
+        """When a scope ("project:PROJ", "board:42", "sprint:7") was last synced."""
+        row = self.conn.execute("SELECT synced_at FROM sync_state WHERE scope = ?", (scope,)).fetchone()
+        return datetime.fromisoformat(row["synced_at"]) if row else None
+
+    def is_fresh(self, scope: str, max_staleness: Optional[float] = None) -> bool:
+        """
+        Whether a scope was synced within the allowed staleness.
+
+        Args:
+            scope: Sync scope
+            max_staleness: Maximum age in seconds (defaults to JIRA_MIRROR_MAX_STALENESS)
+        """
+        if max_staleness is None:
+            max_staleness = get_settings().agent.jira_mirror_max_staleness
+        synced_at = self.synced_at(scope)
+        if synced_at is None:
+            return False
+        return (datetime.now() - synced_at).total_seconds() <= max_staleness
+
+    def mark_synced(self, scope: str, started: datetime, issues: int = 0) -> None:
+        """Record a completed sync of a scope that started at the given time."""
+        with self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO sync_state (scope, synced_at, issues) VALUES (?, ?, ?)",
+                (scope, started.isoformat(timespec="seconds"), issues),
+            )
+
+    # Writes
+
+    def _stored_updated(self, keys: List[str]) -> Dict[str, str]:
+        known = {}
+        for start in range(0, len(keys), _KEY_CHUNK):
+            chunk = keys[start:start + _KEY_CHUNK]
+            placeholders = ", ".join("?" for _ in chunk)
+            known.update(
+                (row["issue_key"], row["updated"])
+                for row in self.conn.execute(
+                    f"SELECT issue_key, updated FROM issues WHERE issue_key IN ({placeholders})", chunk
+                )
+            )
+        return known
+
+    def changed_keys(self, issues: Iterable[Dict[str, Any]]) -> List[str]:
+        """Keys of issues whose "updated" differs from (or is missing in) the mirror."""
+        updated = {
+            issue["key"]: (issue.get("fields") or {}).get("updated") or ""
+            for issue in issues if issue.get("key")
+        }
+        known = self._stored_updated(list(updated))
+        return [key for key, value in updated.items() if not value or known.get(key) != value]
+
+    def upsert(self, issues: Iterable[Dict[str, Any]]) -> int:
+        """
+        Store issues with their links and changelogs.
+
+        Issues whose "updated" timestamp matches the mirror are skipped.
+
+        Args:
+            issues: Issues in the REST API shape, fetched with mirror_fields()
+                and expand=changelog
+
+        Returns:
+            Number of issues written
+        """
+        issues = {issue["key"]: issue for issue in issues if issue.get("key")}
+        changed = [issues[key] for key in self.changed_keys(issues.values())]
+        if not changed:
+            return 0
+
+        team_field = get_settings().atlassian.field_team_assignment
+        rows, links, histories = [], [], []
+        for issue in changed:
+            key = issue["key"]
+            fields = dict(issue.get("fields") or {})
+            issue_links = fields.pop("issuelinks", None) or []
+            project = (fields.get("project") or {}).get("key") or key.split("-")[0]
+            rows.append((
+                key,
+                project.upper(),
+                fields.get("summary"),
+                _name(fields.get("status")),
+                _name(fields.get("assignee")),
+                _name(fields.get(team_field)),
+                _points(fields.get(STORY_POINTS_FIELD)),
+                fields.get("duedate"),
+                fields.get("created"),
+                fields.get("updated"),
+                json.dumps(fields),
+            ))
+            for link in issue_links:
+                for direction, side in (("outward", "outwardIssue"), ("inward", "inwardIssue")):
+                    if (link.get(side) or {}).get("key"):
+                        links.append((
+                            key, direction, link[side]["key"],
+                            (link.get("type") or {}).get("name", ""), link.get("id"),
+                        ))
+            for history in (issue.get("changelog") or {}).get("histories", []):
+                for seq, item in enumerate(history.get("items", [])):
+                    histories.append((
+                        key,
+                        str(history.get("id", "")),
+                        seq,
+                        history.get("created", ""),
+                        _name(history.get("author")),
+                        item.get("field"),
+                        item.get("fieldId"),
+                        item.get("fromString"),
+                        item.get("toString"),
+                    ))
+
+        keys = [row[0] for row in rows]
+        with self.conn:
+            for start in range(0, len(keys), _KEY_CHUNK):
+                chunk = keys[start:start + _KEY_CHUNK]
+                placeholders = ", ".join("?" for _ in chunk)
+                self.conn.execute(f"DELETE FROM issue_links WHERE issue_key IN ({placeholders})", chunk)
+                self.conn.execute(f"DELETE FROM changelog WHERE issue_key IN ({placeholders})", chunk)
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO issues (issue_key, project, summary, status, assignee, team, "
+                "story_points, duedate, created, updated, fields) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO issue_links (issue_key, direction, other_key, link_type, link_id) "
+                "VALUES (?, ?, ?, ?, ?)",
+                links,
+            )
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO changelog (issue_key, history_id, seq, created, author, field, "
+                "field_id, from_string, to_string) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                histories,
+            )
+        return len(rows)
+
+    def remove(self, keys: List[str]) -> int:
+        """Drop issues (and their links, changelogs and sprint membership) from the mirror."""
+        removed = 0
+        with self.conn:
+            for start in range(0, len(keys), _KEY_CHUNK):
+                chunk = keys[start:start + _KEY_CHUNK]
+                placeholders = ", ".join("?" for _ in chunk)
+                for table in ("issue_links", "changelog", "sprint_issues"):
+                    self.conn.execute(f"DELETE FROM {table} WHERE issue_key IN ({placeholders})", chunk)
+                removed += self.conn.execute(
+                    f"DELETE FROM issues WHERE issue_key IN ({placeholders})", chunk
+                ).rowcount
+        return removed
+
+    def store_sprint(self, sprint: Dict[str, Any], board_id: Optional[int] = None) -> None:
+        """Store a sprint as returned by the Agile API."""
+        board_id = board_id if board_id is not None else sprint.get("originBoardId")
+        with self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO sprints (sprint_id, board_id, state, data) VALUES (?, ?, ?, ?)",
+                (int(sprint["id"]), board_id, sprint.get("state"), json.dumps(sprint)),
+            )
+
+    def set_sprint_issues(self, sprint_id: int, keys: List[str]) -> None:
+        """Replace a sprint's membership."""
+        with self.conn:
+            self.conn.execute("DELETE FROM sprint_issues WHERE sprint_id = ?", (sprint_id,))
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO sprint_issues (sprint_id, issue_key) VALUES (?, ?)",
+                ((sprint_id, key) for key in keys),
+            )
+
+    # Reads
+
+    def _rebuild(self, rows: List[sqlite3.Row]) -> List[Dict[str, Any]]:
+        """Turn stored rows back into REST-shaped issues with links and changelogs."""
+        issues = {
+            row["issue_key"]: {"key": row["issue_key"], "fields": json.loads(row["fields"])} for row in rows
+        }
+        for issue in issues.values():
+            issue["fields"]["issuelinks"] = []
+            issue["changelog"] = {"histories": []}
+        keys = list(issues)
+        for start in range(0, len(keys), _KEY_CHUNK):
+            chunk = keys[start:start + _KEY_CHUNK]
+            placeholders = ", ".join("?" for _ in chunk)
+            for link in self.conn.execute(
+                f"SELECT * FROM issue_links WHERE issue_key IN ({placeholders})", chunk
+            ):
+                side = "outwardIssue" if link["direction"] == "outward" else "inwardIssue"
+                issues[link["issue_key"]]["fields"]["issuelinks"].append({
+                    "id": link["link_id"],
+                    "type": {"name": link["link_type"]},
+                    side: {"key": link["other_key"]},
+                })
+            current: Dict[tuple, Dict[str, Any]] = {}
+            for item in self.conn.execute(
+                f"SELECT * FROM changelog WHERE issue_key IN ({placeholders}) "
+                "ORDER BY issue_key, created, history_id, seq",
+                chunk,
+            ):
+                history_key = (item["issue_key"], item["history_id"])
+                history = current.get(history_key)
+                if history is None:
+                    history = current[history_key] = {
+                        "id": item["history_id"],
+                        "created": item["created"],
+                        "author": {"displayName": item["author"]} if item["author"] else None,
+                        "items": [],
+                    }
+                    issues[item["issue_key"]]["changelog"]["histories"].append(history)
+                history["items"].append({
+                    "field": item["field"],
+                    "fieldId": item["field_id"],
+                    "fromString": item["from_string"],
+                    "toString": item["to_string"],
+                })
+        return sorted(issues.values(), key=lambda issue: _issue_key_order(issue["key"]))
+
+    def issues(
+        self,
+        project_key: Optional[str] = None,
+        sprint_id: Optional[int] = None,
+        keys: Optional[List[str]] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Read mirrored issues, filtered by project, sprint and/or keys.
+
+        Returns:
+            Issues in the REST API shape, with issuelinks and changelog
+        """
+        clauses, params = [], []
+        if project_key:
+            clauses.append("project = ?")
+            params.append(project_key.upper())
+        if sprint_id is not None:
+            clauses.append("issue_key IN (SELECT issue_key FROM sprint_issues WHERE sprint_id = ?)")
+            params.append(int(sprint_id))
+        if keys is not None:
+            wanted = set(keys)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        rows = [
+            row for row in self.conn.execute(f"SELECT issue_key, fields FROM issues {where}", params)
+            if keys is None or row["issue_key"] in wanted
+        ]
+        return self._rebuild(rows)
+
+    def links(self, issue_key: str) -> List[Dict[str, Any]]:
+        """Links from and to an issue: (direction, other_key, link_type) dicts."""
+        outgoing = [
+            dict(row) for row in self.conn.execute(
+                "SELECT direction, other_key, link_type FROM issue_links WHERE issue_key = ?", (issue_key,)
+            )
+        ]
+        # Links stored on the other issue only (e.g. the other side was synced alone)
+        incoming = [
+            {
+                "direction": "inward" if row["direction"] == "outward" else "outward",
+                "other_key": row["issue_key"],
+                "link_type": row["link_type"],
+            }
+            for row in self.conn.execute(
+                "SELECT issue_key, direction, link_type FROM issue_links WHERE other_key = ?", (issue_key,)
+            )
+        ]
+        seen = {(link["direction"], link["other_key"], link["link_type"]) for link in outgoing}
+        return outgoing + [
+            link for link in incoming
+            if (link["direction"], link["other_key"], link["link_type"]) not in seen
+        ]
+
+    def sprint(self, sprint_id: int) -> Optional[Dict[str, Any]]:
+        """A mirrored sprint, or None."""
+        row = self.conn.execute("SELECT data FROM sprints WHERE sprint_id = ?", (int(sprint_id),)).fetchone()
+        return json.loads(row["data"]) if row else None
+
+    def active_sprint(self, board_id: int) -> Optional[Dict[str, Any]]:
+        """A board's mirrored active sprint, or None."""
+        row = self.conn.execute(
+            "SELECT data FROM sprints WHERE board_id = ? AND state = 'active' ORDER BY sprint_id DESC",
+            (board_id,),
+        ).fetchone()
+        return json.loads(row["data"]) if row else None
+
+    # Sync from JIRA
+
+    async def sync_project(self, client: Any, project_key: str, full: bool = False) -> Dict[str, Any]:
+        """
+        Fetch a project's issues updated since its last sync.
+
+        Args:
+            client: AsyncJiraClient
+            project_key: Project to sync
+            full: Fetch every issue and drop mirrored issues no longer in JIRA
+
+        Returns:
+            fetched and changed issue counts and the project's mirrored total
+        """
+        from .tools.jira_tools import search_all
+
+        project_key = project_key.upper()
+        scope = f"project:{project_key}"
+        started = datetime.now()
+        last_sync = None if full else self.synced_at(scope)
+        jql = f"project = {project_key}"
+        if last_sync is not None:
+            since = last_sync - _SYNC_OVERLAP
+            jql += f' AND updated >= "{since.strftime("%Y-%m-%d %H:%M")}"'
+        issues = await search_all(client, jql, fields=mirror_fields(), expand=["changelog"])
+        changed = self.upsert(issues)
+
+        removed = 0
+        if full:
+            fetched = {issue["key"] for issue in issues}
+            stale = [
+                row["issue_key"]
+                for row in self.conn.execute("SELECT issue_key FROM issues WHERE project = ?", (project_key,))
+                if row["issue_key"] not in fetched
+            ]
+            removed = self.remove(stale)
+
+        total = self.count(project_key)
+        self.mark_synced(scope, started, total)
+        return {
+            "scope": scope,
+            "fetched": len(issues),
+            "changed": changed,
+            "removed": removed,
+            "issues": total,
+        }
+
+    async def sync_sprint(self, client: Any, sprint_id: int) -> Dict[str, Any]:
+        """
+        Refresh a sprint's membership, then refetch only its changed issues.
+
+        Args:
+            client: AsyncJiraClient
+            sprint_id: Sprint to sync
+
+        Returns:
+            fetched (membership) and changed issue counts
+        """
+        from .tools.jira_tools import search_all
+
+        started = datetime.now()
+        members = await search_all(client, f"sprint = {sprint_id}", fields=["updated"])
+        stale = self.changed_keys(members)
+        issues = await client.get_issues_bulk(stale, fields=mirror_fields(), expand=["changelog"])
+        changed = self.upsert(issues.values())
+        self.set_sprint_issues(sprint_id, [issue["key"] for issue in members])
+        self.mark_synced(f"sprint:{sprint_id}", started, len(members))
+        return {
+            "scope": f"sprint:{sprint_id}",
+            "fetched": len(members),
+            "changed": changed,
+            "issues": len(members),
+        }
+
+    async def sync_board(self, client: Any, board_id: int) -> Dict[str, Any]:
+        """Refresh a board's active sprint and that sprint's issues."""
+        started = datetime.now()
+        sprint = await client.get_active_sprint(board_id)
+        self.store_sprint(sprint, board_id)
+        self.mark_synced(f"board:{board_id}", started)
+        result = await self.sync_sprint(client, sprint["id"])
+        return {**result, "scope": f"board:{board_id}", "sprint_id": sprint["id"]}
+
+    # Read-through access for analyses
+
+    async def get_active_sprint(
+        self, client: Any, board_id: int, max_staleness: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """A board's active sprint, from the mirror when fresh enough."""
+        sprint = self.active_sprint(board_id)
+        if sprint is not None and self.is_fresh(f"board:{board_id}", max_staleness):
+            return sprint
+        started = datetime.now()
+        sprint = await client.get_active_sprint(board_id)
+        self.store_sprint(sprint, board_id)
+        self.mark_synced(f"board:{board_id}", started)
+        return sprint
+
+    async def get_sprint(
+        self, client: Any, sprint_id: int, max_staleness: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """A sprint, from the mirror when its issues are fresh enough."""
+        sprint = self.sprint(sprint_id)
+        if sprint is not None and self.is_fresh(f"sprint:{sprint_id}", max_staleness):
+            return sprint
+        sprint = await client.get_sprint(sprint_id)
+        self.store_sprint(sprint)
+        return sprint
+
+    async def sprint_issues(
+        self, client: Any, sprint_id: int, max_staleness: Optional[float] = None
+    ) -> List[Dict[str, Any]]:
+        """A sprint's issues, synced first only if the mirror is staler than allowed."""
+        if not self.is_fresh(f"sprint:{sprint_id}", max_staleness):
+            await self.sync_sprint(client, sprint_id)
+        return self.issues(sprint_id=sprint_id)
+
+    # Introspection
+
+    def count(self, project_key: Optional[str] = None) -> int:
+        """Number of mirrored issues, optionally for one project."""
+        if project_key:
+            return self.conn.execute(
+                "SELECT COUNT(*) FROM issues WHERE project = ?", (project_key.upper(),)
+            ).fetchone()[0]
+        return self.conn.execute("SELECT COUNT(*) FROM issues").fetchone()[0]
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Summarize the mirror.
+
+        Returns:
+            issue, link and changelog counts, issues by project and every
+            scope's last sync time and age in seconds
+        """
+        def count(table: str) -> int:
+            return self.conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+
+        now = datetime.now()
+        return {
+            "issues": count("issues"),
+            "links": count("issue_links"),
+            "changelog_items": count("changelog"),
+            "by_project": {
+                row["project"]: row["count"]
+                for row in self.conn.execute(
+                    "SELECT project, COUNT(*) AS count FROM issues GROUP BY project ORDER BY project"
+                )
+            },
+            "scopes": {
+                row["scope"]: {
+                    "synced_at": row["synced_at"],
+                    "age_seconds": int((now - datetime.fromisoformat(row["synced_at"])).total_seconds()),
+                    "issues": row["issues"],
+                }
+                for row in self.conn.execute("SELECT * FROM sync_state ORDER BY scope")
+            },
+        }
+
+
+def open_jira_mirror(required: bool = False) -> Optional[JiraMirror]:
+    """
+    Open the mirror when analyses should read from it.
+
+    Args:
+        required: Open it even if JIRA_MIRROR_ENABLED is false (e.g. a
+            caller declared a maximum staleness)
+
+    Returns:
+        The mirror, or None if it is disabled or cannot be opened
+    """
+    if not (required or get_settings().agent.jira_mirror_enabled):
+        return None
+    try:
+        return JiraMirror()
+    except Exception as e:
+        logger.warning(f"JIRA mirror unavailable: {e}")
+        return None
+
+
+async def sync_mirror(
+    projects: Iterable[str] = (),
+    boards: Iterable[int] = (),
+    sprints: Iterable[int] = (),
+    full: bool = False,
+    client: Any = None,
+    mirror: Optional[JiraMirror] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Sync projects, boards' active sprints and sprints into the mirror concurrently.
+
+    Args:
+        projects: Project keys
+        boards: Board IDs
+        sprints: Sprint IDs
+        full: Fully resync projects (drops issues deleted in JIRA)
+        client: AsyncJiraClient (created and closed here if omitted)
+        mirror: Mirror to write to (the default mirror if omitted)
+
+    Returns:
+        One result per scope (see sync_project/sync_board/sync_sprint)
+    """
+    from .tools.jira_tools import AsyncJiraClient
+
+    owns_client, owns_mirror = client is None, mirror is None
+    client = client or AsyncJiraClient()
+    mirror = mirror or JiraMirror()
+    try:
+        return list(await asyncio.gather(
+            *(mirror.sync_project(client, project, full=full) for project in projects),
+            *(mirror.sync_board(client, int(board)) for board in boards),
+            *(mirror.sync_sprint(client, int(sprint)) for sprint in sprints),
+        ))
+    finally:
+        if owns_client:
+            await client.close()
+        if owns_mirror:
+            mirror.close()
+
+
+async def mirrored_project_issues(
+    project_key: str, max_staleness: Optional[float] = None
+) -> List[Dict[str, Any]]:
+    """
+    A project's issues from the mirror, syncing it first if it is too stale.
+
+    Args:
+        project_key: Project to read
+        max_staleness: Maximum age in seconds (defaults to JIRA_MIRROR_MAX_STALENESS)
+
+    Returns:
+        Issues in the REST API shape
+
+    Raises:
+        ValueError: If the project is stale and JIRA credentials are missing
+    """
+    with JiraMirror() as mirror:
+        if not mirror.is_fresh(f"project:{project_key.upper()}", max_staleness):
+            await sync_mirror(projects=[project_key], mirror=mirror)
+        return mirror.issues(project_key=project_key)
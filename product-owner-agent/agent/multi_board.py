@@ -0,0 +1,337 @@
+"""Multi-board sprint report fan-out sharing one fetch per sprint."""
+
+import asyncio
+import logging
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from .burndown import sprint_burndown
+from .config import get_settings
+from .field_profiles import field_profile
+from .jira_mirror import open_jira_mirror
+from .results import SprintReportResult
+from .tools.reporting import (
+    build_sprint_report_prompt,
+    build_sprint_result,
+    calculate_sprint_metrics,
+)
+
+logger = logging.getLogger(__name__)
+
+NARRATIVE_PREAMBLE = (
+    "The sprint data below has already been fetched from JIRA. "
+    "Do not call any tools; write the report directly from this data.\n\n"
+)
+
+
+def load_multi_board_summary_prompt() -> str:
+    """Load the combined summary prompt template."""
+    prompt_path = Path(__file__).parent.parent / "prompts" / "multi_board_summary.txt"
+    with open(prompt_path, "r") as f:
+        return f.read()
+
+
+@dataclass
+class BoardSpec:
+    """A board to report on and the team name to use for it."""
+
+    board_id: int
+    team_name: str = "Team"
+
+    @classmethod
+    def parse(cls, value: str) -> "BoardSpec":
+        """
+        Parse "42" or "42:Alpha Team" into a board spec.
+
+        Args:
+            value: Board ID, optionally followed by ":<team name>"
+
+        Returns:
+            Parsed board spec
+
+        Raises:
+            ValueError: If the board ID is not an integer
+        """
+        board, _, team = value.partition(":")
+        return cls(board_id=int(board.strip()), team_name=team.strip() or f"Board {board.strip()}")
+
+
+@dataclass
+class BoardReport:
+    """Outcome of one board's report in a fan-out run."""
+
+    board: BoardSpec
+    sprint: Dict[str, Any] = field(default_factory=dict)
+    metrics: Dict[str, Any] = field(default_factory=dict)
+    result: Optional[SprintReportResult] = None
+    report: str = ""
+    error: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return a JSON-serializable view of the board report."""
+        return {
+            "board_id": self.board.board_id,
+            "team_name": self.board.team_name,
+            "sprint": {key: self.sprint.get(key) for key in ("id", "name", "startDate", "endDate")}
+            if self.sprint else None,
+            "result": self.result.model_dump(mode="json") if self.result else None,
+            "report": self.report,
+            "error": self.error,
+        }
+
+
+@dataclass
+class MultiBoardResult:
+    """All per-board reports plus the combined summary."""
+
+    reports: List[BoardReport]
+    summary: str = ""
+    stats: Dict[str, Any] = field(default_factory=dict)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return a JSON-serializable view of the whole run."""
+        return {
+            "reports": [board_report.to_dict() for board_report in self.reports],
+            "summary": self.summary,
+            "stats": self.stats,
+        }
+
+
+class MultiBoardReporter:
+    """
+    Generate sprint reports for many boards in one run.
+
+    Active sprints are resolved for every board, then each distinct sprint
+    is fetched with a single JQL query and its metrics computed once, no
+    matter how many boards share it. Narratives are generated concurrently
+    under a concurrency limit and rolled up into one combined summary.
+    """
+
+    def __init__(
+        self,
+        agent: Any,
+        client: Any = None,
+        concurrency: Optional[int] = None,
+        mirror: Any = None,
+        max_staleness: Optional[float] = None,
+    ):
+        """
+        Initialize the reporter.
+
+        Args:
+            agent: ProductOwnerAgent used for narrative generation
+            client: Async JIRA REST client (an AsyncJiraClient is created, and
+                closed after each run, if omitted)
+            concurrency: Maximum narratives generated at once (defaults to REPORT_CONCURRENCY)
+            mirror: JiraMirror to read sprints from (the default mirror is
+                opened per run when JIRA_MIRROR_ENABLED or max_staleness is set)
+            max_staleness: Seconds mirrored data may be old before it is
+                resynced (defaults to JIRA_MIRROR_MAX_STALENESS)
+        """
+        self.agent = agent
+        self._owns_client = client is None
+        if client is None:
+            from .tools.jira_tools import AsyncJiraClient
+
+            client = AsyncJiraClient()
+        self.client = client
+        self.concurrency = concurrency or get_settings().agent.report_concurrency
+        self.mirror = mirror
+        self.max_staleness = max_staleness
+        self._issues_by_sprint: Dict[int, Any] = {}
+        self._burndown_by_sprint: Dict[int, str] = {}
+        self._stats: Dict[str, Any] = {}
+
+    async def _resolve_sprints(self, boards: List[BoardSpec], mirror: Any) -> Dict[int, Dict[str, Any]]:
+        """Look up the active sprint of every distinct board concurrently."""
+        board_ids = list(dict.fromkeys(board.board_id for board in boards))
+        results = await asyncio.gather(
+            *(
+                mirror.get_active_sprint(self.client, board_id, self.max_staleness)
+                if mirror is not None
+                else self.client.get_active_sprint(board_id)
+                for board_id in board_ids
+            ),
+            return_exceptions=True,
+        )
+        return dict(zip(board_ids, results))
+
+    async def _fetch_sprint_issues(self, sprint_ids: List[int], mirror: Any) -> Dict[int, Any]:
+        """Fetch each distinct sprint's issues, every page, one query per sprint."""
+        from .tools.jira_tools import search_all
+
+        fields = field_profile("sprint-report")
+        results = await asyncio.gather(
+            *(
+                mirror.sprint_issues(self.client, sprint_id, self.max_staleness)
+                if mirror is not None
+                else search_all(
+                    self.client,
+                    f"sprint = {sprint_id}",
+                    fields=fields,
+                    expand=["changelog"],
+                )
+                for sprint_id in sprint_ids
+            ),
+            return_exceptions=True,
+        )
+        return dict(zip(sprint_ids, results))
+
+    async def collect(self, boards: List[BoardSpec]) -> List[BoardReport]:
+        """
+        Fetch sprint data and compute metrics for every board.
+
+        Args:
+            boards: Boards to report on
+
+        Returns:
+            One BoardReport per board, with sprint, metrics or error filled in
+        """
+        mirror = self.mirror or open_jira_mirror(required=self.max_staleness is not None)
+        flights = getattr(self.client, "flights", None)
+        coalesced_before = flights.deduplicated if flights is not None else 0
+        try:
+            sprints = await self._resolve_sprints(boards, mirror)
+            distinct_sprints = list(dict.fromkeys(
+                sprint["id"] for sprint in sprints.values() if not isinstance(sprint, Exception)
+            ))
+            issues_by_sprint = await self._fetch_sprint_issues(distinct_sprints, mirror)
+        finally:
+            if self._owns_client:
+                await self.client.close()
+            if mirror is not None and mirror is not self.mirror:
+                mirror.close()
+
+        metrics_by_sprint = {
+            sprint_id: calculate_sprint_metrics(issues)
+            for sprint_id, issues in issues_by_sprint.items()
+            if not isinstance(issues, Exception)
+        }
+        sprint_info = {
+            sprint["id"]: sprint for sprint in sprints.values() if not isinstance(sprint, Exception)
+        }
+        burndown_by_sprint = {
+            sprint_id: sprint_burndown(
+                str(sprint_id),
+                sprint_info[sprint_id].get("startDate", ""),
+                sprint_info[sprint_id].get("endDate", ""),
+                issues,
+            )
+            for sprint_id, issues in issues_by_sprint.items()
+            if not isinstance(issues, Exception)
+        }
+
+        reports = []
+        for board in boards:
+            sprint = sprints[board.board_id]
+            if isinstance(sprint, Exception):
+                reports.append(BoardReport(board=board, error=str(sprint)))
+                continue
+            issues = issues_by_sprint[sprint["id"]]
+            if isinstance(issues, Exception):
+                reports.append(BoardReport(board=board, sprint=sprint, error=str(issues)))
+                continue
+            metrics = metrics_by_sprint[sprint["id"]]
+            series = burndown_by_sprint[sprint["id"]][0]
+            reports.append(BoardReport(
+                board=board,
+                sprint=sprint,
+                metrics=metrics,
+                result=build_sprint_result(
+                    sprint.get("name", str(sprint["id"])),
+                    board.team_name,
+                    sprint.get("startDate", ""),
+                    sprint.get("endDate", ""),
+                    metrics,
+                    series,
+                ),
+            ))
+
+        self._issues_by_sprint = issues_by_sprint
+        self._burndown_by_sprint = {
+            sprint_id: context for sprint_id, (_series, context) in burndown_by_sprint.items()
+        }
+        self._stats = {
+            "boards": len(boards),
+            "distinct_sprints": len(distinct_sprints),
+            "issues_fetched": sum(
+                len(issues) for issues in issues_by_sprint.values()
+                if not isinstance(issues, Exception)
+            ),
+            # Fetches shared with an identical one already in flight
+            "requests_coalesced": (
+                flights.deduplicated - coalesced_before if flights is not None else 0
+            ),
+        }
+        return reports
+
+    async def _generate_narrative(self, semaphore: asyncio.Semaphore, board_report: BoardReport) -> None:
+        """Generate one board's report text under the concurrency limit."""
+        sprint = board_report.sprint
+        prompt = NARRATIVE_PREAMBLE + build_sprint_report_prompt(
+            sprint.get("name", str(sprint["id"])),
+            sprint.get("startDate", "N/A"),
+            sprint.get("endDate", "N/A"),
+            board_report.board.team_name,
+            self._issues_by_sprint[sprint["id"]],
+            metrics=board_report.metrics,
+            burndown=self._burndown_by_sprint.get(sprint["id"], "Not available"),
+        )
+        async with semaphore:
+            logger.info(f"Generating narrative for board {board_report.board.board_id}")
+            try:
+                board_report.report = await self.agent.text_query(prompt)
+            except Exception as e:
+                logger.error(f"Narrative for board {board_report.board.board_id} failed: {e}")
+                board_report.error = str(e)
+
+    def _build_summary_prompt(self, reports: List[BoardReport]) -> str:
+        """Format the combined summary prompt from per-board results."""
+        rows = ["| Board | Team | Sprint | Completion | Points (done/planned) | Blocked |",
+                "|---|---|---|---|---|---|"]
+        highlights = []
+        for board_report in reports:
+            board = board_report.board
+            if board_report.error:
+                rows.append(f"| {board.board_id} | {board.team_name} | - | error: {board_report.error} | - | - |")
+                continue
+            metrics = board_report.result.metrics
+            rows.append(
+                f"| {board.board_id} | {board.team_name} | {board_report.sprint.get('name', '')} "
+                f"| {metrics.completion_rate}% "
+                f"| {metrics.completed_story_points:g}/{metrics.total_story_points:g} "
+                f"| {metrics.blocked} |"
+            )
+            # The executive summary leads each report; that is enough for the roll-up
+            highlights.append(f"#### {board.team_name} (board {board.board_id})\n{board_report.report[:1500]}")
+
+        return load_multi_board_summary_prompt().format(
+            boards_table="\n".join(rows),
+            board_highlights="\n\n".join(highlights) or "No board reports were generated",
+        )
+
+    async def run(self, boards: List[BoardSpec]) -> MultiBoardResult:
+        """
+        Generate reports for all boards and a combined summary.
+
+        Args:
+            boards: Boards to report on
+
+        Returns:
+            Per-board reports, combined summary and fetch statistics
+        """
+        reports = await self.collect(boards)
+
+        semaphore = asyncio.Semaphore(self.concurrency)
+        await asyncio.gather(*(
+            self._generate_narrative(semaphore, board_report)
+            for board_report in reports
+            if not board_report.error
+        ))
+
+        summary = ""
+        if any(not board_report.error for board_report in reports):
+            summary = await self.agent.text_query(self._build_summary_prompt(reports))
+
+        return MultiBoardResult(reports=reports, summary=summary, stats=dict(self._stats))
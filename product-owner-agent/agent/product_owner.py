@@ -3,7 +3,8 @@
 import asyncio
 import logging
 import sys
-from typing import Any, Dict, List, Optional
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
 
 from claude_agent_sdk import (
     ClaudeAgentOptions,
@@ -13,20 +14,43 @@ from claude_agent_sdk import (
     ProcessError,
     PermissionResultAllow,
     PermissionResultDeny,
+    ResultMessage,
 )
 
+from .batch_translation import BatchTranslationResult, BatchTranslator, EpicTranslation
 from .config import get_settings
+from .delta_report import DeltaReporter
+from .field_profiles import field_profile
+from .multi_board import BoardSpec, MultiBoardReporter, MultiBoardResult
+from .results import TranslationResult, collect_results
+from .translation_cache import store_translation, translation_context
 from .tools.translation import (
     translate_epic_to_stories,
     create_stories_from_spec,
 )
-from .tools.reporting import generate_sprint_report, save_report_to_jira
+from .tools.reporting import attach_files_to_jira, generate_sprint_report, save_report_to_jira
 from .tools.dependency import analyze_dependencies, generate_gantt_chart
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
 
+# Role and output guidelines shared by tool-using and text-only sessions
+_ROLE_PROMPT = """You are a Product Owner Agent specialized in Outsystems development.
+
+Your primary responsibilities are:
+1. Translate business requirements into detailed technical specifications
+2. Generate comprehensive progress reports from JIRA and Confluence data
+3. Identify and analyze cross-team dependencies and risks
+
+Guidelines:
+- Use clear, professional language suitable for stakeholders
+- Quantify impacts and provide specific recommendations
+- Format outputs as JIRA-compatible markdown
+- Always consider the Outsystems platform context
+- Prioritize actionable insights over general observations"""
+
+
 class ProductOwnerAgent:
     """
     Product Owner Agent for Outsystems.
@@ -51,6 +75,7 @@ class ProductOwnerAgent:
                 create_stories_from_spec,
                 generate_sprint_report,
                 save_report_to_jira,
+                attach_files_to_jira,
                 analyze_dependencies,
                 generate_gantt_chart,
             ],
@@ -112,6 +137,7 @@ class ProductOwnerAgent:
                 "mcp__po_tools__create_stories_from_spec",
                 "mcp__po_tools__generate_sprint_report",
                 "mcp__po_tools__save_report_to_jira",
+                "mcp__po_tools__attach_files_to_jira",
                 "mcp__po_tools__analyze_dependencies",
                 "mcp__po_tools__generate_gantt_chart",
                 # Atlassian User & Resources
@@ -149,19 +175,7 @@ class ProductOwnerAgent:
                 "Write",
             ],
             can_use_tool=self._permission_handler,
-            system_prompt="""You are a Product Owner Agent specialized in Outsystems development.
-
-Your primary responsibilities are:
-1. Translate business requirements into detailed technical specifications
-2. Generate comprehensive progress reports from JIRA and Confluence data
-3. Identify and analyze cross-team dependencies and risks
-
-Guidelines:
-- Use clear, professional language suitable for stakeholders
-- Quantify impacts and provide specific recommendations
-- Format outputs as JIRA-compatible markdown
-- Always consider the Outsystems platform context
-- Prioritize actionable insights over general observations
+            system_prompt=_ROLE_PROMPT + """
 
 Available Atlassian MCP tools:
 - getAccessibleAtlassianResources: Get your Atlassian Cloud IDs
@@ -180,9 +194,11 @@ Available Atlassian MCP tools:
 
 Custom Product Owner tools:
 - translate_epic_to_stories: Convert business epics to technical stories
-- create_stories_from_spec: Create JIRA stories from specifications
+- create_stories_from_spec: Create all stories of a specification in one call (bulk, linked to the epic;
+  never create the stories one by one with createJiraIssue)
 - generate_sprint_report: Generate comprehensive sprint reports
 - save_report_to_jira: Save reports as JIRA attachments
+- attach_files_to_jira: Attach several files (reports, charts) to JIRA issues in one call
 - analyze_dependencies: Analyze cross-team dependencies
 - generate_gantt_chart: Create visual dependency timelines
 
@@ -214,27 +230,46 @@ then use custom tools for specialized analysis and reporting.""",
             CLINotFoundError: If Claude Code CLI is not found and ANTHROPIC_API_KEY is not set
             ProcessError: If there's an error with the Claude CLI process
         """
+        architecture_type, component_list, team_skills = translation_context(
+            architecture_type, component_list, team_skills
+        )
         prompt = f"""Translate the epic {epic_key} into detailed technical user stories.
 
 Architecture: {architecture_type}
-Existing components: {component_list or 'None specified'}
-Team skills: {team_skills or 'General development'}
+Existing components: {component_list}
+Team skills: {team_skills}
 
 Use the translate_epic_to_stories tool to fetch the epic and generate technical specifications.
+When fetching the epic, request only these fields: {', '.join(field_profile("translation"))}.
 Break down the requirements into implementable stories with clear acceptance criteria."""
 
         try:
             options = self._get_agent_options()
             result = []
-
-            async with ClaudeSDKClient(options=options) as client:
-                await client.query(prompt)
-                async for message in client.receive_response():
-                    text = self._extract_text_from_message(message)
-                    if text:
-                        result.append(text)
-
-            return "".join(result)
+            # The final answer, without narration around the tool calls
+            final = None
+
+            with collect_results() as tool_results:
+                async with ClaudeSDKClient(options=options) as client:
+                    await client.query(prompt)
+                    async for message in client.receive_response():
+                        text = self._extract_text_from_message(message)
+                        if text:
+                            result.append(text)
+                            final = text
+                        if isinstance(message, ResultMessage):
+                            final = None if message.is_error else (message.result or final)
+
+            output = "".join(result)
+            # Cache a fresh translation so the unchanged epic is served from the tool
+            # next time; sessions that touched several epics cannot be split reliably
+            fresh = [
+                tool_result for tool_result in tool_results
+                if isinstance(tool_result, TranslationResult) and not tool_result.cached
+            ]
+            if len(fresh) == 1 and final:
+                store_translation(fresh[0].cache_key, fresh[0].epic_key, final)
+            return output
         except CLINotFoundError:
             raise CLINotFoundError(
                 "Claude Code CLI not found. Please install it with:\n"
@@ -248,8 +283,57 @@ Break down the requirements into implementable stories with clear acceptance cri
                 exit_code=e.exit_code
             )
 
+    async def translate_epics(
+        self,
+        epic_keys: List[str],
+        architecture_type: str = "microservices",
+        component_list: str = "",
+        team_skills: str = "",
+        output_dir: Optional[Path] = None,
+        concurrency: Optional[int] = None,
+        on_result: Optional[Callable[[EpicTranslation], None]] = None,
+        use_cache: bool = True,
+    ) -> BatchTranslationResult:
+        """
+        Translate many epics concurrently with shared context.
+
+        All epics are fetched in bulk over the JIRA REST API (requires
+        ATLASSIAN_USER_EMAIL and ATLASSIAN_API_TOKEN) and translated under a
+        concurrency limit. Each translation is written to its own file as
+        soon as it finishes. Unchanged epics are served from the translation
+        cache.
+
+        Args:
+            epic_keys: JIRA epic keys
+            architecture_type: System architecture type shared by all epics
+            component_list: Existing components shared by all epics
+            team_skills: Team capabilities shared by all epics
+            output_dir: Directory for per-epic files (defaults to TRANSLATION_OUTPUT_DIR)
+            concurrency: Maximum translations at once (defaults to TRANSLATION_CONCURRENCY)
+            on_result: Called with each translation as soon as it finishes
+            use_cache: Serve unchanged epics from the translation cache
+
+        Returns:
+            BatchTranslationResult with per-epic outcomes and throughput/latency stats
+        """
+        translator = BatchTranslator(self, concurrency=concurrency)
+        return await translator.run(
+            epic_keys,
+            architecture_type,
+            component_list,
+            team_skills,
+            output_dir=output_dir,
+            on_result=on_result,
+            use_cache=use_cache,
+        )
+
     async def generate_report(
-        self, board_id: int, sprint_id: int = 0, team_name: str = "Team"
+        self,
+        board_id: int,
+        sprint_id: int = 0,
+        team_name: str = "Team",
+        delta: bool = False,
+        max_staleness: Optional[float] = None,
     ) -> str:
         """
         Generate a sprint progress report.
@@ -258,6 +342,11 @@ Break down the requirements into implementable stories with clear acceptance cri
             board_id: JIRA board ID
             sprint_id: Sprint ID (0 for active sprint)
             team_name: Team name
+            delta: Only regenerate sections whose inputs changed since the
+                previous report for this sprint (reads JIRA over REST, see
+                DeltaReporter)
+            max_staleness: For delta reports, read the sprint from the local
+                JIRA mirror if synced within this many seconds
 
         Returns:
             Generated report
@@ -266,12 +355,24 @@ Break down the requirements into implementable stories with clear acceptance cri
             CLINotFoundError: If Claude Code CLI is not found and ANTHROPIC_API_KEY is not set
             ProcessError: If there's an error with the Claude CLI process
         """
+        if delta:
+            reporter = DeltaReporter(self, max_staleness=max_staleness)
+            result = await reporter.run(board_id, sprint_id, team_name)
+            logger.info(
+                f"Delta report: regenerated {len(result.regenerated)} section(s), "
+                f"reused {len(result.reused)}"
+            )
+            return result.report
+
         prompt = f"""Generate a comprehensive sprint progress report.
 
 Board ID: {board_id}
 Sprint ID: {sprint_id if sprint_id > 0 else 'Active sprint'}
 Team: {team_name}
 
+When fetching the sprint's issues, request only these fields: {', '.join(field_profile("sprint-report"))}
+(with expand=changelog).
+
 Use the generate_sprint_report tool to fetch sprint data and create a detailed report including:
 - Executive summary
 - Team performance metrics
@@ -306,6 +407,33 @@ Format the report professionally for stakeholder consumption."""
                 exit_code=e.exit_code
             )
 
+    async def generate_reports(
+        self, boards: List[Any], concurrency: Optional[int] = None, max_staleness: Optional[float] = None
+    ) -> MultiBoardResult:
+        """
+        Generate sprint reports for many boards sharing one fetch per sprint.
+
+        Sprint data is read once per distinct active sprint over the JIRA REST
+        API (requires ATLASSIAN_USER_EMAIL and ATLASSIAN_API_TOKEN), then the
+        per-board narratives are generated concurrently and combined into one
+        summary.
+
+        Args:
+            boards: Board IDs, "42:Team Name" strings or BoardSpec objects
+            concurrency: Maximum narratives generated at once (defaults to REPORT_CONCURRENCY)
+            max_staleness: Read sprints from the local JIRA mirror if synced
+                within this many seconds
+
+        Returns:
+            MultiBoardResult with per-board reports and the combined summary
+        """
+        specs = [
+            board if isinstance(board, BoardSpec) else BoardSpec.parse(str(board))
+            for board in boards
+        ]
+        reporter = MultiBoardReporter(self, concurrency=concurrency, max_staleness=max_staleness)
+        return await reporter.run(specs)
+
     async def analyze_risks(
         self, jql_query: str, initiative_name: str, target_date: str
     ) -> str:
@@ -329,6 +457,8 @@ Format the report professionally for stakeholder consumption."""
 JQL Query: {jql_query}
 Target Date: {target_date}
 
+When searching for the issues, request only these fields: {', '.join(field_profile("dependency"))}.
+
 Use the analyze_dependencies tool to:
 1. Map all cross-team dependencies
 2. Identify the critical path
@@ -336,7 +466,8 @@ Use the analyze_dependencies tool to:
 4. Calculate timeline risks
 5. Provide mitigation recommendations
 
-Then use generate_gantt_chart to create a visual timeline.
+Then use generate_gantt_chart to create a visual timeline. It reads only these fields, so pass
+the issues through with just: {', '.join(field_profile("gantt"))}.
 
 Provide a comprehensive risk assessment with actionable recommendations."""
 
@@ -511,12 +642,47 @@ You can also ask questions in natural language."""
             print("Try setting ANTHROPIC_API_KEY environment variable to use the API directly.")
             raise
 
-    async def one_shot_query(self, prompt: str) -> str:
+    def _get_text_options(self) -> ClaudeAgentOptions:
+        """
+        Get options for a text-only session: no MCP servers and no tools.
+
+        Returns:
+            ClaudeAgentOptions for a single tool-less turn
+        """
+        return ClaudeAgentOptions(
+            tools=[],
+            mcp_servers={},
+            strict_mcp_config=True,
+            max_turns=1,
+            system_prompt=_ROLE_PROMPT,
+        )
+
+    async def text_query(self, prompt: str) -> str:
+        """
+        Answer a prompt that carries all its data, without starting any tools.
+
+        Skips the Atlassian MCP server and the custom tools server, so narratives
+        over already-fetched data start faster and cannot make tool calls.
+
+        Args:
+            prompt: Query prompt
+
+        Returns:
+            Agent response
+
+        Raises:
+            CLINotFoundError: If Claude Code CLI is not found and ANTHROPIC_API_KEY is not set
+            ProcessError: If there's an error with the Claude CLI process
+        """
+        return await self.one_shot_query(prompt, options=self._get_text_options())
+
+    async def one_shot_query(self, prompt: str, options: Optional[ClaudeAgentOptions] = None) -> str:
         """
         Execute a single query without maintaining session.
 
         Args:
             prompt: Query prompt
+            options: Session options (defaults to the full tool configuration)
 
         Returns:
             Agent response
@@ -526,7 +692,7 @@ You can also ask questions in natural language."""
             ProcessError: If there's an error with the Claude CLI process
         """
         try:
-            options = self._get_agent_options()
+            options = options or self._get_agent_options()
             result = []
 
             async with ClaudeSDKClient(options=options) as client:
@@ -0,0 +1,357 @@
+"""Retry, client-side rate limiting and circuit breaking for the Atlassian REST clients."""
+
+import logging
+import random
+import re
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Dict, Optional
+
+from .config import get_settings
+
+logger = logging.getLogger(__name__)
+
+# Requests that may be sent again after a server error or a lost response;
+# anything is retried after a 429, which JIRA answers before doing any work
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "PUT", "DELETE"})
+
+_RETRYABLE_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+# Path segments that identify one resource ("PROJ-12", "42"), folded so all
+# issues or sprints share one circuit breaker per endpoint (the API version
+# after "/api/" is kept)
+_RESOURCE_ID = re.compile(r"^(\d+|[A-Z][A-Z0-9_]*-\d+)$")
+
+
+class JiraAPIError(Exception):
+    """
+    A failed JIRA or Confluence request.
+
+    Attributes:
+        status: HTTP status, or None if no response arrived
+        retry_after: Seconds the server asked to wait (Retry-After), if any
+    """
+
+    def __init__(self, message: str, status: Optional[int] = None, retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.status = status
+        self.retry_after = retry_after
+
+
+class CircuitOpenError(JiraAPIError):
+    """Raised without a request while an endpoint's circuit breaker is open."""
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a Retry-After header (delay in seconds or an HTTP date).
+
+    Args:
+        value: Header value
+
+    Returns:
+        Seconds to wait (never negative), or None if absent or unparseable
+    """
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+def endpoint_key(method: str, endpoint: str) -> str:
+    """
+    Name the endpoint a request goes to, with resource IDs folded.
+
+    Args:
+        method: HTTP method
+        endpoint: Request path, e.g. "/rest/api/2/issue/PROJ-12"
+
+    Returns:
+        e.g. "GET /rest/api/2/issue/{id}"
+    """
+    parts = endpoint.split("/")
+    folded = [
+        "{id}" if _RESOURCE_ID.match(part) and previous != "api" else part
+        for previous, part in zip([""] + parts, parts)
+    ]
+    return f"{method} {'/'.join(folded)}"
+
+
+class TokenBucket:
+    """
+    Client-side rate limiter shared by every task and thread using a site.
+
+    Callers reserve a token and sleep until it is theirs, so concurrent
+    callers are spread at `rate` per second after an initial `burst`. A
+    429 pauses the whole bucket until the server's Retry-After has passed,
+    instead of letting every in-flight task rediscover the limit.
+    """
+
+    def __init__(self, rate: float, burst: int):
+        """
+        Args:
+            rate: Requests per second (0 for no limit besides pauses)
+            burst: Requests allowed at once after an idle period
+        """
+        self.rate = rate
+        self.burst = max(1, burst)
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """
+        Take a token.
+
+        Returns:
+            Seconds to wait before sending the request
+        """
+        with self._lock:
+            now = time.monotonic()
+            delay = max(0.0, self._paused_until - now)
+            if self.rate <= 0:
+                return delay
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            if self._tokens < 0:
+                delay = max(delay, -self._tokens / self.rate)
+            return delay
+
+    def pause(self, seconds: float) -> None:
+        """Hold back every caller for the next `seconds`."""
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+
+class CircuitBreaker:
+    """
+    Stops calling an endpoint that keeps failing.
+
+    After `failure_threshold` consecutive failures (server errors, timeouts,
+    lost connections) the circuit opens and requests fail immediately with
+    CircuitOpenError. After `reset_seconds` one probe request is let
+    through: success closes the circuit, failure opens it again, and a
+    probe that proves nothing (throttled or abandoned) frees the slot for
+    the next request.
+    """
+
+    def __init__(self, failure_threshold: int, reset_seconds: float):
+        self.failure_threshold = failure_threshold
+        self.reset_seconds = reset_seconds
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self._probing = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        """"closed", "open" or "half-open"."""
+        if self.opened_at is None:
+            return "closed"
+        if self._probing or time.monotonic() - self.opened_at >= self.reset_seconds:
+            return "half-open"
+        return "open"
+
+    def allow(self) -> bool:
+        """Whether a request may be sent now (claims the probe when half-open)."""
+        with self._lock:
+            if self.opened_at is None:
+                return True
+            if self._probing or time.monotonic() - self.opened_at < self.reset_seconds:
+                return False
+            self._probing = True
+            return True
+
+    def record_success(self) -> None:
+        """Close the circuit."""
+        with self._lock:
+            self.failures = 0
+            self.opened_at = None
+            self._probing = False
+
+    def record_failure(self) -> None:
+        """Count a failure, opening the circuit at the threshold or on a failed probe."""
+        with self._lock:
+            self.failures += 1
+            if self._probing or self.failures >= self.failure_threshold:
+                self.opened_at = time.monotonic()
+            self._probing = False
+
+    def release_probe(self) -> None:
+        """Let another request probe the circuit, leaving its state unchanged."""
+        with self._lock:
+            self._probing = False
+
+
+class RequestGuard:
+    """
+    Retry policy, rate limiter and per-endpoint circuit breakers of one site.
+
+    The clients call before() ahead of each attempt, then succeeded() or
+    failed(), or abandoned() when the attempt ends without an answer
+    (cancelled, or an unexpected error); failed() returns how long to back
+    off before the next attempt, or None when the error should be raised.
+    """
+
+    def __init__(
+        self,
+        rate: Optional[float] = None,
+        burst: Optional[int] = None,
+        max_retries: Optional[int] = None,
+        backoff: Optional[float] = None,
+        max_backoff: Optional[float] = None,
+        failure_threshold: Optional[int] = None,
+        reset_seconds: Optional[float] = None,
+    ):
+        """
+        Args:
+            rate: Requests per second (defaults to JIRA_RATE_LIMIT, 0 for no limit)
+            burst: Token bucket size (defaults to JIRA_RATE_BURST)
+            max_retries: Retries per request (defaults to JIRA_MAX_RETRIES)
+            backoff: First backoff ceiling in seconds (defaults to JIRA_RETRY_BACKOFF)
+            max_backoff: Largest backoff ceiling (defaults to JIRA_RETRY_MAX_BACKOFF)
+            failure_threshold: Consecutive failures that open an endpoint's
+                circuit (defaults to JIRA_CIRCUIT_FAILURES)
+            reset_seconds: Time before an open circuit is probed
+                (defaults to JIRA_CIRCUIT_RESET_SECONDS)
+        """
+        settings = get_settings().atlassian
+        self.limiter = TokenBucket(
+            settings.rate_limit if rate is None else rate,
+            settings.rate_burst if burst is None else burst,
+        )
+        self.max_retries = settings.max_retries if max_retries is None else max_retries
+        self.backoff = settings.retry_backoff if backoff is None else backoff
+        self.max_backoff = settings.retry_max_backoff if max_backoff is None else max_backoff
+        self.failure_threshold = (
+            settings.circuit_failures if failure_threshold is None else failure_threshold
+        )
+        self.reset_seconds = settings.circuit_reset_seconds if reset_seconds is None else reset_seconds
+        self.breakers: Dict[str, CircuitBreaker] = {}
+        self.retries = 0
+        self.throttled = 0
+
+    def breaker(self, key: str) -> CircuitBreaker:
+        """The circuit breaker of an endpoint (see endpoint_key())."""
+        if key not in self.breakers:
+            self.breakers[key] = CircuitBreaker(self.failure_threshold, self.reset_seconds)
+        return self.breakers[key]
+
+    def before(self, key: str) -> float:
+        """
+        Admit an attempt.
+
+        Args:
+            key: Endpoint key from endpoint_key()
+
+        Returns:
+            Seconds to wait before sending it
+
+        Raises:
+            CircuitOpenError: If the endpoint's circuit is open
+        """
+        if not self.breaker(key).allow():
+            raise CircuitOpenError(
+                f"JIRA API error: circuit open for {key} after repeated failures; "
+                f"retrying after {self.reset_seconds:.0f}s"
+            )
+        return self.limiter.reserve()
+
+    def succeeded(self, key: str) -> None:
+        """Record a successful attempt."""
+        self.breaker(key).record_success()
+
+    def abandoned(self, key: str) -> None:
+        """Record an attempt that ended without a response worth counting."""
+        self.breaker(key).release_probe()
+
+    def failed(
+        self,
+        method: str,
+        key: str,
+        error: JiraAPIError,
+        attempt: int,
+        idempotent: Optional[bool] = None,
+    ) -> Optional[float]:
+        """
+        Record a failed attempt and decide whether to retry it.
+
+        Args:
+            method: HTTP method
+            key: Endpoint key from endpoint_key()
+            error: The failure (status None for timeouts and lost connections)
+            attempt: Attempts made before this one
+            idempotent: Whether the request may be sent again after a server
+                error (defaults to whether the method is idempotent)
+
+        Returns:
+            Seconds to back off before retrying, or None to give up
+        """
+        if error.status == 429:
+            # Throttling says nothing about the endpoint's health
+            self.throttled += 1
+            self.breaker(key).release_probe()
+        elif error.status is None or error.status >= 500:
+            self.breaker(key).record_failure()
+        else:
+            # A client error proves the endpoint is up
+            self.breaker(key).record_success()
+
+        if idempotent is None:
+            idempotent = method in IDEMPOTENT_METHODS
+        if attempt >= self.max_retries:
+            return None
+        if error.status == 429:
+            pass
+        elif not idempotent:
+            return None
+        elif error.status is not None and error.status not in _RETRYABLE_STATUSES:
+            return None
+        if self.breaker(key).state == "open":
+            return None
+
+        # Full jitter, unless the server said when to come back
+        ceiling = min(self.max_backoff, self.backoff * 2 ** attempt)
+        if error.retry_after is not None:
+            delay = error.retry_after + random.uniform(0, self.backoff)
+        else:
+            delay = random.uniform(0, ceiling)
+        if error.status == 429:
+            self.limiter.pause(delay)
+        self.retries += 1
+        logger.info(f"{key} failed ({error}); retry {attempt + 1}/{self.max_retries} in {delay:.2f}s")
+        return delay
+
+
+# One guard per site, so every client of a site shares its rate limit and breakers
+_guards: Dict[str, RequestGuard] = {}
+_guards_lock = threading.Lock()
+
+
+def request_guard(base_url: str) -> RequestGuard:
+    """
+    The shared guard of a site, created from settings on first use.
+
+    Args:
+        base_url: Site URL
+
+    Returns:
+        The site's RequestGuard
+    """
+    with _guards_lock:
+        if base_url not in _guards:
+            _guards[base_url] = RequestGuard()
+        return _guards[base_url]
@@ -0,0 +1,231 @@
+"""Typed, JSON-serializable results produced by the analysis tools."""
+
+import contextvars
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Literal, Optional, Union
+
+from pydantic import BaseModel, Field
+
+
+class SprintMetrics(BaseModel):
+    """Issue counts and story points for a set of sprint issues."""
+
+    total_issues: int
+    completed: int
+    in_progress: int
+    blocked: int
+    not_started: int
+    completion_rate: float
+    total_story_points: float
+    completed_story_points: float
+    velocity: float
+    blocked_keys: List[str] = Field(default_factory=list)
+
+    @classmethod
+    def from_metrics(cls, metrics: Dict[str, Any]) -> "SprintMetrics":
+        """
+        Build from the dictionary returned by calculate_sprint_metrics.
+
+        Args:
+            metrics: Raw metrics including issue lists
+
+        Returns:
+            Metrics with issue lists reduced to counts
+        """
+        return cls(
+            total_issues=metrics["total_issues"],
+            completed=len(metrics["completed"]),
+            in_progress=len(metrics["in_progress"]),
+            blocked=len(metrics["blocked"]),
+            not_started=len(metrics["not_started"]),
+            completion_rate=metrics["completion_rate"],
+            total_story_points=metrics["total_story_points"],
+            completed_story_points=metrics["completed_story_points"],
+            velocity=metrics["velocity"],
+            blocked_keys=[issue.get("key", "") for issue in metrics["blocked"]],
+        )
+
+
+class Blocker(BaseModel):
+    """An unfinished issue holding up other work."""
+
+    key: str
+    summary: str = ""
+    status: str = ""
+    assignee: str = "Unassigned"
+    team: Optional[str] = None
+    blocks_count: int = 0
+    blocked_issues: List[str] = Field(default_factory=list)
+
+
+class Forecast(BaseModel):
+    """Timeline risk of missing a target date."""
+
+    risk_level: str
+    confidence: int
+    completion_rate: float
+    days_remaining: int
+    total_points: float
+    completed_points: float
+    remaining_points: float
+
+
+class BurndownData(BaseModel):
+    """Day-indexed burndown/burnup series through the last computed day."""
+
+    start: str
+    total_days: int
+    scope: List[float]
+    completed: List[float]
+    remaining: List[float]
+    ideal_remaining: float
+    projected_remaining: float
+
+
+class SprintReportResult(BaseModel):
+    """Structured output of generate_sprint_report."""
+
+    kind: Literal["sprint_report"] = "sprint_report"
+    sprint_name: str
+    team_name: str
+    sprint_start: str = ""
+    sprint_end: str = ""
+    metrics: SprintMetrics
+    blockers: List[Blocker] = Field(default_factory=list)
+    burndown: Optional[BurndownData] = None
+
+
+class DependencyAnalysisResult(BaseModel):
+    """Structured output of analyze_dependencies."""
+
+    kind: Literal["dependency_analysis"] = "dependency_analysis"
+    initiative_name: str
+    target_date: str
+    total_issues: int
+    dependency_count: int
+    teams: List[str] = Field(default_factory=list)
+    critical_path: List[str] = Field(default_factory=list)
+    blockers: List[Blocker] = Field(default_factory=list)
+    forecast: Forecast
+
+
+class GanttChartResult(BaseModel):
+    """Structured output of generate_gantt_chart."""
+
+    kind: Literal["gantt_chart"] = "gantt_chart"
+    initiative_name: str
+    chart_path: str
+    issues_per_team: Dict[str, int] = Field(default_factory=dict)
+
+
+class TranslationResult(BaseModel):
+    """Structured output of translate_epic_to_stories."""
+
+    kind: Literal["translation"] = "translation"
+    epic_key: str
+    cache_key: str
+    cached: bool = False
+    cached_at: Optional[str] = None
+
+
+class CreatedStory(BaseModel):
+    """A story created (or found already created) from a specification."""
+
+    title: str
+    key: str
+    idempotency_label: str
+
+
+class FailedStory(BaseModel):
+    """A story JIRA rejected."""
+
+    title: str
+    error: str
+
+
+class DuplicateMatch(BaseModel):
+    """A backlog issue similar to a proposed story."""
+
+    key: str
+    summary: str
+    similarity: float
+
+
+class DuplicateStory(BaseModel):
+    """A proposed story not created because it likely duplicates backlog issues."""
+
+    title: str
+    matches: List[DuplicateMatch] = Field(default_factory=list)
+
+
+class StoryCreationResult(BaseModel):
+    """Structured output of create_stories_from_spec."""
+
+    kind: Literal["story_creation"] = "story_creation"
+    project_key: str
+    epic_key: str
+    created: List[CreatedStory] = Field(default_factory=list)
+    existing: List[CreatedStory] = Field(default_factory=list)
+    failed: List[FailedStory] = Field(default_factory=list)
+    duplicates: List[DuplicateStory] = Field(default_factory=list)
+    requests: int = 0
+
+    @property
+    def keys(self) -> List[str]:
+        """Keys of all stories now under the epic, created or pre-existing."""
+        return [story.key for story in self.created + self.existing]
+
+
+AnalysisResult = Union[
+    SprintReportResult,
+    DependencyAnalysisResult,
+    GanttChartResult,
+    TranslationResult,
+    StoryCreationResult,
+]
+
+
+# Results published by tools running in the current context (see collect_results)
+_collector: contextvars.ContextVar[Optional[List[AnalysisResult]]] = contextvars.ContextVar(
+    "analysis_result_collector", default=None
+)
+
+
+def publish_result(result: AnalysisResult) -> None:
+    """
+    Hand a tool's structured result to the enclosing collect_results() block.
+
+    Tools run in-process inside the agent session, so callers can receive the
+    typed result directly instead of parsing the model's text. Without an
+    active collector this is a no-op.
+
+    Args:
+        result: Structured tool result
+    """
+    results = _collector.get()
+    if results is not None:
+        results.append(result)
+
+
+@contextmanager
+def collect_results() -> Iterator[List[AnalysisResult]]:
+    """
+    Collect structured results published by tools within the block.
+
+    The agent session must be started inside the block so its tool calls
+    inherit the collector.
+
+    Example:
+        with collect_results() as results:
+            text = await agent.generate_report(42)
+        metrics = results[0].metrics
+
+    Yields:
+        List that fills with results as tools run
+    """
+    results: List[AnalysisResult] = []
+    token = _collector.set(results)
+    try:
+        yield results
+    finally:
+        _collector.reset(token)
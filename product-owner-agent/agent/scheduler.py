@@ -0,0 +1,520 @@
+"""Built-in scheduler daemon for recurring reports and risk analyses."""
+
+import asyncio
+import json
+import logging
+import random
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Set
+
+from .archive import archive_file
+from .config import get_settings
+from .results import SprintReportResult, collect_results
+from .single_flight import coalescing_stats
+
+logger = logging.getLogger(__name__)
+
+
+# Day-of-week accepts 7 as an alias for Sunday and is folded back to 0
+_FIELD_BOUNDS = [(0, 59), (0, 23), (1, 31), (1, 12), (0, 7)]
+_MONTH_NAMES = {
+    name: number
+    for number, name in enumerate(
+        ["jan", "feb", "mar", "apr", "may", "jun",
+         "jul", "aug", "sep", "oct", "nov", "dec"],
+        start=1,
+    )
+}
+_DAY_NAMES = {
+    name: number
+    for number, name in enumerate(["sun", "mon", "tue", "wed", "thu", "fri", "sat"])
+}
+
+# Longest gap between two matching days we search before giving up (4 years
+# covers "29 Feb" style schedules)
+_MAX_SEARCH_DAYS = 366 * 4
+
+
+def _parse_cron_field(expr: str, low: int, high: int, names: Dict[str, int]) -> Set[int]:
+    """Expand one cron field ("*/15", "1-5", "mon,wed") into its values."""
+    values: Set[int] = set()
+
+    def to_int(token: str) -> int:
+        token = token.lower()
+        return names[token] if token in names else int(token)
+
+    for part in expr.split(","):
+        step = 1
+        if "/" in part:
+            part, step_str = part.split("/", 1)
+            step = int(step_str)
+            if step <= 0:
+                raise ValueError(f"Invalid step in cron field '{expr}'")
+
+        if part == "*":
+            start, end = low, high
+        elif "-" in part:
+            start_str, end_str = part.split("-", 1)
+            start, end = to_int(start_str), to_int(end_str)
+        else:
+            start = to_int(part)
+            end = high if step > 1 else start
+
+        if start < low or end > high or start > end:
+            raise ValueError(f"Cron field '{expr}' out of range {low}-{high}")
+        values.update(range(start, end + 1, step))
+
+    return values
+
+
+class CronSchedule:
+    """
+    Standard five-field cron expression (minute hour day month weekday).
+
+    Supports "*", ranges, steps, lists and month/day names. As in cron,
+    when both day-of-month and day-of-week are restricted a day matches
+    if either field matches.
+    """
+
+    def __init__(self, expression: str):
+        """
+        Parse a cron expression.
+
+        Args:
+            expression: Cron expression, e.g. "0 9 * * 1-5"
+
+        Raises:
+            ValueError: If the expression is malformed
+        """
+        fields = expression.split()
+        if len(fields) != 5:
+            raise ValueError(
+                f"Cron expression '{expression}' must have 5 fields, got {len(fields)}"
+            )
+
+        self.expression = expression
+        names = [{}, {}, {}, _MONTH_NAMES, _DAY_NAMES]
+        parsed = [
+            _parse_cron_field(expr, low, high, field_names)
+            for expr, (low, high), field_names in zip(fields, _FIELD_BOUNDS, names)
+        ]
+        self.minutes, self.hours, self.days, self.months, weekdays = parsed
+        self.weekdays = {day % 7 for day in weekdays}
+        # As in cron, a field starting with "*" (including "*/n") does not restrict
+        self._dom_restricted = not fields[2].startswith("*")
+        self._dow_restricted = not fields[4].startswith("*")
+
+    def __repr__(self) -> str:
+        return f"CronSchedule({self.expression!r})"
+
+    def _day_matches(self, day: datetime) -> bool:
+        if day.month not in self.months:
+            return False
+        dom_match = day.day in self.days
+        # Python weekday(): Monday=0; cron: Sunday=0
+        dow_match = (day.weekday() + 1) % 7 in self.weekdays
+        if self._dom_restricted and self._dow_restricted:
+            return dom_match or dow_match
+        return dom_match and dow_match
+
+    def matches(self, moment: datetime) -> bool:
+        """Return True if the schedule fires at the given minute."""
+        return (
+            moment.minute in self.minutes
+            and moment.hour in self.hours
+            and self._day_matches(moment)
+        )
+
+    def next_after(self, moment: datetime) -> datetime:
+        """
+        Return the first fire time strictly after the given moment.
+
+        Args:
+            moment: Reference time
+
+        Returns:
+            Next matching minute
+        """
+        start = moment.replace(second=0, microsecond=0) + timedelta(minutes=1)
+        day = start.replace(hour=0, minute=0)
+        for _ in range(_MAX_SEARCH_DAYS):
+            if self._day_matches(day):
+                for hour in sorted(self.hours):
+                    for minute in sorted(self.minutes):
+                        candidate = day.replace(hour=hour, minute=minute)
+                        if candidate >= start:
+                            return candidate
+            day += timedelta(days=1)
+        raise ValueError(f"Cron expression '{self.expression}' never fires")
+
+    def previous_before(self, moment: datetime) -> Optional[datetime]:
+        """
+        Return the latest fire time at or before the given moment.
+
+        Args:
+            moment: Reference time
+
+        Returns:
+            Most recent matching minute, or None if none within the search window
+        """
+        end = moment.replace(second=0, microsecond=0)
+        day = end.replace(hour=0, minute=0)
+        for _ in range(_MAX_SEARCH_DAYS):
+            if self._day_matches(day):
+                for hour in sorted(self.hours, reverse=True):
+                    for minute in sorted(self.minutes, reverse=True):
+                        candidate = day.replace(hour=hour, minute=minute)
+                        if candidate <= end:
+                            return candidate
+            day -= timedelta(days=1)
+        return None
+
+
+@dataclass
+class ScheduledJob:
+    """A board report, initiative analysis or JIRA mirror sync run on a schedule."""
+
+    name: str
+    kind: str  # "report", "analyze" or "sync"
+    schedule: CronSchedule
+    params: Dict[str, Any] = field(default_factory=dict)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any], default_schedule: str) -> "ScheduledJob":
+        """
+        Build a job from its jobs-file entry.
+
+        Report jobs need "board_id" (optional "sprint_id", "team"); analyze
+        jobs need "jql", "initiative" and "target_date"; sync jobs need
+        "projects", "boards" and/or "sprints" to refresh in the local JIRA
+        mirror (optional "full"). Any job may set its own "schedule",
+        otherwise REPORT_GENERATION_SCHEDULE applies.
+
+        Args:
+            data: Job definition
+            default_schedule: Cron expression used when the job sets none
+
+        Returns:
+            Parsed job
+
+        Raises:
+            ValueError: If the definition is incomplete
+        """
+        data = dict(data)
+        kind = data.pop("type", "report")
+        schedule = CronSchedule(data.pop("schedule", None) or default_schedule)
+
+        if kind == "report":
+            if "board_id" not in data:
+                raise ValueError("Report jobs require 'board_id'")
+            name = data.pop("name", None) or f"report_board_{data['board_id']}"
+        elif kind == "analyze":
+            missing = [key for key in ("jql", "initiative", "target_date") if key not in data]
+            if missing:
+                raise ValueError(f"Analyze jobs require {', '.join(missing)}")
+            name = data.pop("name", None) or f"risk_{data['initiative'].replace(' ', '_')}"
+        elif kind == "sync":
+            if not any(data.get(key) for key in ("projects", "boards", "sprints")):
+                raise ValueError("Sync jobs require 'projects', 'boards' or 'sprints'")
+            name = data.pop("name", None) or "sync_jira_mirror"
+        else:
+            raise ValueError(f"Unknown job type '{kind}' (expected 'report', 'analyze' or 'sync')")
+
+        return cls(name=name, kind=kind, schedule=schedule, params=data)
+
+
+def load_jobs(jobs_file: Path, default_schedule: str) -> List[ScheduledJob]:
+    """
+    Load job definitions from a JSON file.
+
+    The file holds either a list of jobs or an object with a "jobs" list.
+
+    Args:
+        jobs_file: Path to the jobs file
+        default_schedule: Cron expression for jobs without their own
+
+    Returns:
+        Parsed jobs
+
+    Raises:
+        ValueError: If job names collide or a definition is invalid
+    """
+    with open(jobs_file, "r") as f:
+        data = json.load(f)
+    entries = data.get("jobs", []) if isinstance(data, dict) else data
+
+    jobs = [ScheduledJob.from_dict(entry, default_schedule) for entry in entries]
+    names = [job.name for job in jobs]
+    duplicates = {name for name in names if names.count(name) > 1}
+    if duplicates:
+        raise ValueError(f"Duplicate job names: {', '.join(sorted(duplicates))}")
+    return jobs
+
+
+class SchedulerState:
+    """Last-run bookkeeping persisted as JSON so restarts can catch up."""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.jobs: Dict[str, Dict[str, Any]] = {}
+        if self.path.exists():
+            try:
+                self.jobs = json.loads(self.path.read_text()).get("jobs", {})
+            except (ValueError, OSError) as e:
+                logger.warning(f"Ignoring unreadable scheduler state {self.path}: {e}")
+
+    def last_run(self, job_name: str) -> Optional[datetime]:
+        """Return the scheduled time of the job's last completed run."""
+        value = self.jobs.get(job_name, {}).get("last_scheduled")
+        return datetime.fromisoformat(value) if value else None
+
+    def record(
+        self, job_name: str, scheduled: datetime, status: str, duration: float,
+        output: Optional[str] = None, error: Optional[str] = None,
+    ) -> None:
+        """Record a finished run and flush the state file atomically."""
+        self.jobs[job_name] = {
+            "last_scheduled": scheduled.isoformat(timespec="minutes"),
+            "finished_at": datetime.now().isoformat(timespec="seconds"),
+            "status": status,
+            "duration_seconds": round(duration, 2),
+            "output": output,
+            "error": error,
+        }
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(self.path.suffix + ".tmp")
+        tmp_path.write_text(json.dumps({"jobs": self.jobs}, indent=2))
+        tmp_path.replace(self.path)
+
+
+class Scheduler:
+    """
+    Long-running daemon that fires scheduled jobs in-process.
+
+    A single ProductOwnerAgent (and its tools server) is kept warm for all
+    runs instead of cold-starting the CLI per board. Runs are spread by a
+    random per-job jitter, bounded by a concurrency limit, and a job that is
+    still running when it fires again is skipped rather than stacked.
+    """
+
+    def __init__(
+        self,
+        jobs: List[ScheduledJob],
+        agent: Any = None,
+        state_path: Optional[Path] = None,
+        max_concurrency: Optional[int] = None,
+        jitter_seconds: Optional[float] = None,
+        catch_up: Optional[bool] = None,
+        on_run: Optional[Callable[[str, Dict[str, Any]], None]] = None,
+    ):
+        """
+        Initialize the scheduler.
+
+        Args:
+            jobs: Jobs to run
+            agent: ProductOwnerAgent to reuse (created lazily if omitted)
+            state_path: Last-run state file (defaults to SCHEDULER_STATE_FILE)
+            max_concurrency: Maximum jobs running at once
+            jitter_seconds: Upper bound of the random delay before each run
+            catch_up: Run jobs whose last scheduled time was missed while stopped
+            on_run: Called with the job name and its recorded state after each run
+        """
+        settings = get_settings()
+        self.jobs = jobs
+        self._agent = agent
+        self.state = SchedulerState(state_path or settings.agent.scheduler_state_file)
+        self.max_concurrency = max_concurrency or settings.agent.scheduler_max_concurrency
+        self.jitter_seconds = (
+            settings.agent.scheduler_jitter_seconds if jitter_seconds is None else jitter_seconds
+        )
+        self.catch_up = settings.agent.scheduler_catch_up if catch_up is None else catch_up
+        self.on_run = on_run
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        self._running: Dict[str, asyncio.Task] = {}
+        self._stopping = asyncio.Event()
+
+    @property
+    def agent(self) -> Any:
+        """The shared, warm agent instance."""
+        if self._agent is None:
+            from .product_owner import ProductOwnerAgent
+
+            self._agent = ProductOwnerAgent()
+        return self._agent
+
+    def next_runs(self, now: Optional[datetime] = None) -> Dict[str, datetime]:
+        """Return each job's next fire time."""
+        now = now or datetime.now()
+        return {job.name: job.schedule.next_after(now) for job in self.jobs}
+
+    def missed_jobs(self, now: Optional[datetime] = None) -> List[tuple]:
+        """
+        Find jobs whose most recent scheduled run never completed.
+
+        Args:
+            now: Reference time
+
+        Returns:
+            (job, scheduled_time) pairs to catch up on
+        """
+        now = now or datetime.now()
+        missed = []
+        for job in self.jobs:
+            previous = job.schedule.previous_before(now)
+            last = self.state.last_run(job.name)
+            if previous is not None and last is not None and previous > last:
+                missed.append((job, previous))
+        return missed
+
+    def trigger(self, job: ScheduledJob, scheduled: datetime) -> Optional[asyncio.Task]:
+        """
+        Start a run of the job unless one is already in flight.
+
+        Args:
+            job: Job to run
+            scheduled: Scheduled fire time being served
+
+        Returns:
+            The run task, or None if the run was skipped as overlapping
+        """
+        running = self._running.get(job.name)
+        if running is not None and not running.done():
+            logger.warning(
+                f"Skipping {job.name} scheduled at {scheduled:%Y-%m-%d %H:%M}: "
+                "previous run still in progress"
+            )
+            return None
+
+        task = asyncio.create_task(self._run_job(job, scheduled))
+        self._running[job.name] = task
+        return task
+
+    async def _run_job(self, job: ScheduledJob, scheduled: datetime) -> None:
+        """Run one job with jitter under the concurrency limit and record the outcome."""
+        if self.jitter_seconds > 0:
+            await asyncio.sleep(random.uniform(0, self.jitter_seconds))
+
+        async with self._semaphore:
+            logger.info(f"Running {job.name} (scheduled {scheduled:%Y-%m-%d %H:%M})")
+            started = time.monotonic()
+            try:
+                output = await self._execute(job)
+            except Exception as e:
+                logger.error(f"Job {job.name} failed: {e}")
+                self.state.record(
+                    job.name, scheduled, "error", time.monotonic() - started, error=str(e)
+                )
+                self._notify(job)
+                return
+
+            duration = time.monotonic() - started
+            logger.info(f"Finished {job.name} in {duration:.1f}s -> {output}")
+            coalesced = coalescing_stats()
+            if coalesced["deduplicated"]:
+                logger.info(
+                    f"JIRA reads so far: {coalesced['calls']}, {coalesced['deduplicated']} "
+                    f"coalesced with an identical read in flight ({coalesced['dedup_rate']}%)"
+                )
+            self.state.record(job.name, scheduled, "ok", duration, output=str(output))
+            self._notify(job)
+
+    def _notify(self, job: ScheduledJob) -> None:
+        if self.on_run is not None:
+            self.on_run(job.name, self.state.jobs[job.name])
+
+    async def _execute(self, job: ScheduledJob) -> Path:
+        """Run the job through the shared agent and save its output."""
+        params = job.params
+        if job.kind == "sync":
+            return await self._sync(job)
+        from .tools.reporting import generate_report_summary
+
+        with collect_results() as results:
+            if job.kind == "report":
+                content = await self.agent.generate_report(
+                    int(params["board_id"]),
+                    int(params.get("sprint_id", 0)),
+                    params.get("team", "Team"),
+                )
+                metadata = {"team": params.get("team")}
+            else:
+                content = await self.agent.analyze_risks(
+                    params["jql"], params["initiative"], params["target_date"]
+                )
+                metadata = {"initiative": params["initiative"]}
+
+        for result in results:
+            if isinstance(result, SprintReportResult):
+                logger.info(f"{job.name} summary:\n{generate_report_summary(content, result)}")
+        if results:
+            metadata["payload"] = {"results": [result.model_dump(mode="json") for result in results]}
+
+        report_dir = get_settings().output.report_output_dir
+        report_dir.mkdir(parents=True, exist_ok=True)
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        file_path = report_dir / f"{job.name}_{timestamp}.md"
+        file_path.write_text(content)
+        archive_file(file_path, kind="report", title=job.name, content=content, **metadata)
+        return file_path
+
+    async def _sync(self, job: ScheduledJob) -> Path:
+        """Refresh the job's scopes in the local JIRA mirror; no agent is involved."""
+        from .jira_mirror import sync_mirror
+
+        params = job.params
+        results = await sync_mirror(
+            projects=params.get("projects", []),
+            boards=params.get("boards", []),
+            sprints=params.get("sprints", []),
+            full=bool(params.get("full", False)),
+        )
+        for result in results:
+            logger.info(f"{job.name}: {result['scope']} {result['changed']} of {result['fetched']} changed")
+        return get_settings().output.jira_mirror_db
+
+    def stop(self) -> None:
+        """Ask the run loop to exit after the current sleep."""
+        self._stopping.set()
+
+    async def run_forever(self) -> None:
+        """Fire jobs at their scheduled times until stop() is called."""
+        if not self.jobs:
+            logger.warning("No scheduled jobs configured")
+            return
+
+        if self.catch_up:
+            for job, scheduled in self.missed_jobs():
+                logger.info(f"Catching up missed run of {job.name} ({scheduled:%Y-%m-%d %H:%M})")
+                self.trigger(job, scheduled)
+
+        # Jobs never run before start counting from now instead of replaying history
+        now = datetime.now()
+        for job in self.jobs:
+            if self.state.last_run(job.name) is None:
+                previous = job.schedule.previous_before(now)
+                if previous is not None:
+                    self.state.record(job.name, previous, "initialized", 0.0)
+
+        while not self._stopping.is_set():
+            now = datetime.now()
+            upcoming = self.next_runs(now)
+            fire_at = min(upcoming.values())
+            delay = max(0.0, (fire_at - now).total_seconds())
+
+            try:
+                await asyncio.wait_for(self._stopping.wait(), timeout=delay)
+                break
+            except asyncio.TimeoutError:
+                pass
+
+            for job in self.jobs:
+                if upcoming[job.name] == fire_at:
+                    self.trigger(job, fire_at)
+
+        pending = [task for task in self._running.values() if not task.done()]
+        if pending:
+            logger.info(f"Waiting for {len(pending)} running job(s) to finish")
+            await asyncio.gather(*pending, return_exceptions=True)
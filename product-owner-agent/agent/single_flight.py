@@ -0,0 +1,138 @@
+"""Single-flight coalescing of identical concurrent JIRA and Confluence reads."""
+
+import asyncio
+import threading
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
+
+from .config import get_settings
+
+
+def request_key(
+    scope: Optional[str], url: str, params: Optional[Dict[str, Any]] = None
+) -> Tuple:
+    """
+    Normalize a GET request into a single-flight key.
+
+    Args:
+        scope: Account the request is made as (reads of different accounts
+            never share a result)
+        url: Full request URL
+        params: Query parameters, in any order
+
+    Returns:
+        A hashable key equal for requests that fetch the same thing
+    """
+    return (scope, url, tuple(sorted((name, str(value)) for name, value in (params or {}).items())))
+
+
+class SingleFlight:
+    """
+    Shares one in-flight call among concurrent callers asking for the same key.
+
+    The first caller starts the fetch; callers arriving while it is still
+    running await the same task and get the same parsed result (or error)
+    instead of sending their own request. Nothing is kept once the fetch
+    completes, so later calls fetch fresh data. A caller that is cancelled
+    does not cancel the fetch for the others.
+
+    Calls are coalesced per event loop; the counters span all of them.
+    """
+
+    def __init__(self):
+        self._flights: Dict[Tuple[asyncio.AbstractEventLoop, Hashable], asyncio.Future] = {}
+        self.calls = 0
+        self.deduplicated = 0
+
+    async def do(self, key: Hashable, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Run fetch() unless an identical call is already in flight.
+
+        Args:
+            key: What is being fetched (see request_key())
+            fetch: Starts the fetch
+
+        Returns:
+            The fetch's result, shared with every coalesced caller; treat it
+            as read-only
+        """
+        key = (asyncio.get_running_loop(), key)
+        self.calls += 1
+        flight = self._flights.get(key)
+        if flight is not None:
+            self.deduplicated += 1
+        else:
+            flight = asyncio.ensure_future(fetch())
+            self._flights[key] = flight
+            flight.add_done_callback(lambda done: self._land(key, done))
+        return await asyncio.shield(flight)
+
+    def _land(self, key: Tuple, flight: asyncio.Future) -> None:
+        if self._flights.get(key) is flight:
+            del self._flights[key]
+        # Mark the error retrieved even if every caller was cancelled
+        if not flight.cancelled():
+            flight.exception()
+
+    @property
+    def in_flight(self) -> int:
+        """Fetches currently running."""
+        return len(self._flights)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Coalescing counters.
+
+        Returns:
+            calls, deduplicated (calls served by another caller's fetch),
+            requests (fetches actually started), in_flight and dedup_rate (%)
+        """
+        return {
+            "calls": self.calls,
+            "deduplicated": self.deduplicated,
+            "requests": self.calls - self.deduplicated,
+            "in_flight": self.in_flight,
+            "dedup_rate": round(100 * self.deduplicated / self.calls, 1) if self.calls else 0.0,
+        }
+
+
+# One per site, so every client of a site coalesces with the others
+_flights: Dict[str, SingleFlight] = {}
+_flights_lock = threading.Lock()
+
+
+def single_flight(base_url: str) -> Optional[SingleFlight]:
+    """
+    The shared single-flight group of a site.
+
+    Args:
+        base_url: Site URL
+
+    Returns:
+        The site's SingleFlight, or None if JIRA_COALESCE_REQUESTS is off
+    """
+    if not get_settings().atlassian.coalesce_requests:
+        return None
+    with _flights_lock:
+        if base_url not in _flights:
+            _flights[base_url] = SingleFlight()
+        return _flights[base_url]
+
+
+def coalescing_stats() -> Dict[str, Any]:
+    """
+    Coalescing counters summed over every site used by this process.
+
+    Returns:
+        Same keys as SingleFlight.stats()
+    """
+    with _flights_lock:
+        groups = list(_flights.values())
+    calls = sum(flights.calls for flights in groups)
+    deduplicated = sum(flights.deduplicated for flights in groups)
+    return {
+        "calls": calls,
+        "deduplicated": deduplicated,
+        "requests": calls - deduplicated,
+        "in_flight": sum(flights.in_flight for flights in groups),
+        "dedup_rate": round(100 * deduplicated / calls, 1) if calls else 0.0,
+    }
@@ -0,0 +1,360 @@
+"""Bulk creation of JIRA stories from a technical specification."""
+
+import asyncio
+import hashlib
+import json
+import logging
+from typing import Any, Dict, List, Optional, Tuple
+
+from .config import get_settings
+from .field_profiles import STORY_POINTS_FIELD, field_profile
+from .results import (
+    CreatedStory,
+    DuplicateMatch,
+    DuplicateStory,
+    FailedStory,
+    StoryCreationResult,
+)
+
+logger = logging.getLogger(__name__)
+
+# JIRA accepts at most 50 issues per bulk create request
+BULK_CREATE_LIMIT = 50
+
+# Labels per "labels in (...)" lookup, keeping the JQL well under URL limits
+_LABEL_CHUNK = 50
+
+IDEMPOTENCY_LABEL_PREFIX = "po-agent-"
+
+
+def idempotency_label(project_key: str, epic_key: str, title: str) -> str:
+    """
+    Derive the label that identifies a story across retries and reruns.
+
+    Args:
+        project_key: Project the story is created in
+        epic_key: Parent epic
+        title: Story title (case and surrounding whitespace are ignored)
+
+    Returns:
+        Label such as "po-agent-3f2a9c1b7d4e"
+    """
+    payload = json.dumps([project_key.upper(), epic_key.upper(), " ".join(title.lower().split())])
+    return IDEMPOTENCY_LABEL_PREFIX + hashlib.sha256(payload.encode()).hexdigest()[:12]
+
+
+def story_fields(
+    story: Dict[str, Any], project_key: str, epic_key: str, label: str
+) -> Dict[str, Any]:
+    """
+    Build the JIRA fields for one story.
+
+    Args:
+        story: Story with "title" and optional "description",
+            "acceptance_criteria" (string or list), "story_points" and "labels"
+        project_key: Project to create the story in
+        epic_key: Epic the story is linked to through its parent field
+        label: Idempotency label from idempotency_label()
+
+    Returns:
+        Fields for a bulk create entry
+    """
+    description = story.get("description") or ""
+    criteria = story.get("acceptance_criteria")
+    if criteria:
+        if isinstance(criteria, str):
+            criteria = [criteria]
+        description += "\n\nh3. Acceptance Criteria\n" + "\n".join(f"* {item}" for item in criteria)
+
+    fields: Dict[str, Any] = {
+        "project": {"key": project_key},
+        "issuetype": {"name": story.get("issue_type") or "Story"},
+        "summary": story["title"],
+        "description": description.strip(),
+        "parent": {"key": epic_key},
+        "labels": [label] + list(story.get("labels") or []),
+    }
+    if story.get("story_points") is not None:
+        fields[STORY_POINTS_FIELD] = story["story_points"]
+    return fields
+
+
+def _element_error(error: Dict[str, Any]) -> str:
+    """Flatten a bulk create elementErrors entry into one message."""
+    element = error.get("elementErrors", {})
+    messages = list(element.get("errorMessages", []))
+    messages.extend(f"{name}: {message}" for name, message in element.get("errors", {}).items())
+    return "; ".join(messages) or f"HTTP {error.get('status', 'error')}"
+
+
+class StoryCreator:
+    """
+    Create a specification's stories with JIRA's bulk API.
+
+    Stories go out in batches of up to 50 per request with a bounded number
+    of requests in flight, each linked to the epic in the same request. Every
+    story carries a label derived from its project, epic and title; stories
+    whose label already exists are skipped, so rerunning a creation or
+    retrying a batch whose response was lost never duplicates stories.
+
+    Given a DuplicateIndex, the project's recently updated issues are synced
+    into it first and stories that resemble existing backlog issues are
+    reported as duplicates instead of being created.
+    """
+
+    def __init__(
+        self,
+        client: Any = None,
+        concurrency: Optional[int] = None,
+        batch_size: int = BULK_CREATE_LIMIT,
+        max_attempts: int = 3,
+        retry_delay: float = 1.0,
+        duplicates: Any = None,
+    ):
+        """
+        Initialize the creator.
+
+        Args:
+            client: Async JIRA REST client (an AsyncJiraClient is created, and
+                closed after each run, if omitted)
+            concurrency: Maximum bulk requests at once (defaults to STORY_CREATION_CONCURRENCY)
+            batch_size: Stories per bulk request (at most 50)
+            max_attempts: Attempts per batch before its stories are reported as failed
+            retry_delay: Seconds before the first retry, doubled for each further one
+            duplicates: DuplicateIndex checked before creating (no check if omitted)
+        """
+        self._owns_client = client is None
+        if client is None:
+            from .tools.jira_tools import AsyncJiraClient
+
+            client = AsyncJiraClient()
+        self.client = client
+        self.concurrency = concurrency or get_settings().agent.story_creation_concurrency
+        self.batch_size = min(batch_size, BULK_CREATE_LIMIT)
+        self.max_attempts = max_attempts
+        self.retry_delay = retry_delay
+        self.duplicates = duplicates
+
+    async def find_existing(self, project_key: str, labels: List[str]) -> Dict[str, str]:
+        """
+        Look up stories already created with the given idempotency labels.
+
+        Args:
+            project_key: Project to search
+            labels: Idempotency labels
+
+        Returns:
+            Issue key by label
+        """
+        from .tools.jira_tools import search_all
+
+        chunks = [labels[start:start + _LABEL_CHUNK] for start in range(0, len(labels), _LABEL_CHUNK)]
+        # Every page of each lookup: JIRA may return fewer than asked per page
+        results = await asyncio.gather(*(
+            search_all(
+                self.client,
+                f"project = {project_key} AND labels in ({', '.join(chunk)})",
+                fields=field_profile("labels"),
+                page_size=len(chunk),
+            )
+            for chunk in chunks
+        ))
+        wanted = set(labels)
+        existing = {}
+        for issues in results:
+            for issue in issues:
+                for label in issue.get("fields", {}).get("labels") or []:
+                    if label in wanted:
+                        existing[label] = issue["key"]
+        return existing
+
+    async def sync_duplicates(self, project_key: str) -> None:
+        """Bring the duplicate index up to date with the project's backlog."""
+        synced = await self.duplicates.sync(self.client, project_key)
+        logger.info(
+            f"Duplicate index for {project_key}: {synced['changed']} of "
+            f"{synced['fetched']} fetched issues changed"
+        )
+
+    def _flag_duplicates(
+        self,
+        project_key: str,
+        pending: List[Tuple[str, Dict[str, Any]]],
+        result: StoryCreationResult,
+    ) -> List[Tuple[str, Dict[str, Any]]]:
+        """Move stories that resemble backlog issues from pending to result.duplicates."""
+        remaining = []
+        for label, fields in pending:
+            matches = self.duplicates.find_similar(
+                fields["summary"], fields["description"], project_key
+            )
+            if matches:
+                result.duplicates.append(DuplicateStory(
+                    title=fields["summary"],
+                    matches=[DuplicateMatch(**match) for match in matches],
+                ))
+            else:
+                remaining.append((label, fields))
+        return remaining
+
+    async def _create_batch(
+        self,
+        semaphore: asyncio.Semaphore,
+        project_key: str,
+        batch: List[Tuple[str, Dict[str, Any]]],
+        result: StoryCreationResult,
+    ) -> None:
+        """Create one batch under the concurrency limit, retrying what is still missing."""
+        async with semaphore:
+            pending = batch
+            error: Optional[Exception] = None
+            for attempt in range(self.max_attempts):
+                if attempt:
+                    await asyncio.sleep(self.retry_delay * 2 ** (attempt - 1))
+                    # The failed request may have created some stories before erroring;
+                    # never resend a batch that could not be checked
+                    try:
+                        found = await self.find_existing(project_key, [label for label, _ in pending])
+                    except Exception as e:
+                        logger.warning(f"Could not check for stories already created: {e}")
+                        error = e
+                        continue
+                    for label, fields in pending:
+                        if label in found:
+                            result.created.append(CreatedStory(
+                                title=fields["summary"], key=found[label], idempotency_label=label
+                            ))
+                    pending = [(label, fields) for label, fields in pending if label not in found]
+                    if not pending:
+                        return
+
+                result.requests += 1
+                try:
+                    response = await self.client.create_issues_bulk(
+                        [{"fields": fields} for _, fields in pending]
+                    )
+                except Exception as e:
+                    logger.warning(
+                        f"Bulk create of {len(pending)} stories failed "
+                        f"(attempt {attempt + 1}/{self.max_attempts}): {e}"
+                    )
+                    error = e
+                    continue
+
+                # Created issues are listed in request order, skipping rejected elements
+                rejected = {
+                    element["failedElementNumber"]: _element_error(element)
+                    for element in response.get("errors", [])
+                }
+                created = iter(response.get("issues", []))
+                for index, (label, fields) in enumerate(pending):
+                    if index in rejected:
+                        result.failed.append(FailedStory(title=fields["summary"], error=rejected[index]))
+                        continue
+                    issue = next(created, None)
+                    if issue is None:
+                        # The story may exist anyway; a rerun finds it by its label
+                        result.failed.append(FailedStory(
+                            title=fields["summary"], error="Not listed in JIRA's bulk create response"
+                        ))
+                    else:
+                        result.created.append(CreatedStory(
+                            title=fields["summary"], key=issue["key"], idempotency_label=label
+                        ))
+                return
+
+            for _, fields in pending:
+                result.failed.append(FailedStory(title=fields["summary"], error=str(error)))
+
+    async def create(
+        self,
+        project_key: str,
+        epic_key: str,
+        stories: List[Dict[str, Any]],
+        allow_duplicates: bool = False,
+    ) -> StoryCreationResult:
+        """
+        Create stories under an epic.
+
+        Args:
+            project_key: Project to create the stories in
+            epic_key: Parent epic
+            stories: Stories with at least a "title" (repeated titles are created once)
+            allow_duplicates: Create stories even if they resemble backlog issues
+
+        Returns:
+            Created, pre-existing, likely duplicate and rejected stories, in input order
+        """
+        try:
+            return await self._create(project_key, epic_key, stories, allow_duplicates)
+        finally:
+            if self._owns_client:
+                await self.client.close()
+
+    async def _create(
+        self,
+        project_key: str,
+        epic_key: str,
+        stories: List[Dict[str, Any]],
+        allow_duplicates: bool,
+    ) -> StoryCreationResult:
+        result = StoryCreationResult(project_key=project_key, epic_key=epic_key)
+
+        planned: Dict[str, Dict[str, Any]] = {}
+        for story in stories:
+            title = (story.get("title") or "").strip()
+            if not title:
+                result.failed.append(FailedStory(title="", error="Story has no title"))
+                continue
+            label = idempotency_label(project_key, epic_key, title)
+            if label not in planned:
+                planned[label] = story_fields({**story, "title": title}, project_key, epic_key, label)
+        if not planned:
+            return result
+
+        existing = await self.find_existing(project_key, list(planned))
+        for label, key in existing.items():
+            result.existing.append(CreatedStory(
+                title=planned[label]["summary"], key=key, idempotency_label=label
+            ))
+
+        pending = [(label, fields) for label, fields in planned.items() if label not in existing]
+        if self.duplicates is not None and not allow_duplicates and pending:
+            if self.duplicates.sync_since(project_key) is None:
+                # A first sync reads the whole backlog: far too slow inside one creation
+                logger.warning(
+                    f"Duplicate index was never synced for {project_key}; not checking for "
+                    f"duplicates. Run `po-agent duplicates sync {project_key}` to enable the check"
+                )
+            else:
+                # Checking against a stale index beats not checking at all
+                try:
+                    await self.sync_duplicates(project_key)
+                except Exception as e:
+                    logger.warning(f"Could not sync the duplicate index for {project_key}: {e}")
+                pending = self._flag_duplicates(project_key, pending, result)
+
+        batches = [
+            pending[start:start + self.batch_size]
+            for start in range(0, len(pending), self.batch_size)
+        ]
+        semaphore = asyncio.Semaphore(self.concurrency)
+        await asyncio.gather(*(
+            self._create_batch(semaphore, project_key, batch, result) for batch in batches
+        ))
+
+        order = {label: index for index, label in enumerate(planned)}
+        result.created.sort(key=lambda story: order[story.idempotency_label])
+        result.existing.sort(key=lambda story: order[story.idempotency_label])
+        if self.duplicates is not None and result.created:
+            # New stories count as backlog for later batches and translations
+            self.duplicates.update([
+                {"key": story.key, "fields": planned[story.idempotency_label]}
+                for story in result.created
+            ], project_key)
+        logger.info(
+            f"Stories for {epic_key}: {len(result.created)} created, "
+            f"{len(result.existing)} existing, {len(result.duplicates)} likely duplicates, "
+            f"{len(result.failed)} failed in {result.requests} bulk requests"
+        )
+        return result
@@ -1,17 +1,27 @@
 """Tools package for Product Owner Agent."""
 
-# Note: jira_tools.py is deprecated in favor of Atlassian MCP Server integration
-# The file is retained for reference but not imported by default
+# Note: agent sessions use the Atlassian MCP Server for JIRA access. jira_tools.py
+# is a direct REST client for bulk paths only and is not exposed as a tool
 
-from .translation import translate_epic_to_stories, create_stories_from_spec
-from .reporting import generate_sprint_report, save_report_to_jira
-from .dependency import analyze_dependencies, generate_gantt_chart
+import importlib
 
-__all__ = [
-    "translate_epic_to_stories",
-    "create_stories_from_spec",
-    "generate_sprint_report",
-    "save_report_to_jira",
-    "analyze_dependencies",
-    "generate_gantt_chart",
-]
\ No newline at end of file
+# Tool name -> module defining it; modules are imported on first access so
+# that importing one of them (or jira_tools) does not load all the others
+_TOOL_MODULES = {
+    "translate_epic_to_stories": "translation",
+    "create_stories_from_spec": "translation",
+    "generate_sprint_report": "reporting",
+    "save_report_to_jira": "reporting",
+    "attach_files_to_jira": "reporting",
+    "analyze_dependencies": "dependency",
+    "generate_gantt_chart": "dependency",
+}
+
+__all__ = list(_TOOL_MODULES)
+
+
+def __getattr__(name):
+    if name in _TOOL_MODULES:
+        module = importlib.import_module(f".{_TOOL_MODULES[name]}", __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -6,7 +6,17 @@ from typing import Any, Dict, List, Set, Tuple
 
 from claude_agent_sdk import tool
 
+from ..archive import archive_file
 from ..config import get_settings
+from ..jira_mirror import mirrored_project_issues
+from ..results import (
+    Blocker,
+    DependencyAnalysisResult,
+    Forecast,
+    GanttChartResult,
+    publish_result,
+)
+from ..vector_index import retrieve_context
 
 
 def load_risk_analysis_prompt() -> str:
@@ -250,13 +260,51 @@ def calculate_timeline_risk(graph: Dict[str, Any], target_date: str) -> Dict[str
     }
 
 
+async def load_issues(args: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    Issues passed as issues_json, or read from the local JIRA mirror.
+
+    Args:
+        args: Tool arguments with "issues_json", or "project_key" (and
+            optionally "max_staleness" in seconds) to read the mirror
+
+    Returns:
+        Issues in the REST API shape
+    """
+    import json
+
+    if args.get("issues_json"):
+        return json.loads(args["issues_json"])
+    if args.get("project_key"):
+        max_staleness = args.get("max_staleness")
+        return await mirrored_project_issues(
+            args["project_key"], float(max_staleness) if max_staleness is not None else None
+        )
+    return []
+
+
+_ISSUE_SOURCE_PROPERTIES = {
+    # JSON string of issues from Atlassian MCP
+    "issues_json": {"type": "string"},
+    # Read the project's issues from the local JIRA mirror instead
+    "project_key": {"type": "string"},
+    "max_staleness": {"type": "number"},
+}
+
+
 @tool(
     "analyze_dependencies",
-    "Analyze cross-team dependencies and identify risks. Use Atlassian MCP jira_search to fetch issues first.",
+    "Analyze cross-team dependencies and identify risks. Use Atlassian MCP jira_search to fetch issues "
+    "first, or pass project_key to read the project from the local JIRA mirror (synced if older than "
+    "max_staleness seconds).",
     {
-        "initiative_name": str,
-        "target_date": str,  # YYYY-MM-DD format
-        "issues_json": str,  # JSON string of issues from Atlassian MCP
+        "type": "object",
+        "properties": {
+            "initiative_name": {"type": "string"},
+            "target_date": {"type": "string"},  # YYYY-MM-DD format
+            **_ISSUE_SOURCE_PROPERTIES,
+        },
+        "required": ["initiative_name", "target_date"],
     },
 )
 async def analyze_dependencies(args: Dict[str, Any]) -> Dict[str, Any]:
@@ -269,15 +317,14 @@ async def analyze_dependencies(args: Dict[str, Any]) -> Dict[str, Any]:
         initiative_name: Name of the initiative
         target_date: Target completion date
         issues_json: JSON string of issues from Atlassian MCP
+        project_key: Project to read from the local JIRA mirror instead
+        max_staleness: Seconds the mirrored project may be old before it is resynced
 
     Returns:
         Comprehensive dependency and risk analysis
     """
     try:
-        import json
-
-        # Parse issues from JSON
-        issues = json.loads(args["issues_json"])
+        issues = await load_issues(args)
 
         if not issues:
             return {
@@ -332,6 +379,13 @@ async def analyze_dependencies(args: Dict[str, Any]) -> Dict[str, Any]:
             historical_performance=f"Completion rate: {timeline_risk['completion_rate']}%, Risk level: {timeline_risk['risk_level']}",
         )
 
+        # Past risk reports and specs about the same work
+        related = retrieve_context(
+            args["initiative_name"] + "\n" + "\n".join(node["summary"] for node in graph["nodes"].values())
+        )
+        if related:
+            formatted_prompt += f"\n\n{related}"
+
         summary = f"""Dependency Analysis Summary:
 - Total Issues: {len(issues)}
 - Teams Involved: {len(teams)}
@@ -349,13 +403,28 @@ Top Blockers:
 {formatted_prompt}
 """
 
+        result = DependencyAnalysisResult(
+            initiative_name=args["initiative_name"],
+            target_date=args["target_date"],
+            total_issues=len(issues),
+            dependency_count=len(graph["edges"]),
+            teams=sorted(str(team) for team in teams),
+            critical_path=critical_path,
+            blockers=[
+                Blocker(**{**blocker, "team": str(blocker["team"]) if blocker["team"] else None})
+                for blocker in blockers
+            ],
+            forecast=Forecast(**timeline_risk),
+        )
+        publish_result(result)
+
         return {
             "content": [
                 {
                     "type": "text",
                     "text": summary,
                 }
-            ]
+            ],
         }
 
     except Exception as e:
@@ -372,10 +441,15 @@ Top Blockers:
 
 @tool(
     "generate_gantt_chart",
-    "Generate Mermaid Gantt chart for dependencies. Use Atlassian MCP jira_search to fetch issues first.",
+    "Generate Mermaid Gantt chart for dependencies. Use Atlassian MCP jira_search to fetch issues first, "
+    "or pass project_key to read the project from the local JIRA mirror.",
     {
-        "initiative_name": str,
-        "issues_json": str,  # JSON string of issues from Atlassian MCP
+        "type": "object",
+        "properties": {
+            "initiative_name": {"type": "string"},
+            **_ISSUE_SOURCE_PROPERTIES,
+        },
+        "required": ["initiative_name"],
     },
 )
 async def generate_gantt_chart(args: Dict[str, Any]) -> Dict[str, Any]:
@@ -387,15 +461,14 @@ async def generate_gantt_chart(args: Dict[str, Any]) -> Dict[str, Any]:
     Args:
         initiative_name: Name of the initiative
         issues_json: JSON string of issues from Atlassian MCP
+        project_key: Project to read from the local JIRA mirror instead
+        max_staleness: Seconds the mirrored project may be old before it is resynced
 
     Returns:
-        Mermaid Gantt chart code
+        Mermaid Gantt chart code and the path it was saved to
     """
     try:
-        import json
-
-        # Parse issues from JSON
-        issues = json.loads(args["issues_json"])
+        issues = await load_issues(args)
 
         if not issues:
             return {
@@ -470,6 +543,7 @@ async def generate_gantt_chart(args: Dict[str, Any]) -> Dict[str, Any]:
         # Save chart
         settings = get_settings()
         chart_dir = settings.output.chart_output_dir
+        chart_dir.mkdir(parents=True, exist_ok=True)
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         filename = f"gantt_{args['initiative_name'].replace(' ', '_')}_{timestamp}.md"
         file_path = chart_dir / filename
@@ -477,13 +551,30 @@ async def generate_gantt_chart(args: Dict[str, Any]) -> Dict[str, Any]:
         with open(file_path, "w") as f:
             f.write(chart_code)
 
+        result = GanttChartResult(
+            initiative_name=args["initiative_name"],
+            chart_path=str(file_path),
+            issues_per_team={str(team): len(team_issues) for team, team_issues in teams.items()},
+        )
+        publish_result(result)
+
+        archive_file(
+            file_path,
+            kind="chart",
+            title=f"gantt_{args['initiative_name']}",
+            content=chart_code,
+            team=", ".join(str(team) for team in teams) or None,
+            initiative=args["initiative_name"],
+            payload=result.model_dump(mode="json"),
+        )
+
         return {
             "content": [
                 {
                     "type": "text",
                     "text": f"Gantt chart generated:\n\n{chart_code}\n\nSaved to: {file_path}",
                 }
-            ]
+            ],
         }
 
     except Exception as e:
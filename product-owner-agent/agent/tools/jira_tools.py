@@ -1,60 +1,296 @@
 """
-DEPRECATED: JIRA REST API integration tools for Product Owner Agent.
+JIRA REST API client for bulk, non-interactive data paths.
 
-⚠️ WARNING: This module is DEPRECATED as of v0.2.0 ⚠️
+Interactive agent sessions use the Atlassian Remote MCP Server for all JIRA
+operations (see MIGRATION_GUIDE.md). Paths that fan out over many boards or
+issues at once, such as multi-board reports, cannot afford one model turn
+per fetch and read JIRA directly through these clients instead:
+AsyncJiraClient for async code (one pooled keep-alive aiohttp session) and
+JiraClient for synchronous callers (a pooled requests Session).
 
-This file is retained for reference only. All JIRA operations should now
-use the Atlassian Remote MCP Server integration instead of direct REST API calls.
-
-DO NOT USE THIS MODULE IN NEW CODE.
-
-Migration Information:
-- Instead of JiraClient.search_issues() → Use Atlassian MCP tool: mcp__atlassian__jira_search
-- Instead of JiraClient.get_issue() → Use Atlassian MCP tool: mcp__atlassian__jira_get_issue
-- Instead of JiraClient.create_issue() → Use Atlassian MCP tool: mcp__atlassian__jira_create_issue
-- Instead of JiraClient.update_issue() → Use Atlassian MCP tool: mcp__atlassian__jira_update_issue
-- Instead of JiraClient.add_comment() → Use Atlassian MCP tool: mcp__atlassian__jira_add_comment
-- Instead of JiraClient.get_sprint_data() → Use Atlassian MCP tool: mcp__atlassian__jira_get_sprint
-- Instead of JiraClient.upload_attachment() → Save locally and use Confluence/JIRA MCP tools
-
-See MIGRATION_GUIDE.md for complete migration instructions.
-See CHANGELOG.md [0.2.0] for details on the MCP integration.
-
-This file will be removed in v0.3.0.
+Direct REST access authenticates with an Atlassian API token:
+- ATLASSIAN_SITE_URL: Your Atlassian Cloud site (e.g. https://yourcompany.atlassian.net)
+- ATLASSIAN_USER_EMAIL: Account email the token belongs to
+- ATLASSIAN_API_TOKEN: API token from https://id.atlassian.com/manage-profile/security/api-tokens
 """
 
+import asyncio
 import base64
 import json
+import mimetypes
+import time
+from contextlib import ExitStack
+from itertools import count, islice
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple
+from urllib.parse import quote_plus
 
+import aiohttp
 import requests
 from requests.auth import HTTPBasicAuth
 
 from ..config import get_settings
+from ..field_profiles import field_profile, resolve_fields
+from ..http_cache import ResponseCache, open_response_cache
+from ..resilience import JiraAPIError, RequestGuard, endpoint_key, parse_retry_after, request_guard
+from ..single_flight import SingleFlight, request_key, single_flight
 
 
-class JiraClient:
-    """Client for JIRA API operations."""
-
-    def __init__(self):
-        """Initialize JIRA client with configuration."""
-        settings = get_settings()
-        self.base_url = settings.jira.base_url.rstrip("/")
-        self.auth = HTTPBasicAuth(
-            settings.jira.user_email, settings.jira.api_token
+def _credentials(
+    base_url: Optional[str], user_email: Optional[str], api_token: Optional[str]
+) -> Tuple[str, str, str]:
+    """Resolve the site URL and API token credentials, falling back to settings."""
+    settings = get_settings()
+    user_email = user_email or settings.atlassian.user_email
+    api_token = api_token or settings.atlassian.api_token
+    if not user_email or not api_token:
+        raise ValueError(
+            "Direct JIRA access requires ATLASSIAN_USER_EMAIL and ATLASSIAN_API_TOKEN"
+        )
+    return (base_url or settings.atlassian.site_url).rstrip("/"), user_email, api_token
+
+
+def _custom_fields() -> Dict[str, str]:
+    """Custom field IDs by the names create_issue() accepts."""
+    atlassian = get_settings().atlassian
+    return {
+        "technical_spec": atlassian.field_technical_spec,
+        "dependency_links": atlassian.field_dependency_links,
+        "risk_score": atlassian.field_risk_score,
+        "team_assignment": atlassian.field_team_assignment,
+        "milestone_target": atlassian.field_milestone_target,
+    }
+
+
+def _search_params(
+    jql: str,
+    fields: Optional[List[str]],
+    max_results: int,
+    expand: Optional[List[str]],
+    start_at: int,
+) -> Dict[str, Any]:
+    params: Dict[str, Any] = {
+        "jql": jql,
+        "maxResults": max_results,
+    }
+    if start_at:
+        params["startAt"] = start_at
+    if fields:
+        params["fields"] = ",".join(fields)
+    if expand:
+        params["expand"] = ",".join(expand)
+    return params
+
+
+def _sprint_issue_params(
+    fields: Optional[List[str]],
+    start_at: int = 0,
+    max_results: int = 100,
+    expand: Optional[List[str]] = None,
+) -> Dict[str, Any]:
+    """Query parameters for a page of sprint issues (sprint-report profile by default)."""
+    params: Dict[str, Any] = {
+        "fields": ",".join(resolve_fields(fields, "sprint-report")),
+        "maxResults": max_results,
+    }
+    if start_at:
+        params["startAt"] = start_at
+    if expand:
+        params["expand"] = ",".join(expand)
+    return params
+
+
+def _issue_page(issues: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """All pages of a listing, in the shape of a single page."""
+    return {"startAt": 0, "maxResults": len(issues), "total": len(issues), "issues": issues}
+
+
+def _active_sprint(board_id: int, sprints: Dict[str, Any]) -> Dict[str, Any]:
+    if not sprints.get("values"):
+        raise Exception(f"No active sprint found for board {board_id}")
+    return sprints["values"][0]
+
+
+# Keys per "key in (...)" search: one page of results, and a JQL string
+# short enough (URL-encoded) to keep the request URL well under the ~8 KB
+# that proxies and JIRA accept
+_KEY_CHUNK = 100
+_KEY_JQL_LENGTH = 3000
+
+
+def _key_jql(keys: List[str]) -> str:
+    return f"key in ({', '.join(keys)})"
+
+
+def _key_chunks(keys: Iterable[str]) -> List[List[str]]:
+    """
+    Split distinct issue keys into "key in (...)" batches.
+
+    Args:
+        keys: Issue keys (duplicates and case variants are dropped)
+
+    Returns:
+        Batches of at most _KEY_CHUNK keys whose encoded JQL stays within
+        _KEY_JQL_LENGTH characters
+    """
+    chunks: List[List[str]] = []
+    chunk: List[str] = []
+    length = len(quote_plus(_key_jql([])))
+    for key in dict.fromkeys(key.upper() for key in keys):
+        size = len(quote_plus(f"{key}, "))
+        if chunk and (len(chunk) == _KEY_CHUNK or length + size > _KEY_JQL_LENGTH):
+            chunks.append(chunk)
+            chunk, length = [], len(quote_plus(_key_jql([])))
+        chunk.append(key)
+        length += size
+    if chunk:
+        chunks.append(chunk)
+    return chunks
+
+
+def _issue_links(issues: Dict[str, Dict[str, Any]]) -> Dict[str, List[Dict[str, Any]]]:
+    return {key: issue.get("fields", {}).get("issuelinks", []) for key, issue in issues.items()}
+
+
+def _multipart(files: List[Path], stack: ExitStack) -> aiohttp.FormData:
+    """
+    Build a multipart body whose parts are read from disk as they are sent.
+
+    Args:
+        files: Files to send, each as a "file" part
+        stack: Closes the opened files once the request is done
+
+    Returns:
+        The request body
+    """
+    form = aiohttp.FormData()
+    for path in files:
+        form.add_field(
+            "file",
+            stack.enter_context(open(path, "rb")),
+            filename=path.name,
+            content_type=mimetypes.guess_type(path.name)[0] or "application/octet-stream",
+        )
+    return form
+
+
+def _file_parts(files: List[Path], stack: ExitStack) -> List[Tuple[str, Tuple[str, Any, str]]]:
+    """
+    Build the requests multipart "files" argument for a list of files.
+
+    Args:
+        files: Files to send, each as a "file" part
+        stack: Closes the opened files once the request is done
+
+    Returns:
+        (field, (filename, file object, content type)) per file
+    """
+    return [
+        (
+            "file",
+            (
+                path.name,
+                stack.enter_context(open(path, "rb")),
+                mimetypes.guess_type(path.name)[0] or "application/octet-stream",
+            ),
         )
+        for path in files
+    ]
+
+
+def _issue_data(
+    custom_fields: Dict[str, str],
+    project_key: str,
+    summary: str,
+    description: str,
+    issue_type: str,
+    values: Dict[str, Any],
+) -> Dict[str, Any]:
+    data = {
+        "fields": {
+            "project": {"key": project_key},
+            "summary": summary,
+            "description": description,
+            "issuetype": {"name": issue_type},
+        }
+    }
+
+    # Add custom fields
+    for field_name, field_value in values.items():
+        if field_name in custom_fields:
+            data["fields"][custom_fields[field_name]] = field_value
+    return data
+
+
+def _link_data(inward_issue: str, outward_issue: str, link_type: str) -> Dict[str, Any]:
+    return {
+        "type": {"name": link_type},
+        "inwardIssue": {"key": inward_issue},
+        "outwardIssue": {"key": outward_issue},
+    }
+
+
+class JiraClient:
+    """
+    Synchronous client for JIRA API operations.
+
+    Requests share one requests Session, so connections are kept alive
+    between calls instead of paying a TCP and TLS handshake each time.
+    GET responses go through the response cache when one is configured
+    (see agent.http_cache).
+    """
+
+    def __init__(
+        self,
+        base_url: Optional[str] = None,
+        user_email: Optional[str] = None,
+        api_token: Optional[str] = None,
+        cache: Optional[ResponseCache] = None,
+        guard: Optional[RequestGuard] = None,
+    ):
+        """
+        Initialize JIRA client with configuration.
+
+        Args:
+            base_url: Site URL (defaults to ATLASSIAN_SITE_URL)
+            user_email: Account email (defaults to ATLASSIAN_USER_EMAIL)
+            api_token: API token (defaults to ATLASSIAN_API_TOKEN)
+            cache: Response cache (defaults to JIRA_HTTP_CACHE_DB if
+                JIRA_HTTP_CACHE_ENABLED is set)
+            guard: Retry, rate-limit and circuit-breaker state (defaults to
+                the one shared by all clients of the site)
+
+        Raises:
+            ValueError: If no credentials are configured
+        """
+        self.base_url, user_email, api_token = _credentials(base_url, user_email, api_token)
+        self.auth = HTTPBasicAuth(user_email, api_token)
         self.headers = {
             "Accept": "application/json",
             "Content-Type": "application/json",
         }
-        self.custom_fields = {
-            "technical_spec": settings.jira.field_technical_spec,
-            "dependency_links": settings.jira.field_dependency_links,
-            "risk_score": settings.jira.field_risk_score,
-            "team_assignment": settings.jira.field_team_assignment,
-            "milestone_target": settings.jira.field_milestone_target,
-        }
+        self.custom_fields = _custom_fields()
+        self.timeout = get_settings().atlassian.request_timeout
+        self.session = requests.Session()
+        self.session.auth = self.auth
+        self._owns_cache = cache is None
+        self.cache = cache if cache is not None else open_response_cache()
+        self._cache_scope = user_email
+        self.guard = guard or request_guard(self.base_url)
+        self.active_sprint_ttl = get_settings().atlassian.active_sprint_ttl
+        self._active_sprints: Dict[int, Tuple[float, Dict[str, Any]]] = {}
+
+    def __enter__(self) -> "JiraClient":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close pooled connections and the response cache this client opened."""
+        self.session.close()
+        if self._owns_cache and self.cache is not None:
+            self.cache.close()
 
     def _request(
         self,
@@ -62,29 +298,92 @@ class JiraClient:
         endpoint: str,
         data: Optional[Dict] = None,
         params: Optional[Dict] = None,
+        files: Optional[List[Path]] = None,
     ) -> Dict[str, Any]:
-        """Make HTTP request to JIRA API with error handling."""
+        """
+        Make HTTP request to JIRA API with error handling.
+
+        Throttled (429) requests, and idempotent ones that hit a server
+        error or lost connection, are retried with backoff (see RequestGuard).
+
+        With `files` the request is a multipart upload of each file as the
+        "file" part, reopened on every attempt and retried like the async
+        client's uploads (see AsyncJiraClient._send).
+
+        Raises:
+            JiraAPIError: If the request fails for good
+            CircuitOpenError: If the endpoint keeps failing
+        """
         url = f"{self.base_url}{endpoint}"
+        headers = self.headers
+        timeout: Any = self.timeout
+        if files:
+            # requests sets the multipart Content-Type itself
+            headers = {"Accept": "application/json", "X-Atlassian-Token": "no-check"}
+            # Connect and per-read limits only, so large files are not cut off
+            timeout = (self.timeout, self.timeout)
+        cache = self.cache if method == "GET" else None
+        cached = None
+        if cache is not None:
+            cache_key = cache.key(url, params, self._cache_scope)
+            cached = cache.lookup(cache_key)
+            if cached is not None and cached.fresh:
+                cache.hit(cached)
+                return json.loads(cached.body)
+            if cached is not None:
+                headers = {**headers, **cached.conditional_headers()}
 
-        try:
-            response = requests.request(
-                method=method,
-                url=url,
-                headers=self.headers,
-                auth=self.auth,
-                json=data,
-                params=params,
-                timeout=30,
-            )
-            response.raise_for_status()
-            return response.json() if response.content else {}
-        except requests.exceptions.HTTPError as e:
-            raise Exception(f"JIRA API error: {e.response.status_code} - {e.response.text}")
-        except requests.exceptions.RequestException as e:
-            raise Exception(f"JIRA connection error: {str(e)}")
+        route = endpoint_key(method, endpoint)
+        for attempt in count():
+            delay = self.guard.before(route)
+            try:
+                if delay:
+                    time.sleep(delay)
+                try:
+                    with ExitStack() as stack:
+                        response = self.session.request(
+                            method=method,
+                            url=url,
+                            headers=headers,
+                            json=data,
+                            params=params,
+                            files=_file_parts(files, stack) if files else None,
+                            timeout=timeout,
+                        )
+                except requests.exceptions.RequestException as e:
+                    error = JiraAPIError(f"JIRA connection error: {str(e)}")
+                else:
+                    if response.status_code == 304 and cached is not None:
+                        self.guard.succeeded(route)
+                        cache.revalidated(cached, endpoint, response.headers)
+                        return json.loads(cached.body)
+                    if response.status_code < 400:
+                        self.guard.succeeded(route)
+                        if cache is not None:
+                            cache.store(cache_key, endpoint, response.text, response.headers)
+                        return response.json() if response.content else {}
+                    error = JiraAPIError(
+                        f"JIRA API error: {response.status_code} - {response.text}",
+                        status=response.status_code,
+                        retry_after=parse_retry_after(response.headers.get("Retry-After")),
+                    )
+            except BaseException:
+                # Hand the endpoint's half-open probe to the next request
+                self.guard.abandoned(route)
+                raise
+            delay = self.guard.failed(method, route, error, attempt, idempotent=True if files else None)
+            if delay is None:
+                raise error
+            time.sleep(delay)
 
     def search_issues(
-        self, jql: str, fields: Optional[List[str]] = None, max_results: int = 100
+        self,
+        jql: str,
+        fields: Optional[List[str]] = None,
+        max_results: int = 100,
+        expand: Optional[List[str]] = None,
+        start_at: int = 0,
+        profile: Optional[str] = None,
     ) -> Dict[str, Any]:
         """
         Search JIRA issues using JQL.
@@ -93,30 +392,36 @@ class JiraClient:
             jql: JIRA Query Language string
             fields: List of fields to return (None for all)
             max_results: Maximum number of results
+            expand: Entities to expand (e.g. ["changelog"])
+            start_at: Index of the first result (for paging)
+            profile: Field profile to request when fields is not given
+                (see field_profiles)
 
         Returns:
             Search results including issues list
         """
-        params = {
-            "jql": jql,
-            "maxResults": max_results,
-        }
-        if fields:
-            params["fields"] = ",".join(fields)
-
+        params = _search_params(jql, resolve_fields(fields, profile), max_results, expand, start_at)
         return self._request("GET", "/rest/api/2/search", params=params)
 
-    def get_issue(self, issue_key: str, fields: Optional[List[str]] = None) -> Dict[str, Any]:
+    def get_issue(
+        self,
+        issue_key: str,
+        fields: Optional[List[str]] = None,
+        profile: Optional[str] = None,
+    ) -> Dict[str, Any]:
         """
         Get a single JIRA issue by key.
 
         Args:
             issue_key: JIRA issue key (e.g., "PROJ-123")
-            fields: List of fields to return
+            fields: List of fields to return (None for all)
+            profile: Field profile to request when fields is not given
+                (see field_profiles)
 
         Returns:
             Issue data
         """
+        fields = resolve_fields(fields, profile)
         params = {}
         if fields:
             params["fields"] = ",".join(fields)
@@ -144,21 +449,24 @@ class JiraClient:
         Returns:
             Created issue data including key
         """
-        data = {
-            "fields": {
-                "project": {"key": project_key},
-                "summary": summary,
-                "description": description,
-                "issuetype": {"name": issue_type},
-            }
-        }
+        data = _issue_data(
+            self.custom_fields, project_key, summary, description, issue_type, custom_fields
+        )
+        return self._request("POST", "/rest/api/2/issue", data=data)
 
-        # Add custom fields
-        for field_name, field_value in custom_fields.items():
-            if field_name in self.custom_fields:
-                data["fields"][self.custom_fields[field_name]] = field_value
+    def create_issues_bulk(self, issue_updates: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Create up to 50 issues in one request.
 
-        return self._request("POST", "/rest/api/2/issue", data=data)
+        Args:
+            issue_updates: One {"fields": {...}} entry per issue
+
+        Returns:
+            "issues" (id, key, self) for the created issues in request order,
+            and "errors" with the failedElementNumber of each rejected entry
+        """
+        data = {"issueUpdates": issue_updates}
+        return self._request("POST", "/rest/api/2/issue/bulk", data=data)
 
     def update_issue(
         self, issue_key: str, fields: Dict[str, Any]
@@ -194,7 +502,7 @@ class JiraClient:
 
     def upload_attachment(
         self, issue_key: str, file_path: Path
-    ) -> Dict[str, Any]:
+    ) -> List[Dict[str, Any]]:
         """
         Upload an attachment to a JIRA issue.
 
@@ -203,48 +511,137 @@ class JiraClient:
             file_path: Path to file to upload
 
         Returns:
-            Attachment data
-        """
-        url = f"{self.base_url}/rest/api/2/issue/{issue_key}/attachments"
-        headers = {"X-Atlassian-Token": "no-check"}
+            Attachment data (JIRA answers with a list)
 
-        with open(file_path, "rb") as f:
-            files = {"file": (file_path.name, f)}
-            response = requests.post(
-                url, headers=headers, auth=self.auth, files=files, timeout=60
-            )
-            response.raise_for_status()
-            return response.json()
+        Raises:
+            JiraAPIError: If the upload fails for good
+        """
+        return self._request(
+            "POST", f"/rest/api/2/issue/{issue_key}/attachments", files=[Path(file_path)]
+        )
 
-    def get_sprint_data(self, board_id: int, sprint_id: Optional[int] = None) -> Dict[str, Any]:
+    def get_sprint_data(
+        self, board_id: int, sprint_id: Optional[int] = None, fields: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
         """
         Get sprint data from JIRA Agile API.
 
         Args:
             board_id: Board ID
             sprint_id: Specific sprint ID (None for active sprint)
+            fields: Issue fields to return (defaults to the sprint-report profile)
 
         Returns:
-            Sprint data including issues
+            Sprint data including every page of its issues
         """
-        if sprint_id:
-            endpoint = f"/rest/agile/1.0/sprint/{sprint_id}"
-        else:
-            endpoint = f"/rest/agile/1.0/board/{board_id}/sprint"
-            params = {"state": "active"}
-            sprints = self._request("GET", endpoint, params=params)
-            if not sprints.get("values"):
-                raise Exception("No active sprint found")
-            sprint_id = sprints["values"][0]["id"]
-            endpoint = f"/rest/agile/1.0/sprint/{sprint_id}"
+        if not sprint_id:
+            sprint_id = self.get_active_sprint(board_id)["id"]
+        sprint_info = self.get_sprint(sprint_id)
 
-        sprint_info = self._request("GET", endpoint)
+        issues: List[Dict[str, Any]] = []
+        while True:
+            page = self.get_sprint_issues(sprint_id, fields=fields, start_at=len(issues))
+            issues.extend(page.get("issues", []))
+            if not page.get("issues") or len(issues) >= page.get("total", 0):
+                break
+        return {"sprint": sprint_info, "issues": _issue_page(issues)}
 
-        # Get issues in sprint
-        issues_endpoint = f"/rest/agile/1.0/sprint/{sprint_id}/issue"
-        issues = self._request("GET", issues_endpoint)
+    def get_sprint_issues(
+        self,
+        sprint_id: int,
+        fields: Optional[List[str]] = None,
+        start_at: int = 0,
+        max_results: int = 100,
+        expand: Optional[List[str]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Get one page of a sprint's issues.
 
-        return {"sprint": sprint_info, "issues": issues}
+        Args:
+            sprint_id: Sprint ID
+            fields: Issue fields to return (defaults to the sprint-report profile)
+            start_at: Index of the first issue
+            max_results: Page size (JIRA caps it)
+            expand: Entities to expand (e.g. ["changelog"])
+
+        Returns:
+            Page with startAt, maxResults, total and issues
+        """
+        return self._request(
+            "GET",
+            f"/rest/agile/1.0/sprint/{sprint_id}/issue",
+            params=_sprint_issue_params(fields, start_at, max_results, expand),
+        )
+
+    def get_active_sprint(self, board_id: int) -> Dict[str, Any]:
+        """
+        Get the active sprint of a board.
+
+        Lookups are cached per board for JIRA_ACTIVE_SPRINT_TTL seconds.
+
+        Args:
+            board_id: Board ID
+
+        Returns:
+            Sprint data (id, name, startDate, endDate, ...)
+        """
+        cached = self._active_sprints.get(board_id)
+        if cached is not None and cached[0] > time.monotonic():
+            return cached[1]
+        sprints = self._request(
+            "GET", f"/rest/agile/1.0/board/{board_id}/sprint", params={"state": "active"}
+        )
+        sprint = _active_sprint(board_id, sprints)
+        self._active_sprints[board_id] = (time.monotonic() + self.active_sprint_ttl, sprint)
+        return sprint
+
+    def get_sprint(self, sprint_id: int) -> Dict[str, Any]:
+        """
+        Get a sprint by ID.
+
+        Args:
+            sprint_id: Sprint ID
+
+        Returns:
+            Sprint data (id, name, startDate, endDate, ...)
+        """
+        return self._request("GET", f"/rest/agile/1.0/sprint/{sprint_id}")
+
+    def get_project(self, project_key: str) -> Dict[str, Any]:
+        """
+        Get a project's definition (cached for JIRA_HTTP_CACHE_METADATA_TTL).
+
+        Args:
+            project_key: Project key
+
+        Returns:
+            Project data (id, key, name, issueTypes, ...)
+        """
+        return self._request("GET", f"/rest/api/2/project/{project_key}")
+
+    def get_issue_types(self) -> List[Dict[str, Any]]:
+        """Get the site's issue types (cached for JIRA_HTTP_CACHE_METADATA_TTL)."""
+        return self._request("GET", "/rest/api/2/issuetype")
+
+    def get_issue_link_types(self) -> List[Dict[str, Any]]:
+        """Get the site's issue link types (cached for JIRA_HTTP_CACHE_METADATA_TTL)."""
+        response = self._request("GET", "/rest/api/2/issueLinkType")
+        return response.get("issueLinkTypes", [])
+
+    def get_confluence_page(self, page_id: str, body_format: str = "storage") -> Dict[str, Any]:
+        """
+        Get a Confluence page of the same site.
+
+        Args:
+            page_id: Page ID
+            body_format: Body representation ("storage", "atlas_doc_format", ...)
+
+        Returns:
+            Page data including title, version and body
+        """
+        return self._request(
+            "GET", f"/wiki/api/v2/pages/{page_id}", params={"body-format": body_format}
+        )
 
     def get_issue_links(self, issue_key: str) -> List[Dict[str, Any]]:
         """
@@ -256,9 +653,52 @@ class JiraClient:
         Returns:
             List of issue links
         """
-        issue = self.get_issue(issue_key, fields=["issuelinks"])
+        issue = self.get_issue(issue_key, fields=field_profile("links"))
         return issue.get("fields", {}).get("issuelinks", [])
 
+    def get_issues_bulk(
+        self,
+        issue_keys: Iterable[str],
+        fields: Optional[List[str]] = None,
+        expand: Optional[List[str]] = None,
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Get many issues with one "key in (...)" search per batch of keys.
+
+        Args:
+            issue_keys: Issue keys
+            fields: List of fields to return (None for all)
+            expand: Entities to expand (e.g. ["changelog"])
+
+        Returns:
+            Issue data by key (issues that do not exist are missing)
+        """
+        issues: Dict[str, Dict[str, Any]] = {}
+        for chunk in _key_chunks(issue_keys):
+            # JIRA may apply a lower maxResults (e.g. with changelogs): page the rest
+            found = 0
+            while True:
+                page = self.search_issues(
+                    _key_jql(chunk), fields=fields, max_results=len(chunk), expand=expand, start_at=found
+                )
+                found += len(page.get("issues", []))
+                issues.update((issue["key"], issue) for issue in page.get("issues", []))
+                if not page.get("issues") or found >= page.get("total", 0):
+                    break
+        return issues
+
+    def get_links_bulk(self, issue_keys: Iterable[str]) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Get the issue links of many issues (see get_issues_bulk).
+
+        Args:
+            issue_keys: Issue keys
+
+        Returns:
+            Issue links by key (issues that do not exist are missing)
+        """
+        return _issue_links(self.get_issues_bulk(issue_keys, fields=field_profile("links")))
+
     def create_issue_link(
         self, inward_issue: str, outward_issue: str, link_type: str = "Blocks"
     ) -> Dict[str, Any]:
@@ -273,20 +713,924 @@ class JiraClient:
         Returns:
             Empty dict on success
         """
-        data = {
-            "type": {"name": link_type},
-            "inwardIssue": {"key": inward_issue},
-            "outwardIssue": {"key": outward_issue},
-        }
+        data = _link_data(inward_issue, outward_issue, link_type)
         return self._request("POST", "/rest/api/2/issueLink", data=data)
 
 
+class _KeyBatcher:
+    """
+    Coalesces issue keys requested in the same event-loop tick.
+
+    Keys are collected until the loop runs its next callbacks, then fetched
+    with one "key in (...)" search per batch, the batches concurrently.
+    Every caller waiting on a key gets the same result.
+    """
+
+    def __init__(self, client: "AsyncJiraClient"):
+        self.client = client
+        self._pending: Dict[Tuple, Dict[str, asyncio.Future]] = {}
+        self._tasks: set = set()
+
+    def request(
+        self, keys: List[str], fields: Optional[List[str]], expand: Optional[List[str]]
+    ) -> List[asyncio.Future]:
+        """Futures resolving to each key's issue (None if it does not exist)."""
+        loop = asyncio.get_running_loop()
+        if not self._pending:
+            loop.call_soon(self._flush)
+        shape = (tuple(fields or ()), tuple(expand or ()))
+        pending = self._pending.setdefault(shape, {})
+        return [pending.setdefault(key, loop.create_future()) for key in keys]
+
+    def _flush(self) -> None:
+        batches, self._pending = self._pending, {}
+        for (fields, expand), futures in batches.items():
+            for chunk in _key_chunks(futures):
+                task = asyncio.ensure_future(
+                    self._fetch(list(fields) or None, list(expand) or None, {key: futures[key] for key in chunk})
+                )
+                self._tasks.add(task)
+                task.add_done_callback(self._tasks.discard)
+
+    async def _fetch(
+        self,
+        fields: Optional[List[str]],
+        expand: Optional[List[str]],
+        futures: Dict[str, asyncio.Future],
+    ) -> None:
+        try:
+            # Pages past the first when JIRA applies a lower maxResults than asked
+            issues = await search_all(
+                self.client, _key_jql(list(futures)), fields=fields, expand=expand, page_size=len(futures)
+            )
+        except Exception as e:
+            for future in futures.values():
+                if not future.done():
+                    future.set_exception(e)
+            return
+        found = {issue["key"]: issue for issue in issues}
+        for key, future in futures.items():
+            if not future.done():
+                future.set_result(found.get(key))
+
+
+class AsyncJiraClient:
+    """
+    Asynchronous client for JIRA API operations.
+
+    All requests go through one aiohttp session whose connections are kept
+    alive (JIRA_KEEPALIVE_SECONDS) and capped per host
+    (JIRA_POOL_LIMIT_PER_HOST); responses are requested gzip-compressed.
+    Calls never block the event loop, so callers fan out with
+    asyncio.gather and the pool bounds what actually goes on the wire.
+
+    The session is opened on first use and bound to the running event loop.
+    Use the client as an async context manager or call close() when done;
+    a closed client reopens its session on the next request.
+
+    GET responses go through the response cache when one is configured
+    (see agent.http_cache): unchanged bodies are revalidated with
+    If-None-Match/If-Modified-Since instead of downloaded again.
+
+    Identical GETs made concurrently, by this or any other client of the
+    site on the same event loop, share one request and its parsed result
+    (see agent.single_flight), so overlapping reports fetch a sprint or
+    search once. Shared results must not be mutated.
+    """
+
+    def __init__(
+        self,
+        base_url: Optional[str] = None,
+        user_email: Optional[str] = None,
+        api_token: Optional[str] = None,
+        limit_per_host: Optional[int] = None,
+        cache: Optional[ResponseCache] = None,
+        guard: Optional[RequestGuard] = None,
+        flights: Optional[SingleFlight] = None,
+    ):
+        """
+        Initialize the client.
+
+        Args:
+            base_url: Site URL (defaults to ATLASSIAN_SITE_URL)
+            user_email: Account email (defaults to ATLASSIAN_USER_EMAIL)
+            api_token: API token (defaults to ATLASSIAN_API_TOKEN)
+            limit_per_host: Connections per host (defaults to JIRA_POOL_LIMIT_PER_HOST)
+            cache: Response cache (defaults to JIRA_HTTP_CACHE_DB if
+                JIRA_HTTP_CACHE_ENABLED is set)
+            guard: Retry, rate-limit and circuit-breaker state (defaults to
+                the one shared by all clients of the site)
+            flights: Single-flight group coalescing identical concurrent GETs
+                (defaults to the one shared by all clients of the site, or
+                none if JIRA_COALESCE_REQUESTS is off)
+
+        Raises:
+            ValueError: If no credentials are configured
+        """
+        self.base_url, user_email, api_token = _credentials(base_url, user_email, api_token)
+        credentials = base64.b64encode(f"{user_email}:{api_token}".encode()).decode()
+        self.headers = {
+            "Accept": "application/json",
+            "Accept-Encoding": "gzip, deflate",
+            "Authorization": f"Basic {credentials}",
+        }
+        self.custom_fields = _custom_fields()
+        settings = get_settings().atlassian
+        self.limit_per_host = limit_per_host or settings.pool_limit_per_host
+        self.keepalive_seconds = settings.keepalive_seconds
+        self.timeout = settings.request_timeout
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._session_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._owns_cache = cache is None
+        self.cache = cache if cache is not None else open_response_cache()
+        self._cache_scope = user_email
+        self.guard = guard or request_guard(self.base_url)
+        self.flights = flights if flights is not None else single_flight(self.base_url)
+        self._batcher = _KeyBatcher(self)
+        self.active_sprint_ttl = settings.active_sprint_ttl
+        self.upload_concurrency = settings.upload_concurrency
+        self._active_sprints: Dict[int, Tuple[float, Dict[str, Any]]] = {}
+
+    async def __aenter__(self) -> "AsyncJiraClient":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        """
+        The pooled session, opened on first use in the running event loop.
+
+        A session only works in the loop that opened it, so a client must be
+        closed before it is used from another loop (e.g. a later asyncio.run).
+
+        Raises:
+            RuntimeError: If the session is still open in another event loop
+        """
+        loop = asyncio.get_running_loop()
+        if self._session is not None and not self._session.closed and self._session_loop is not loop:
+            raise RuntimeError(
+                "AsyncJiraClient is still open in another event loop; close it "
+                "(e.g. with 'async with client:') before using it from a new one"
+            )
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=0,
+                limit_per_host=self.limit_per_host,
+                keepalive_timeout=self.keepalive_seconds,
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                headers=self.headers,
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+            )
+            self._session_loop = loop
+        return self._session
+
+    async def close(self) -> None:
+        """Close the session, its pooled connections and the response cache this client opened."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        self._session_loop = None
+        if self._owns_cache and self.cache is not None:
+            self.cache.close()
+
+    async def _request(
+        self,
+        method: str,
+        endpoint: str,
+        data: Optional[Dict] = None,
+        params: Optional[Dict] = None,
+        files: Optional[List[Path]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Make HTTP request to JIRA API, joining an identical GET in flight.
+
+        Raises:
+            JiraAPIError: If the request fails for good
+            CircuitOpenError: If the endpoint keeps failing
+        """
+        if method == "GET" and self.flights is not None:
+            key = request_key(self._cache_scope, f"{self.base_url}{endpoint}", params)
+            return await self.flights.do(key, lambda: self._send(method, endpoint, params=params))
+        return await self._send(method, endpoint, data=data, params=params, files=files)
+
+    async def _send(
+        self,
+        method: str,
+        endpoint: str,
+        data: Optional[Dict] = None,
+        params: Optional[Dict] = None,
+        files: Optional[List[Path]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Make HTTP request to JIRA API with error handling.
+
+        Throttled (429) requests, and idempotent ones that hit a server
+        error or lost connection, are retried with backoff (see RequestGuard).
+        Concurrent tasks share the guard's rate limit and circuit breakers.
+
+        With `files` the request is a multipart upload: each file is streamed
+        from disk in chunks as the "file" part, reopened on every attempt, so
+        uploads are retried like idempotent requests (a retry after a lost
+        response can at worst attach a file twice). Uploads have no overall
+        time limit, only per-read and connect timeouts.
+
+        Raises:
+            JiraAPIError: If the request fails for good
+            CircuitOpenError: If the endpoint keeps failing
+        """
+        if params:
+            params = {name: str(value) for name, value in params.items()}
+        url = f"{self.base_url}{endpoint}"
+        headers = None
+        options: Dict[str, Any] = {}
+        if files:
+            headers = {"X-Atlassian-Token": "no-check"}
+            options["timeout"] = aiohttp.ClientTimeout(
+                total=None, sock_connect=self.timeout, sock_read=self.timeout
+            )
+        cache = self.cache if method == "GET" else None
+        cached = None
+        if cache is not None:
+            cache_key = cache.key(url, params, self._cache_scope)
+            cached = cache.lookup(cache_key)
+            if cached is not None and cached.fresh:
+                cache.hit(cached)
+                return json.loads(cached.body)
+            if cached is not None:
+                headers = cached.conditional_headers()
+
+        route = endpoint_key(method, endpoint)
+        for attempt in count():
+            delay = self.guard.before(route)
+            try:
+                if delay:
+                    await asyncio.sleep(delay)
+                with ExitStack() as stack:
+                    if files:
+                        options["data"] = _multipart(files, stack)
+                    async with self.session.request(
+                        method, url, json=data, params=params, headers=headers, **options
+                    ) as response:
+                        if response.status == 304 and cached is not None:
+                            self.guard.succeeded(route)
+                            cache.revalidated(cached, endpoint, response.headers)
+                            return json.loads(cached.body)
+                        text = await response.text()
+                        if response.status < 400:
+                            self.guard.succeeded(route)
+                            if cache is not None:
+                                cache.store(cache_key, endpoint, text, response.headers)
+                            return json.loads(text) if text else {}
+                        error = JiraAPIError(
+                            f"JIRA API error: {response.status} - {text}",
+                            status=response.status,
+                            retry_after=parse_retry_after(response.headers.get("Retry-After")),
+                        )
+            except aiohttp.ClientError as e:
+                error = JiraAPIError(f"JIRA connection error: {str(e)}")
+            except asyncio.TimeoutError:
+                error = JiraAPIError(f"JIRA connection error: no response within {self.timeout}s")
+            except BaseException:
+                # Hand the endpoint's half-open probe to the next request
+                self.guard.abandoned(route)
+                raise
+            delay = self.guard.failed(method, route, error, attempt, idempotent=True if files else None)
+            if delay is None:
+                raise error
+            await asyncio.sleep(delay)
+
+    async def search_issues(
+        self,
+        jql: str,
+        fields: Optional[List[str]] = None,
+        max_results: int = 100,
+        expand: Optional[List[str]] = None,
+        start_at: int = 0,
+        profile: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        Search JIRA issues using JQL.
+
+        Args:
+            jql: JIRA Query Language string
+            fields: List of fields to return (None for all)
+            max_results: Maximum number of results
+            expand: Entities to expand (e.g. ["changelog"])
+            start_at: Index of the first result (for paging)
+            profile: Field profile to request when fields is not given
+                (see field_profiles)
+
+        Returns:
+            Search results including issues list
+        """
+        params = _search_params(jql, resolve_fields(fields, profile), max_results, expand, start_at)
+        return await self._request("GET", "/rest/api/2/search", params=params)
+
+    async def search_issues_jql(
+        self,
+        jql: str,
+        fields: Optional[List[str]] = None,
+        max_results: int = 100,
+        expand: Optional[List[str]] = None,
+        next_page_token: Optional[str] = None,
+        profile: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        Search JIRA issues with the token-paginated JQL search API.
+
+        Args:
+            jql: JIRA Query Language string
+            fields: List of fields to return (None for all)
+            max_results: Maximum number of results
+            expand: Entities to expand (e.g. ["changelog"])
+            next_page_token: Token from the previous page (None for the first)
+            profile: Field profile to request when fields is not given
+                (see field_profiles)
+
+        Returns:
+            Search results with "issues" and, unless this is the last page,
+            "nextPageToken"
+        """
+        params = _search_params(jql, resolve_fields(fields, profile), max_results, expand, 0)
+        if next_page_token:
+            params["nextPageToken"] = next_page_token
+        return await self._request("GET", "/rest/api/3/search/jql", params=params)
+
+    async def get_issue(
+        self,
+        issue_key: str,
+        fields: Optional[List[str]] = None,
+        profile: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        Get a single JIRA issue by key.
+
+        Args:
+            issue_key: JIRA issue key (e.g., "PROJ-123")
+            fields: List of fields to return (None for all)
+            profile: Field profile to request when fields is not given
+                (see field_profiles)
+
+        Returns:
+            Issue data
+        """
+        fields = resolve_fields(fields, profile)
+        params = {"fields": ",".join(fields)} if fields else None
+        return await self._request("GET", f"/rest/api/2/issue/{issue_key}", params=params)
+
+    async def create_issue(
+        self,
+        project_key: str,
+        summary: str,
+        description: str,
+        issue_type: str = "Story",
+        **custom_fields,
+    ) -> Dict[str, Any]:
+        """
+        Create a new JIRA issue.
+
+        Args:
+            project_key: Project key (e.g., "PROJ")
+            summary: Issue summary/title
+            description: Issue description
+            issue_type: Type of issue (Story, Epic, Task, etc.)
+            **custom_fields: Custom field values
+
+        Returns:
+            Created issue data including key
+        """
+        data = _issue_data(
+            self.custom_fields, project_key, summary, description, issue_type, custom_fields
+        )
+        return await self._request("POST", "/rest/api/2/issue", data=data)
+
+    async def create_issues_bulk(self, issue_updates: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Create up to 50 issues in one request.
+
+        Args:
+            issue_updates: One {"fields": {...}} entry per issue
+
+        Returns:
+            "issues" (id, key, self) for the created issues in request order,
+            and "errors" with the failedElementNumber of each rejected entry
+        """
+        data = {"issueUpdates": issue_updates}
+        return await self._request("POST", "/rest/api/2/issue/bulk", data=data)
+
+    async def update_issue(self, issue_key: str, fields: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Update a JIRA issue.
+
+        Args:
+            issue_key: Issue key to update
+            fields: Dictionary of fields to update
+
+        Returns:
+            Empty dict on success
+        """
+        return await self._request("PUT", f"/rest/api/2/issue/{issue_key}", data={"fields": fields})
+
+    async def add_comment(self, issue_key: str, comment: str) -> Dict[str, Any]:
+        """
+        Add a comment to a JIRA issue.
+
+        Args:
+            issue_key: Issue key
+            comment: Comment text
+
+        Returns:
+            Created comment data
+        """
+        return await self._request(
+            "POST", f"/rest/api/2/issue/{issue_key}/comment", data={"body": comment}
+        )
+
+    async def upload_attachment(self, issue_key: str, file_path: Path) -> List[Dict[str, Any]]:
+        """
+        Upload an attachment to a JIRA issue, streaming it from disk.
+
+        Args:
+            issue_key: Issue key
+            file_path: Path to file to upload
+
+        Returns:
+            Attachment data (JIRA answers with a list)
+
+        Raises:
+            JiraAPIError: If the upload fails for good
+        """
+        return await self._request(
+            "POST", f"/rest/api/2/issue/{issue_key}/attachments", files=[Path(file_path)]
+        )
+
+    async def upload_attachments(
+        self,
+        uploads: Iterable[Tuple[str, Path]],
+        concurrency: Optional[int] = None,
+        return_exceptions: bool = False,
+    ) -> List[Any]:
+        """
+        Upload many attachments concurrently.
+
+        Each file is its own request, so one failed upload is retried (or
+        reported) on its own. At most `concurrency` uploads are in flight,
+        leaving the rest of the connection pool to other requests.
+
+        Args:
+            uploads: (issue key, file path) pairs
+            concurrency: Uploads at once (defaults to JIRA_UPLOAD_CONCURRENCY)
+            return_exceptions: Return an upload's error as its result instead
+                of raising it
+
+        Returns:
+            Attachment data (or the error) per upload, in order
+        """
+        semaphore = asyncio.Semaphore(max(1, concurrency or self.upload_concurrency))
+
+        async def upload(issue_key: str, file_path: Path) -> List[Dict[str, Any]]:
+            async with semaphore:
+                return await self.upload_attachment(issue_key, file_path)
+
+        return await asyncio.gather(
+            *(upload(issue_key, file_path) for issue_key, file_path in uploads),
+            return_exceptions=return_exceptions,
+        )
+
+    async def get_active_sprint(self, board_id: int) -> Dict[str, Any]:
+        """
+        Get the active sprint of a board.
+
+        Lookups are cached per board for JIRA_ACTIVE_SPRINT_TTL seconds.
+
+        Args:
+            board_id: Board ID
+
+        Returns:
+            Sprint data (id, name, startDate, endDate, ...)
+        """
+        cached = self._active_sprints.get(board_id)
+        if cached is not None and cached[0] > time.monotonic():
+            return cached[1]
+        sprints = await self._request(
+            "GET", f"/rest/agile/1.0/board/{board_id}/sprint", params={"state": "active"}
+        )
+        sprint = _active_sprint(board_id, sprints)
+        self._active_sprints[board_id] = (time.monotonic() + self.active_sprint_ttl, sprint)
+        return sprint
+
+    async def get_active_sprints(
+        self, board_ids: Iterable[int], return_exceptions: bool = False
+    ) -> Dict[int, Any]:
+        """
+        Get the active sprints of many boards concurrently.
+
+        Args:
+            board_ids: Board IDs
+            return_exceptions: Return a board's error as its value instead
+                of raising it (e.g. a board without an active sprint)
+
+        Returns:
+            Sprint data (or the error) by board ID
+        """
+        board_ids = list(dict.fromkeys(board_ids))
+        sprints = await asyncio.gather(
+            *(self.get_active_sprint(board_id) for board_id in board_ids),
+            return_exceptions=return_exceptions,
+        )
+        return dict(zip(board_ids, sprints))
+
+    async def get_sprint(self, sprint_id: int) -> Dict[str, Any]:
+        """
+        Get a sprint by ID.
+
+        Args:
+            sprint_id: Sprint ID
+
+        Returns:
+            Sprint data (id, name, startDate, endDate, ...)
+        """
+        return await self._request("GET", f"/rest/agile/1.0/sprint/{sprint_id}")
+
+    async def get_project(self, project_key: str) -> Dict[str, Any]:
+        """
+        Get a project's definition (cached for JIRA_HTTP_CACHE_METADATA_TTL).
+
+        Args:
+            project_key: Project key
+
+        Returns:
+            Project data (id, key, name, issueTypes, ...)
+        """
+        return await self._request("GET", f"/rest/api/2/project/{project_key}")
+
+    async def get_issue_types(self) -> List[Dict[str, Any]]:
+        """Get the site's issue types (cached for JIRA_HTTP_CACHE_METADATA_TTL)."""
+        return await self._request("GET", "/rest/api/2/issuetype")
+
+    async def get_issue_link_types(self) -> List[Dict[str, Any]]:
+        """Get the site's issue link types (cached for JIRA_HTTP_CACHE_METADATA_TTL)."""
+        response = await self._request("GET", "/rest/api/2/issueLinkType")
+        return response.get("issueLinkTypes", [])
+
+    async def get_confluence_page(self, page_id: str, body_format: str = "storage") -> Dict[str, Any]:
+        """
+        Get a Confluence page of the same site.
+
+        Args:
+            page_id: Page ID
+            body_format: Body representation ("storage", "atlas_doc_format", ...)
+
+        Returns:
+            Page data including title, version and body
+        """
+        return await self._request(
+            "GET", f"/wiki/api/v2/pages/{page_id}", params={"body-format": body_format}
+        )
+
+    async def get_sprint_data(
+        self, board_id: int, sprint_id: Optional[int] = None, fields: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
+        """
+        Get sprint data from JIRA Agile API.
+
+        Once the sprint ID is known, the sprint and the first page of its
+        issues are fetched concurrently, then the remaining pages
+        JIRA_SEARCH_CONCURRENCY at a time.
+
+        Args:
+            board_id: Board ID
+            sprint_id: Specific sprint ID (None for active sprint)
+            fields: Issue fields to return (defaults to the sprint-report profile)
+
+        Returns:
+            Sprint data including every page of its issues
+        """
+        if not sprint_id:
+            sprint_id = (await self.get_active_sprint(board_id))["id"]
+        sprint_info, issues = await asyncio.gather(
+            self.get_sprint(sprint_id),
+            collect(iter_sprint_issues(self, sprint_id, fields=fields)),
+        )
+        return {"sprint": sprint_info, "issues": _issue_page(issues)}
+
+    async def get_sprint_issues(
+        self,
+        sprint_id: int,
+        fields: Optional[List[str]] = None,
+        start_at: int = 0,
+        max_results: int = 100,
+        expand: Optional[List[str]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Get one page of a sprint's issues.
+
+        Args:
+            sprint_id: Sprint ID
+            fields: Issue fields to return (defaults to the sprint-report profile)
+            start_at: Index of the first issue
+            max_results: Page size (JIRA caps it)
+            expand: Entities to expand (e.g. ["changelog"])
+
+        Returns:
+            Page with startAt, maxResults, total and issues
+        """
+        return await self._request(
+            "GET",
+            f"/rest/agile/1.0/sprint/{sprint_id}/issue",
+            params=_sprint_issue_params(fields, start_at, max_results, expand),
+        )
+
+    async def get_issues_bulk(
+        self,
+        issue_keys: Iterable[str],
+        fields: Optional[List[str]] = None,
+        expand: Optional[List[str]] = None,
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Get many issues with concurrent "key in (...)" searches.
+
+        Keys requested by any caller in the same event-loop tick with the
+        same fields and expand are coalesced, so concurrent callers that
+        overlap share one fetch per key.
+
+        Args:
+            issue_keys: Issue keys
+            fields: List of fields to return (None for all)
+            expand: Entities to expand (e.g. ["changelog"])
+
+        Returns:
+            Issue data by key (issues that do not exist are missing)
+
+        Raises:
+            JiraAPIError: If a batch cannot be fetched
+        """
+        keys = list(dict.fromkeys(key.upper() for key in issue_keys))
+        futures = self._batcher.request(keys, fields, expand)
+        # Shielded: a cancelled caller must not cancel fetches other callers share
+        results = await asyncio.gather(*(asyncio.shield(future) for future in futures))
+        return {key: issue for key, issue in zip(keys, results) if issue is not None}
+
+    async def get_links_bulk(self, issue_keys: Iterable[str]) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Get the issue links of many issues (see get_issues_bulk).
+
+        Args:
+            issue_keys: Issue keys
+
+        Returns:
+            Issue links by key (issues that do not exist are missing)
+        """
+        return _issue_links(await self.get_issues_bulk(issue_keys, fields=field_profile("links")))
+
+    async def get_issue_links(self, issue_key: str) -> List[Dict[str, Any]]:
+        """
+        Get all issue links (dependencies) for an issue.
+
+        Goes through get_links_bulk, so walking a link graph with
+        asyncio.gather costs one search per batch of keys, not one request
+        per issue.
+
+        Args:
+            issue_key: Issue key
+
+        Returns:
+            List of issue links
+        """
+        links = await self.get_links_bulk([issue_key])
+        if issue_key.upper() not in links:
+            raise JiraAPIError(f"JIRA API error: 404 - Issue {issue_key} does not exist", status=404)
+        return links[issue_key.upper()]
+
+    async def create_issue_link(
+        self, inward_issue: str, outward_issue: str, link_type: str = "Blocks"
+    ) -> Dict[str, Any]:
+        """
+        Create a link between two issues.
+
+        Args:
+            inward_issue: Issue that is blocked/depends on
+            outward_issue: Issue that blocks/is depended on
+            link_type: Type of link (Blocks, Relates, etc.)
+
+        Returns:
+            Empty dict on success
+        """
+        data = _link_data(inward_issue, outward_issue, link_type)
+        return await self._request("POST", "/rest/api/2/issueLink", data=data)
+
+
+async def iter_search(
+    client: Any,
+    jql: str,
+    fields: Optional[List[str]] = None,
+    expand: Optional[List[str]] = None,
+    page_size: int = 100,
+    concurrency: Optional[int] = None,
+    ordered: bool = True,
+    token_paging: bool = False,
+) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Stream every issue matching a JQL query.
+
+    The first page reports the total; the remaining startAt pages are then
+    fetched concurrently, at most `concurrency` at a time, so a large result
+    set takes about one page's latency times pages / concurrency. The page
+    size the server actually applied (JIRA caps maxResults) is used for the
+    offsets. Issues seen on an earlier page are not yielded again when
+    results shift between pages.
+
+    With token_paging, the token-based JQL search API is read page by page
+    instead; each page's token comes from the previous one, so those pages
+    cannot be fetched in parallel.
+
+    Args:
+        client: Client with an async search_issues() (and search_issues_jql()
+            for token paging), e.g. AsyncJiraClient
+        jql: JIRA Query Language string
+        fields: List of fields to return (None for all)
+        expand: Entities to expand (e.g. ["changelog"])
+        page_size: Issues requested per page
+        concurrency: Pages fetched at once (defaults to JIRA_SEARCH_CONCURRENCY)
+        ordered: Yield in result order (True) or as pages arrive (False)
+        token_paging: Use nextPageToken pagination
+
+    Yields:
+        Issues
+    """
+    fresh = _dedupe()
+
+    if token_paging:
+        token = None
+        while True:
+            page = await client.search_issues_jql(
+                jql, fields=fields, max_results=page_size, expand=expand, next_page_token=token
+            )
+            for issue in fresh(page.get("issues", [])):
+                yield issue
+            token = page.get("nextPageToken")
+            if not token or page.get("isLast"):
+                return
+
+    def fetch(start: int, max_results: int) -> Awaitable[Dict[str, Any]]:
+        paging = {"start_at": start} if start else {}
+        return client.search_issues(jql, fields=fields, max_results=max_results, expand=expand, **paging)
+
+    async for issue in _iter_offset_pages(fetch, page_size, concurrency, ordered, fresh):
+        yield issue
+
+
+async def _iter_offset_pages(
+    fetch: Callable[[int, int], Awaitable[Dict[str, Any]]],
+    page_size: int,
+    concurrency: Optional[int],
+    ordered: bool,
+    fresh: Callable[[List[Dict[str, Any]]], List[Dict[str, Any]]],
+) -> AsyncIterator[Dict[str, Any]]:
+    """Stream a startAt-paginated listing: the first page, then the rest concurrently."""
+    first = await fetch(0, page_size)
+    issues = first.get("issues", [])
+    for issue in fresh(issues):
+        yield issue
+    total = first.get("total", len(issues))
+    step = min(first.get("maxResults") or page_size, page_size) or page_size
+    starts = iter(range(len(issues), total, step)) if issues else iter(())
+    concurrency = concurrency or get_settings().atlassian.search_concurrency
+
+    def start_page(start: int) -> "asyncio.Task":
+        return asyncio.ensure_future(fetch(start, step))
+
+    # A window of `concurrency` pages is in flight; each page that is
+    # yielded frees a slot for the next start offset
+    pending: List[asyncio.Task] = [start_page(start) for start in islice(starts, concurrency)]
+    try:
+        while pending:
+            if ordered:
+                task = pending.pop(0)
+                page = await task
+            else:
+                done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                task = done.pop()
+                pending.remove(task)
+                page = task.result()
+            next_start = next(starts, None)
+            if next_start is not None:
+                pending.append(start_page(next_start))
+            for issue in fresh(page.get("issues", [])):
+                yield issue
+    finally:
+        for task in pending:
+            task.cancel()
+
+
+def _dedupe() -> Callable[[List[Dict[str, Any]]], List[Dict[str, Any]]]:
+    """Filter dropping issues already seen on an earlier page (results can shift between pages)."""
+    seen = set()
+
+    def fresh(issues: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        new = [issue for issue in issues if issue.get("key") not in seen]
+        seen.update(issue.get("key") for issue in new)
+        return new
+
+    return fresh
+
+
+async def iter_sprint_issues(
+    client: Any,
+    sprint_id: int,
+    fields: Optional[List[str]] = None,
+    expand: Optional[List[str]] = None,
+    page_size: int = 100,
+    concurrency: Optional[int] = None,
+    ordered: bool = True,
+) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Stream every issue of a sprint through the Agile API, paginated like iter_search.
+
+    Args:
+        client: Client with an async get_sprint_issues(), e.g. AsyncJiraClient
+        sprint_id: Sprint ID
+        fields: Issue fields to return (defaults to the sprint-report profile)
+        expand: Entities to expand (e.g. ["changelog"])
+        page_size: Issues requested per page
+        concurrency: Pages fetched at once (defaults to JIRA_SEARCH_CONCURRENCY)
+        ordered: Yield in board order (True) or as pages arrive (False)
+
+    Yields:
+        Issues
+    """
+    def fetch(start: int, max_results: int) -> Awaitable[Dict[str, Any]]:
+        return client.get_sprint_issues(
+            sprint_id, fields=fields, start_at=start, max_results=max_results, expand=expand
+        )
+
+    async for issue in _iter_offset_pages(fetch, page_size, concurrency, ordered, _dedupe()):
+        yield issue
+
+
+async def collect(issues: AsyncIterator[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Gather a stream of issues into a list."""
+    return [issue async for issue in issues]
+
+
+async def search_all(client: Any, jql: str, **kwargs) -> List[Dict[str, Any]]:
+    """
+    Fetch every issue matching a JQL query (see iter_search for the options).
+
+    Returns:
+        Issues in result order
+    """
+    return [issue async for issue in iter_search(client, jql, **kwargs)]
+
+
+async def walk_issue_links(
+    client: "AsyncJiraClient", issue_keys: Iterable[str], depth: Optional[int] = None
+) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Collect the link graph around some issues, one level at a time.
+
+    Each level is fetched with get_links_bulk, so a graph of N issues costs
+    about N / 100 searches per level instead of N requests.
+
+    Args:
+        client: AsyncJiraClient
+        issue_keys: Issues to start from
+        depth: Link hops to follow (defaults to DEPENDENCY_SCAN_DEPTH)
+
+    Returns:
+        Issue links by key for every issue reached (issues that do not
+        exist are missing)
+    """
+    if depth is None:
+        depth = get_settings().agent.dependency_scan_depth
+    graph: Dict[str, List[Dict[str, Any]]] = {}
+    frontier = list(dict.fromkeys(key.upper() for key in issue_keys))
+    for _ in range(depth + 1):
+        if not frontier:
+            break
+        links = await client.get_links_bulk(frontier)
+        graph.update(links)
+        seen = set(graph) | set(frontier)
+        frontier = list(dict.fromkeys(
+            other["key"]
+            for issue_links in links.values()
+            for link in issue_links
+            for other in (link.get("inwardIssue"), link.get("outwardIssue"))
+            if other and other.get("key") and other["key"] not in seen
+        ))
+    return graph
+
+
 # Tool functions that can be exposed to the agent
 
-def search_issues(jql: str, max_results: int = 100) -> Dict[str, Any]:
-    """Search JIRA issues using JQL query."""
-    client = JiraClient()
-    return client.search_issues(jql, max_results=max_results)
+def search_issues(jql: str, max_results: int = 100, profile: Optional[str] = None) -> Dict[str, Any]:
+    """Search JIRA issues using JQL query, optionally projected to a field profile."""
+    with JiraClient() as client:
+        return client.search_issues(jql, max_results=max_results, profile=profile)
 
 
 def create_issue(
@@ -297,29 +1641,29 @@ def create_issue(
     **kwargs,
 ) -> Dict[str, Any]:
     """Create a new JIRA issue."""
-    client = JiraClient()
-    return client.create_issue(project_key, summary, description, issue_type, **kwargs)
+    with JiraClient() as client:
+        return client.create_issue(project_key, summary, description, issue_type, **kwargs)
 
 
 def update_issue(issue_key: str, fields: Dict[str, Any]) -> Dict[str, Any]:
     """Update an existing JIRA issue."""
-    client = JiraClient()
-    return client.update_issue(issue_key, fields)
+    with JiraClient() as client:
+        return client.update_issue(issue_key, fields)
 
 
 def add_comment(issue_key: str, comment: str) -> Dict[str, Any]:
     """Add a comment to a JIRA issue."""
-    client = JiraClient()
-    return client.add_comment(issue_key, comment)
+    with JiraClient() as client:
+        return client.add_comment(issue_key, comment)
 
 
-def upload_attachment(issue_key: str, file_path: str) -> Dict[str, Any]:
+def upload_attachment(issue_key: str, file_path: str) -> List[Dict[str, Any]]:
     """Upload an attachment to a JIRA issue."""
-    client = JiraClient()
-    return client.upload_attachment(issue_key, Path(file_path))
+    with JiraClient() as client:
+        return client.upload_attachment(issue_key, Path(file_path))
 
 
 def get_sprint_data(board_id: int, sprint_id: Optional[int] = None) -> Dict[str, Any]:
     """Get sprint data including all issues."""
-    client = JiraClient()
-    return client.get_sprint_data(board_id, sprint_id)
\ No newline at end of file
+    with JiraClient() as client:
+        return client.get_sprint_data(board_id, sprint_id)
\ No newline at end of file
@@ -2,11 +2,14 @@
 
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 from claude_agent_sdk import tool
 
+from ..archive import archive_file
+from ..burndown import BurndownSeries, sprint_burndown
 from ..config import get_settings
+from ..results import Blocker, SprintMetrics, SprintReportResult, publish_result
 
 
 def load_reporting_prompt() -> str:
@@ -105,15 +108,112 @@ def format_updates(issues: List[Dict[str, Any]]) -> str:
     return "\n".join(updates) if updates else "No recent updates"
 
 
+def build_sprint_report_prompt(
+    sprint_name: str,
+    sprint_start: str,
+    sprint_end: str,
+    team_name: str,
+    issues: List[Dict[str, Any]],
+    metrics: Optional[Dict[str, Any]] = None,
+    burndown: str = "Not available",
+) -> str:
+    """
+    Format the reporting prompt for a sprint's issues.
+
+    Args:
+        sprint_name: Sprint name
+        sprint_start: Sprint start date
+        sprint_end: Sprint end date
+        team_name: Name of the team
+        issues: Sprint issues
+        metrics: Precomputed metrics for the issues (calculated if omitted)
+        burndown: Compact burndown/burnup context (see burndown_context)
+
+    Returns:
+        Formatted reporting prompt
+    """
+    if metrics is None:
+        metrics = calculate_sprint_metrics(issues)
+
+    prompt_template = load_reporting_prompt()
+    return prompt_template.format(
+        sprint_id=sprint_name,
+        team_name=team_name,
+        sprint_start=sprint_start,
+        sprint_end=sprint_end,
+        completed_tasks=len(metrics["completed"]),
+        in_progress_tasks=len(metrics["in_progress"]),
+        blocked_tasks=len(metrics["blocked"]),
+        not_started_tasks=len(metrics["not_started"]),
+        task_details=format_task_details(issues),
+        recent_updates=format_updates(issues),
+        previous_velocity="N/A",  # Would need historical data
+        team_capacity=metrics["total_issues"],
+        planned_points=metrics["total_story_points"],
+        completed_points=metrics["completed_story_points"],
+        burndown=burndown,
+    )
+
+
+def build_sprint_result(
+    sprint_name: str,
+    team_name: str,
+    sprint_start: str,
+    sprint_end: str,
+    metrics: Dict[str, Any],
+    burndown: Optional[BurndownSeries] = None,
+) -> SprintReportResult:
+    """
+    Build the structured result of a sprint report.
+
+    Args:
+        sprint_name: Sprint name
+        team_name: Name of the team
+        sprint_start: Sprint start date
+        sprint_end: Sprint end date
+        metrics: Metrics from calculate_sprint_metrics
+        burndown: Computed burndown series, if available
+
+    Returns:
+        Serializable sprint report result
+    """
+    blockers = []
+    for issue in metrics["blocked"]:
+        fields = issue.get("fields", {})
+        assignee = fields.get("assignee")
+        blockers.append(Blocker(
+            key=issue.get("key", ""),
+            summary=fields.get("summary", ""),
+            status=(fields.get("status") or {}).get("name", ""),
+            assignee=assignee.get("displayName", "Unassigned") if assignee else "Unassigned",
+        ))
+
+    return SprintReportResult(
+        sprint_name=sprint_name,
+        team_name=team_name,
+        sprint_start=sprint_start,
+        sprint_end=sprint_end,
+        metrics=SprintMetrics.from_metrics(metrics),
+        blockers=blockers,
+        burndown=burndown.to_result() if burndown is not None else None,
+    )
+
+
 @tool(
     "generate_sprint_report",
-    "Generate a comprehensive sprint progress report. Use Atlassian MCP jira_get_sprint and jira_search to fetch sprint data first.",
+    "Generate a comprehensive sprint progress report. Use Atlassian MCP jira_get_sprint and jira_search to fetch sprint data first. Fetch issues with expand=changelog to include burndown/burnup trends.",
     {
-        "sprint_name": str,
-        "sprint_start": str,
-        "sprint_end": str,
-        "team_name": str,
-        "issues_json": str,  # JSON string of sprint issues from Atlassian MCP
+        "type": "object",
+        "properties": {
+            "sprint_name": {"type": "string"},
+            "sprint_start": {"type": "string"},
+            "sprint_end": {"type": "string"},
+            "team_name": {"type": "string"},
+            # JSON string of sprint issues from Atlassian MCP
+            "issues_json": {"type": "string"},
+            "sprint_id": {"type": "string"},
+        },
+        "required": ["sprint_name", "sprint_start", "sprint_end", "team_name", "issues_json"],
     },
 )
 async def generate_sprint_report(args: Dict[str, Any]) -> Dict[str, Any]:
@@ -128,41 +228,47 @@ async def generate_sprint_report(args: Dict[str, Any]) -> Dict[str, Any]:
         sprint_start: Sprint start date
         sprint_end: Sprint end date
         team_name: Name of the team
-        issues_json: JSON string of sprint issues
+        issues_json: JSON string of sprint issues (with changelogs for burndown)
+        sprint_id: Sprint ID used to persist the burndown series (optional)
 
     Returns:
-        Formatted report prompt for Claude to process
+        Formatted report prompt for Claude to process; the metrics are
+        published to any active collect_results() block
     """
     try:
         import json
 
         issues = json.loads(args["issues_json"])
 
-        # Calculate metrics
+        # Replay changelogs into the day-indexed burndown series
+        series, burndown = sprint_burndown(
+            args.get("sprint_id") or args["sprint_name"],
+            args["sprint_start"],
+            args["sprint_end"],
+            issues,
+        )
+
+        # Calculate metrics and format the prompt
         metrics = calculate_sprint_metrics(issues)
+        formatted_prompt = build_sprint_report_prompt(
+            args["sprint_name"],
+            args["sprint_start"],
+            args["sprint_end"],
+            args["team_name"],
+            issues,
+            metrics=metrics,
+            burndown=burndown,
+        )
 
-        # Format data for prompt
-        task_details = format_task_details(issues)
-        recent_updates = format_updates(issues)
-
-        # Load and format prompt
-        prompt_template = load_reporting_prompt()
-        formatted_prompt = prompt_template.format(
-            sprint_id=args["sprint_name"],
-            team_name=args["team_name"],
-            sprint_start=args["sprint_start"],
-            sprint_end=args["sprint_end"],
-            completed_tasks=len(metrics["completed"]),
-            in_progress_tasks=len(metrics["in_progress"]),
-            blocked_tasks=len(metrics["blocked"]),
-            not_started_tasks=len(metrics["not_started"]),
-            task_details=task_details,
-            recent_updates=recent_updates,
-            previous_velocity="N/A",  # Would need historical data
-            team_capacity=metrics["total_issues"],
-            planned_points=metrics["total_story_points"],
-            completed_points=metrics["completed_story_points"],
+        result = build_sprint_result(
+            args["sprint_name"],
+            args["team_name"],
+            args["sprint_start"],
+            args["sprint_end"],
+            metrics,
+            series,
         )
+        publish_result(result)
 
         return {
             "content": [
@@ -170,7 +276,7 @@ async def generate_sprint_report(args: Dict[str, Any]) -> Dict[str, Any]:
                     "type": "text",
                     "text": f"Sprint data analyzed successfully. Generating report...\n\n{formatted_prompt}",
                 }
-            ]
+            ],
         }
 
     except Exception as e:
@@ -185,33 +291,151 @@ async def generate_sprint_report(args: Dict[str, Any]) -> Dict[str, Any]:
         }
 
 
+async def attach_files(uploads: Iterable[Tuple[str, Path]]) -> List[Dict[str, Any]]:
+    """
+    Attach files to JIRA issues, uploading them concurrently.
+
+    Files are streamed from disk through the REST client's pooled session,
+    at most JIRA_UPLOAD_CONCURRENCY at once; failed uploads are retried
+    and then reported per file rather than failing the whole batch.
+
+    Args:
+        uploads: (issue key, file path) pairs
+
+    Returns:
+        One {"issue_key", "file", "attachment_id"} or {"issue_key", "file",
+        "error"} per upload, in order
+
+    Raises:
+        ValueError: If no JIRA API credentials are configured
+    """
+    from .jira_tools import AsyncJiraClient
+
+    uploads = [(issue_key, Path(file_path)) for issue_key, file_path in uploads]
+    async with AsyncJiraClient() as client:
+        results = await client.upload_attachments(uploads, return_exceptions=True)
+
+    attached = []
+    for (issue_key, file_path), result in zip(uploads, results):
+        entry: Dict[str, Any] = {"issue_key": issue_key, "file": str(file_path)}
+        if isinstance(result, Exception):
+            entry["error"] = str(result)
+        else:
+            entry["attachment_id"] = result[0]["id"] if result else None
+        attached.append(entry)
+    return attached
+
+
+@tool(
+    "attach_files_to_jira",
+    "Attach local files (reports, charts) to JIRA issues. Uploads run concurrently and failed "
+    "uploads are retried; each file's outcome is reported.",
+    {
+        "type": "object",
+        "properties": {
+            "attachments": {
+                "type": "array",
+                "items": {
+                    "type": "object",
+                    "properties": {
+                        "issue_key": {"type": "string"},
+                        "file_path": {"type": "string"},
+                    },
+                    "required": ["issue_key", "file_path"],
+                },
+            },
+        },
+        "required": ["attachments"],
+    },
+)
+async def attach_files_to_jira(args: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Attach files to JIRA issues.
+
+    Args:
+        attachments: List of {"issue_key", "file_path"}
+
+    Returns:
+        Outcome of each upload
+    """
+    try:
+        uploads = [(item["issue_key"], Path(item["file_path"])) for item in args["attachments"]]
+        missing = [str(path) for _, path in uploads if not path.is_file()]
+        if missing:
+            raise FileNotFoundError(f"No such file: {', '.join(missing)}")
+        attached = await attach_files(uploads)
+
+        lines = [
+            f"- {Path(entry['file']).name} → {entry['issue_key']}: "
+            + (f"failed ({entry['error']})" if "error" in entry else f"attachment {entry['attachment_id']}")
+            for entry in attached
+        ]
+        failed = sum("error" in entry for entry in attached)
+        response: Dict[str, Any] = {
+            "content": [
+                {
+                    "type": "text",
+                    "text": f"Attached {len(attached) - failed} of {len(attached)} files:\n" + "\n".join(lines),
+                }
+            ],
+        }
+        if attached and failed == len(attached):
+            response["isError"] = True
+        return response
+
+    except Exception as e:
+        return {
+            "content": [
+                {
+                    "type": "text",
+                    "text": f"Error attaching files: {str(e)}",
+                }
+            ],
+            "isError": True,
+        }
+
+
 @tool(
     "save_report_to_jira",
-    "Save generated report locally and provide instructions for uploading to JIRA/Confluence",
+    "Save generated report locally and attach it to a JIRA issue",
     {
-        "issue_key": str,
-        "report_content": str,
-        "report_name": str,
+        "type": "object",
+        "properties": {
+            "issue_key": {"type": "string"},
+            "report_content": {"type": "string"},
+            "report_name": {"type": "string"},
+            "team_name": {"type": "string"},
+            "initiative_name": {"type": "string"},
+            "sprint_name": {"type": "string"},
+            "attach": {"type": "boolean"},
+        },
+        "required": ["issue_key", "report_content", "report_name"],
     },
 )
 async def save_report_to_jira(args: Dict[str, Any]) -> Dict[str, Any]:
     """
-    Save a generated report locally and provide instructions for JIRA/Confluence upload.
+    Save a generated report locally and attach it to a JIRA issue.
 
-    This tool saves the report file locally. Use Atlassian MCP tools to upload to JIRA
-    or create/update a Confluence page.
+    The report is always saved and archived first; if the upload fails
+    (or attach is false, e.g. for a Confluence page ID) the result says so
+    and the Atlassian MCP tools can share the local copy instead.
 
     Args:
         issue_key: JIRA issue key to attach report to (or Confluence page ID)
         report_content: Markdown content of the report
         report_name: Name for the report file
+        team_name: Team the report covers (optional, for the archive index)
+        initiative_name: Initiative the report covers (optional)
+        sprint_name: Sprint the report covers (optional)
+        attach: Upload the report to the issue (default true)
 
     Returns:
-        File path and upload instructions
+        File path and attachment outcome
     """
     try:
         settings = get_settings()
         report_dir = settings.output.report_output_dir
+        report_dir.mkdir(parents=True, exist_ok=True)
 
         # Generate filename with timestamp
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -222,21 +446,43 @@ async def save_report_to_jira(args: Dict[str, Any]) -> Dict[str, Any]:
         with open(file_path, "w") as f:
             f.write(args["report_content"])
 
-        instructions = f"""Report saved locally to: {file_path}
+        # Index the report so it can be found with `po-agent reports search`
+        archive_file(
+            file_path,
+            kind="report",
+            title=args["report_name"],
+            content=args["report_content"],
+            team=args.get("team_name") or None,
+            initiative=args.get("initiative_name") or None,
+            sprint=args.get("sprint_name") or None,
+            issue_key=args["issue_key"],
+        )
+
+        attachment: Dict[str, Any] = {"issue_key": args["issue_key"], "file": str(file_path)}
+        if args.get("attach", True):
+            try:
+                attachment = (await attach_files([(args["issue_key"], file_path)]))[0]
+            except Exception as e:
+                attachment["error"] = str(e)
+        else:
+            attachment["error"] = "not requested"
+
+        if "error" in attachment:
+            status = f"""- Not attached to {args['issue_key']}: {attachment['error']}
 
 To share this report:
 1. For JIRA: Use Atlassian MCP jira_add_comment to add the report content to issue {args['issue_key']}
-2. For Confluence: Use Atlassian MCP confluence_create_page or confluence_update_page to publish the report
-
-Report content is ready to be uploaded."""
+2. For Confluence: Use Atlassian MCP confluence_create_page or confluence_update_page to publish the report"""
+        else:
+            status = f"- Attached to: {args['issue_key']} (attachment {attachment['attachment_id']})"
 
         return {
             "content": [
                 {
                     "type": "text",
-                    "text": f"Report saved successfully:\n- File: {filename}\n- Attached to: {args['issue_key']}\n- Local copy: {file_path}",
+                    "text": f"Report saved successfully:\n- File: {filename}\n{status}\n- Local copy: {file_path}",
                 }
-            ]
+            ],
         }
 
     except Exception as e:
@@ -251,16 +497,38 @@ Report content is ready to be uploaded."""
         }
 
 
-def generate_report_summary(report_content: str) -> str:
+def generate_report_summary(
+    report_content: str, result: Optional[SprintReportResult] = None
+) -> str:
     """
     Generate a brief summary of the report for notifications.
 
     Args:
         report_content: Full report content
+        result: Structured result the report was generated from; when given,
+            the summary is built from its metrics instead of the report text
 
     Returns:
         Brief summary text
     """
+    if result is not None:
+        metrics = result.metrics
+        lines = [
+            f"{result.team_name} – {result.sprint_name}",
+            f"Completion: {metrics.completion_rate}% "
+            f"({metrics.completed}/{metrics.total_issues} issues)",
+            f"Velocity: {metrics.velocity:g} of {metrics.total_story_points:g} points",
+        ]
+        if result.blockers:
+            lines.append(
+                f"Blocked: {', '.join(blocker.key for blocker in result.blockers)}"
+            )
+        if result.burndown is not None:
+            lines.append(
+                f"Projected remaining at sprint end: {result.burndown.projected_remaining:.1f} points"
+            )
+        return "\n".join(lines)
+
     # Extract key metrics from report
     lines = report_content.split("\n")
     summary_lines = [line for line in lines if any(
@@ -268,4 +536,4 @@ def generate_report_summary(report_content: str) -> str:
         for keyword in ["predictability", "velocity", "completion", "risk"]
     )]
 
-    return "\n".join(summary_lines[:5]) if summary_lines else "Report generated successfully"
\ No newline at end of file
+    return "\n".join(summary_lines[:5]) if summary_lines else "Report generated successfully"
@@ -1,11 +1,19 @@
 """Business to technical requirement translation tools."""
 
+import json
 from pathlib import Path
 from typing import Any, Dict, List
 
 from claude_agent_sdk import tool
 
+from ..component_catalog import component_context
 from ..config import get_settings
+from ..duplicates import open_duplicate_index
+from ..results import TranslationResult, publish_result
+from ..story_creation import StoryCreator
+from ..translation_cache import cached_translation, translation_cache_key, translation_context
+from ..vector_index import retrieve_context
+from .jira_tools import AsyncJiraClient
 
 
 def load_translation_prompt() -> str:
@@ -15,6 +23,42 @@ def load_translation_prompt() -> str:
         return f.read()
 
 
+def build_translation_prompt(
+    epic_summary: str,
+    epic_description: str,
+    architecture_type: str,
+    component_list: str,
+    team_skills: str,
+) -> str:
+    """
+    Format the translation prompt for an epic.
+
+    Args:
+        epic_summary: Epic summary from JIRA
+        epic_description: Epic description from JIRA
+        architecture_type: System architecture (e.g., "microservices", "monolithic")
+        component_list: Comma-separated list of existing components
+        team_skills: Comma-separated list of team capabilities
+
+    Returns:
+        Formatted translation prompt
+    """
+    # Get Outsystems version from config
+    settings = get_settings()
+    version = settings.outsystems.version
+
+    business_requirement = f"{epic_summary}\n\n{epic_description}"
+
+    prompt_template = load_translation_prompt()
+    return prompt_template.format(
+        business_requirement=business_requirement,
+        version=version,
+        architecture_type=architecture_type,
+        component_list=component_list,
+        team_skills=team_skills,
+    )
+
+
 @tool(
     "translate_epic_to_stories",
     "Translate a business epic into technical user stories. Use Atlassian MCP jira_get_issue to fetch the epic first.",
@@ -40,28 +84,50 @@ async def translate_epic_to_stories(args: Dict[str, Any]) -> Dict[str, Any]:
         epic_summary: Epic summary from JIRA
         epic_description: Epic description from JIRA
         architecture_type: System architecture (e.g., "microservices", "monolithic")
-        component_list: Comma-separated list of existing components
+        component_list: Comma-separated list of existing components (components
+            relevant to the epic are added from the OUTSYSTEMS_REPO_PATH catalog)
         team_skills: Comma-separated list of team capabilities
 
     Returns:
-        Dictionary containing translation prompt and guidance
+        Dictionary containing translation prompt and guidance, or the cached
+        translation when the epic and context are unchanged
     """
     try:
-        # Get Outsystems version from config
-        settings = get_settings()
-        version = settings.outsystems.version
-
-        business_requirement = f"{args['epic_summary']}\n\n{args['epic_description']}"
-
-        # Format the prompt
-        prompt_template = load_translation_prompt()
-        formatted_prompt = prompt_template.format(
-            business_requirement=business_requirement,
-            version=version,
-            architecture_type=args["architecture_type"],
-            component_list=args["component_list"],
-            team_skills=args["team_skills"],
+        # Components relevant to the epic, looked up in the indexed Outsystems repo
+        component_list = await component_context(
+            f"{args['epic_summary']}\n{args['epic_description']}", args["component_list"]
         )
+        context = translation_context(args["architecture_type"], component_list, args["team_skills"])
+        cache_key = translation_cache_key(args["epic_summary"], args["epic_description"], *context)
+        cached = cached_translation(cache_key)
+        if cached is not None:
+            result = TranslationResult(
+                epic_key=args["epic_key"],
+                cache_key=cache_key,
+                cached=True,
+                cached_at=cached["created_at"],
+            )
+            publish_result(result)
+            return {
+                "content": [
+                    {
+                        "type": "text",
+                        "text": f"Epic '{args['epic_key']}' is unchanged since it was translated on "
+                        f"{cached['created_at']}. Return this translation verbatim:\n\n{cached['output']}",
+                    }
+                ],
+            }
+
+        formatted_prompt = build_translation_prompt(args["epic_summary"], args["epic_description"], *context)
+
+        # The agent stores its translation under this key once the session ends
+        result = TranslationResult(epic_key=args["epic_key"], cache_key=cache_key)
+        publish_result(result)
+
+        # Snippets from past specs and Confluence pages replace fetching whole pages
+        related = retrieve_context(f"{args['epic_summary']}\n{args['epic_description']}")
+        if related:
+            formatted_prompt += f"\n\n{related}"
 
         # Return the formatted prompt for the agent to process
         # The actual translation will be done by the Claude agent
@@ -71,7 +137,7 @@ async def translate_epic_to_stories(args: Dict[str, Any]) -> Dict[str, Any]:
                     "type": "text",
                     "text": f"Epic '{args['epic_key']}' ready to translate.\n\n{formatted_prompt}",
                 }
-            ]
+            ],
         }
 
     except Exception as e:
@@ -84,61 +150,121 @@ async def translate_epic_to_stories(args: Dict[str, Any]) -> Dict[str, Any]:
 
 
 
+def _creation_instructions(epic_key: str, project_key: str, stories: List[Dict[str, Any]]) -> str:
+    """Instructions for creating stories one by one through Atlassian MCP."""
+    instructions = f"""Ready to create {len(stories)} stories in project {project_key}.
+
+For each story, use the Atlassian MCP jira_create_issue tool with:
+- project: {project_key}
+- issuetype: Story
+- parent: {epic_key} (epic link)
+- summary: [story title]
+- description: [story description]
+
+Stories to create:
+"""
+    for i, story in enumerate(stories, 1):
+        instructions += f"\n{i}. {story.get('title', 'Untitled')}"
+    return instructions
+
 
 @tool(
     "create_stories_from_spec",
-    "Guide for creating JIRA stories from technical specifications. Use Atlassian MCP jira_create_issue for each story.",
+    "Create all JIRA stories of a technical specification in one call, linked to the epic. "
+    "Stories are created in bulk and safe to retry: stories that already exist are not duplicated. "
+    "Stories resembling existing backlog issues are reported as likely duplicates and not created "
+    "unless allow_duplicates is true. Do not call createJiraIssue for the individual stories.",
     {
-        "epic_key": str,
-        "project_key": str,
-        "stories_json": str,  # JSON string of stories list
+        "type": "object",
+        "properties": {
+            "epic_key": {"type": "string", "description": "Parent epic key"},
+            "project_key": {"type": "string", "description": "JIRA project key"},
+            "stories_json": {
+                "type": "string",
+                "description": "JSON array of stories with title, description and optional "
+                "acceptance_criteria (list), story_points and labels",
+            },
+            "allow_duplicates": {
+                "type": "boolean",
+                "description": "Create stories even if they resemble existing backlog issues",
+            },
+        },
+        "required": ["epic_key", "project_key", "stories_json"],
     },
 )
 async def create_stories_from_spec(args: Dict[str, Any]) -> Dict[str, Any]:
     """
-    Provide guidance for creating JIRA user stories from a technical specification.
+    Create JIRA user stories from a technical specification.
 
-    NOTE: This tool provides instructions. Actual story creation should be done using
-    Atlassian MCP jira_create_issue tool for each story.
+    Stories are created with JIRA's bulk API (see StoryCreator). Unless
+    DUPLICATE_DETECTION_ENABLED is false, each story is first checked against
+    the project's backlog in the duplicate index and likely duplicates are
+    reported instead of created. Without
+    direct JIRA credentials, instructions for creating each story through
+    Atlassian MCP jira_create_issue are returned instead.
 
     Args:
         epic_key: Parent epic key to link stories to
         project_key: JIRA project key
         stories_json: JSON string containing list of stories
+        allow_duplicates: Skip the near-duplicate check against the backlog
 
     Returns:
-        Instructions for creating stories via Atlassian MCP
+        Created story keys, or instructions for creating stories via Atlassian MCP
     """
     try:
-        import json
-
         stories = json.loads(args["stories_json"])
 
         if not isinstance(stories, list):
             raise ValueError("stories_json must be a JSON array")
 
-        instructions = f"""Ready to create {len(stories)} stories in project {args['project_key']}.
+        try:
+            client = AsyncJiraClient()
+        except ValueError:
+            return {
+                "content": [
+                    {
+                        "type": "text",
+                        "text": _creation_instructions(args["epic_key"], args["project_key"], stories),
+                    }
+                ]
+            }
 
-For each story, use the Atlassian MCP jira_create_issue tool with:
-- project: {args['project_key']}
-- issuetype: Story
-- parent: {args['epic_key']} (epic link)
-- summary: [story title]
-- description: [story description]
+        creator = StoryCreator(client=client, duplicates=open_duplicate_index())
+        try:
+            result = await creator.create(
+                args["project_key"],
+                args["epic_key"],
+                stories,
+                allow_duplicates=bool(args.get("allow_duplicates")),
+            )
+        finally:
+            await client.close()
+            if creator.duplicates is not None:
+                creator.duplicates.close()
+        publish_result(result)
 
-Stories to create:
-"""
-        for i, story in enumerate(stories, 1):
-            instructions += f"\n{i}. {story.get('title', 'Untitled')}"
+        lines = [f"Stories for {result.epic_key} in project {result.project_key}:"]
+        if result.created:
+            lines.append(f"Created {len(result.created)}: {', '.join(s.key for s in result.created)}")
+        if result.existing:
+            lines.append(
+                f"Already existed {len(result.existing)}: {', '.join(s.key for s in result.existing)}"
+            )
+        for story in result.duplicates:
+            matches = ", ".join(
+                f"{match.key} {match.summary!r} ({match.similarity:.0%})" for match in story.matches
+            )
+            lines.append(f"Likely duplicate, not created: {story.title} ~ {matches}")
+        if result.duplicates:
+            lines.append("Call again with allow_duplicates=true to create likely duplicates anyway.")
+        for story in result.failed:
+            lines.append(f"Failed: {story.title or '(untitled)'} - {story.error}")
 
-        return {
-            "content": [
-                {
-                    "type": "text",
-                    "text": instructions,
-                }
-            ]
-        }
+        response = {"content": [{"type": "text", "text": "\n".join(lines)}]}
+        if result.failed and not result.keys:
+            response["isError"] = True
+        return response
 
     except Exception as e:
         return {
@@ -149,4 +275,4 @@ Stories to create:
                 }
             ],
             "isError": True,
-        }
\ No newline at end of file
+        }
@@ -0,0 +1,331 @@
+"""Persistent cache of epic translations keyed by a hash of their inputs."""
+
+import hashlib
+import json
+import logging
+import sqlite3
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from .config import get_settings
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS translations (
+    cache_key TEXT PRIMARY KEY,
+    epic_key TEXT NOT NULL,
+    output TEXT NOT NULL,
+    created_at TEXT NOT NULL,
+    last_used_at TEXT NOT NULL,
+    hits INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS idx_translations_epic_key ON translations(epic_key);
+CREATE INDEX IF NOT EXISTS idx_translations_last_used ON translations(last_used_at);
+CREATE TABLE IF NOT EXISTS counters (
+    name TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+"""
+
+
+def template_version() -> str:
+    """Return a short hash of the translation prompt template."""
+    from .tools.translation import load_translation_prompt
+
+    return hashlib.sha256(load_translation_prompt().encode()).hexdigest()[:12]
+
+
+def translation_context(
+    architecture_type: str, component_list: str, team_skills: str
+) -> Tuple[str, str, str]:
+    """
+    Normalize the shared translation context, filling in defaults for blanks.
+
+    The prompt and the cache key both use this, so "translate" and
+    "translate-batch" agree on the key for the same epic and context.
+
+    Args:
+        architecture_type: System architecture type
+        component_list: Existing components
+        team_skills: Team capabilities
+
+    Returns:
+        (architecture_type, component_list, team_skills)
+    """
+    return (
+        (architecture_type or "").strip() or "microservices",
+        (component_list or "").strip() or "None specified",
+        (team_skills or "").strip() or "General development",
+    )
+
+
+def translation_cache_key(
+    epic_summary: str,
+    epic_description: str,
+    architecture_type: str,
+    component_list: str,
+    team_skills: str,
+    version: Optional[str] = None,
+    template: Optional[str] = None,
+) -> str:
+    """
+    Hash everything a translation depends on.
+
+    The context is normalized with translation_context first.
+
+    Args:
+        epic_summary: Epic summary from JIRA
+        epic_description: Epic description from JIRA
+        architecture_type: System architecture type
+        component_list: Existing components
+        team_skills: Team capabilities
+        version: Outsystems version (defaults to OUTSYSTEMS_VERSION)
+        template: Prompt template version (defaults to template_version())
+
+    Returns:
+        Hex digest identifying the translation inputs
+    """
+    if version is None:
+        version = get_settings().outsystems.version
+    if template is None:
+        template = template_version()
+    payload = json.dumps([
+        (epic_summary or "").strip(),
+        (epic_description or "").strip(),
+        *translation_context(architecture_type, component_list, team_skills),
+        version,
+        template,
+    ])
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class TranslationCache:
+    """
+    SQLite cache of translation outputs.
+
+    Entries expire after TRANSLATION_CACHE_TTL_DAYS and the least recently
+    used entries are evicted beyond TRANSLATION_CACHE_MAX_ENTRIES. Hit and
+    miss counts persist across runs.
+    """
+
+    def __init__(
+        self,
+        db_path: Optional[Path] = None,
+        max_entries: Optional[int] = None,
+        ttl_days: Optional[int] = None,
+        create: bool = True,
+    ):
+        """
+        Open (and create if needed) the cache.
+
+        Args:
+            db_path: Cache location (defaults to TRANSLATION_CACHE_DB)
+            max_entries: Entry limit (defaults to TRANSLATION_CACHE_MAX_ENTRIES)
+            ttl_days: Entry lifetime (defaults to TRANSLATION_CACHE_TTL_DAYS)
+            create: Create the database if it does not exist yet (when
+                false, a missing database reads as empty and nothing is written
+                to disk)
+        """
+        settings = get_settings()
+        self.db_path = Path(db_path or settings.output.translation_cache_db)
+        self.max_entries = (
+            settings.agent.translation_cache_max_entries if max_entries is None else max_entries
+        )
+        self.ttl_days = settings.agent.translation_cache_ttl_days if ttl_days is None else ttl_days
+        if create or self.db_path.exists():
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            self.conn = sqlite3.connect(str(self.db_path))
+        else:
+            # Nothing stored yet: read from an empty database instead of creating one
+            self.conn = sqlite3.connect(":memory:")
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript(_SCHEMA)
+
+    def __enter__(self) -> "TranslationCache":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        self.conn.close()
+
+    def _count(self, name: str) -> None:
+        self.conn.execute(
+            "INSERT INTO counters (name, value) VALUES (?, 1) "
+            "ON CONFLICT(name) DO UPDATE SET value = value + 1",
+            (name,),
+        )
+
+    def _expiry_cutoff(self) -> str:
+        return (datetime.now() - timedelta(days=self.ttl_days)).isoformat(timespec="seconds")
+
+    def get(self, cache_key: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up a translation and record a hit or miss.
+
+        Args:
+            cache_key: Key from translation_cache_key()
+
+        Returns:
+            Entry with epic_key, output and created_at, or None on a miss
+        """
+        now = datetime.now().isoformat(timespec="seconds")
+        with self.conn:
+            row = self.conn.execute(
+                "SELECT * FROM translations WHERE cache_key = ? AND created_at >= ?",
+                (cache_key, self._expiry_cutoff()),
+            ).fetchone()
+            if row is None:
+                self._count("misses")
+                return None
+            self._count("hits")
+            self.conn.execute(
+                "UPDATE translations SET hits = hits + 1, last_used_at = ? WHERE cache_key = ?",
+                (now, cache_key),
+            )
+        return dict(row)
+
+    def put(self, cache_key: str, epic_key: str, output: str) -> None:
+        """
+        Store a translation, replacing older ones for the same epic.
+
+        Args:
+            cache_key: Key from translation_cache_key()
+            epic_key: Epic the translation belongs to
+            output: Translation text
+        """
+        now = datetime.now().isoformat(timespec="seconds")
+        with self.conn:
+            # An epic's previous content can never be requested again once it changed
+            self.conn.execute(
+                "DELETE FROM translations WHERE epic_key = ? AND cache_key != ?",
+                (epic_key, cache_key),
+            )
+            self.conn.execute(
+                """
+                INSERT OR REPLACE INTO translations
+                    (cache_key, epic_key, output, created_at, last_used_at, hits)
+                VALUES (?, ?, ?, ?, ?, 0)
+                """,
+                (cache_key, epic_key, output, now, now),
+            )
+        self.evict()
+
+    def evict(self) -> int:
+        """
+        Drop expired entries and the least recently used beyond the limit.
+
+        Returns:
+            Number of entries removed
+        """
+        with self.conn:
+            expired = self.conn.execute(
+                "DELETE FROM translations WHERE created_at < ?", (self._expiry_cutoff(),)
+            ).rowcount
+            overflow = self.conn.execute(
+                """
+                DELETE FROM translations WHERE cache_key IN (
+                    SELECT cache_key FROM translations
+                    ORDER BY last_used_at DESC, created_at DESC
+                    LIMIT -1 OFFSET ?
+                )
+                """,
+                (self.max_entries,),
+            ).rowcount
+        return expired + overflow
+
+    def invalidate(self, epic_keys: Optional[List[str]] = None) -> int:
+        """
+        Remove cached translations.
+
+        Args:
+            epic_keys: Epics to forget (None clears the whole cache)
+
+        Returns:
+            Number of entries removed
+        """
+        with self.conn:
+            if epic_keys is None:
+                return self.conn.execute("DELETE FROM translations").rowcount
+            return sum(
+                self.conn.execute(
+                    "DELETE FROM translations WHERE epic_key = ? COLLATE NOCASE", (key,)
+                ).rowcount
+                for key in epic_keys
+            )
+
+    def reset_stats(self) -> None:
+        """Zero the hit and miss counters."""
+        with self.conn:
+            self.conn.execute("DELETE FROM counters")
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Return cache size and hit/miss metrics.
+
+        Returns:
+            entries, size_bytes, hits, misses and hit_rate (percent)
+        """
+        counters = {
+            row["name"]: row["value"] for row in self.conn.execute("SELECT * FROM counters")
+        }
+        entries, size = self.conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(LENGTH(output)), 0) FROM translations"
+        ).fetchone()
+        hits = counters.get("hits", 0)
+        misses = counters.get("misses", 0)
+        lookups = hits + misses
+        return {
+            "entries": entries,
+            "size_bytes": size,
+            "max_entries": self.max_entries,
+            "ttl_days": self.ttl_days,
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": round(hits / lookups * 100, 1) if lookups else 0.0,
+        }
+
+
+def cached_translation(cache_key: str) -> Optional[Dict[str, Any]]:
+    """
+    Look up a translation in the default cache.
+
+    Lookups are best-effort: a disabled or unreadable cache is a miss.
+
+    Args:
+        cache_key: Key from translation_cache_key()
+
+    Returns:
+        Cached entry, or None
+    """
+    if not get_settings().agent.translation_cache_enabled:
+        return None
+    try:
+        with TranslationCache() as cache:
+            return cache.get(cache_key)
+    except Exception as e:
+        logger.warning(f"Translation cache lookup failed: {e}")
+        return None
+
+
+def store_translation(cache_key: str, epic_key: str, output: str) -> None:
+    """
+    Store a translation in the default cache (best-effort).
+
+    Args:
+        cache_key: Key from translation_cache_key()
+        epic_key: Epic the translation belongs to
+        output: Translation text
+    """
+    if not get_settings().agent.translation_cache_enabled or not output.strip():
+        return
+    try:
+        with TranslationCache() as cache:
+            cache.put(cache_key, epic_key, output)
+    except Exception as e:
+        logger.warning(f"Failed to cache translation of {epic_key}: {e}")
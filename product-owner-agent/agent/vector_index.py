@@ -0,0 +1,713 @@
+"""Embedded, file-backed vector index of specs, reports and Confluence pages."""
+
+import hashlib
+import html
+import json
+import logging
+import os
+import re
+import threading
+from contextlib import contextmanager
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+try:
+    import fcntl
+except ImportError:  # Windows: writers are serialized within one process only
+    fcntl = None
+
+from .config import get_settings
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_INDEX_DIR = Path("./reports/vector_index")
+
+_VECTORS_FILE = "vectors.npy"
+_META_FILE = "index.json"
+_ANN_FILE = "ann.npz"
+_LOCK_FILE = ".lock"
+
+# Kinds of documents whose source is a file that may disappear
+_FILE_KINDS = {"report", "chart", "spec", "confluence"}
+_CONFLUENCE_SUFFIXES = {".html", ".htm", ".md", ".txt"}
+
+_TOKEN = re.compile(r"\w+", flags=re.UNICODE)
+_HTML_TITLE = re.compile(r"<title[^>]*>(.*?)</title>", flags=re.IGNORECASE | re.DOTALL)
+_HTML_DROP = re.compile(r"<(script|style)[^>]*>.*?</\1>", flags=re.IGNORECASE | re.DOTALL)
+_HTML_BREAK = re.compile(r"<\s*(br|/p|/div|/h\d|/li|/tr)[^>]*>", flags=re.IGNORECASE)
+_HTML_TAG = re.compile(r"<[^>]+>")
+
+
+def index_path(connection: Optional[str] = None) -> Path:
+    """
+    Resolve the index directory from VECTOR_DB_CONNECTION.
+
+    Args:
+        connection: Local path or file:// URL (defaults to VECTOR_DB_CONNECTION)
+
+    Returns:
+        Index directory
+
+    Raises:
+        ValueError: If the connection names a database server
+    """
+    if connection is None:
+        connection = get_settings().vector_db.connection
+    if not connection:
+        return DEFAULT_INDEX_DIR
+    if connection.startswith("file://"):
+        return Path(connection[len("file://"):])
+    if "://" in connection:
+        raise ValueError(
+            "VECTOR_DB_CONNECTION must be a local directory; the vector index is embedded"
+        )
+    return Path(connection)
+
+
+def _normalize(word: str) -> str:
+    """Strip common English inflections so "refunds" and "refunded" match "refund"."""
+    word = word.lower()
+    if len(word) > 5 and word.endswith("ing"):
+        word = word[:-3]
+    elif len(word) > 4 and word.endswith("ies"):
+        word = word[:-3] + "y"
+    elif len(word) > 4 and word.endswith("ed"):
+        word = word[:-2]
+    elif len(word) > 3 and word.endswith("s") and not word.endswith("ss"):
+        word = word[:-1]
+    # "issue", "issues" and "issued" all become "issu"
+    if len(word) > 3 and word.endswith("e"):
+        word = word[:-1]
+    return word
+
+
+@lru_cache(maxsize=65536)
+def _feature(token: str, dimensions: int) -> Tuple[Tuple[int, float], ...]:
+    """
+    Hash a feature to two (bucket, sign) pairs, stable across processes.
+
+    Two buckets per feature keep a single hash collision from cancelling a
+    feature out.
+    """
+    digest = hashlib.blake2b(token.encode(), digest_size=8).digest()
+    pairs = []
+    for half in (digest[:4], digest[4:]):
+        value = int.from_bytes(half, "little")
+        pairs.append((value % dimensions, 1.0 if value >> 31 else -1.0))
+    return tuple(pairs)
+
+
+class HashingEmbedder:
+    """
+    Local embedding function using signed feature hashing.
+
+    Normalized words and adjacent word pairs are hashed into a fixed number of
+    dimensions with sublinear term frequency, and vectors are L2-normalized
+    so dot products are cosine similarities. No model download or network
+    access is needed, and embeddings are identical across runs.
+    """
+
+    def __init__(self, dimensions: int = 512):
+        """
+        Initialize the embedder.
+
+        Args:
+            dimensions: Embedding size
+        """
+        self.dimensions = dimensions
+
+    def embed(self, texts: List[str]) -> np.ndarray:
+        """
+        Embed texts.
+
+        Args:
+            texts: Texts to embed
+
+        Returns:
+            float32 array of shape (len(texts), dimensions)
+        """
+        vectors = np.zeros((len(texts), self.dimensions), dtype=np.float32)
+        for row, text in enumerate(texts):
+            words = [_normalize(word) for word in _TOKEN.findall(text)]
+            counts: Dict[str, int] = {}
+            for feature in words + [f"{a} {b}" for a, b in zip(words, words[1:])]:
+                counts[feature] = counts.get(feature, 0) + 1
+            for feature, count in counts.items():
+                # Word pairs add phrase information but weigh less than words
+                weight = (0.5 if " " in feature else 1.0) * (1.0 + np.log(count))
+                for bucket, sign in _feature(feature, self.dimensions):
+                    vectors[row, bucket] += sign * weight
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        np.divide(vectors, norms, out=vectors, where=norms > 0)
+        return vectors
+
+
+def chunk_text(text: str, max_chars: int = 1000) -> List[str]:
+    """
+    Split text into chunks of whole paragraphs.
+
+    Paragraphs longer than max_chars are split at sentence ends, or hard
+    split when a sentence is itself too long.
+
+    Args:
+        text: Text to split
+        max_chars: Target chunk size
+
+    Returns:
+        Non-empty chunks in document order
+    """
+    pieces = []
+    for paragraph in re.split(r"\n\s*\n", text):
+        paragraph = paragraph.strip()
+        if len(paragraph) <= max_chars:
+            pieces.append(paragraph)
+            continue
+        for sentence in re.split(r"(?<=[.!?])\s+", paragraph):
+            pieces.extend(sentence[start:start + max_chars] for start in range(0, len(sentence), max_chars))
+
+    chunks: List[str] = []
+    current = ""
+    for piece in filter(None, pieces):
+        if current and len(current) + len(piece) + 2 > max_chars:
+            chunks.append(current)
+            current = piece
+        else:
+            current = f"{current}\n\n{piece}" if current else piece
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+def html_to_text(markup: str) -> Tuple[str, str]:
+    """
+    Reduce an exported HTML page to its title and plain text.
+
+    Args:
+        markup: HTML document
+
+    Returns:
+        (title, text); the title is empty if the page has none
+    """
+    title_match = _HTML_TITLE.search(markup)
+    title = html.unescape(title_match.group(1)).strip() if title_match else ""
+    text = _HTML_DROP.sub(" ", markup)
+    text = _HTML_BREAK.sub("\n\n", text)
+    text = html.unescape(_HTML_TAG.sub(" ", text))
+    text = "\n\n".join(
+        " ".join(line.split()) for line in re.split(r"\n\s*\n", text) if line.strip()
+    )
+    return title, text
+
+
+def _kmeans(vectors: np.ndarray, clusters: int, iterations: int = 10, seed: int = 0) -> np.ndarray:
+    """Spherical k-means; returns unit-length centroids."""
+    rng = np.random.default_rng(seed)
+    centroids = vectors[rng.choice(len(vectors), clusters, replace=False)].copy()
+    for _ in range(iterations):
+        assignments = np.argmax(vectors @ centroids.T, axis=1)
+        for cluster in range(clusters):
+            members = vectors[assignments == cluster]
+            if len(members):
+                centroids[cluster] = members.sum(axis=0)
+        norms = np.linalg.norm(centroids, axis=1, keepdims=True)
+        np.divide(centroids, norms, out=centroids, where=norms > 0)
+    return centroids
+
+
+def _nearest(vectors: np.ndarray, centroids: np.ndarray, batch: int = 65536) -> np.ndarray:
+    """Assign each vector to its most similar centroid, in bounded-memory batches."""
+    return np.concatenate([
+        np.argmax(vectors[start:start + batch] @ centroids.T, axis=1)
+        for start in range(0, len(vectors), batch)
+    ] or [np.zeros(0, dtype=np.int64)]).astype(np.int32)
+
+
+class VectorIndex:
+    """
+    Chunk-level vector index stored as a NumPy matrix plus JSON metadata.
+
+    Small corpora are searched exactly with one matrix-vector product. Once
+    the corpus reaches VECTOR_DB_ANN_THRESHOLD chunks, an inverted-file
+    (IVF) index is trained: chunks are clustered with k-means and a query
+    only scores the chunks in the clusters closest to it. Documents are
+    keyed by source (a file path or other identifier); adding a source
+    again replaces its chunks.
+    """
+
+    def __init__(
+        self,
+        path: Optional[Path] = None,
+        embedder: Optional[HashingEmbedder] = None,
+        ann_threshold: Optional[int] = None,
+    ):
+        """
+        Open (or start) an index.
+
+        Args:
+            path: Index directory (defaults to VECTOR_DB_CONNECTION)
+            embedder: Embedding function (defaults to a HashingEmbedder
+                with VECTOR_DB_DIMENSIONS dimensions)
+            ann_threshold: Chunk count from which searches are approximate
+                (defaults to VECTOR_DB_ANN_THRESHOLD)
+        """
+        settings = get_settings()
+        self.path = Path(path) if path is not None else index_path()
+        self.embedder = embedder or HashingEmbedder(settings.vector_db.dimensions)
+        self.ann_threshold = ann_threshold or settings.vector_db.ann_threshold
+        self.vectors = np.zeros((0, self.embedder.dimensions), dtype=np.float32)
+        self.chunks: List[Dict[str, str]] = []
+        self.sources: Dict[str, Optional[str]] = {}
+        self.centroids: Optional[np.ndarray] = None
+        self.assignments: Optional[np.ndarray] = None
+        self._trained_size = 0
+        self._kinds: Optional[np.ndarray] = None
+        self._lists: Optional[Tuple[np.ndarray, np.ndarray]] = None
+        self._load()
+
+    def __len__(self) -> int:
+        return len(self.chunks)
+
+    def _load(self) -> None:
+        meta_path = self.path / _META_FILE
+        if not meta_path.exists():
+            return
+        meta = json.loads(meta_path.read_text())
+        if meta["dimensions"] != self.embedder.dimensions:
+            logger.warning(
+                f"Vector index at {self.path} has {meta['dimensions']} dimensions, "
+                f"expected {self.embedder.dimensions}; starting a new index"
+            )
+            return
+        self.vectors = np.load(self.path / _VECTORS_FILE)
+        self.chunks = meta["chunks"]
+        self.sources = meta["sources"]
+        ann_path = self.path / _ANN_FILE
+        if ann_path.exists():
+            ann = np.load(ann_path)
+            centroids, assignments = ann["centroids"], ann["assignments"]
+            trained_size = int(ann["trained_size"])
+            # Left over from an index of other dimensions, or out of step with
+            # the vectors; dropped here and removed by the next save()
+            if (
+                centroids.ndim != 2
+                or centroids.shape[1] != self.vectors.shape[1]
+                or len(assignments) != len(self.vectors)
+                or trained_size > len(self.vectors)
+            ):
+                logger.warning(f"Ignoring stale ANN index at {ann_path}; it is rebuilt when needed")
+            else:
+                self.centroids = centroids
+                self.assignments = assignments
+                self._trained_size = trained_size
+
+    def save(self) -> None:
+        """Write the index, replacing the previous files atomically."""
+        self.path.mkdir(parents=True, exist_ok=True)
+        if len(self) >= self.ann_threshold and (
+            self.centroids is None or len(self) > 2 * self._trained_size
+        ):
+            self.build_ann()
+
+        tmp_vectors = self.path / f"{_VECTORS_FILE}.tmp"
+        with open(tmp_vectors, "wb") as f:
+            np.save(f, self.vectors)
+        tmp_meta = self.path / f"{_META_FILE}.tmp"
+        tmp_meta.write_text(json.dumps({
+            "dimensions": self.embedder.dimensions,
+            "chunks": self.chunks,
+            "sources": self.sources,
+        }))
+        if self.centroids is not None:
+            tmp_ann = self.path / f"{_ANN_FILE}.tmp"
+            with open(tmp_ann, "wb") as f:
+                np.savez(
+                    f,
+                    centroids=self.centroids,
+                    assignments=self.assignments,
+                    trained_size=self._trained_size,
+                )
+            os.replace(tmp_ann, self.path / _ANN_FILE)
+        else:
+            (self.path / _ANN_FILE).unlink(missing_ok=True)
+        os.replace(tmp_vectors, self.path / _VECTORS_FILE)
+        os.replace(tmp_meta, self.path / _META_FILE)
+
+    def is_current(self, source: str, signature: Optional[str]) -> bool:
+        """
+        Check whether a source is indexed at the given version.
+
+        Args:
+            source: Document identifier
+            signature: Version marker recorded by add() (e.g. mtime and size)
+
+        Returns:
+            True if the source is indexed with this signature
+        """
+        return source in self.sources and self.sources[source] == signature
+
+    def add(
+        self,
+        source: str,
+        text: str,
+        kind: str,
+        title: str,
+        signature: Optional[str] = None,
+    ) -> int:
+        """
+        Index a document, replacing any earlier version of it.
+
+        Args:
+            source: Document identifier (usually its path)
+            text: Document text
+            kind: Document kind ("spec", "report", "chart", "confluence", ...)
+            title: Human-readable title
+            signature: Version marker used by is_current()
+
+        Returns:
+            Number of chunks indexed
+        """
+        self.remove(source)
+        chunks = chunk_text(text)
+        self.sources[source] = signature
+        if not chunks:
+            return 0
+        vectors = self.embedder.embed(chunks)
+        self.vectors = np.concatenate([self.vectors, vectors])
+        self.chunks.extend({"source": source, "kind": kind, "title": title, "text": chunk} for chunk in chunks)
+        self._kinds = None
+        self._lists = None
+        if self.centroids is not None:
+            self.assignments = np.concatenate([self.assignments, _nearest(vectors, self.centroids)])
+        return len(chunks)
+
+    def remove(self, source: str) -> int:
+        """
+        Drop a document's chunks.
+
+        Args:
+            source: Document identifier
+
+        Returns:
+            Number of chunks removed
+        """
+        if source not in self.sources:
+            return 0
+        del self.sources[source]
+        keep = np.array([chunk["source"] != source for chunk in self.chunks], dtype=bool)
+        removed = int((~keep).sum())
+        if removed:
+            self.vectors = self.vectors[keep]
+            self.chunks = [chunk for chunk, kept in zip(self.chunks, keep) if kept]
+            self._kinds = None
+            self._lists = None
+            if self.assignments is not None:
+                self.assignments = self.assignments[keep]
+        return removed
+
+    def build_ann(self, clusters: Optional[int] = None) -> None:
+        """
+        Train the inverted-file index on the current chunks.
+
+        Args:
+            clusters: Number of clusters (defaults to about sqrt(chunks))
+        """
+        if not len(self):
+            return
+        clusters = min(clusters or max(int(np.sqrt(len(self))), 1), len(self))
+        # Train on a sample; large corpora do not need every vector to place centroids
+        rng = np.random.default_rng(0)
+        sample_size = min(len(self), clusters * 256)
+        sample = self.vectors[rng.choice(len(self), sample_size, replace=False)]
+        self.centroids = _kmeans(sample, clusters)
+        self.assignments = _nearest(self.vectors, self.centroids)
+        self._trained_size = len(self)
+        self._lists = None
+        logger.info(f"Trained IVF index: {clusters} clusters over {len(self)} chunks")
+
+    def _inverted_lists(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Chunk indexes grouped by cluster, with each cluster's start offset."""
+        if self._lists is None:
+            order = np.argsort(self.assignments, kind="stable")
+            counts = np.bincount(self.assignments, minlength=len(self.centroids))
+            self._lists = (order, np.concatenate([[0], np.cumsum(counts)]))
+        return self._lists
+
+    def search(
+        self,
+        query: str,
+        k: int = 4,
+        kinds: Optional[List[str]] = None,
+        exact: Optional[bool] = None,
+        probes: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Find the chunks most similar to a query.
+
+        Args:
+            query: Free text
+            k: Number of chunks returned
+            kinds: Only return chunks of these document kinds
+            exact: Force brute-force (True) or IVF (False) search; by default
+                IVF is used when trained and the corpus reaches the threshold
+            probes: Clusters scored per IVF query (defaults to a tenth of
+                the clusters, at least 4)
+
+        Returns:
+            Chunks with source, kind, title, text and cosine score, best first
+        """
+        if not len(self):
+            return []
+        vector = self.embedder.embed([query])[0]
+        if exact is None:
+            exact = self.centroids is None or len(self) < self.ann_threshold
+
+        if exact or self.centroids is None:
+            # Score the matrix in place; gathering rows would copy the whole corpus
+            candidates = np.arange(len(self))
+            scores = self.vectors @ vector
+        else:
+            probes = min(probes or max(len(self.centroids) // 10, 4), len(self.centroids))
+            nearest = np.argpartition(-(self.centroids @ vector), probes - 1)[:probes]
+            order, offsets = self._inverted_lists()
+            candidates = np.concatenate([order[offsets[c]:offsets[c + 1]] for c in nearest])
+            scores = self.vectors[candidates] @ vector
+        if kinds:
+            if self._kinds is None:
+                self._kinds = np.array([chunk["kind"] for chunk in self.chunks])
+            wanted = np.isin(self._kinds[candidates], kinds)
+            candidates, scores = candidates[wanted], scores[wanted]
+        if not len(candidates):
+            return []
+
+        top = min(k, len(candidates))
+        best = np.argpartition(-scores, top - 1)[:top]
+        best = best[np.argsort(-scores[best])]
+        return [
+            {**self.chunks[candidates[i]], "score": round(float(scores[i]), 4)}
+            for i in best
+        ]
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Summarize the index.
+
+        Returns:
+            path, documents, chunks, chunks by kind, dimensions, size and
+            whether searches are approximate
+        """
+        by_kind: Dict[str, int] = {}
+        for chunk in self.chunks:
+            by_kind[chunk["kind"]] = by_kind.get(chunk["kind"], 0) + 1
+        return {
+            "path": str(self.path),
+            "documents": len(self.sources),
+            "chunks": len(self),
+            "by_kind": dict(sorted(by_kind.items())),
+            "dimensions": self.embedder.dimensions,
+            "size_bytes": int(self.vectors.nbytes),
+            "approximate": self.centroids is not None and len(self) >= self.ann_threshold,
+            "clusters": 0 if self.centroids is None else len(self.centroids),
+        }
+
+
+def _file_signature(path: Path) -> str:
+    stat = path.stat()
+    return f"{stat.st_mtime_ns}:{stat.st_size}"
+
+
+def _ingest_file(index: VectorIndex, path: Path, kind: str, title: Optional[str] = None) -> bool:
+    """Index a file unless it is unchanged; returns whether it was (re)indexed."""
+    source = str(path.resolve())
+    signature = _file_signature(path)
+    if index.is_current(source, signature):
+        return False
+    text = path.read_text(encoding="utf-8", errors="replace")
+    if path.suffix.lower() in {".html", ".htm"}:
+        page_title, text = html_to_text(text)
+        title = title or page_title
+    index.add(source, text, kind=kind, title=title or path.stem, signature=signature)
+    return True
+
+
+def ingest_sources(
+    index: VectorIndex,
+    archive_db: Optional[Path] = None,
+    spec_dir: Optional[Path] = None,
+    confluence_dir: Optional[Path] = None,
+) -> Dict[str, int]:
+    """
+    Feed archived reports and charts, translated specs and Confluence exports.
+
+    Unchanged files are skipped, and documents whose files were deleted are
+    dropped from the index. The index is not saved.
+
+    Args:
+        index: Index to update
+        archive_db: Report archive (defaults to REPORT_ARCHIVE_DB)
+        spec_dir: Translated specifications (defaults to TRANSLATION_OUTPUT_DIR)
+        confluence_dir: Exported Confluence pages (defaults to CONFLUENCE_EXPORT_DIR)
+
+    Returns:
+        Documents indexed per kind, plus "unchanged" and "removed" counts
+    """
+    from .archive import ReportArchive
+
+    settings = get_settings()
+    archive_db = Path(archive_db or settings.output.report_archive_db)
+    spec_dir = Path(spec_dir or settings.output.translation_output_dir)
+    if confluence_dir is None and settings.vector_db.confluence_export_dir:
+        confluence_dir = Path(settings.vector_db.confluence_export_dir)
+
+    counts = {"report": 0, "chart": 0, "spec": 0, "confluence": 0, "unchanged": 0, "removed": 0}
+
+    def ingest(path: Path, kind: str, title: Optional[str] = None) -> None:
+        if _ingest_file(index, path, kind, title):
+            counts[kind] += 1
+        else:
+            counts["unchanged"] += 1
+
+    if archive_db.exists():
+        with ReportArchive(archive_db) as archive:
+            rows = archive.conn.execute("SELECT path, kind, title FROM reports").fetchall()
+        for row in rows:
+            path = Path(row["path"])
+            if path.exists():
+                ingest(path, row["kind"] if row["kind"] in counts else "report", row["title"])
+    if spec_dir.is_dir():
+        for path in sorted(spec_dir.glob("*.md")):
+            ingest(path, "spec")
+    if confluence_dir is not None and Path(confluence_dir).is_dir():
+        for path in sorted(Path(confluence_dir).rglob("*")):
+            if path.is_file() and path.suffix.lower() in _CONFLUENCE_SUFFIXES:
+                ingest(path, "confluence")
+
+    kinds = {chunk["source"]: chunk["kind"] for chunk in index.chunks}
+    for source in list(index.sources):
+        if kinds.get(source) in _FILE_KINDS and not Path(source).exists():
+            index.remove(source)
+            counts["removed"] += 1
+    return counts
+
+
+# Loaded indexes by directory, reused while the files on disk are unchanged
+_loaded: Dict[Path, Tuple[Optional[int], VectorIndex]] = {}
+_write_lock = threading.Lock()
+
+
+@contextmanager
+def index_write_lock(path: Optional[Path] = None) -> Iterator[None]:
+    """
+    Hold an index directory's write lock, across threads and processes.
+
+    Load, modify and save the index inside the block, so that concurrent
+    writers do not overwrite each other's additions.
+
+    Args:
+        path: Index directory (defaults to VECTOR_DB_CONNECTION)
+    """
+    path = Path(path) if path is not None else index_path()
+    path.mkdir(parents=True, exist_ok=True)
+    with _write_lock, open(path / _LOCK_FILE, "a") as lock_file:
+        if fcntl is not None:
+            # Released when the file is closed
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+        yield
+
+
+def _meta_mtime(path: Path) -> Optional[int]:
+    meta_path = path / _META_FILE
+    return meta_path.stat().st_mtime_ns if meta_path.exists() else None
+
+
+def open_index() -> Optional[VectorIndex]:
+    """
+    Return the default index, loading it only when its files changed.
+
+    Returns:
+        The index, or None when VECTOR_DB_ENABLED is off
+    """
+    if not get_settings().vector_db.enabled:
+        return None
+    path = index_path().resolve()
+    mtime = _meta_mtime(path)
+    cached = _loaded.get(path)
+    if cached is None or cached[0] != mtime:
+        cached = (mtime, VectorIndex(path))
+        _loaded[path] = cached
+    return cached[1]
+
+
+def index_documents(documents: List[Dict[str, str]]) -> None:
+    """
+    Add freshly written documents to the default index with one save (best-effort).
+
+    The index already loaded by this process is reused (it is reloaded only
+    if another writer saved since), and the update is made under the index's
+    write lock.
+
+    Args:
+        documents: Dicts with source (usually the file path), text, kind and title
+    """
+    if not documents or not get_settings().vector_db.enabled:
+        return
+    try:
+        path = index_path().resolve()
+        with index_write_lock(path):
+            index = open_index()
+            try:
+                for document in documents:
+                    source = Path(document["source"])
+                    signature = _file_signature(source) if source.exists() else None
+                    index.add(
+                        document["source"],
+                        document["text"],
+                        kind=document["kind"],
+                        title=document["title"],
+                        signature=signature,
+                    )
+                index.save()
+            except Exception:
+                # The loaded copy no longer matches the files; reload it next time
+                _loaded.pop(path, None)
+                raise
+            _loaded[path] = (_meta_mtime(path), index)
+    except Exception as e:
+        logger.warning(f"Failed to add {len(documents)} document(s) to vector index: {e}")
+
+
+def retrieve_context(query: str, k: Optional[int] = None, kinds: Optional[List[str]] = None) -> str:
+    """
+    Format the snippets most relevant to a query for a prompt.
+
+    Retrieval is best-effort: with VECTOR_DB_ENABLED off, an empty index or
+    on any error, an empty string is returned.
+
+    Args:
+        query: Text to find related context for
+        k: Number of snippets (defaults to VECTOR_DB_TOP_K)
+        kinds: Only use these document kinds
+
+    Returns:
+        Prompt section listing the snippets, or ""
+    """
+    settings = get_settings().vector_db
+    try:
+        index = open_index()
+        if index is None:
+            return ""
+        matches = index.search(query, k=k or settings.top_k, kinds=kinds)
+    except Exception as e:
+        logger.warning(f"Vector index lookup failed: {e}")
+        return ""
+
+    matches = [match for match in matches if match["score"] >= settings.min_score]
+    if not matches:
+        return ""
+    lines = ["Related context from past specifications, reports and Confluence pages:"]
+    for match in matches:
+        lines.append(f"\n[{match['kind']}] {match['title']} (similarity {match['score']:.2f})")
+        lines.append(match["text"])
+    return "\n".join(lines)
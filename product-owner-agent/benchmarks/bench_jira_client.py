@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Benchmark the JIRA REST clients against the local fake JIRA server.
+
+Compares fetching the same issues four ways:
+- per-call: a new connection per request (how JiraClient used to call requests)
+- sync session: JiraClient with its pooled requests Session
+- async sequential: AsyncJiraClient awaiting one request at a time
+- async concurrent: AsyncJiraClient with all requests gathered at once
+
+Usage:
+    python benchmarks/bench_jira_client.py [--requests 200] [--latency 0.01] [--limit 10]
+
+The fake server speaks plain HTTP on localhost, so the per-call numbers
+leave out the TLS handshake a real JIRA Cloud site adds to every new
+connection; the gap to pooled clients is larger in production.
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+from pathlib import Path
+
+os.environ.setdefault("ATLASSIAN_SITE_URL", "https://example.atlassian.net")
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import requests  # noqa: E402
+
+from agent.tools.jira_tools import AsyncJiraClient, JiraClient  # noqa: E402
+from fake_jira_server import FakeJiraServer  # noqa: E402
+
+CREDENTIALS = {"user_email": "bench@example.com", "api_token": "token"}
+
+
+def per_call(jira: FakeJiraServer, keys):
+    for key in keys:
+        response = requests.get(
+            f"{jira.url}/rest/api/2/issue/{key}",
+            auth=(CREDENTIALS["user_email"], CREDENTIALS["api_token"]),
+            headers={"Accept": "application/json", "Connection": "close"},
+            timeout=30,
+        )
+        response.raise_for_status()
+
+
+def sync_session(jira: FakeJiraServer, keys):
+    client = JiraClient(base_url=jira.url, **CREDENTIALS)
+    for key in keys:
+        client.get_issue(key)
+
+
+def async_sequential(jira: FakeJiraServer, keys, limit: int):
+    async def run():
+        async with AsyncJiraClient(base_url=jira.url, limit_per_host=limit, **CREDENTIALS) as client:
+            for key in keys:
+                await client.get_issue(key)
+
+    asyncio.run(run())
+
+
+def async_concurrent(jira: FakeJiraServer, keys, limit: int):
+    async def run():
+        async with AsyncJiraClient(base_url=jira.url, limit_per_host=limit, **CREDENTIALS) as client:
+            await asyncio.gather(*(client.get_issue(key) for key in keys))
+
+    asyncio.run(run())
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=200, help="Issues fetched per scenario")
+    parser.add_argument("--latency", type=float, default=0.01, help="Simulated server time per request (s)")
+    parser.add_argument("--limit", type=int, default=10, help="Connections per host for the async client")
+    args = parser.parse_args()
+
+    scenarios = [
+        ("per-call", lambda jira, keys: per_call(jira, keys)),
+        ("sync session", lambda jira, keys: sync_session(jira, keys)),
+        ("async sequential", lambda jira, keys: async_sequential(jira, keys, args.limit)),
+        ("async concurrent", lambda jira, keys: async_concurrent(jira, keys, args.limit)),
+    ]
+
+    print(f"{args.requests} GET /issue requests, {args.latency * 1000:.0f} ms server latency, "
+          f"limit_per_host={args.limit}\n")
+    print(f"{'scenario':<18} {'seconds':>8} {'req/s':>8} {'connections':>12}")
+    for name, scenario in scenarios:
+        with FakeJiraServer(latency=args.latency) as jira:
+            for n in range(args.requests):
+                jira.add_issue("BENCH", {"summary": f"Issue {n}", "description": "x" * 2000})
+            keys = list(jira.issues)
+            started = time.perf_counter()
+            scenario(jira, keys)
+            elapsed = time.perf_counter() - started
+            print(f"{name:<18} {elapsed:>8.2f} {len(keys) / elapsed:>8.0f} {len(jira.connections):>12}")
+
+
+if __name__ == "__main__":
+    main()
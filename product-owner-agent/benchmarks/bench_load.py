@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+End-to-end load benchmark against the local fake JIRA/Confluence server.
+
+Generates a seeded dataset, then runs a mix of operations at increasing
+concurrency, each one what a report or analysis does end to end:
+- sprint-report: resolve a board's active sprint, page through its issues
+  with changelogs and run the generate_sprint_report tool on them
+- dependencies: search a project with the dependency profile and run the
+  analyze_dependencies tool on it
+- issues: bulk-fetch 25 issues and their links
+- page: read a Confluence page
+
+For every level it reports throughput and p50/p95/p99 latency of the
+operations, with the 503s, 429s and client retries they went through.
+All clients share the site's rate limiter, circuit breakers and
+single-flight group, as in one scheduler process.
+
+Usage:
+    python benchmarks/bench_load.py [--issues 300] [--levels 1,2,4,8,16,32] [--operations 200]
+        [--latency 0.02] [--jitter 0.03] [--error-rate 0.01] [--rate-limit 300] [--seed 7]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Keep the tools' burndown series and archives out of the working tree
+_WORKDIR = Path(tempfile.mkdtemp(prefix="po-agent-bench-"))
+os.environ.setdefault("ATLASSIAN_SITE_URL", "https://example.atlassian.net")
+os.environ.setdefault("REPORT_OUTPUT_DIR", str(_WORKDIR / "reports"))
+os.environ.setdefault("CHART_OUTPUT_DIR", str(_WORKDIR / "charts"))
+os.environ.setdefault("REPORT_ARCHIVE_DB", str(_WORKDIR / "archive.db"))
+os.environ.setdefault("BURNDOWN_DIR", str(_WORKDIR / "burndown"))
+os.environ.setdefault("JIRA_RETRY_BACKOFF", "0.05")
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from agent.field_profiles import field_profile  # noqa: E402
+from agent.resilience import request_guard  # noqa: E402
+from agent.tools.dependency import analyze_dependencies  # noqa: E402
+from agent.tools.jira_tools import AsyncJiraClient, collect, iter_sprint_issues, search_all  # noqa: E402
+from agent.tools.reporting import generate_sprint_report  # noqa: E402
+from fake_jira_server import FakeJiraServer  # noqa: E402
+
+CREDENTIALS = {"user_email": "bench@example.com", "api_token": "token"}
+
+# Relative frequency of each operation in the mix
+MIX = {"sprint-report": 3, "dependencies": 1, "issues": 4, "page": 2}
+
+
+def percentile(values, fraction):
+    """Nearest-rank percentile of a non-empty list."""
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, max(0, round(fraction * len(ordered)) - 1))]
+
+
+async def sprint_report(client, dataset, rng):
+    board_id = rng.choice(dataset["boards"])
+    sprint = await client.get_active_sprint(board_id)
+    issues = await collect(iter_sprint_issues(
+        client, sprint["id"], fields=field_profile("sprint-report"), expand=["changelog"]
+    ))
+    result = await generate_sprint_report.handler({
+        "sprint_name": sprint["name"],
+        "sprint_start": sprint["startDate"][:10],
+        "sprint_end": sprint["endDate"][:10],
+        "team_name": f"Board {board_id}",
+        "issues_json": json.dumps(issues),
+    })
+    if result.get("isError"):
+        raise RuntimeError(result["content"][0]["text"])
+
+
+async def dependencies(client, dataset, rng):
+    project_key = rng.choice(dataset["projects"])
+    issues = await search_all(client, f"project = {project_key}", fields=field_profile("dependency"))
+    result = await analyze_dependencies.handler({
+        "initiative_name": f"{project_key} roadmap",
+        "target_date": "2030-01-01",
+        "issues_json": json.dumps(issues),
+    })
+    if result.get("isError"):
+        raise RuntimeError(result["content"][0]["text"])
+
+
+async def issues(client, dataset, rng):
+    keys = rng.sample(dataset["keys"], min(25, len(dataset["keys"])))
+    await asyncio.gather(client.get_issues_bulk(keys, fields=["summary", "status"]), client.get_links_bulk(keys))
+
+
+async def page(client, dataset, rng):
+    await client.get_confluence_page(rng.choice(dataset["page_ids"]))
+
+
+OPERATIONS = {"sprint-report": sprint_report, "dependencies": dependencies, "issues": issues, "page": page}
+
+
+async def run_level(jira, dataset, concurrency, operations, seed):
+    """Run `operations` operations, `concurrency` at a time, each on its own client."""
+    rng = random.Random(seed)
+    queue = rng.choices(list(MIX), weights=list(MIX.values()), k=operations)
+    latencies, failures = [], 0
+
+    async def worker(worker_rng):
+        nonlocal failures
+        async with AsyncJiraClient(base_url=jira.url, **CREDENTIALS) as client:
+            while queue:
+                name = queue.pop()
+                started = time.perf_counter()
+                try:
+                    await OPERATIONS[name](client, dataset, worker_rng)
+                except Exception:
+                    failures += 1
+                latencies.append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker(random.Random(seed * 1000 + n)) for n in range(concurrency)))
+    return latencies, failures, time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--projects", type=int, default=2, help="Projects (one board each)")
+    parser.add_argument("--issues", type=int, default=300, help="Issues per project")
+    parser.add_argument("--levels", default="1,2,4,8,16,32", help="Concurrency levels")
+    parser.add_argument("--operations", type=int, default=200, help="Operations per level")
+    parser.add_argument("--latency", type=float, default=0.02, help="Server time per request (s)")
+    parser.add_argument("--jitter", type=float, default=0.03, help="Extra random server time, up to (s)")
+    parser.add_argument("--error-rate", type=float, default=0.01, help="Fraction of requests answered 503")
+    parser.add_argument("--rate-limit", type=float, default=300, help="Requests/s before the server answers 429")
+    parser.add_argument("--seed", type=int, default=7, help="Seed for the dataset, server and operation mix")
+    args = parser.parse_args()
+    levels = [int(level) for level in args.levels.split(",")]
+
+    with FakeJiraServer(
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        rate_limit=args.rate_limit or None,
+        seed=args.seed,
+    ) as jira:
+        dataset = jira.generate(projects=args.projects, issues_per_project=args.issues, seed=args.seed)
+        dataset["keys"] = list(jira.issues)
+        dataset["page_ids"] = list(jira.pages)
+        guard = request_guard(jira.url)
+
+        print(
+            f"{dataset['issues']} issues, {dataset['links']} links, {dataset['pages']} pages; "
+            f"{args.latency * 1000:.0f}+{args.jitter * 1000:.0f} ms latency, "
+            f"{args.error_rate:.1%} errors, {args.rate_limit:g} req/s limit\n"
+        )
+        print(
+            f"{'concurrency':>11} {'ops/s':>7} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} "
+            f"{'requests':>9} {'503s':>5} {'429s':>5} {'retries':>8} {'failed':>7}"
+        )
+        for level in levels:
+            before = (len(jira.requests), jira.errors, jira.throttled, guard.retries)
+            latencies, failures, elapsed = asyncio.run(
+                run_level(jira, dataset, level, args.operations, args.seed + level)
+            )
+            requests, errors, throttled, retries = (
+                now - then
+                for now, then in zip((len(jira.requests), jira.errors, jira.throttled, guard.retries), before)
+            )
+            print(
+                f"{level:>11} {len(latencies) / elapsed:>7.1f} "
+                f"{percentile(latencies, 0.50) * 1000:>8.0f} {percentile(latencies, 0.95) * 1000:>8.0f} "
+                f"{percentile(latencies, 0.99) * 1000:>8.0f} {requests:>9} {errors:>5} {throttled:>5} "
+                f"{retries:>8} {failures:>7}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Benchmark paginated JQL search against the local fake JIRA server.
+
+Fetches every issue of a project with search_all at increasing page
+concurrency, plus the token-paginated API (which is always sequential),
+and reports wall time next to the page latency x pages / concurrency
+estimate.
+
+Usage:
+    python benchmarks/bench_search.py [--issues 5000] [--latency 0.05] [--page-size 100]
+"""
+
+import argparse
+import asyncio
+import math
+import os
+import sys
+import time
+from pathlib import Path
+
+os.environ.setdefault("ATLASSIAN_SITE_URL", "https://example.atlassian.net")
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from agent.tools.jira_tools import AsyncJiraClient, search_all  # noqa: E402
+from fake_jira_server import FakeJiraServer  # noqa: E402
+
+CREDENTIALS = {"user_email": "bench@example.com", "api_token": "token"}
+
+
+def fetch(jira: FakeJiraServer, page_size: int, **kwargs) -> int:
+    async def run():
+        async with AsyncJiraClient(base_url=jira.url, limit_per_host=16, **CREDENTIALS) as client:
+            return await search_all(client, "project = BENCH", fields=["summary"], page_size=page_size, **kwargs)
+
+    return len(asyncio.run(run()))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--issues", type=int, default=5000, help="Issues in the project")
+    parser.add_argument("--latency", type=float, default=0.05, help="Simulated server time per page (s)")
+    parser.add_argument("--page-size", type=int, default=100, help="Issues per page")
+    args = parser.parse_args()
+
+    pages = math.ceil(args.issues / args.page_size)
+    scenarios = [("token paging", {"token_paging": True})] + [
+        (f"concurrency {n}", {"concurrency": n}) for n in (1, 2, 4, 8, 16)
+    ]
+
+    print(f"{args.issues} issues, {pages} pages of {args.page_size}, "
+          f"{args.latency * 1000:.0f} ms server latency\n")
+    print(f"{'scenario':<16} {'seconds':>8} {'estimate':>9} {'issues':>7}")
+    with FakeJiraServer(latency=args.latency) as jira:
+        jira.max_page_size = args.page_size
+        for n in range(args.issues):
+            jira.add_issue("BENCH", {"summary": f"Issue {n}"})
+        for name, kwargs in scenarios:
+            concurrency = kwargs.get("concurrency", 1)
+            # The first page is always fetched alone to learn the total
+            estimate = args.latency * (1 + math.ceil((pages - 1) / concurrency))
+            started = time.perf_counter()
+            count = fetch(jira, args.page_size, **kwargs)
+            elapsed = time.perf_counter() - started
+            print(f"{name:<16} {elapsed:>8.2f} {estimate:>9.2f} {count:>7}")
+
+
+if __name__ == "__main__":
+    main()
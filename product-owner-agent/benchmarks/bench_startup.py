@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Benchmark CLI startup, its imports and settings construction.
+
+Runs each command in a fresh interpreter several times and reports the
+best and median wall time. It then runs each command once under
+-X importtime and reports the time spent importing, how many modules
+were loaded, which heavy dependencies were (the Claude Agent SDK, aiohttp,
+requests, numpy) and the slowest top-level imports. Finally it times the
+settings in a fresh interpreter:
+importing agent.config, creating Settings (which parses .env), building
+the first section and the rest, and a cached get_settings() call. Every
+run uses a scratch directory holding .env.example as its .env, and the
+benchmark reports whether anything was created there.
+
+Usage:
+    python benchmarks/bench_startup.py [--runs 5] [--top 5]
+"""
+
+import argparse
+import json
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+COMMANDS = [["--help"], ["config"], ["config", "--json"]]
+
+# Dependencies only the agent and JIRA commands should pay for
+HEAVY_MODULES = ["claude_agent_sdk", "aiohttp", "requests", "numpy"]
+
+SETTINGS_PROBE = """
+import json, time
+started = time.perf_counter()
+from agent.config import Settings, get_settings
+imported = time.perf_counter()
+settings = get_settings()
+created = time.perf_counter()
+settings.atlassian
+first = time.perf_counter()
+for section in ("outsystems", "vector_db", "agent", "claude", "notifications", "output"):
+    getattr(settings, section)
+rest = time.perf_counter()
+get_settings().output
+cached = time.perf_counter()
+print(json.dumps({
+    "import agent.config": imported - started,
+    "Settings() (parse .env)": created - imported,
+    "first section": first - created,
+    "other 6 sections": rest - first,
+    "cached get_settings()": cached - rest,
+}))
+"""
+
+
+def run(args, cwd, env):
+    started = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, *args], cwd=cwd, env=env, capture_output=True, text=True
+    )
+    elapsed = time.perf_counter() - started
+    if result.returncode != 0:
+        raise RuntimeError(f"{' '.join(args)} failed:\n{result.stderr}")
+    return elapsed, result
+
+
+def import_profile(trace):
+    """
+    Parse an -X importtime trace.
+
+    Returns:
+        (cumulative seconds of each top-level import, names of every module loaded)
+    """
+    top_level, loaded = {}, set()
+    for line in trace.splitlines():
+        if not line.startswith("import time:") or line.endswith("imported package"):
+            continue
+        _, cumulative, name = line.split("|")
+        loaded.add(name.strip())
+        # Nested imports are indented two spaces per level
+        if not name[1:].startswith(" "):
+            top_level[name.strip()] = int(cumulative) / 1e6
+    return top_level, loaded
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5, help="Runs per measurement")
+    parser.add_argument("--top", type=int, default=5, help="Slowest top-level imports to list per command")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        scratch = Path(tmp)
+        shutil.copy(ROOT / ".env.example", scratch / ".env")
+        env = {
+            **os.environ,
+            "PYTHONPATH": str(ROOT),
+            "PYTHONDONTWRITEBYTECODE": "1",
+            "ATLASSIAN_SITE_URL": os.environ.get("ATLASSIAN_SITE_URL", "https://example.atlassian.net"),
+        }
+        # Warm the bytecode cache and OS file cache so runs measure startup, not disk
+        run([str(ROOT / "main.py"), "--help"], scratch, env)
+
+        print(f"{'command':<24} {'best ms':>8} {'median ms':>10}")
+        for command in COMMANDS:
+            times = [run([str(ROOT / "main.py"), *command], scratch, env)[0] for _ in range(args.runs)]
+            print(f"{'po-agent ' + ' '.join(command):<24} {min(times) * 1000:>8.0f} {statistics.median(times) * 1000:>10.0f}")
+
+        print(f"\n{'command':<24} {'import ms':>9} {'modules':>8}  heavy modules loaded")
+        for command in COMMANDS:
+            trace = run(["-X", "importtime", str(ROOT / "main.py"), *command], scratch, env)[1].stderr
+            top_level, loaded = import_profile(trace)
+            heavy = [name for name in HEAVY_MODULES if name in loaded]
+            print(
+                f"{'po-agent ' + ' '.join(command):<24} {sum(top_level.values()) * 1000:>9.0f} "
+                f"{len(loaded):>8}  {', '.join(heavy) or '-'}"
+            )
+            slowest = sorted(top_level.items(), key=lambda item: item[1], reverse=True)[:args.top]
+            print(f"{'':<24} slowest: {', '.join(f'{name} {seconds * 1000:.0f}' for name, seconds in slowest)}")
+
+        samples = [json.loads(run(["-c", SETTINGS_PROBE], scratch, env)[1].stdout) for _ in range(args.runs)]
+        print(f"\n{'settings step':<24} {'best ms':>8} {'median ms':>10}")
+        for step in samples[0]:
+            times = [sample[step] for sample in samples]
+            print(f"{step:<24} {min(times) * 1000:>8.2f} {statistics.median(times) * 1000:>10.2f}")
+
+        created = sorted(path.name for path in scratch.iterdir() if path.name != ".env")
+        print(f"\nCreated in the working directory: {', '.join(created) or 'nothing'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,749 @@
+#!/usr/bin/env python3
+"""
+In-process fake of the JIRA and Confluence REST APIs for tests and benchmarks.
+
+Serves issues, sprints, links and pages from memory over real HTTP so
+JiraClient, AsyncJiraClient and the bulk paths built on them run
+unmodified. Start it with a context manager:
+
+    with FakeJiraServer() as jira:
+        client = JiraClient(base_url=jira.url, user_email="t@example.com", api_token="t")
+
+generate() fills it with a realistic dataset derived from a seed. Run the
+module to serve one standalone, e.g. for po-agent pointed at it through
+ATLASSIAN_SITE_URL:
+
+    python fake_jira_server.py --port 8089 --seed 7 --issues 500 --latency 0.05 --error-rate 0.01
+"""
+
+import argparse
+import asyncio
+import base64
+import hashlib
+import random
+import re
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from typing import Any, Dict, List, Optional
+
+from aiohttp import web
+
+# Same cap as JIRA Cloud
+BULK_CREATE_LIMIT = 50
+
+ISSUE_TYPES = [{"id": str(n), "name": name} for n, name in enumerate(["Epic", "Story", "Task", "Bug"], 1)]
+LINK_TYPES = [
+    {"id": "1", "name": "Blocks", "inward": "is blocked by", "outward": "blocks"},
+    {"id": "2", "name": "Relates", "inward": "relates to", "outward": "relates to"},
+]
+
+STATUSES = ["To Do", "In Progress", "In Review", "Blocked", "Done"]
+STORY_POINTS_FIELD = "customfield_10016"
+TEAM_FIELD = "customfield_10004"
+
+_CLAUSE = re.compile(r"^\s*(\w+)\s*(=|>=|in)\s*(.+?)\s*$", re.IGNORECASE)
+
+
+def _parse_jql(jql: str) -> List[tuple]:
+    """
+    Parse "field = value", "field in (a, b)" and "updated >= date" clauses
+    joined by AND; a trailing ORDER BY is ignored.
+    """
+    clauses = []
+    jql = re.split(r"\s+ORDER\s+BY\s+", jql.strip(), flags=re.IGNORECASE)[0]
+    for part in re.split(r"\s+AND\s+", jql, flags=re.IGNORECASE):
+        match = _CLAUSE.match(part)
+        if not match:
+            raise ValueError(f"Unsupported JQL: {part}")
+        field, op, value = match.groups()
+        if op.lower() == "in":
+            values = [v.strip().strip('"') for v in value.strip("()").split(",")]
+        else:
+            values = [value.strip('"')]
+        clauses.append((field.lower(), op.lower(), values))
+    return clauses
+
+
+def _jql_time(value: str) -> str:
+    """Normalize an issue timestamp or JQL date to comparable "YYYY-MM-DD HH:MM"."""
+    return value.replace("T", " ").replace("/", "-")[:16]
+
+
+class FakeJiraServer:
+    """
+    Fake JIRA REST API running on a background thread.
+
+    Attributes:
+        issues: Issues by key, in the REST API's {"key", "id", "fields"} shape
+        sprints: Sprints by ID ({"id", "name", "state", "originBoardId", ...})
+        pages: Confluence pages by ID ({"id", "title", "version", "body"})
+        links: Issue links created through the API
+        attachments: Uploaded attachments by issue key ({"id", "filename",
+            "mimeType", "size", "sha1"}); bodies are hashed as they stream in
+        requests: (method, path) of every request received
+        connections: Client (host, port) of every connection seen, so keep-alive
+            shows up as fewer connections than requests
+        peak_in_flight: Most requests handled at once
+        latency: Seconds added to every response
+        max_page_size: Cap on maxResults per search page, as JIRA applies
+        fail_bulk: Number of upcoming bulk creates that create their issues
+            and then answer 500, as when a response is lost
+        not_modified: Number of 304 responses to conditional GETs
+        rate_limit: Requests per second served (burst of one second's worth);
+            the excess is answered 429 with a Retry-After, as JIRA Cloud does
+        throttled: Number of 429 responses
+        fail_requests: Number of upcoming requests answered 503
+        error_rate: Fraction of requests answered 503 at random
+        jitter: Up to this many seconds added at random to each response's latency
+        errors: Number of 503 responses (fail_requests and error_rate)
+
+    GET responses carry an ETag (and issues a Last-Modified), and requests
+    whose If-None-Match or If-Modified-Since still match are answered 304.
+    """
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        rate_limit: Optional[float] = None,
+        seed: Optional[int] = None,
+        port: int = 0,
+    ):
+        """
+        Args:
+            latency: Seconds added to every response
+            jitter: Up to this many seconds more, drawn per response
+            error_rate: Fraction of requests answered 503
+            rate_limit: Requests per second served before answering 429
+            seed: Seeds the latency, error and generate() randomness
+            port: Port to listen on (0 picks a free one)
+        """
+        self.issues: Dict[str, Dict[str, Any]] = {}
+        self.sprints: Dict[int, Dict[str, Any]] = {}
+        self.pages: Dict[str, Dict[str, Any]] = {}
+        self.links: List[Dict[str, Any]] = []
+        self.attachments: Dict[str, List[Dict[str, Any]]] = {}
+        self.requests: List[tuple] = []
+        self.connections: set = set()
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self.latency = latency
+        self.jitter = jitter
+        self.max_page_size = 100
+        self.fail_bulk = 0
+        self.not_modified = 0
+        self.rate_limit: Optional[float] = rate_limit
+        self.throttled = 0
+        self.fail_requests = 0
+        self.error_rate = error_rate
+        self.errors = 0
+        self.port = port
+        self.random = random.Random(seed)
+        self._allowance = 0.0
+        self._allowance_at = 0.0
+        self._counters: Dict[str, int] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._runner: Optional[web.AppRunner] = None
+        self._thread: Optional[threading.Thread] = None
+        self.url = ""
+
+    def add_issue(self, project_key: str, fields: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Store an issue and assign it the project's next key.
+
+        Args:
+            project_key: Project the issue belongs to
+            fields: Issue fields
+
+        Returns:
+            The stored issue
+        """
+        number = self._counters.get(project_key, 0) + 1
+        self._counters[project_key] = number
+        key = f"{project_key}-{number}"
+        updated = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.000+0000")
+        issue = {
+            "id": str(10000 + len(self.issues)),
+            "key": key,
+            "self": f"{self.url}/rest/api/2/issue/{key}",
+            "fields": {"updated": updated, **fields, "project": {"key": project_key}},
+        }
+        self.issues[key] = issue
+        return issue
+
+    def add_sprint(self, board_id: int, name: str, state: str = "active", **fields) -> Dict[str, Any]:
+        """
+        Store a sprint of a board; issues join it through their "sprint" field.
+
+        Returns:
+            The stored sprint
+        """
+        sprint_id = len(self.sprints) + 1
+        sprint = {"id": sprint_id, "name": name, "state": state, "originBoardId": board_id, **fields}
+        self.sprints[sprint_id] = sprint
+        return sprint
+
+    def add_page(self, title: str, body: str) -> Dict[str, Any]:
+        """
+        Store a Confluence page.
+
+        Returns:
+            The stored page
+        """
+        page_id = str(100000 + len(self.pages))
+        page = {
+            "id": page_id,
+            "title": title,
+            "version": {"number": 1},
+            "body": {"storage": {"value": body, "representation": "storage"}},
+        }
+        self.pages[page_id] = page
+        return page
+
+    def generate(
+        self,
+        projects: int = 2,
+        issues_per_project: int = 200,
+        sprints_per_board: int = 4,
+        link_ratio: float = 0.3,
+        pages_per_project: int = 5,
+        seed: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """
+        Fill the server with a dataset derived from a seed.
+
+        Every project ("P1", "P2", ...) gets one board (board ID 1, 2, ...)
+        with closed sprints and one active sprint, issues spread over those
+        sprints and the backlog, "Blocks" links between issues of the same
+        and other projects, and Confluence pages. Issues carry a status,
+        assignee, team, story points, due date and a changelog (returned with
+        expand=changelog) of their status transitions. The same seed and
+        sizes always produce the same data.
+
+        Args:
+            projects: Number of projects (one board each)
+            issues_per_project: Issues per project
+            sprints_per_board: Sprints per board, the last one active
+            link_ratio: Fraction of issues blocking another issue
+            pages_per_project: Confluence pages per project
+            seed: Seed for the data (defaults to the server's seed)
+
+        Returns:
+            {"projects", "boards", "active_sprints", "issues", "links", "pages"}
+            with the project keys, board IDs, active sprint IDs and counts
+        """
+        rng = random.Random(seed) if seed is not None else self.random
+        now = datetime.now(timezone.utc).replace(microsecond=0)
+        stamp = "%Y-%m-%dT%H:%M:%S.000+0000"
+        assignees = [f"Developer {n}" for n in range(1, 13)]
+        summary_words = ["checkout", "payment", "login", "search", "profile", "export", "refund",
+                         "invoice", "cart", "report", "catalog", "notification", "billing", "audit"]
+        project_keys, boards, active_sprints, keys = [], [], [], []
+        link_count = 0
+
+        for number in range(1, projects + 1):
+            project_key = f"P{number}"
+            board_id = number
+            project_keys.append(project_key)
+            boards.append(board_id)
+            sprint_ids = []
+            for n in range(sprints_per_board):
+                weeks_back = sprints_per_board - n
+                start = now - timedelta(weeks=2 * weeks_back - 1)
+                active = n == sprints_per_board - 1
+                sprint = self.add_sprint(
+                    board_id,
+                    f"{project_key} Sprint {n + 1}",
+                    state="active" if active else "closed",
+                    startDate=start.strftime(stamp),
+                    endDate=(start + timedelta(weeks=2)).strftime(stamp),
+                )
+                sprint_ids.append(sprint["id"])
+            active_sprints.append(sprint_ids[-1])
+            team = f"Team {project_key}"
+
+            for n in range(issues_per_project):
+                sprint_id = rng.choice(sprint_ids + [sprint_ids[-1], None])
+                if sprint_id is None or sprint_id != sprint_ids[-1]:
+                    status = "Done" if sprint_id is not None else rng.choice(["To Do", "To Do", "Blocked"])
+                else:
+                    status = rng.choices(STATUSES, weights=[3, 3, 1, 1, 4])[0]
+                created = now - timedelta(days=rng.randint(7, 8 * sprints_per_board), hours=rng.randint(0, 23))
+                if status == "Blocked":
+                    transitions = ["Blocked"]
+                else:
+                    transitions = [name for name in STATUSES[1:STATUSES.index(status) + 1] if name != "Blocked"]
+                histories, previous, moment = [], "To Do", created
+                for target in transitions:
+                    moment = min(now, moment + timedelta(hours=rng.randint(2, 60)))
+                    histories.append({
+                        "id": str(len(histories) + 1),
+                        "created": moment.strftime(stamp),
+                        "items": [{"field": "status", "fromString": previous, "toString": target}],
+                    })
+                    previous = target
+                fields = {
+                    "summary": f"{rng.choice(summary_words).title()} {rng.choice(summary_words)} story {n + 1}",
+                    "description": f"As a user I want {rng.choice(summary_words)} to work. " * rng.randint(1, 8),
+                    "issuetype": {"name": rng.choices(["Story", "Task", "Bug"], weights=[6, 2, 2])[0]},
+                    "status": {"name": status},
+                    "assignee": {"displayName": rng.choice(assignees)} if rng.random() < 0.9 else None,
+                    STORY_POINTS_FIELD: rng.choice([1, 2, 3, 5, 8, 13]),
+                    TEAM_FIELD: team,
+                    "duedate": (now + timedelta(days=rng.randint(-10, 60))).strftime("%Y-%m-%d"),
+                    "labels": rng.sample(["frontend", "backend", "api", "ux", "infra"], k=rng.randint(0, 2)),
+                    "created": created.strftime(stamp),
+                    "updated": moment.strftime(stamp),
+                    "issuelinks": [],
+                }
+                if sprint_id is not None:
+                    fields["sprint"] = sprint_id
+                issue = self.add_issue(project_key, fields)
+                issue["changelog"] = {"startAt": 0, "total": len(histories), "histories": histories}
+                keys.append(issue["key"])
+
+            for n in range(pages_per_project):
+                self.add_page(
+                    f"{project_key} design note {n + 1}",
+                    "".join(f"<p>{rng.choice(summary_words)} {rng.choice(summary_words)}</p>" for _ in range(rng.randint(20, 200))),
+                )
+
+        for key in keys:
+            if len(keys) > 1 and rng.random() < link_ratio:
+                blocked = rng.choice(keys)
+                while blocked == key:
+                    blocked = rng.choice(keys)
+                self._link({
+                    "type": {"name": "Blocks"},
+                    "inwardIssue": {"key": blocked},
+                    "outwardIssue": {"key": key},
+                })
+                link_count += 1
+
+        return {
+            "projects": project_keys,
+            "boards": boards,
+            "active_sprints": active_sprints,
+            "issues": len(keys),
+            "links": link_count,
+            "pages": projects * pages_per_project,
+        }
+
+    def _link(self, link: Dict[str, Any]) -> None:
+        """Store an issueLink request body and show the link on both issues, as JIRA does."""
+        self.links.append(link)
+        name = link.get("type", {}).get("name")
+        kind = next((kind for kind in LINK_TYPES if kind["name"] == name), {"name": name})
+        outward_key, inward_key = link["outwardIssue"]["key"], link["inwardIssue"]["key"]
+        link_id = str(len(self.links))
+        self.issues[outward_key]["fields"].setdefault("issuelinks", []).append(
+            {"id": link_id, "type": kind, "outwardIssue": {"key": inward_key}}
+        )
+        self.issues[inward_key]["fields"].setdefault("issuelinks", []).append(
+            {"id": link_id, "type": kind, "inwardIssue": {"key": outward_key}}
+        )
+
+    def _matches(self, issue: Dict[str, Any], clauses: List[tuple]) -> bool:
+        fields = issue["fields"]
+        for field, op, values in clauses:
+            if op == ">=":
+                if _jql_time(fields.get(field) or "") < _jql_time(values[0]):
+                    return False
+                continue
+            if field == "key":
+                actual = [issue["key"]]
+            elif field == "project":
+                actual = [fields["project"]["key"]]
+            elif field == "labels":
+                actual = fields.get("labels") or []
+            elif field == "parent":
+                actual = [(fields.get("parent") or {}).get("key")]
+            else:
+                value = fields.get(field)
+                actual = [value.get("name") if isinstance(value, dict) else value]
+            if not set(map(str, actual)) & set(values):
+                return False
+        return True
+
+    def _validate(self, fields: Dict[str, Any]) -> Dict[str, str]:
+        errors = {}
+        if not (fields.get("project") or {}).get("key"):
+            errors["project"] = "project is required"
+        if not fields.get("summary"):
+            errors["summary"] = "You must specify a summary of the issue."
+        elif len(fields["summary"]) > 255:
+            errors["summary"] = "Summary must be less than 255 characters."
+        parent = (fields.get("parent") or {}).get("key")
+        if parent and parent not in self.issues:
+            errors["parent"] = f"Issue '{parent}' does not exist"
+        return errors
+
+    def _project(self, request: web.Request, issues: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Keep only the requested fields, as JIRA does for ?fields=, and the changelog if expanded."""
+        if "changelog" not in request.query.get("expand", "").split(","):
+            issues = [
+                {name: value for name, value in issue.items() if name != "changelog"} if "changelog" in issue else issue
+                for issue in issues
+            ]
+        wanted = request.query.get("fields")
+        if not wanted or wanted in ("*all", "*navigable"):
+            return issues
+        names = set(wanted.split(","))
+        return [
+            {**issue, "fields": {name: value for name, value in issue["fields"].items() if name in names}}
+            for issue in issues
+        ]
+
+    def _query(self, request: web.Request) -> List[Dict[str, Any]]:
+        clauses = _parse_jql(request.query.get("jql", ""))
+        return [issue for issue in self.issues.values() if self._matches(issue, clauses)]
+
+    async def _search(self, request: web.Request) -> web.Response:
+        try:
+            matches = self._query(request)
+        except ValueError as e:
+            return web.json_response({"errorMessages": [str(e)]}, status=400)
+        start = int(request.query.get("startAt", 0))
+        max_results = min(int(request.query.get("maxResults", 50)), self.max_page_size)
+        return web.json_response({
+            "startAt": start,
+            "maxResults": max_results,
+            "total": len(matches),
+            "issues": self._project(request, matches[start:start + max_results]),
+        })
+
+    async def _search_jql(self, request: web.Request) -> web.Response:
+        """Token-paginated search: no total, an opaque nextPageToken instead."""
+        try:
+            matches = self._query(request)
+        except ValueError as e:
+            return web.json_response({"errorMessages": [str(e)]}, status=400)
+        token = request.query.get("nextPageToken")
+        start = int(base64.urlsafe_b64decode(token)) if token else 0
+        max_results = min(int(request.query.get("maxResults", 50)), self.max_page_size)
+        body: Dict[str, Any] = {"issues": self._project(request, matches[start:start + max_results])}
+        if start + max_results < len(matches):
+            body["nextPageToken"] = base64.urlsafe_b64encode(str(start + max_results).encode()).decode()
+        else:
+            body["isLast"] = True
+        return web.json_response(body)
+
+    async def _get_issue(self, request: web.Request) -> web.Response:
+        issue = self.issues.get(request.match_info["key"])
+        if issue is None:
+            return web.json_response({"errorMessages": ["Issue does not exist"]}, status=404)
+        headers = {}
+        try:
+            updated = datetime.strptime(issue["fields"].get("updated", ""), "%Y-%m-%dT%H:%M:%S.%f%z")
+            headers["Last-Modified"] = format_datetime(updated.astimezone(timezone.utc), usegmt=True)
+        except ValueError:
+            pass
+        return web.json_response(self._project(request, [issue])[0], headers=headers)
+
+    async def _create_issue(self, request: web.Request) -> web.Response:
+        fields = (await request.json()).get("fields", {})
+        errors = self._validate(fields)
+        if errors:
+            return web.json_response({"errorMessages": [], "errors": errors}, status=400)
+        issue = self.add_issue(fields["project"]["key"], fields)
+        return web.json_response({key: issue[key] for key in ("id", "key", "self")}, status=201)
+
+    async def _update_issue(self, request: web.Request) -> web.Response:
+        issue = self.issues.get(request.match_info["key"])
+        if issue is None:
+            return web.json_response({"errorMessages": ["Issue does not exist"]}, status=404)
+        issue["fields"].update((await request.json()).get("fields", {}))
+        issue["fields"]["updated"] = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.000+0000")
+        return web.Response(status=204)
+
+    async def _add_comment(self, request: web.Request) -> web.Response:
+        issue = self.issues.get(request.match_info["key"])
+        if issue is None:
+            return web.json_response({"errorMessages": ["Issue does not exist"]}, status=404)
+        comments = issue["fields"].setdefault("comment", {"comments": []})["comments"]
+        comment = {"id": str(len(comments) + 1), "body": (await request.json()).get("body", "")}
+        comments.append(comment)
+        return web.json_response(comment, status=201)
+
+    async def _add_attachments(self, request: web.Request) -> web.Response:
+        key = request.match_info["key"]
+        if key not in self.issues:
+            return web.json_response({"errorMessages": ["Issue does not exist"]}, status=404)
+        if request.headers.get("X-Atlassian-Token") != "no-check":
+            return web.json_response({"errorMessages": ["XSRF check failed"]}, status=403)
+        created = []
+        reader = await request.multipart()
+        async for part in reader:
+            if part.name != "file":
+                continue
+            digest, size = hashlib.sha1(), 0
+            while chunk := await part.read_chunk():
+                digest.update(chunk)
+                size += len(chunk)
+            attachment = {
+                "id": str(20000 + sum(len(files) for files in self.attachments.values())),
+                "filename": part.filename,
+                "mimeType": part.headers.get("Content-Type", "application/octet-stream"),
+                "size": size,
+                "sha1": digest.hexdigest(),
+            }
+            self.attachments.setdefault(key, []).append(attachment)
+            created.append(attachment)
+        return web.json_response(created)
+
+    async def _create_link(self, request: web.Request) -> web.Response:
+        link = await request.json()
+        for side in ("inwardIssue", "outwardIssue"):
+            if link.get(side, {}).get("key") not in self.issues:
+                return web.json_response({"errorMessages": [f"{side} does not exist"]}, status=404)
+        self._link(link)
+        return web.Response(status=201)
+
+    async def _board_sprints(self, request: web.Request) -> web.Response:
+        board_id = int(request.match_info["board_id"])
+        state = request.query.get("state")
+        values = [
+            sprint for sprint in self.sprints.values()
+            if sprint["originBoardId"] == board_id and (not state or sprint["state"] == state)
+        ]
+        return web.json_response({"isLast": True, "values": values})
+
+    async def _get_sprint(self, request: web.Request) -> web.Response:
+        sprint = self.sprints.get(int(request.match_info["sprint_id"]))
+        if sprint is None:
+            return web.json_response({"errorMessages": ["Sprint does not exist"]}, status=404)
+        return web.json_response(sprint)
+
+    async def _sprint_issues(self, request: web.Request) -> web.Response:
+        sprint_id = int(request.match_info["sprint_id"])
+        issues = [
+            issue for issue in self.issues.values() if issue["fields"].get("sprint") == sprint_id
+        ]
+        start = int(request.query.get("startAt", 0))
+        max_results = min(int(request.query.get("maxResults", 50)), self.max_page_size)
+        return web.json_response({
+            "startAt": start,
+            "maxResults": max_results,
+            "total": len(issues),
+            "issues": self._project(request, issues[start:start + max_results]),
+        })
+
+    async def _get_project(self, request: web.Request) -> web.Response:
+        key = request.match_info["key"]
+        if key not in self._counters:
+            return web.json_response({"errorMessages": ["No project could be found"]}, status=404)
+        return web.json_response({"key": key, "name": key.title(), "issueTypes": ISSUE_TYPES})
+
+    async def _issue_types(self, request: web.Request) -> web.Response:
+        return web.json_response(ISSUE_TYPES)
+
+    async def _link_types(self, request: web.Request) -> web.Response:
+        return web.json_response({"issueLinkTypes": LINK_TYPES})
+
+    async def _get_page(self, request: web.Request) -> web.Response:
+        page = self.pages.get(request.match_info["page_id"])
+        if page is None:
+            return web.json_response({"errors": [{"title": "Page not found"}]}, status=404)
+        return web.json_response(page)
+
+    async def _create_bulk(self, request: web.Request) -> web.Response:
+        updates = (await request.json()).get("issueUpdates", [])
+        if len(updates) > BULK_CREATE_LIMIT:
+            return web.json_response(
+                {"errorMessages": [f"At most {BULK_CREATE_LIMIT} issues per request"]}, status=400
+            )
+        created, errors = [], []
+        for number, update in enumerate(updates):
+            fields = update.get("fields", {})
+            element_errors = self._validate(fields)
+            if element_errors:
+                errors.append({
+                    "status": 400,
+                    "failedElementNumber": number,
+                    "elementErrors": {"errorMessages": [], "errors": element_errors},
+                })
+                continue
+            issue = self.add_issue(fields["project"]["key"], fields)
+            created.append({key: issue[key] for key in ("id", "key", "self")})
+        if self.fail_bulk:
+            self.fail_bulk -= 1
+            return web.json_response({"errorMessages": ["Internal server error"]}, status=500)
+        return web.json_response({"issues": created, "errors": errors}, status=201)
+
+    def _retry_after(self) -> Optional[float]:
+        """Seconds until the rate limit admits a request, or None if it does now."""
+        if not self.rate_limit:
+            return None
+        now = time.monotonic()
+        if not self._allowance_at:
+            self._allowance = self.rate_limit
+        else:
+            self._allowance = min(
+                self.rate_limit, self._allowance + (now - self._allowance_at) * self.rate_limit
+            )
+        self._allowance_at = now
+        if self._allowance >= 1:
+            self._allowance -= 1
+            return None
+        return (1 - self._allowance) / self.rate_limit
+
+    @web.middleware
+    async def _record(self, request: web.Request, handler):
+        self.requests.append((request.method, request.path))
+        self.connections.add(request.transport.get_extra_info("peername"))
+        retry_after = self._retry_after()
+        failing = bool(self.fail_requests) or (self.error_rate > 0 and self.random.random() < self.error_rate)
+        if retry_after is not None or failing:
+            # Drain unread uploads so the connection can be reused for the retry
+            await request.release()
+        if retry_after is not None:
+            self.throttled += 1
+            return web.json_response(
+                {"errorMessages": ["Rate limit exceeded"]},
+                status=429,
+                headers={"Retry-After": f"{retry_after:.3f}"},
+            )
+        if failing:
+            self.fail_requests = max(0, self.fail_requests - 1)
+            self.errors += 1
+            return web.json_response({"errorMessages": ["Service unavailable"]}, status=503)
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        try:
+            delay = self.latency + (self.random.uniform(0, self.jitter) if self.jitter else 0)
+            if delay:
+                await asyncio.sleep(delay)
+            response = await handler(request)
+            await request.release()
+        finally:
+            self.in_flight -= 1
+        if request.method == "GET" and response.status == 200 and response.body:
+            response.headers["ETag"] = f'"{hashlib.sha1(response.body).hexdigest()}"'
+            if self._unchanged(request, response):
+                self.not_modified += 1
+                return web.Response(status=304, headers={"ETag": response.headers["ETag"]})
+        if "gzip" in request.headers.get("Accept-Encoding", "") and response.body:
+            response.enable_compression()
+        return response
+
+    @staticmethod
+    def _unchanged(request: web.Request, response: web.Response) -> bool:
+        """Whether a conditional GET's validators still match the response."""
+        etag = request.headers.get("If-None-Match")
+        if etag is not None:
+            return etag == response.headers["ETag"]
+        since, modified = request.if_modified_since, response.last_modified
+        return since is not None and modified is not None and modified <= since
+
+    def _app(self) -> web.Application:
+        app = web.Application(middlewares=[self._record])
+        app.router.add_get("/rest/api/2/search", self._search)
+        app.router.add_get("/rest/api/3/search/jql", self._search_jql)
+        app.router.add_post("/rest/api/2/issue/bulk", self._create_bulk)
+        app.router.add_post("/rest/api/2/issue", self._create_issue)
+        app.router.add_get("/rest/api/2/issue/{key}", self._get_issue)
+        app.router.add_put("/rest/api/2/issue/{key}", self._update_issue)
+        app.router.add_post("/rest/api/2/issue/{key}/comment", self._add_comment)
+        app.router.add_post("/rest/api/2/issue/{key}/attachments", self._add_attachments)
+        app.router.add_post("/rest/api/2/issueLink", self._create_link)
+        app.router.add_get("/rest/api/2/project/{key}", self._get_project)
+        app.router.add_get("/rest/api/2/issuetype", self._issue_types)
+        app.router.add_get("/rest/api/2/issueLinkType", self._link_types)
+        app.router.add_get("/wiki/api/v2/pages/{page_id}", self._get_page)
+        app.router.add_get("/rest/agile/1.0/board/{board_id}/sprint", self._board_sprints)
+        app.router.add_get("/rest/agile/1.0/sprint/{sprint_id}", self._get_sprint)
+        app.router.add_get("/rest/agile/1.0/sprint/{sprint_id}/issue", self._sprint_issues)
+        return app
+
+    def start(self) -> "FakeJiraServer":
+        """Start serving on a free localhost port."""
+        self._loop = asyncio.new_event_loop()
+        started = threading.Event()
+
+        async def serve():
+            self._runner = web.AppRunner(self._app())
+            await self._runner.setup()
+            site = web.TCPSite(self._runner, "127.0.0.1", self.port)
+            await site.start()
+            port = self._runner.addresses[0][1]
+            self.url = f"http://127.0.0.1:{port}"
+            started.set()
+
+        def run():
+            asyncio.set_event_loop(self._loop)
+            self._loop.run_until_complete(serve())
+            self._loop.run_forever()
+
+        self._thread = threading.Thread(target=run, name="fake-jira", daemon=True)
+        self._thread.start()
+        started.wait(timeout=10)
+        return self
+
+    def stop(self) -> None:
+        """Stop the server and its thread."""
+        if self._loop is None:
+            return
+        asyncio.run_coroutine_threadsafe(self._runner.cleanup(), self._loop).result(timeout=10)
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(timeout=10)
+        self._loop.close()
+        self._loop = None
+
+    def __enter__(self) -> "FakeJiraServer":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Serve a generated JIRA/Confluence dataset until interrupted."
+    )
+    parser.add_argument("--port", type=int, default=8089, help="Port to listen on")
+    parser.add_argument("--seed", type=int, default=0, help="Seed for data, latency and errors")
+    parser.add_argument("--projects", type=int, default=2, help="Projects (one board each)")
+    parser.add_argument("--issues", type=int, default=200, help="Issues per project")
+    parser.add_argument("--sprints", type=int, default=4, help="Sprints per board, the last active")
+    parser.add_argument("--pages", type=int, default=5, help="Confluence pages per project")
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds added to every response")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Up to this many seconds more at random")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of requests answered 503")
+    parser.add_argument("--rate-limit", type=float, help="Requests per second before answering 429")
+    args = parser.parse_args()
+
+    jira = FakeJiraServer(
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        rate_limit=args.rate_limit,
+        seed=args.seed,
+        port=args.port,
+    )
+    with jira:
+        dataset = jira.generate(
+            projects=args.projects,
+            issues_per_project=args.issues,
+            sprints_per_board=args.sprints,
+            pages_per_project=args.pages,
+        )
+        print(f"Fake JIRA serving at {jira.url}")
+        print(
+            f"{dataset['issues']} issues in {', '.join(dataset['projects'])}; boards "
+            f"{', '.join(map(str, dataset['boards']))} (active sprints "
+            f"{', '.join(map(str, dataset['active_sprints']))}); {dataset['links']} links, "
+            f"{dataset['pages']} pages"
+        )
+        print("Any user email and API token are accepted. Press Ctrl+C to stop.")
+        try:
+            while True:
+                time.sleep(3600)
+        except KeyboardInterrupt:
+            print(f"\nServed {len(jira.requests)} requests ({jira.errors} errors, {jira.throttled} throttled)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,21 @@
+"""Helpers shared by the tests that run the REST clients against FakeJiraServer."""
+
+import asyncio
+
+from agent.tools.jira_tools import AsyncJiraClient
+
+# FakeJiraServer accepts any basic-auth credentials
+CREDENTIALS = {"user_email": "po@example.com", "api_token": "token"}
+
+
+def make_client(jira, **kwargs) -> AsyncJiraClient:
+    """AsyncJiraClient pointed at a running FakeJiraServer."""
+    return AsyncJiraClient(base_url=jira.url, **CREDENTIALS, **kwargs)
+
+
+def run(client, coroutine):
+    """Run a coroutine and close the client's session in the same event loop."""
+    async def main():
+        async with client:
+            return await coroutine
+    return asyncio.run(main())
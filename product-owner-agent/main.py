@@ -7,19 +7,55 @@ Product Owner responsibilities for Outsystems development teams.
 """
 
 import asyncio
+import json
 import sys
+import time
+from contextlib import contextmanager
 from pathlib import Path
 
 import click
 from rich.console import Console
 from rich.panel import Panel
 from rich.progress import Progress, SpinnerColumn, TextColumn
+from rich.table import Table
 
-from agent import ProductOwnerAgent, get_settings
+from agent import get_settings
+from agent.results import collect_results
 
 console = Console()
 
 
+def json_option(func):
+    """Add a --json flag that switches a command to machine-readable output."""
+    return click.option(
+        "--json",
+        "as_json",
+        is_flag=True,
+        help="Print the result as JSON instead of formatted output",
+    )(func)
+
+
+def echo_json(payload):
+    """Print a JSON payload on stdout without rich rendering."""
+    click.echo(json.dumps(payload, indent=2, default=str))
+
+
+@contextmanager
+def spinner(description, enabled=True):
+    """Show a progress spinner while the block runs (skipped for --json)."""
+    if not enabled:
+        yield
+        return
+    with Progress(
+        SpinnerColumn(),
+        TextColumn("[progress.description]{task.description}"),
+        console=console,
+    ) as progress:
+        task = progress.add_task(description, total=None)
+        yield
+        progress.update(task, completed=True)
+
+
 def print_banner():
     """Print application banner."""
     banner = """
@@ -71,7 +107,8 @@ def cli():
     type=click.Path(),
     help="Output file for translation results",
 )
-def translate(epic_key, architecture, components, skills, output):
+@json_option
+def translate(epic_key, architecture, components, skills, output, as_json):
     """
     Translate a business epic into technical user stories.
 
@@ -80,32 +117,158 @@ def translate(epic_key, architecture, components, skills, output):
     Example:
         po-agent translate EPIC-123 --architecture microservices
     """
-    console.print(
-        f"\n[bold]Translating epic {epic_key}...[/bold]", style="cyan"
-    )
+    if not as_json:
+        console.print(
+            f"\n[bold]Translating epic {epic_key}...[/bold]", style="cyan"
+        )
 
     async def run():
+        from agent import ProductOwnerAgent
         agent = ProductOwnerAgent()
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console,
-        ) as progress:
-            task = progress.add_task("Processing epic...", total=None)
-
+        with spinner("Processing epic...", enabled=not as_json):
             result = await agent.translate_epic(
                 epic_key, architecture, components, skills
             )
 
-            progress.update(task, completed=True)
+        if output:
+            Path(output).write_text(result)
+
+        if as_json:
+            echo_json({"epic_key": epic_key, "translation": result, "output": output})
+            return
 
         console.print("\n[bold green]✓ Translation completed![/bold green]")
         console.print(Panel(result, title="Translation Result", border_style="green"))
 
         if output:
-            output_path = Path(output)
-            output_path.write_text(result)
-            console.print(f"\n[dim]Saved to: {output_path}[/dim]")
+            console.print(f"\n[dim]Saved to: {output}[/dim]")
+
+    asyncio.run(run())
+
+
+@cli.command("translate-batch")
+@click.argument("epic_keys", nargs=-1)
+@click.option(
+    "--file",
+    "-f",
+    "keys_file",
+    type=click.Path(exists=True, dir_okay=False),
+    help="File listing epic keys (one per line, commas or spaces also work)",
+)
+@click.option(
+    "--architecture",
+    "-a",
+    default="microservices",
+    help="System architecture type",
+)
+@click.option(
+    "--components",
+    "-c",
+    default="",
+    help="Comma-separated list of existing components",
+)
+@click.option(
+    "--skills",
+    "-s",
+    default="",
+    help="Comma-separated list of team skills",
+)
+@click.option(
+    "--concurrency",
+    "-n",
+    type=int,
+    help="Translations run at once (defaults to TRANSLATION_CONCURRENCY)",
+)
+@click.option(
+    "--output-dir",
+    "-o",
+    type=click.Path(file_okay=False),
+    help="Directory for one file per epic (defaults to TRANSLATION_OUTPUT_DIR)",
+)
+@click.option(
+    "--no-cache",
+    is_flag=True,
+    help="Retranslate every epic even if unchanged since its cached translation",
+)
+@json_option
+def translate_batch(
+    epic_keys, keys_file, architecture, components, skills, concurrency, output_dir, no_cache, as_json
+):
+    """
+    Translate many epics concurrently into technical user stories.
+
+    EPIC_KEYS: JIRA epic keys (and/or --file)
+
+    All epics are fetched in one bulk query and share the architecture,
+    component and skills context. Each translation is written to
+    <output-dir>/<EPIC-KEY>.md as soon as it finishes. Requires
+    ATLASSIAN_USER_EMAIL and ATLASSIAN_API_TOKEN.
+
+    Example:
+        po-agent translate-batch EPIC-1 EPIC-2 -f onboarding_epics.txt -n 6
+    """
+    from agent.batch_translation import read_epic_keys
+
+    keys = list(epic_keys)
+    if keys_file:
+        keys.extend(read_epic_keys(Path(keys_file)))
+    if not keys:
+        raise click.UsageError("Provide epic keys as arguments or with --file")
+
+    if not as_json:
+        console.print(
+            f"\n[bold]Translating {len(keys)} epics...[/bold]", style="cyan"
+        )
+
+    def report_progress(translation):
+        if as_json:
+            return
+        if translation.error:
+            console.print(f"[red]✗ {translation.epic_key}: {translation.error}[/red]")
+        elif translation.cached:
+            console.print(
+                f"[green]✓ {translation.epic_key}[/green] "
+                f"[dim]unchanged, from cache -> {translation.output_path}[/dim]"
+            )
+        else:
+            console.print(
+                f"[green]✓ {translation.epic_key}[/green] "
+                f"[dim]{translation.latency:.1f}s -> {translation.output_path}[/dim]"
+            )
+
+    async def run():
+        from agent import ProductOwnerAgent
+        agent = ProductOwnerAgent()
+        result = await agent.translate_epics(
+            keys,
+            architecture,
+            components,
+            skills,
+            output_dir=Path(output_dir) if output_dir else None,
+            concurrency=concurrency,
+            on_result=report_progress,
+            use_cache=not no_cache,
+        )
+
+        if as_json:
+            echo_json(result.to_dict())
+            return
+
+        stats = result.stats
+        table = Table(title="Batch translation")
+        table.add_column("Metric", style="bold")
+        table.add_column("Value")
+        table.add_row("Epics", f"{stats['succeeded']}/{stats['epics']} translated")
+        table.add_row("From cache", str(stats["cache_hits"]))
+        table.add_row("Wall time", f"{stats['wall_seconds']:.1f}s")
+        table.add_row("Throughput", f"{stats['epics_per_minute']:.1f} epics/min")
+        if "latency_p50" in stats:
+            table.add_row(
+                "Latency",
+                f"mean {stats['latency_mean']:.1f}s, p50 {stats['latency_p50']:.1f}s, "
+                f"p95 {stats['latency_p95']:.1f}s, max {stats['latency_max']:.1f}s",
+            )
+        console.print(table)
 
     asyncio.run(run())
 
@@ -131,7 +294,18 @@ def translate(epic_key, architecture, components, skills, output):
     type=click.Path(),
     help="Output file for report",
 )
-def report(board_id, sprint, team, save_to_jira, output):
+@click.option(
+    "--delta",
+    is_flag=True,
+    help="Only regenerate sections whose inputs changed since the last report",
+)
+@click.option(
+    "--max-staleness",
+    type=float,
+    help="With --delta, read the sprint from the local JIRA mirror if synced within this many seconds",
+)
+@json_option
+def report(board_id, sprint, team, save_to_jira, output, delta, max_staleness, as_json):
     """
     Generate a sprint progress report.
 
@@ -139,36 +313,182 @@ def report(board_id, sprint, team, save_to_jira, output):
 
     Example:
         po-agent report 42 --sprint 123 --team "Alpha Team"
+        po-agent report 42 --team "Alpha Team" --delta
     """
-    console.print(
-        f"\n[bold]Generating report for board {board_id}...[/bold]",
-        style="cyan",
-    )
+    if not as_json:
+        console.print(
+            f"\n[bold]Generating report for board {board_id}...[/bold]",
+            style="cyan",
+        )
 
     async def run():
+        from agent import ProductOwnerAgent
         agent = ProductOwnerAgent()
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console,
-        ) as progress:
-            task = progress.add_task("Analyzing sprint data...", total=None)
+        with spinner("Analyzing sprint data...", enabled=not as_json), collect_results() as results:
+            result = await agent.generate_report(
+                board_id, sprint, team, delta=delta, max_staleness=max_staleness
+            )
 
-            result = await agent.generate_report(board_id, sprint, team)
+        if output:
+            Path(output).write_text(result)
 
-            progress.update(task, completed=True)
+        attachment = None
+        if save_to_jira:
+            from agent.tools.reporting import attach_files
+
+            # Upload the --output file, or a copy in the report directory
+            if output:
+                report_file = Path(output)
+            else:
+                timestamp = time.strftime("%Y%m%d_%H%M%S")
+                report_dir = get_settings().output.report_output_dir
+                report_dir.mkdir(parents=True, exist_ok=True)
+                report_file = report_dir / f"sprint_report_{board_id}_{timestamp}.md"
+                report_file.write_text(result)
+                # Index the copy like save_report_to_jira does, for `po-agent reports search`
+                from agent.archive import archive_file
+
+                archive_file(
+                    report_file,
+                    kind="report",
+                    title=report_file.stem,
+                    content=result,
+                    team=team,
+                    sprint=next(
+                        (item.sprint_name for item in results if item.kind == "sprint_report"),
+                        str(sprint) if sprint else None,
+                    ),
+                    issue_key=save_to_jira,
+                    payload={"results": [item.model_dump(mode="json") for item in results]} if results else None,
+                )
+            try:
+                attachment = (await attach_files([(save_to_jira, report_file)]))[0]
+            except ValueError as e:
+                attachment = {"issue_key": save_to_jira, "file": str(report_file), "error": str(e)}
+
+        if as_json:
+            echo_json({
+                "board_id": board_id,
+                "sprint_id": sprint,
+                "team_name": team,
+                "report": result,
+                "results": [item.model_dump(mode="json") for item in results],
+                "output": output,
+                "attachment": attachment,
+            })
+            return
 
         console.print("\n[bold green]✓ Report generated![/bold green]")
         console.print(Panel(result, title="Sprint Report", border_style="green"))
 
         if output:
-            output_path = Path(output)
-            output_path.write_text(result)
-            console.print(f"\n[dim]Saved to: {output_path}[/dim]")
+            console.print(f"\n[dim]Saved to: {output}[/dim]")
+
+        if attachment is not None:
+            if "error" in attachment:
+                console.print(f"\n[red]✗ Could not attach report to {save_to_jira}: {attachment['error']}[/red]")
+                console.print(f"[dim]Report kept at: {attachment['file']}[/dim]")
+            else:
+                console.print(
+                    f"\n[green]✓ Attached {Path(attachment['file']).name} to {save_to_jira}[/green] "
+                    f"[dim](attachment {attachment['attachment_id']})[/dim]"
+                )
 
-        if save_to_jira:
-            console.print(f"\n[dim]Attaching report to {save_to_jira}...[/dim]")
-            # TODO: Implement JIRA attachment
+    asyncio.run(run())
+
+
+@cli.command("report-many")
+@click.argument("boards", nargs=-1, required=True)
+@click.option(
+    "--concurrency",
+    "-c",
+    type=int,
+    help="Narratives generated at once (defaults to REPORT_CONCURRENCY)",
+)
+@click.option(
+    "--output-dir",
+    "-o",
+    type=click.Path(file_okay=False),
+    help="Directory to write each board report and the combined summary to",
+)
+@click.option(
+    "--max-staleness",
+    type=float,
+    help="Read sprints from the local JIRA mirror if synced within this many seconds",
+)
+@json_option
+def report_many(boards, concurrency, output_dir, max_staleness, as_json):
+    """
+    Generate sprint reports for several boards plus a combined summary.
+
+    BOARDS: Board IDs, optionally with a team name as "42:Alpha Team"
+
+    Each distinct active sprint is fetched once and shared by every board on
+    it. Requires ATLASSIAN_USER_EMAIL and ATLASSIAN_API_TOKEN.
+
+    Example:
+        po-agent report-many 42:Alpha 43:Beta 44 --concurrency 4 -o reports/monday
+    """
+    from agent.multi_board import BoardSpec
+
+    try:
+        specs = [BoardSpec.parse(board) for board in boards]
+    except ValueError as e:
+        raise click.BadParameter(str(e), param_hint="BOARDS")
+
+    if not as_json:
+        console.print(
+            f"\n[bold]Generating reports for {len(specs)} boards...[/bold]",
+            style="cyan",
+        )
+
+    async def run():
+        from agent import ProductOwnerAgent
+        agent = ProductOwnerAgent()
+        with spinner("Fetching sprints and generating reports...", enabled=not as_json):
+            result = await agent.generate_reports(
+                specs, concurrency=concurrency, max_staleness=max_staleness
+            )
+
+        if output_dir:
+            out = Path(output_dir)
+            out.mkdir(parents=True, exist_ok=True)
+            for board_report in result.reports:
+                if board_report.report:
+                    (out / f"board_{board_report.board.board_id}.md").write_text(board_report.report)
+            if result.summary:
+                (out / "summary.md").write_text(result.summary)
+
+        if as_json:
+            echo_json(result.to_dict())
+            return
+
+        table = Table(title="Board reports")
+        table.add_column("Board")
+        table.add_column("Team", style="bold")
+        table.add_column("Sprint")
+        table.add_column("Completion")
+        table.add_column("Status")
+        for board_report in result.reports:
+            table.add_row(
+                str(board_report.board.board_id),
+                board_report.board.team_name,
+                board_report.sprint.get("name", "-"),
+                f"{board_report.result.metrics.completion_rate}%" if board_report.result else "-",
+                f"[red]{board_report.error}[/red]" if board_report.error else "[green]✓[/green]",
+            )
+        console.print(table)
+        console.print(
+            f"[dim]{result.stats['distinct_sprints']} distinct sprint(s), "
+            f"{result.stats['issues_fetched']} issues fetched, "
+            f"{result.stats['requests_coalesced']} duplicate request(s) coalesced[/dim]"
+        )
+
+        if result.summary:
+            console.print(Panel(result.summary, title="Combined Summary", border_style="green"))
+
+        if output_dir:
+            console.print(f"\n[dim]Saved to: {output_dir}[/dim]")
 
     asyncio.run(run())
 
@@ -199,7 +519,8 @@ def report(board_id, sprint, team, save_to_jira, output):
     type=click.Path(),
     help="Output file for analysis",
 )
-def analyze(jql_query, initiative, target_date, generate_chart, output):
+@json_option
+def analyze(jql_query, initiative, target_date, generate_chart, output, as_json):
     """
     Analyze dependencies and risks for an initiative.
 
@@ -208,23 +529,30 @@ def analyze(jql_query, initiative, target_date, generate_chart, output):
     Example:
         po-agent analyze "project=PROJ AND fixVersion='v2.0'" -i "Version 2.0" -d 2025-12-31
     """
-    console.print(
-        f"\n[bold]Analyzing initiative: {initiative}...[/bold]",
-        style="cyan",
-    )
+    if not as_json:
+        console.print(
+            f"\n[bold]Analyzing initiative: {initiative}...[/bold]",
+            style="cyan",
+        )
 
     async def run():
+        from agent import ProductOwnerAgent
         agent = ProductOwnerAgent()
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console,
-        ) as progress:
-            task = progress.add_task("Analyzing dependencies...", total=None)
-
+        with spinner("Analyzing dependencies...", enabled=not as_json), collect_results() as results:
             result = await agent.analyze_risks(jql_query, initiative, target_date)
 
-            progress.update(task, completed=True)
+        if output:
+            Path(output).write_text(result)
+
+        if as_json:
+            echo_json({
+                "initiative_name": initiative,
+                "target_date": target_date,
+                "analysis": result,
+                "results": [item.model_dump(mode="json") for item in results],
+                "output": output,
+            })
+            return
 
         console.print("\n[bold green]✓ Analysis completed![/bold green]")
         console.print(
@@ -232,9 +560,7 @@ def analyze(jql_query, initiative, target_date, generate_chart, output):
         )
 
         if output:
-            output_path = Path(output)
-            output_path.write_text(result)
-            console.print(f"\n[dim]Saved to: {output_path}[/dim]")
+            console.print(f"\n[dim]Saved to: {output}[/dim]")
 
     asyncio.run(run())
 
@@ -253,6 +579,7 @@ def interactive():
     print_banner()
 
     async def run():
+        from agent import ProductOwnerAgent
         agent = ProductOwnerAgent()
         await agent.interactive_session()
 
@@ -264,7 +591,768 @@ def interactive():
 
 
 @cli.command()
-def config():
+@click.option(
+    "--jobs",
+    "jobs_file",
+    type=click.Path(exists=True, dir_okay=False),
+    help="Jobs file (defaults to SCHEDULER_JOBS_FILE)",
+)
+@click.option(
+    "--max-concurrency",
+    type=int,
+    help="Maximum jobs running at once (defaults to SCHEDULER_MAX_CONCURRENCY)",
+)
+@click.option(
+    "--list",
+    "list_only",
+    is_flag=True,
+    help="Show configured jobs and their next run time, then exit",
+)
+@json_option
+def scheduler(jobs_file, max_concurrency, list_only, as_json):
+    """
+    Run scheduled board reports and initiative analyses.
+
+    Jobs fire on REPORT_GENERATION_SCHEDULE (or their own "schedule") inside
+    one long-running process that keeps the agent warm between runs. With
+    --json the daemon prints JSON lines: the job list, then one per run.
+
+    Example:
+        po-agent scheduler --jobs scheduler_jobs.json
+    """
+    import logging
+
+    from agent.scheduler import Scheduler, load_jobs
+
+    settings = get_settings()
+    jobs_path = Path(jobs_file) if jobs_file else settings.agent.scheduler_jobs_file
+
+    try:
+        jobs = load_jobs(jobs_path, settings.agent.report_generation_schedule)
+    except (OSError, ValueError) as e:
+        if as_json:
+            echo_json({"error": f"Error loading jobs from {jobs_path}: {str(e)}"})
+        else:
+            console.print(f"[red]Error loading jobs from {jobs_path}: {str(e)}[/red]")
+        sys.exit(1)
+
+    def echo_run(job_name, run):
+        click.echo(json.dumps({"job": job_name, **run}, default=str))
+
+    daemon = Scheduler(jobs, max_concurrency=max_concurrency, on_run=echo_run if as_json else None)
+    next_runs = daemon.next_runs()
+
+    if as_json:
+        listing = {
+            "jobs_file": str(jobs_path),
+            "jobs": [
+                {
+                    "name": job.name,
+                    "kind": job.kind,
+                    "schedule": job.schedule.expression,
+                    "params": job.params,
+                    "last_run": daemon.state.last_run(job.name),
+                    "next_run": next_runs[job.name],
+                }
+                for job in jobs
+            ],
+        }
+        if list_only:
+            echo_json(listing)
+            return
+        # The daemon streams JSON lines: the job listing, then one line per finished run
+        click.echo(json.dumps(listing, default=str))
+    else:
+        table = Table(title=f"Scheduled jobs ({jobs_path})")
+        table.add_column("Job", style="bold")
+        table.add_column("Type")
+        table.add_column("Schedule")
+        table.add_column("Last run", style="dim")
+        table.add_column("Next run", style="cyan")
+        for job in jobs:
+            last_run = daemon.state.last_run(job.name)
+            table.add_row(
+                job.name,
+                job.kind,
+                job.schedule.expression,
+                f"{last_run:%Y-%m-%d %H:%M}" if last_run else "never",
+                f"{next_runs[job.name]:%Y-%m-%d %H:%M}",
+            )
+        console.print(table)
+
+    if list_only:
+        return
+
+    logging.basicConfig(
+        level=settings.agent.log_level.upper(),
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    )
+    if not as_json:
+        console.print(
+            f"\n[bold]Scheduler running[/bold] "
+            f"(max {daemon.max_concurrency} concurrent, jitter ≤{daemon.jitter_seconds:g}s). "
+            "Press Ctrl+C to stop."
+        )
+
+    try:
+        asyncio.run(daemon.run_forever())
+    except KeyboardInterrupt:
+        if not as_json:
+            console.print("\n[yellow]Scheduler stopped[/yellow]")
+
+
+@cli.command()
+@click.argument("projects", nargs=-1)
+@click.option("--board", "-b", "boards", type=int, multiple=True, help="Board whose active sprint to sync")
+@click.option("--sprint", "-s", "sprints", type=int, multiple=True, help="Sprint to sync")
+@click.option("--full", is_flag=True, help="Re-fetch every project issue, dropping deleted ones")
+@click.option("--status", "show_status", is_flag=True, help="Show what the mirror holds and how old it is")
+@json_option
+def sync(projects, boards, sprints, full, show_status, as_json):
+    """
+    Refresh the local JIRA mirror for PROJECTS, boards and sprints.
+
+    Projects fetch only issues updated since their last sync; sprints fetch
+    their membership and then only changed issues. Reports and analyses
+    read the mirror instead of JIRA while it is fresher than their maximum
+    staleness. Add a "sync" job to the scheduler to keep it fresh.
+
+    Example:
+        po-agent sync PROJ OPS --board 42 --board 43
+        po-agent sync --status
+    """
+    from agent.jira_mirror import JiraMirror, sync_mirror
+
+    if not (projects or boards or sprints or show_status):
+        raise click.UsageError("Name projects, --board or --sprint to sync (or use --status)")
+
+    results = []
+    if projects or boards or sprints:
+        try:
+            with spinner("Syncing JIRA mirror...", enabled=not as_json):
+                results = asyncio.run(sync_mirror(projects, boards, sprints, full=full))
+        except Exception as e:
+            raise click.ClickException(str(e))
+
+    with JiraMirror() as mirror:
+        stats = mirror.stats()
+
+    if as_json:
+        echo_json({"results": results, "mirror": stats})
+        return
+
+    if results:
+        table = Table(title="JIRA mirror sync")
+        table.add_column("Scope", style="bold")
+        table.add_column("Fetched", justify="right")
+        table.add_column("Changed", justify="right")
+        table.add_column("Issues", justify="right")
+        for result in results:
+            table.add_row(
+                result["scope"], str(result["fetched"]), str(result["changed"]), str(result["issues"])
+            )
+        console.print(table)
+
+    if show_status:
+        table = Table(title=f"JIRA mirror ({stats['issues']} issues, {stats['links']} links)")
+        table.add_column("Scope", style="bold")
+        table.add_column("Issues", justify="right")
+        table.add_column("Last sync")
+        table.add_column("Age", justify="right")
+        for scope, state in stats["scopes"].items():
+            table.add_row(scope, str(state["issues"]), state["synced_at"], f"{state['age_seconds']}s")
+        console.print(table)
+
+
+@cli.group()
+def reports():
+    """
+    Search and maintain the archive of saved reports and charts.
+    """
+    pass
+
+
+@reports.command("search")
+@click.argument("query", required=False, default="")
+@click.option("--team", "-t", help="Filter by team name")
+@click.option("--initiative", "-i", help="Filter by initiative name")
+@click.option("--sprint", "-s", help="Filter by sprint name")
+@click.option(
+    "--kind",
+    "-k",
+    type=click.Choice(["report", "chart"]),
+    help="Only reports or only charts",
+)
+@click.option("--since", help="Earliest date (YYYY-MM-DD)")
+@click.option("--until", help="Latest date (YYYY-MM-DD)")
+@click.option("--limit", "-n", type=int, default=20, help="Maximum matches")
+@json_option
+def reports_search(query, team, initiative, sprint, kind, since, until, limit, as_json):
+    """
+    Full-text search over archived reports and charts.
+
+    QUERY: Words to search for (omit to list by metadata only)
+
+    Example:
+        po-agent reports search "risk" --initiative "Version 2.0" --since 2025-09-01
+    """
+    from agent.archive import ReportArchive
+
+    with ReportArchive(create=False) as archive:
+        matches = archive.search(
+            query,
+            kind=kind,
+            team=team,
+            initiative=initiative,
+            sprint=sprint,
+            since=since,
+            until=until,
+            limit=limit,
+        )
+
+    if as_json:
+        echo_json(matches)
+        return
+
+    if not matches:
+        console.print("[yellow]No matching reports found[/yellow]")
+        return
+
+    table = Table(title=f"{len(matches)} matching document(s)")
+    table.add_column("Date", style="dim")
+    table.add_column("Title", style="bold")
+    table.add_column("Team")
+    table.add_column("Initiative")
+    table.add_column("Sprint")
+    table.add_column("Match")
+    for match in matches:
+        table.add_row(
+            match["created_at"].replace("T", " "),
+            match["title"],
+            match["team"] or "",
+            match["initiative"] or "",
+            match["sprint"] or "",
+            match["snippet"] or "",
+        )
+    console.print(table)
+    for match in matches:
+        console.print(f"[dim]{match['path']}[/dim]")
+
+
+@reports.command("reindex")
+@json_option
+def reports_reindex(as_json):
+    """
+    Rebuild the archive index from the report and chart directories.
+
+    Example:
+        po-agent reports reindex
+    """
+    from agent.archive import ReportArchive
+
+    settings = get_settings()
+    with ReportArchive() as archive:
+        removed = archive.remove_missing()
+        indexed = archive.reindex(
+            [settings.output.report_output_dir, settings.output.chart_output_dir]
+        )
+        total = archive.count()
+
+    if as_json:
+        echo_json({"indexed": indexed, "removed": removed, "total": total})
+        return
+
+    console.print(
+        f"[green]✓ Indexed {indexed} file(s), removed {removed} stale entr"
+        f"{'y' if removed == 1 else 'ies'} ({total} total)[/green]"
+    )
+
+
+@cli.group()
+def cache():
+    """
+    Inspect and maintain the translation cache.
+    """
+    pass
+
+
+@cache.command("stats")
+@json_option
+def cache_stats(as_json):
+    """
+    Show translation cache size and hit/miss metrics.
+
+    Example:
+        po-agent cache stats
+    """
+    from agent.translation_cache import TranslationCache
+
+    with TranslationCache(create=False) as translation_cache:
+        stats = translation_cache.stats()
+
+    if as_json:
+        echo_json(stats)
+        return
+
+    table = Table(title="Translation cache")
+    table.add_column("Metric", style="bold")
+    table.add_column("Value")
+    table.add_row("Entries", f"{stats['entries']} / {stats['max_entries']}")
+    table.add_row("Size", f"{stats['size_bytes'] / 1024:.1f} KiB")
+    table.add_row("TTL", f"{stats['ttl_days']} days")
+    table.add_row("Hits", str(stats["hits"]))
+    table.add_row("Misses", str(stats["misses"]))
+    table.add_row("Hit rate", f"{stats['hit_rate']}%")
+    console.print(table)
+
+
+@cache.command("invalidate")
+@click.argument("epic_keys", nargs=-1)
+@click.option("--all", "clear_all", is_flag=True, help="Remove every cached translation")
+@click.option("--reset-stats", is_flag=True, help="Also zero the hit/miss counters")
+@json_option
+def cache_invalidate(epic_keys, clear_all, reset_stats, as_json):
+    """
+    Forget cached translations so the epics are retranslated.
+
+    EPIC_KEYS: Epics to forget (or --all)
+
+    Example:
+        po-agent cache invalidate EPIC-123 EPIC-124
+    """
+    from agent.translation_cache import TranslationCache
+
+    if not epic_keys and not clear_all:
+        raise click.UsageError("Provide epic keys or --all")
+
+    with TranslationCache() as translation_cache:
+        removed = translation_cache.invalidate(None if clear_all else list(epic_keys))
+        if reset_stats:
+            translation_cache.reset_stats()
+
+    if as_json:
+        echo_json({"removed": removed, "stats_reset": reset_stats})
+        return
+    console.print(f"[green]✓ Removed {removed} cached translation(s)[/green]")
+
+
+@cache.command("prune")
+@json_option
+def cache_prune(as_json):
+    """
+    Evict expired and least recently used translations beyond the limit.
+
+    Example:
+        po-agent cache prune
+    """
+    from agent.translation_cache import TranslationCache
+
+    with TranslationCache() as translation_cache:
+        removed = translation_cache.evict()
+
+    if as_json:
+        echo_json({"removed": removed})
+        return
+    console.print(f"[green]✓ Evicted {removed} cached translation(s)[/green]")
+
+
+@cli.group("http-cache")
+def http_cache():
+    """
+    Inspect and clear the JIRA/Confluence response cache.
+    """
+    pass
+
+
+@http_cache.command("stats")
+@json_option
+def http_cache_stats(as_json):
+    """
+    Show response cache size, hit ratio and bytes saved.
+
+    Example:
+        po-agent http-cache stats
+    """
+    from agent.http_cache import ResponseCache
+
+    with ResponseCache(create=False) as response_cache:
+        stats = response_cache.stats()
+
+    if as_json:
+        echo_json(stats)
+        return
+
+    table = Table(title="HTTP response cache")
+    table.add_column("Metric", style="bold")
+    table.add_column("Value")
+    table.add_row("Entries", str(stats["entries"]))
+    table.add_row(
+        "Size", f"{stats['size_bytes'] / 1024:.1f} / {stats['max_bytes'] / 1024:.0f} KiB"
+    )
+    table.add_row("Fresh hits", str(stats["fresh_hits"]))
+    table.add_row("Revalidated (304)", str(stats["revalidated"]))
+    table.add_row("Misses", str(stats["misses"]))
+    table.add_row("Hit rate", f"{stats['hit_rate']}%")
+    table.add_row("Saved", f"{stats['bytes_saved'] / 1024:.1f} KiB")
+    console.print(table)
+
+
+@http_cache.command("clear")
+@click.option("--reset-stats", is_flag=True, help="Also zero the hit/miss counters")
+@json_option
+def http_cache_clear(reset_stats, as_json):
+    """
+    Remove every cached response.
+
+    Example:
+        po-agent http-cache clear --reset-stats
+    """
+    from agent.http_cache import ResponseCache
+
+    with ResponseCache() as response_cache:
+        removed = response_cache.clear(reset_stats=reset_stats)
+
+    if as_json:
+        echo_json({"removed": removed, "stats_reset": reset_stats})
+        return
+    console.print(f"[green]✓ Removed {removed} cached response(s)[/green]")
+
+
+@cli.group()
+def components():
+    """
+    Index and search the Outsystems component catalog.
+    """
+    pass
+
+
+@components.command("scan")
+@click.option("--full", is_flag=True, help="Re-parse every file, not only changed ones")
+@json_option
+def components_scan(full, as_json):
+    """
+    Update the component index from OUTSYSTEMS_REPO_PATH.
+
+    Only files changed since the last scan are parsed again.
+
+    Example:
+        po-agent components scan
+    """
+    from agent.component_catalog import ComponentCatalog
+
+    with ComponentCatalog() as catalog:
+        try:
+            with spinner("Scanning repository...", enabled=not as_json):
+                result = catalog.update(full=full)
+        except (ValueError, FileNotFoundError) as e:
+            raise click.ClickException(str(e))
+        stats = catalog.stats()
+
+    if as_json:
+        echo_json({**result, "by_kind": stats["by_kind"]})
+        return
+
+    console.print(
+        f"[green]✓ Indexed {result['components']} components "
+        f"({result['parsed']} of {result['files']} files parsed, {result['removed']} removed)[/green]"
+    )
+    table = Table(title=f"Components in {stats['repo_path']}")
+    table.add_column("Kind", style="bold")
+    table.add_column("Count", justify="right")
+    for kind, count in stats["by_kind"].items():
+        table.add_row(kind.replace("_", " "), str(count))
+    console.print(table)
+
+
+@components.command("search")
+@click.argument("query")
+@click.option(
+    "--kind",
+    type=click.Choice(["module", "entity", "server_action", "screen", "api"]),
+    help="Only return this kind of component",
+)
+@click.option("--limit", "-n", default=10, show_default=True, help="Maximum results")
+@json_option
+def components_search(query, kind, limit, as_json):
+    """
+    Find the indexed components most relevant to QUERY.
+
+    Example:
+        po-agent components search "customer payment refunds"
+    """
+    from agent.component_catalog import ComponentCatalog
+
+    with ComponentCatalog(create=False) as catalog:
+        matches = catalog.search(query, limit=limit, kind=kind)
+
+    if as_json:
+        echo_json(matches)
+        return
+
+    if not matches:
+        console.print("[yellow]No matching components[/yellow]")
+        return
+
+    table = Table(title=f"Components matching '{query}'")
+    table.add_column("Module", style="cyan")
+    table.add_column("Name", style="bold")
+    table.add_column("Kind")
+    table.add_column("Description")
+    for match in matches:
+        table.add_row(
+            match["module"], match["name"], match["kind"].replace("_", " "), match["description"]
+        )
+    console.print(table)
+
+
+@cli.group()
+def vectors():
+    """
+    Build and query the local vector index of specs, reports and Confluence pages.
+    """
+    pass
+
+
+@vectors.command("ingest")
+@click.option(
+    "--confluence-dir",
+    type=click.Path(exists=True, file_okay=False, path_type=Path),
+    help="Exported Confluence pages (defaults to CONFLUENCE_EXPORT_DIR)",
+)
+@click.option("--rebuild-ann", is_flag=True, help="Retrain the approximate index now")
+@json_option
+def vectors_ingest(confluence_dir, rebuild_ann, as_json):
+    """
+    Index archived reports, translated specs and Confluence exports.
+
+    Unchanged files are skipped and deleted files are dropped.
+
+    Example:
+        po-agent vectors ingest --confluence-dir exports/ENG
+    """
+    from agent.vector_index import VectorIndex, index_path, index_write_lock, ingest_sources
+
+    try:
+        path = index_path()
+    except ValueError as e:
+        raise click.ClickException(str(e))
+    with spinner("Indexing documents...", enabled=not as_json), index_write_lock(path):
+        index = VectorIndex(path)
+        counts = ingest_sources(index, confluence_dir=confluence_dir)
+        if rebuild_ann:
+            index.build_ann()
+        index.save()
+    stats = index.stats()
+
+    if as_json:
+        echo_json({"ingested": counts, "stats": stats})
+        return
+
+    indexed = sum(counts[kind] for kind in ("report", "chart", "spec", "confluence"))
+    console.print(
+        f"[green]✓ Indexed {indexed} document(s) "
+        f"({counts['unchanged']} unchanged, {counts['removed']} removed)[/green]"
+    )
+    console.print(
+        f"[dim]{stats['documents']} documents, {stats['chunks']} chunks in {stats['path']}[/dim]"
+    )
+
+
+@vectors.command("search")
+@click.argument("query")
+@click.option("--top-k", "-k", default=5, show_default=True, help="Snippets returned")
+@click.option(
+    "--kind",
+    "kinds",
+    multiple=True,
+    type=click.Choice(["spec", "report", "chart", "confluence"]),
+    help="Only search these document kinds (repeatable)",
+)
+@click.option("--exact", is_flag=True, help="Force brute-force search")
+@json_option
+def vectors_search(query, top_k, kinds, exact, as_json):
+    """
+    Find the snippets most similar to QUERY.
+
+    Example:
+        po-agent vectors search "payment gateway timeout" --kind confluence
+    """
+    from agent.vector_index import VectorIndex
+
+    try:
+        index = VectorIndex()
+    except ValueError as e:
+        raise click.ClickException(str(e))
+    started = time.perf_counter()
+    matches = index.search(query, k=top_k, kinds=list(kinds) or None, exact=True if exact else None)
+    elapsed_ms = (time.perf_counter() - started) * 1000
+
+    if as_json:
+        echo_json({"matches": matches, "elapsed_ms": round(elapsed_ms, 2)})
+        return
+
+    if not matches:
+        console.print("[yellow]No matching snippets[/yellow]")
+        return
+    for match in matches:
+        console.print(Panel(
+            match["text"],
+            title=f"[{match['kind']}] {match['title']}",
+            subtitle=f"similarity {match['score']:.2f}",
+            border_style="cyan",
+        ))
+    console.print(f"[dim]{len(matches)} of {len(index)} chunks in {elapsed_ms:.1f} ms[/dim]")
+
+
+@vectors.command("stats")
+@json_option
+def vectors_stats(as_json):
+    """
+    Show vector index size and search mode.
+
+    Example:
+        po-agent vectors stats
+    """
+    from agent.vector_index import VectorIndex
+
+    try:
+        stats = VectorIndex().stats()
+    except ValueError as e:
+        raise click.ClickException(str(e))
+
+    if as_json:
+        echo_json(stats)
+        return
+
+    table = Table(title="Vector index")
+    table.add_column("Metric", style="bold")
+    table.add_column("Value")
+    table.add_row("Path", stats["path"])
+    table.add_row("Documents", str(stats["documents"]))
+    table.add_row("Chunks", str(stats["chunks"]))
+    for kind, count in stats["by_kind"].items():
+        table.add_row(f"  {kind}", str(count))
+    table.add_row("Dimensions", str(stats["dimensions"]))
+    table.add_row("Size", f"{stats['size_bytes'] / 1024:.1f} KiB")
+    table.add_row(
+        "Search", f"approximate ({stats['clusters']} clusters)" if stats["approximate"] else "exact"
+    )
+    console.print(table)
+
+
+@cli.group()
+def duplicates():
+    """
+    Maintain the backlog index used to flag duplicate stories.
+    """
+    pass
+
+
+@duplicates.command("sync")
+@click.argument("project_key")
+@click.option("--full", is_flag=True, help="Re-fetch every issue, dropping deleted ones")
+@json_option
+def duplicates_sync(project_key, full, as_json):
+    """
+    Index PROJECT_KEY's issues updated since the last sync.
+
+    The first sync fetches the whole backlog; create_stories_from_spec
+    keeps the index current afterwards.
+
+    Example:
+        po-agent duplicates sync PROJ
+    """
+    from agent.duplicates import DuplicateIndex
+    from agent.tools.jira_tools import AsyncJiraClient
+
+    async def run():
+        async with AsyncJiraClient() as client:
+            with DuplicateIndex() as index:
+                return await index.sync(client, project_key, full=full)
+
+    try:
+        with spinner(f"Syncing {project_key} backlog...", enabled=not as_json):
+            result = asyncio.run(run())
+    except Exception as e:
+        raise click.ClickException(str(e))
+
+    if as_json:
+        echo_json(result)
+        return
+
+    console.print(
+        f"[green]✓ {result['issues']} {project_key} issues indexed "
+        f"({result['changed']} of {result['fetched']} fetched issues changed)[/green]"
+    )
+
+
+@duplicates.command("check")
+@click.argument("project_key")
+@click.argument("summary")
+@click.option("--description", "-d", default="", help="Story description")
+@click.option("--threshold", type=float, help="Minimum similarity (defaults to DUPLICATE_THRESHOLD)")
+@json_option
+def duplicates_check(project_key, summary, description, threshold, as_json):
+    """
+    Find indexed PROJECT_KEY issues similar to a story SUMMARY.
+
+    Example:
+        po-agent duplicates check PROJ "Guest checkout without an account"
+    """
+    from agent.duplicates import DuplicateIndex
+
+    with DuplicateIndex(create=False) as index:
+        started = time.perf_counter()
+        matches = index.find_similar(summary, description, project_key, threshold=threshold, limit=10)
+        elapsed_ms = (time.perf_counter() - started) * 1000
+
+    if as_json:
+        echo_json({"matches": matches, "elapsed_ms": round(elapsed_ms, 3)})
+        return
+
+    if not matches:
+        console.print(f"[green]No likely duplicates[/green] [dim]({elapsed_ms:.2f} ms)[/dim]")
+        return
+
+    table = Table(title=f"Likely duplicates of '{summary}' ({elapsed_ms:.2f} ms)")
+    table.add_column("Key", style="cyan")
+    table.add_column("Summary")
+    table.add_column("Similarity", justify="right")
+    for match in matches:
+        table.add_row(match["key"], match["summary"], f"{match['similarity']:.0%}")
+    console.print(table)
+
+
+@duplicates.command("stats")
+@json_option
+def duplicates_stats(as_json):
+    """
+    Show indexed issues per project and when each was last synced.
+
+    Example:
+        po-agent duplicates stats
+    """
+    from agent.duplicates import DuplicateIndex
+
+    with DuplicateIndex(create=False) as index:
+        stats = index.stats()
+
+    if as_json:
+        echo_json(stats)
+        return
+
+    table = Table(title=f"Duplicate index ({stats['issues']} issues)")
+    table.add_column("Project", style="bold")
+    table.add_column("Issues", justify="right")
+    table.add_column("Last sync")
+    for project, count in stats["by_project"].items():
+        table.add_row(project, str(count), stats["last_sync"].get(project, "-"))
+    console.print(table)
+
+
+@cli.command()
+@json_option
+def config(as_json):
     """
     Show current configuration.
 
@@ -277,6 +1365,31 @@ def config():
     try:
         settings = get_settings()
 
+        if as_json:
+            echo_json({
+                "atlassian": {
+                    "mcp_url": settings.atlassian.mcp_url,
+                    "site_url": settings.atlassian.site_url,
+                },
+                "outsystems": {
+                    "docs_url": settings.outsystems.docs_url,
+                    "version": settings.outsystems.version,
+                    "repo_path": settings.outsystems.repo_path,
+                },
+                "agent": {
+                    "report_generation_schedule": settings.agent.report_generation_schedule,
+                    "risk_alert_threshold": settings.agent.risk_alert_threshold,
+                    "dependency_scan_depth": settings.agent.dependency_scan_depth,
+                    "log_level": settings.agent.log_level,
+                },
+                "output": {
+                    "report_output_dir": settings.output.report_output_dir,
+                    "chart_output_dir": settings.output.chart_output_dir,
+                },
+                "notifications": {"slack_enabled": settings.notifications.slack_enabled},
+            })
+            return
+
         config_info = f"""
 [bold]Atlassian MCP Configuration:[/bold]
   MCP URL: {settings.atlassian.mcp_url}
@@ -304,6 +1417,9 @@ def config():
         console.print(Panel(config_info, title="Agent Configuration", border_style="blue"))
 
     except Exception as e:
+        if as_json:
+            echo_json({"error": f"Error loading configuration: {str(e)}"})
+            sys.exit(1)
         console.print(f"[red]Error loading configuration: {str(e)}[/red]")
         console.print(
             "\n[yellow]Tip:[/yellow] Make sure you have a .env file with required settings."
@@ -312,7 +1428,8 @@ def config():
 
 
 @cli.command()
-def check():
+@json_option
+def check(as_json):
     """
     Check system requirements and connectivity.
 
@@ -322,14 +1439,21 @@ def check():
     Example:
         po-agent check
     """
-    console.print("\n[bold]Checking system requirements...[/bold]\n")
+    # Suppress rich output when the results are printed as JSON
+    say = (lambda *args, **kwargs: None) if as_json else console.print
+    results = {"python": None, "packages": {}, "configuration": None, "mcp_servers": {}}
+
+    say("\n[bold]Checking system requirements...[/bold]\n")
 
     # Check Python version
     python_version = sys.version_info
+    results["python"] = f"{python_version.major}.{python_version.minor}"
     if python_version >= (3, 8):
-        console.print("✓ Python version:", f"{python_version.major}.{python_version.minor}", style="green")
+        say("✓ Python version:", results["python"], style="green")
     else:
-        console.print("✗ Python version too old (need 3.8+)", style="red")
+        say("✗ Python version too old (need 3.8+)", style="red")
+        if as_json:
+            echo_json({**results, "ok": False})
         return
 
     # Check required packages
@@ -345,35 +1469,48 @@ def check():
     for package in required_packages:
         try:
             __import__(package.replace("-", "_"))
-            console.print(f"✓ {package} installed", style="green")
+            results["packages"][package] = True
+            say(f"✓ {package} installed", style="green")
         except ImportError:
-            console.print(f"✗ {package} not installed", style="red")
+            results["packages"][package] = False
+            say(f"✗ {package} not installed", style="red")
 
     # Check configuration
     try:
         settings = get_settings()
-        console.print("✓ Configuration loaded", style="green")
+        say("✓ Configuration loaded", style="green")
 
         # Test Agent initialization
-        console.print("\n[dim]Testing Agent initialization...[/dim]")
+        say("\n[dim]Testing Agent initialization...[/dim]")
         from agent import ProductOwnerAgent
         agent = ProductOwnerAgent()
-        console.print("✓ Agent initialized successfully", style="green")
+        say("✓ Agent initialized successfully", style="green")
+        results["configuration"] = "ok"
 
         # Check MCP servers
         options = agent._get_agent_options()
-        console.print(f"✓ MCP servers configured: {', '.join(options.mcp_servers.keys())}", style="green")
+        say(f"✓ MCP servers configured: {', '.join(options.mcp_servers.keys())}", style="green")
 
         atlassian_config = options.mcp_servers.get("atlassian", {})
-        console.print(f"✓ Atlassian MCP: {atlassian_config.get('type', 'N/A')} at {atlassian_config.get('url', 'N/A')}", style="green")
+        say(f"✓ Atlassian MCP: {atlassian_config.get('type', 'N/A')} at {atlassian_config.get('url', 'N/A')}", style="green")
+        results["mcp_servers"] = {
+            # Servers without an explicit type are stdio commands
+            name: server.get("type", "stdio") for name, server in options.mcp_servers.items()
+        }
 
-        console.print("\n[yellow]Note:[/yellow] First run will require browser authentication for Atlassian MCP")
+        say("\n[yellow]Note:[/yellow] First run will require browser authentication for Atlassian MCP")
 
     except Exception as e:
-        console.print(f"✗ Configuration error: {str(e)}", style="red")
-        console.print("\n[yellow]Create a .env file based on .env.example[/yellow]")
+        results["configuration"] = f"error: {str(e)}"
+        say(f"✗ Configuration error: {str(e)}", style="red")
+        say("\n[yellow]Create a .env file based on .env.example[/yellow]")
+
+    if as_json:
+        results["ok"] = all(results["packages"].values()) and results["configuration"] == "ok"
+        echo_json(results)
+        return
 
-    console.print("\n[bold green]System check completed![/bold green]")
+    say("\n[bold green]System check completed![/bold green]")
 
 
 if __name__ == "__main__":
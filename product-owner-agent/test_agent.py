@@ -31,14 +31,14 @@ except Exception as e:
     print(f"✗ Configuration error: {e}")
     sys.exit(1)
 
-# Test output directories creation
+# Test output directories (created by whatever writes to them, not by loading settings)
 print("\nTesting output directories...")
 try:
-    assert settings.output.report_output_dir.exists()
-    assert settings.output.chart_output_dir.exists()
-    print("✓ Output directories created")
+    assert isinstance(settings.output.report_output_dir, Path)
+    assert isinstance(settings.output.chart_output_dir, Path)
+    print("✓ Output directories configured (created on first write)")
 except AssertionError:
-    print("✗ Output directories not created")
+    print("✗ Output directories not configured")
     sys.exit(1)
 
 # Test prompt loading
@@ -82,6 +82,11 @@ try:
     # Count Atlassian MCP tools
     atlassian_tools = [t for t in options.allowed_tools if 'atlassian' in t]
     print(f"  - Atlassian MCP tools available: {len(atlassian_tools)}")
+
+    # Text-only narratives start neither MCP server nor any tool
+    text_options = agent._get_text_options()
+    assert not text_options.mcp_servers and text_options.tools == []
+    print("  - Text-only options: no MCP servers, no tools")
 except Exception as e:
     print(f"✗ Agent initialization error: {e}")
     sys.exit(1)
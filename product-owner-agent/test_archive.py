@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""Test the full-text report archive."""
+
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+from agent.archive import ReportArchive, to_match_query
+
+
+def test_match_query_escaping():
+    """Punctuation in search terms must not break FTS5 syntax."""
+    assert to_match_query("Version 2.0") == '"Version" "2" "0"'
+    assert to_match_query("PROJ-123 risk") == '"PROJ" "123" "risk"'
+    assert to_match_query("  ") == ""
+    print("✓ Test 1: Match query escaping")
+
+
+def test_index_and_search():
+    """Reports are searchable by text and filterable by metadata."""
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp_path = Path(tmp)
+        with ReportArchive(tmp_path / "archive.db") as archive:
+            risk = tmp_path / "risk_20250915_090000.md"
+            risk.write_text("High timeline risk for the checkout redesign")
+            archive.add(
+                risk,
+                kind="report",
+                title="risk",
+                content=risk.read_text(),
+                initiative="Version 2.0",
+                created_at=datetime(2025, 9, 15, 9, 0, 0),
+            )
+
+            sprint = tmp_path / "sprint_20251001_090000.md"
+            sprint.write_text("Velocity improved, no risk flagged")
+            archive.add(
+                sprint,
+                kind="report",
+                title="sprint",
+                content=sprint.read_text(),
+                team="Alpha Team",
+                sprint="Sprint 12",
+                created_at=datetime(2025, 10, 1, 9, 0, 0),
+            )
+
+            chart = tmp_path / "gantt_Version_2.0_20250916_090000.md"
+            chart.write_text("gantt\n    section Alpha Team")
+            archive.add(
+                chart,
+                kind="chart",
+                title="gantt_Version 2.0",
+                content=chart.read_text(),
+                team="Alpha Team, Beta Team",
+                initiative="Version 2.0",
+            )
+
+            assert len(archive.search("risk")) == 2
+            assert [m["title"] for m in archive.search("risk", initiative="version 2.0")] == ["risk"]
+            assert [m["title"] for m in archive.search("risk", since="2025-09-20")] == ["sprint"]
+            assert [m["title"] for m in archive.search("", until="2025-09-15", kind="report")] == ["risk"]
+            assert {m["kind"] for m in archive.search("", team="Beta Team")} == {"chart"}
+            assert len(archive.search("", team="Alpha Team")) == 2
+            assert "[timeline]" in archive.search("timeline")[0]["snippet"]
+
+            # Re-adding the same file replaces the previous entry
+            archive.add(risk, kind="report", title="risk", content="Rewritten")
+            assert archive.count() == 3
+            assert archive.search("checkout") == []
+    print("✓ Test 2: Index and search with metadata filters")
+
+
+def test_reindex_and_prune():
+    """Existing files are backfilled and deleted files are pruned."""
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp_path = Path(tmp)
+        (tmp_path / "status_20250901_080000.md").write_text("Initiative status")
+        (tmp_path / "gantt_Mobile_App_20250902_080000.md").write_text("gantt chart")
+
+        with ReportArchive(tmp_path / "archive.db") as archive:
+            assert archive.reindex([tmp_path, tmp_path / "missing"]) == 2
+            assert archive.reindex([tmp_path]) == 0
+
+            chart = archive.search("", kind="chart")[0]
+            assert chart["initiative"] == "Mobile App"
+            assert chart["created_at"] == "2025-09-02T08:00:00"
+
+            (tmp_path / "status_20250901_080000.md").unlink()
+            assert archive.remove_missing() == 1
+            assert archive.count() == 1
+    print("✓ Test 3: Reindex and prune")
+
+
+def test_search_latency():
+    """Searches stay in the millisecond range across thousands of reports."""
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp_path = Path(tmp)
+        with ReportArchive(tmp_path / "archive.db") as archive:
+            for i in range(3000):
+                archive.add(
+                    tmp_path / f"report_{i}.md",
+                    kind="report",
+                    title=f"report {i}",
+                    content=f"Sprint {i % 40} summary for team {i % 7} with risk item {i}",
+                    team=f"Team {i % 7}",
+                )
+
+            start = time.perf_counter()
+            matches = archive.search("risk item 2999")
+            elapsed_ms = (time.perf_counter() - start) * 1000
+
+            assert matches[0]["title"] == "report 2999"
+            assert elapsed_ms < 100, f"Search took {elapsed_ms:.1f}ms"
+    print(f"✓ Test 4: Search over 3000 reports in {elapsed_ms:.1f}ms")
+
+
+if __name__ == "__main__":
+    test_match_query_escaping()
+    test_index_and_search()
+    test_reindex_and_prune()
+    test_search_latency()
+
+    print("\n" + "=" * 60)
+    print("✓ All report archive tests passed!")
+    print("=" * 60)
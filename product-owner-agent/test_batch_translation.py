@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""Test concurrent batch epic translation."""
+
+import asyncio
+import os
+import tempfile
+from pathlib import Path
+
+os.environ.setdefault("ATLASSIAN_SITE_URL", "https://example.atlassian.net")
+
+from agent.batch_translation import BatchTranslator, read_epic_keys, summarize_latencies, EpicTranslation
+from agent.tools.jira_tools import AsyncJiraClient
+from agent.translation_cache import TranslationCache
+from fake_jira_server import FakeJiraServer
+
+
+class FakeJiraClient:
+    """Serves a fixed set of epics and records bulk lookups."""
+
+    EPICS = {
+        f"EPIC-{n}": {"summary": f"Epic {n}", "description": f"Customers need feature {n}"}
+        for n in range(1, 6)
+    }
+
+    def __init__(self):
+        self.lookups = []
+
+    async def get_issues_bulk(self, issue_keys, fields=None, expand=None):
+        self.lookups.append(list(issue_keys))
+        return {
+            key: {"key": key, "fields": dict(self.EPICS[key])} for key in issue_keys if key in self.EPICS
+        }
+
+
+class FakeAgent:
+    """Records prompts, tracks concurrency and fails on request."""
+
+    def __init__(self, fail=()):
+        self.prompts = []
+        self.active = 0
+        self.peak = 0
+        self.fail = fail
+
+    async def text_query(self, prompt):
+        self.prompts.append(prompt)
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        await asyncio.sleep(0.02)
+        self.active -= 1
+        for key in self.fail:
+            if f"Epic {key[-1]}\n" in prompt:
+                raise RuntimeError("model unavailable")
+        return "## Stories\n- Story A"
+
+
+def test_read_epic_keys():
+    """Key files accept newlines, commas, spaces and comments."""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "epics.txt"
+        path.write_text("EPIC-1, EPIC-2\n# onboarding\nEPIC-3 EPIC-4  # last two\n\n")
+        assert read_epic_keys(path) == ["EPIC-1", "EPIC-2", "EPIC-3", "EPIC-4"]
+    print("✓ Test 1: Epic key files")
+
+
+def test_batch_translates_concurrently():
+    """One bulk fetch, bounded concurrency, one file per epic, shared context."""
+    with tempfile.TemporaryDirectory() as tmp:
+        client = FakeJiraClient()
+        agent = FakeAgent(fail=["EPIC-3"])
+        cache = TranslationCache(Path(tmp) / "cache.db")
+        translator = BatchTranslator(agent, client=client, concurrency=2, cache=cache)
+        streamed = []
+
+        result = asyncio.run(translator.run(
+            ["EPIC-1", "epic-2", "EPIC-3", "EPIC-4", "EPIC-5", "EPIC-9", "EPIC-1"],
+            architecture_type="modular monolith",
+            component_list="Auth Service",
+            team_skills="Outsystems",
+            output_dir=Path(tmp),
+            on_result=lambda translation: streamed.append(translation.epic_key),
+        ))
+
+        assert client.lookups == [["EPIC-1", "EPIC-2", "EPIC-3", "EPIC-4", "EPIC-5", "EPIC-9"]]
+        assert agent.peak == 2
+        assert len(agent.prompts) == 5
+        assert all("modular monolith" in p and "Auth Service" in p for p in agent.prompts)
+
+        by_key = {t.epic_key: t for t in result.translations}
+        assert [t.epic_key for t in result.translations] == [
+            "EPIC-1", "EPIC-2", "EPIC-3", "EPIC-4", "EPIC-5", "EPIC-9"
+        ]
+        assert by_key["EPIC-9"].error == "Epic not found"
+        assert by_key["EPIC-3"].error == "model unavailable"
+        assert by_key["EPIC-1"].output_path == Path(tmp) / "EPIC-1.md"
+        assert (Path(tmp) / "EPIC-1.md").read_text().startswith("# EPIC-1: Epic 1")
+        assert not (Path(tmp) / "EPIC-3.md").exists()
+        assert sorted(streamed) == sorted(by_key)
+
+        stats = result.stats
+        assert (stats["epics"], stats["succeeded"], stats["failed"], stats["fetched"]) == (6, 4, 2, 5)
+        assert stats["latency_p50"] >= 0.02
+        assert stats["epics_per_minute"] > 0
+        cache.close()
+    print("✓ Test 2: Batch translation with bounded concurrency")
+
+
+def test_fetch_pages_past_the_server_cap():
+    """Epics beyond JIRA's maxResults cap are paged in, not reported missing."""
+    with FakeJiraServer() as jira, tempfile.TemporaryDirectory() as tmp:
+        jira.max_page_size = 2
+        for n in range(1, 6):
+            jira.add_issue("EPIC", {"summary": f"Epic {n}", "description": f"Customers need feature {n}"})
+        client = AsyncJiraClient(base_url=jira.url, user_email="po@example.com", api_token="token")
+        translator = BatchTranslator(FakeAgent(), client=client, cache=TranslationCache(Path(tmp) / "cache.db"))
+
+        async def run():
+            async with client:
+                return await translator.run([f"EPIC-{n}" for n in range(1, 6)], output_dir=Path(tmp))
+
+        result = asyncio.run(run())
+        translator.cache.close()
+
+    assert [t.error for t in result.translations] == [None] * 5
+    assert result.stats["fetched"] == 5
+    print("✓ Test 3: Epic fetch pages past the server's page cap")
+
+
+def test_latency_stats():
+    """Percentiles use the nearest rank over successful translations."""
+    translations = [EpicTranslation(f"E-{n}", latency=float(n)) for n in range(1, 21)]
+    translations.append(EpicTranslation("E-X", latency=99.0, error="boom"))
+    stats = summarize_latencies(translations, wall_seconds=30.0)
+    assert stats["latency_p50"] == 10.0
+    assert stats["latency_p95"] == 19.0
+    assert stats["latency_max"] == 20.0
+    assert stats["epics_per_minute"] == 40.0
+    print("✓ Test 4: Latency statistics")
+
+
+if __name__ == "__main__":
+    test_read_epic_keys()
+    test_batch_translates_concurrently()
+    test_fetch_pages_past_the_server_cap()
+    test_latency_stats()
+
+    print("\n" + "=" * 60)
+    print("✓ All batch translation tests passed!")
+    print("=" * 60)
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""Test incremental burndown/burnup series."""
+
+import os
+import tempfile
+from datetime import date
+from pathlib import Path
+
+import numpy as np
+
+os.environ.setdefault("ATLASSIAN_SITE_URL", "https://example.atlassian.net")
+
+from agent.burndown import BurndownTracker
+
+
+def history(created, field, old, new, field_id=None):
+    item = {"field": field, "fromString": old, "toString": new}
+    if field_id:
+        item["fieldId"] = field_id
+    return {"created": created, "items": [item]}
+
+
+def make_issues(include_late_changes=True):
+    """Three issues: one done on day 2, one re-estimated, one added mid-sprint."""
+    first = [history("2025-10-02T10:00:00.000+0000", "status", "In Progress", "Done")]
+    second = [history("2025-10-03T09:00:00.000+0000", "Story Points", "3", "5", "customfield_10016")]
+    if include_late_changes:
+        second.append(history("2025-10-06T15:00:00.000+0000", "status", "To Do", "Done"))
+    return [
+        {
+            "key": "P-1",
+            "fields": {"status": {"name": "Done"}, "customfield_10016": 8,
+                       "created": "2025-09-20T10:00:00.000+0000"},
+            "changelog": {"histories": first},
+        },
+        {
+            "key": "P-2",
+            "fields": {"status": {"name": "Done" if include_late_changes else "To Do"},
+                       "customfield_10016": 5, "created": "2025-09-20T10:00:00.000+0000"},
+            "changelog": {"histories": second},
+        },
+        {
+            "key": "P-3",
+            "fields": {"status": {"name": "To Do"}, "customfield_10016": 2,
+                       "created": "2025-10-04T08:00:00.000+0000"},
+            "changelog": {"histories": []},
+        },
+    ]
+
+
+def test_full_replay():
+    """Changes land on the right day and mid-sprint additions grow scope."""
+    with tempfile.TemporaryDirectory() as tmp:
+        tracker = BurndownTracker(Path(tmp))
+        series = tracker.compute("42", "2025-10-01", "2025-10-10", make_issues(), today=date(2025, 10, 7))
+
+        assert series.computed_through == 6
+        assert list(series.scope[:7]) == [11, 11, 13, 15, 15, 15, 15]
+        assert list(series.completed[:7]) == [0, 8, 8, 8, 8, 13, 13]
+        assert list(series.remaining[:7]) == [11, 3, 5, 7, 7, 2, 2]
+        assert np.isnan(series.scope[7])
+        assert series.days[0] == np.datetime64("2025-10-01")
+
+        context = series.to_context()
+        assert "day 7 of 10" in context
+        assert "Remaining (burndown): [11, 3, 5, 7, 7, 2, 2]" in context
+        assert "Scope change since start: +4" in context
+        assert series.daily_pace() == 13 / 6
+    print("✓ Test 1: Full changelog replay")
+
+
+def test_incremental_replay_matches_full():
+    """A later run reuses persisted state and only needs newer changelog entries."""
+    with tempfile.TemporaryDirectory() as tmp:
+        tracker = BurndownTracker(Path(tmp))
+        early = tracker.compute(
+            "42", "2025-10-01", "2025-10-10", make_issues(include_late_changes=False),
+            today=date(2025, 10, 5),
+        )
+        assert early.computed_through == 4
+        assert (Path(tmp) / "sprint_42.npz").exists()
+
+        # Drop history already replayed: only the persisted state can supply it
+        late_issues = make_issues()
+        for issue in late_issues:
+            issue["changelog"]["histories"] = [
+                h for h in issue["changelog"]["histories"] if h["created"] >= "2025-10-05"
+            ]
+        incremental = tracker.compute("42", "2025-10-01", "2025-10-10", late_issues, today=date(2025, 10, 7))
+
+        with tempfile.TemporaryDirectory() as fresh:
+            full = BurndownTracker(Path(fresh)).compute(
+                "42", "2025-10-01", "2025-10-10", make_issues(), today=date(2025, 10, 7)
+            )
+
+        assert np.array_equal(incremental.scope[:7], full.scope[:7])
+        assert np.array_equal(incremental.completed[:7], full.completed[:7])
+    print("✓ Test 2: Incremental replay matches full replay")
+
+
+def test_not_started_and_changed_dates():
+    """Future sprints have no data; changed sprint dates discard stale state."""
+    with tempfile.TemporaryDirectory() as tmp:
+        tracker = BurndownTracker(Path(tmp))
+        series = tracker.compute("7", "2025-10-01", "2025-10-10", make_issues(), today=date(2025, 9, 25))
+        assert series.computed_through == -1
+        assert "not started" in series.to_context()
+
+        tracker.compute("7", "2025-10-01", "2025-10-10", make_issues(), today=date(2025, 10, 5))
+        moved = tracker.compute("7", "2025-10-02", "2025-10-12", make_issues(), today=date(2025, 10, 5))
+        assert len(moved.scope) == 11
+        assert moved.computed_through == 3
+    print("✓ Test 3: Not-started sprints and changed dates")
+
+
+def test_removed_issues_and_pace():
+    """Issues dropped from the sprint leave scope; work done before day 0 is not pace."""
+    with tempfile.TemporaryDirectory() as tmp:
+        tracker = BurndownTracker(Path(tmp))
+        issues = make_issues(include_late_changes=False)
+        issues.append({
+            "key": "P-4",
+            "fields": {"status": {"name": "Done"}, "customfield_10016": 3,
+                       "created": "2025-09-20T10:00:00.000+0000"},
+            "changelog": {"histories": [history("2025-09-25T10:00:00.000+0000", "status", "To Do", "Done")]},
+        })
+        early = tracker.compute("42", "2025-10-01", "2025-10-10", issues, today=date(2025, 10, 5))
+        assert list(early.scope[:5]) == [14, 14, 16, 18, 18]
+        assert list(early.completed[:5]) == [3, 11, 11, 11, 11]
+        assert early.daily_pace() == 8 / 4
+
+        # P-3 and P-4 were removed from the sprint after the persisted days
+        later = tracker.compute(
+            "42", "2025-10-01", "2025-10-10", make_issues()[:2], today=date(2025, 10, 7)
+        )
+        assert list(later.scope[:7]) == [14, 14, 16, 18, 13, 13, 13]
+        assert list(later.completed[:7]) == [3, 11, 11, 11, 8, 13, 13]
+    print("✓ Test 4: Removed issues leave scope; pace excludes pre-sprint work")
+
+
+if __name__ == "__main__":
+    test_full_replay()
+    test_incremental_replay_matches_full()
+    test_not_started_and_changed_dates()
+    test_removed_issues_and_pace()
+
+    print("\n" + "=" * 60)
+    print("✓ All burndown tests passed!")
+    print("=" * 60)
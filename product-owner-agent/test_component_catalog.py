@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+"""Test the indexed Outsystems component catalog."""
+
+import asyncio
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+from unittest import mock
+
+os.environ.setdefault("ATLASSIAN_SITE_URL", "https://example.atlassian.net")
+
+from agent.component_catalog import (
+    ComponentCatalog,
+    component_context,
+    parse_components,
+    split_identifier,
+)
+from agent.config import reload_settings
+from agent.tools.translation import translate_epic_to_stories
+
+PAYMENTS_XML = """<?xml version="1.0"?>
+<Module Name="Payments" Description="Card and wallet payments">
+  <Entity Name="Payment" Description="A captured payment" />
+  <StaticEntity Name="PaymentStatus" />
+  <ServerAction Name="RefundPayment" Description="Refund a captured card payment" />
+  <ServerAction Name="CapturePayment" />
+  <ExposedRESTAPI Name="PaymentsAPI" />
+</Module>
+"""
+
+ORDERS_JSON = {
+    "module": "Orders",
+    "elements": [
+        {"type": "Entity", "name": "Order", "description": "Customer order"},
+        {"type": "Screen", "name": "OrderHistory"},
+        {"type": "server_action", "name": "CancelOrder"},
+        {"type": "Structure", "name": "OrderLine"},
+    ],
+}
+
+
+def make_repo(root: Path) -> Path:
+    repo = root / "repo"
+    (repo / "Payments").mkdir(parents=True)
+    (repo / "Orders").mkdir()
+    (repo / ".git").mkdir()
+    (repo / "Payments" / "Payments.xml").write_text(PAYMENTS_XML)
+    (repo / "Orders" / "orders.json").write_text(json.dumps(ORDERS_JSON))
+    (repo / "Legacy_CRM.oml").write_bytes(b"\x00binary")
+    (repo / ".git" / "ignored.xml").write_text('<Entity Name="Ignored" />')
+    return repo
+
+
+def test_parse_components():
+    """XML and JSON exports yield typed components; other elements are ignored."""
+    xml = parse_components(PAYMENTS_XML, ".xml")
+    assert [(c["kind"], c["name"]) for c in xml] == [
+        ("module", "Payments"),
+        ("entity", "Payment"),
+        ("entity", "PaymentStatus"),
+        ("server_action", "RefundPayment"),
+        ("server_action", "CapturePayment"),
+        ("api", "PaymentsAPI"),
+    ]
+    assert xml[3]["description"] == "Refund a captured card payment"
+
+    parsed = parse_components(json.dumps(ORDERS_JSON), ".json")
+    assert [(c["kind"], c["name"]) for c in parsed] == [
+        ("entity", "Order"), ("screen", "OrderHistory"), ("server_action", "CancelOrder"),
+    ]
+    assert parse_components("{not json", ".json") == []
+    assert split_identifier("GetCustomerOrders") == "Get Customer Orders"
+    assert split_identifier("PaymentsAPI_v2") == "Payments API v2"
+    print("✓ Test 1: Component parsing")
+
+
+def test_incremental_update():
+    """Only changed files are parsed again and deleted files are dropped."""
+    with tempfile.TemporaryDirectory() as tmp:
+        repo = make_repo(Path(tmp))
+        with ComponentCatalog(Path(tmp) / "index.db", repo_path=repo) as catalog:
+            assert catalog.is_stale()
+            first = catalog.update()
+            assert (first["files"], first["parsed"], first["components"]) == (3, 3, 10)
+            assert not catalog.is_stale(max_age_minutes=60)
+
+            assert catalog.update()["parsed"] == 0
+
+            orders = repo / "Orders" / "orders.json"
+            data = dict(ORDERS_JSON, elements=ORDERS_JSON["elements"][:1])
+            orders.write_text(json.dumps(data))
+            os.utime(orders, ns=(1, 1))  # different mtime even on coarse clocks
+            changed = catalog.update()
+            assert (changed["parsed"], changed["components"]) == (1, 8)
+
+            (repo / "Legacy_CRM.oml").unlink()
+            removed = catalog.update()
+            assert (removed["removed"], removed["components"]) == (1, 7)
+            assert catalog.stats()["by_kind"] == {"api": 1, "entity": 3, "module": 1, "server_action": 2}
+
+            # Components without a declared module belong to their directory
+            assert catalog.search("order")[0]["module"] == "Orders"
+    print("✓ Test 2: Incremental index updates")
+
+
+def test_search_relevance():
+    """Epic text retrieves the matching components, names first."""
+    with tempfile.TemporaryDirectory() as tmp:
+        repo = make_repo(Path(tmp))
+        with ComponentCatalog(Path(tmp) / "index.db", repo_path=repo) as catalog:
+            catalog.update()
+            matches = catalog.search(
+                "Customers should be able to request refunds for their card payments", limit=4
+            )
+            assert len(matches) == 4
+            assert matches[0]["name"] == "RefundPayment"
+            assert {"Payments", "Payment"} <= {m["name"] for m in matches}
+
+            entities = catalog.search("order payment", kind="entity")
+            assert {m["name"] for m in entities} == {"Order", "Payment", "PaymentStatus"}
+            assert catalog.search("the and for") == []
+    print("✓ Test 3: Relevance search")
+
+
+def test_translation_retrieves_components():
+    """The translation tool adds relevant components without rescanning each time."""
+    names = ("OUTSYSTEMS_REPO_PATH", "COMPONENT_INDEX_DB", "TRANSLATION_CACHE_ENABLED")
+    saved = {name: os.environ.get(name) for name in names}
+    with tempfile.TemporaryDirectory() as tmp:
+        repo = make_repo(Path(tmp))
+        try:
+            os.environ.update({
+                "OUTSYSTEMS_REPO_PATH": str(repo),
+                "COMPONENT_INDEX_DB": str(Path(tmp) / "index.db"),
+                "TRANSLATION_CACHE_ENABLED": "false",
+            })
+            reload_settings()
+
+            response = asyncio.run(translate_epic_to_stories.handler({
+                "epic_key": "EPIC-1",
+                "epic_summary": "Self-service refunds",
+                "epic_description": "Customers request refunds for card payments.",
+                "architecture_type": "microservices",
+                "component_list": "Auth Service",
+                "team_skills": "Outsystems",
+            }))
+            text = response["content"][0]["text"]
+            assert "Auth Service, Payments.RefundPayment (server action)" in text
+
+            with ComponentCatalog() as catalog:
+                last_scan = catalog.stats()["last_scan"]
+            # A fresh index is reused as is
+            (repo / "Payments" / "Payments.xml").write_text('<ServerAction Name="IssueRefund" />')
+            assert "IssueRefund" not in asyncio.run(component_context("refund"))
+            with ComponentCatalog() as catalog:
+                assert catalog.stats()["last_scan"] == last_scan
+
+            # A due refresh runs off the event loop, once for concurrent lookups
+            update = ComponentCatalog.update
+
+            def slow_update(catalog, full=False):
+                time.sleep(0.2)
+                return update(catalog, full)
+
+            async def lookups_and_ticks():
+                ticks = 0
+
+                async def tick():
+                    nonlocal ticks
+                    while True:
+                        await asyncio.sleep(0.01)
+                        ticks += 1
+
+                ticker = asyncio.ensure_future(tick())
+                found = await asyncio.gather(*(component_context("refund") for _ in range(3)))
+                ticker.cancel()
+                return found, ticks
+
+            with ComponentCatalog() as catalog, catalog.conn:
+                catalog._set_meta("last_scan", "2000-01-01T00:00:00")
+            with mock.patch.object(ComponentCatalog, "update", autospec=True, side_effect=slow_update) as scan:
+                found, ticks = asyncio.run(lookups_and_ticks())
+            assert all("IssueRefund" in context for context in found)
+            assert ticks >= 10, ticks
+            assert scan.call_count == 1
+        finally:
+            for name, value in saved.items():
+                if value is None:
+                    os.environ.pop(name, None)
+                else:
+                    os.environ[name] = value
+            reload_settings()
+
+    assert asyncio.run(component_context("refund", "Auth Service")) == "Auth Service"  # no repo configured
+    print("✓ Test 4: Translation retrieves relevant components")
+
+
+if __name__ == "__main__":
+    test_parse_components()
+    test_incremental_update()
+    test_search_relevance()
+    test_translation_retrieves_components()
+
+    print("\n" + "=" * 60)
+    print("✓ All component catalog tests passed!")
+    print("=" * 60)
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""Test settings loading: one .env parse, lazy sections, no side effects, light imports."""
+
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+from unittest import mock
+
+os.environ.setdefault("ATLASSIAN_SITE_URL", "https://example.atlassian.net")
+
+from agent import config
+from agent.config import Settings
+
+
+def test_env_file_and_precedence():
+    """.env values fill in what the environment leaves unset, case-insensitively."""
+    with tempfile.TemporaryDirectory() as tmp:
+        env_file = Path(tmp) / ".env"
+        env_file.write_text(
+            "# Local overrides\n"
+            "JIRA_SEARCH_CONCURRENCY=9\n"
+            "report_output_dir=/tmp/po-reports\n"
+            "LOG_LEVEL=DEBUG\n"
+            "SLACK_ENABLED=true\n"
+        )
+        with mock.patch.dict(os.environ, {"LOG_LEVEL": "WARNING"}):
+            settings = Settings(env_file=env_file)
+            assert settings.atlassian.search_concurrency == 9
+            assert settings.output.report_output_dir == Path("/tmp/po-reports")
+            assert settings.agent.log_level == "WARNING"
+            assert settings.notifications.slack_enabled is True
+
+        # Missing file: defaults and environment only
+        settings = Settings(env_file=Path(tmp) / "missing.env")
+        assert settings.atlassian.search_concurrency == 4
+    print("✓ Test 1: .env values, environment precedence and defaults")
+
+
+def test_single_parse_and_lazy_sections():
+    """The file is parsed once; sections are built on first access; nothing is created."""
+    with tempfile.TemporaryDirectory() as tmp:
+        env_file = Path(tmp) / ".env"
+        env_file.write_text(f"REPORT_OUTPUT_DIR={tmp}/reports\nCHART_OUTPUT_DIR={tmp}/charts\n")
+
+        with mock.patch.object(config, "dotenv_values", wraps=config.dotenv_values) as parse:
+            settings = Settings(env_file=env_file)
+            assert "atlassian" not in vars(settings) and "output" not in vars(settings)
+            output = settings.output
+            assert settings.output is output and "agent" not in vars(settings)
+            for section in ("atlassian", "outsystems", "vector_db", "agent", "claude", "notifications"):
+                getattr(settings, section)
+            assert parse.call_count == 1
+
+        assert output.report_output_dir == Path(tmp) / "reports"
+        assert not output.report_output_dir.exists() and not output.chart_output_dir.exists()
+
+        # A section that fails validation does not break the others
+        with mock.patch.dict(os.environ, {"JIRA_SEARCH_CONCURRENCY": "many"}):
+            settings = Settings(env_file=None)
+            assert settings.agent.log_level
+            try:
+                settings.atlassian
+                raise AssertionError("invalid JIRA_SEARCH_CONCURRENCY should be rejected")
+            except ValueError:
+                pass
+    print("✓ Test 2: Single parse, lazy sections and no directories created")
+
+
+READ_ONLY_COMMANDS = [
+    ["reports", "search", "risk"],
+    ["cache", "stats"],
+    ["http-cache", "stats"],
+    ["duplicates", "stats"],
+    ["duplicates", "check", "PROJ", "Guest checkout"],
+    ["components", "search", "payments"],
+]
+
+
+def test_read_only_commands_create_nothing():
+    """Searches and stats over stores that were never written report empty and create no files."""
+    main = Path(__file__).resolve().parent / "main.py"
+    with tempfile.TemporaryDirectory() as tmp:
+        for command in READ_ONLY_COMMANDS:
+            result = subprocess.run(
+                [sys.executable, str(main), *command, "--json"],
+                cwd=tmp,
+                capture_output=True,
+                text=True,
+            )
+            assert result.returncode == 0, (command, result.stderr)
+            json.loads(result.stdout)
+            assert list(Path(tmp).iterdir()) == [], (command, list(Path(tmp).iterdir()))
+    print("✓ Test 3: Read-only commands create no output files")
+
+
+IMPORT_PROBE = """
+import json, sys
+import main
+loaded = {name for name in ("claude_agent_sdk", "aiohttp", "agent.tools.translation") if name in sys.modules}
+from agent import ProductOwnerAgent
+from agent.tools import generate_sprint_report, reporting
+print(json.dumps({
+    "loaded": sorted(loaded),
+    "agent": ProductOwnerAgent.__module__,
+    "tool": generate_sprint_report.name,
+    "module": reporting.__name__,
+}))
+"""
+
+
+def test_lazy_imports():
+    """The CLI module loads without the SDK or tools; they import on first use."""
+    result = subprocess.run(
+        [sys.executable, "-c", IMPORT_PROBE],
+        cwd=Path(__file__).resolve().parent,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    probe = json.loads(result.stdout)
+    assert probe["loaded"] == [], probe["loaded"]
+    assert probe["agent"] == "agent.product_owner"
+    assert probe["tool"] == "generate_sprint_report"
+    assert probe["module"] == "agent.tools.reporting"
+
+    from agent import tools
+    try:
+        tools.missing_tool
+        raise AssertionError("unknown tools should raise AttributeError")
+    except AttributeError:
+        pass
+    print("✓ Test 4: CLI imports without the SDK; agent and tools load on first use")
+
+
+if __name__ == "__main__":
+    test_env_file_and_precedence()
+    test_single_parse_and_lazy_sections()
+    test_read_only_commands_create_nothing()
+    test_lazy_imports()
+
+    print("\n" + "=" * 60)
+    print("✓ All config tests passed!")
+    print("=" * 60)
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""Test delta sprint reports."""
+
+import asyncio
+import copy
+import os
+import tempfile
+from datetime import date
+from pathlib import Path
+
+import numpy as np
+
+os.environ.setdefault("ATLASSIAN_SITE_URL", "https://example.atlassian.net")
+
+from agent.burndown import BurndownSeries
+from agent.delta_report import SECTIONS, DeltaReporter, build_snapshot, section_fingerprints, split_sections
+
+
+def issue(key, status, points, comment=None):
+    fields = {"summary": f"Story {key}", "status": {"name": status}, "customfield_10016": points}
+    if comment:
+        fields["comment"] = {"comments": [{"author": {"displayName": "Ana"}, "body": comment}]}
+    return {"key": key, "fields": fields}
+
+
+class FakeJiraClient:
+    def __init__(self, issues):
+        self.issues = issues
+
+    async def get_active_sprint(self, board_id):
+        return {"id": 7, "name": "Sprint 7"}
+
+    async def search_issues(self, jql, fields=None, max_results=100, expand=None):
+        return {"issues": copy.deepcopy(self.issues)}
+
+
+class FakeAgent:
+    """Writes every requested section from text-only queries and records prompts."""
+
+    def __init__(self):
+        self.prompts = []
+
+    async def text_query(self, prompt):
+        self.prompts.append(prompt)
+        requested = prompt.split("## Sections to Write\n", 1)[1].split("\n\n", 1)[0]
+        names = [line[2:].split(" (from:")[0] for line in requested.splitlines()]
+        return "\n\n".join(f"### {name}\nrun {len(self.prompts)}" for name in names)
+
+
+def test_split_sections():
+    """Generated markdown is split on level-3 headings."""
+    sections = split_sections("### A\nfirst\n\n#### Sub\nmore\n### B\nsecond\n")
+    assert sections == {"A": "first\n\n#### Sub\nmore", "B": "second"}
+    print("✓ Test 1: Section splitting")
+
+
+def test_only_changed_sections_regenerate():
+    """Unchanged inputs reuse previous sections; changed inputs regenerate theirs."""
+    with tempfile.TemporaryDirectory() as tmp:
+        client = FakeJiraClient([
+            issue("P-1", "Done", 5),
+            issue("P-2", "In Progress", 3),
+            issue("P-3", "To Do", 2, comment="Waiting for API spec"),
+        ])
+        agent = FakeAgent()
+        reporter = DeltaReporter(agent, client=client, state_dir=Path(tmp))
+
+        first = asyncio.run(reporter.run(42, team_name="Alpha"))
+        assert first.regenerated == [name for name, _ in SECTIONS]
+        assert "First report for this sprint" in agent.prompts[0]
+
+        # Nothing changed: no model call, report reused verbatim
+        second = asyncio.run(reporter.run(42, team_name="Alpha"))
+        assert second.regenerated == []
+        assert len(agent.prompts) == 1
+        assert second.report == first.report
+
+        # A new comment only touches the "Recent Updates" section
+        client.issues[1] = issue("P-2", "In Progress", 3, comment="PR opened")
+        third = asyncio.run(reporter.run(42, team_name="Alpha"))
+        assert third.regenerated == ["Recent Updates"]
+        assert third.changes["changed"] == {"P-2": ["latest_comment"]}
+        prompt = agent.prompts[-1]
+        assert "PR opened" in prompt
+        assert "Story P-1" not in prompt  # completed issues are not resent
+        assert "### Recent Updates\nrun 2" in third.report
+        assert "### Key Achievements\nrun 1" in third.report
+
+        # Completing a story changes metrics, achievements and priorities
+        client.issues[1] = issue("P-2", "Done", 3, comment="PR opened")
+        fourth = asyncio.run(reporter.run(42, team_name="Alpha"))
+        assert set(fourth.regenerated) == {
+            "Executive Summary", "Team Performance Metrics", "Key Achievements",
+            "Blockers and Risks", "Next Sprint Priorities",
+        }
+        assert "Recent Updates" in fourth.reused
+    print("✓ Test 2: Only sections with changed inputs regenerate")
+
+
+def test_burndown_fingerprint_ignores_quiet_days():
+    """A new day without issue changes keeps the metrics section; a change regenerates it."""
+    issues = [issue("P-1", "Done", 5), issue("P-2", "In Progress", 3)]
+    scope = np.full(10, np.nan)
+    completed = np.full(10, np.nan)
+    scope[:5] = [8, 8, 8, 8, 8]
+    completed[:5] = [0, 5, 5, 5, 5]
+
+    def fingerprint(computed_through, completed_values=completed):
+        series = BurndownSeries(date(2025, 10, 1), scope, completed_values, computed_through)
+        snapshot = build_snapshot(issues, series.to_context(), series=series)
+        return section_fingerprints(snapshot)["Team Performance Metrics"]
+
+    assert fingerprint(2) == fingerprint(4)
+    changed = completed.copy()
+    changed[4] = 8
+    assert fingerprint(4, changed) != fingerprint(4)
+    print("✓ Test 3: Burndown fingerprint ignores days without changes")
+
+
+if __name__ == "__main__":
+    test_split_sections()
+    test_only_changed_sections_regenerate()
+    test_burndown_fingerprint_ignores_quiet_days()
+
+    print("\n" + "=" * 60)
+    print("✓ All delta report tests passed!")
+    print("=" * 60)
@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+"""Test near-duplicate detection against the backlog."""
+
+import asyncio
+import json
+import os
+import random
+import tempfile
+import time
+from pathlib import Path
+
+os.environ.setdefault("ATLASSIAN_SITE_URL", "https://example.atlassian.net")
+
+from agent.config import reload_settings
+from agent.duplicates import DuplicateIndex, minhash, similarity, tokens
+from agent.results import StoryCreationResult, collect_results
+from agent.story_creation import StoryCreator
+from agent.tools.jira_tools import AsyncJiraClient
+from agent.tools.translation import create_stories_from_spec
+from fake_jira_server import FakeJiraServer
+from jira_test_helpers import make_client, run
+
+BACKLOG = [
+    ("Guest checkout without an account", "Shoppers pay for their cart without signing up"),
+    ("Refund a card payment", "Support agents refund captured card payments to the customer"),
+    ("Reset password by email", "Users receive a reset link to choose a new password"),
+    ("Export orders to CSV", "Finance downloads the monthly orders as a spreadsheet"),
+]
+
+
+def issue(key, summary, description="", updated="2025-10-01T09:00:00.000+0000"):
+    return {"key": key, "fields": {"summary": summary, "description": description, "updated": updated}}
+
+
+def test_signatures():
+    """Signature agreement estimates the Jaccard similarity of token sets."""
+    assert tokens("As a user I want to reset my Passwords") == {"reset", "my", "password"}
+    adf = {"type": "doc", "content": [{"type": "paragraph", "content": [{"type": "text", "text": "Card refunds"}]}]}
+    assert tokens("Refund", adf) == {"refund", "card"}
+
+    first = tokens(*BACKLOG[1])
+    second = tokens("Refund card payments", "Agents refund a customer's captured card payment")
+    exact = len(first & second) / len(first | second)
+    estimate = similarity(minhash(first), minhash(second))
+    assert abs(estimate - exact) < 0.15
+    assert similarity(minhash(first), minhash(tokens(*BACKLOG[3]))) < 0.2
+    assert similarity(minhash(set()), minhash(set())) == 1.0  # callers skip empty sets
+    print("✓ Test 1: MinHash signatures")
+
+
+def test_incremental_index():
+    """Only issues whose updated timestamp changed are rehashed."""
+    with tempfile.TemporaryDirectory() as tmp:
+        with DuplicateIndex(Path(tmp) / "dup.db") as index:
+            issues = [issue(f"PROJ-{n + 1}", *story) for n, story in enumerate(BACKLOG)]
+            assert index.update(issues, "PROJ") == 4
+            assert index.update(issues, "PROJ") == 0
+
+            issues[0] = issue("PROJ-1", "Guest checkout with PayPal", updated="2025-10-02T09:00:00.000+0000")
+            assert index.update(issues, "PROJ") == 1
+            assert index.update([issue("OTHER-1", "Refund a card payment")], "OTHER") == 1
+
+            matches = index.find_similar("Refund card payments", "Agents refund captured card payments", "proj")
+            assert [match["key"] for match in matches] == ["PROJ-2"]
+            assert 0.5 <= matches[0]["similarity"] <= 1.0
+            assert index.find_similar("Guest checkout without an account", "", "PROJ", threshold=0.5) == []
+            assert index.find_similar("Quarterly tax report", "", "PROJ") == []
+
+            assert index.remove(["PROJ-2", "PROJ-99"]) == 1
+            assert index.find_similar("Refund a card payment", "", "PROJ", threshold=0.1) == []
+            assert index.stats()["by_project"] == {"OTHER": 1, "PROJ": 3}
+
+        # Buckets persist with the signatures
+        with DuplicateIndex(Path(tmp) / "dup.db") as index:
+            matches = index.find_similar("Export orders as CSV", "Finance downloads monthly orders", "PROJ")
+            assert matches[0]["key"] == "PROJ-4"
+    print("✓ Test 2: Incremental updates and lookups")
+
+
+def test_sync_from_jira():
+    """Syncs page through the backlog, then refetch only recently updated issues."""
+    with FakeJiraServer() as jira, tempfile.TemporaryDirectory() as tmp:
+        for n in range(230):
+            jira.add_issue("PROJ", {"summary": f"Backlog item {n}", "description": f"topic{n} detail{n}"})
+        old = jira.add_issue("PROJ", {"summary": "Legacy SOAP export"})
+        old["fields"]["updated"] = "2020-01-01T09:00:00.000+0000"
+        client = make_client(jira)
+
+        with DuplicateIndex(Path(tmp) / "dup.db") as index:
+            first = run(client, index.sync(client, "PROJ"))
+            assert (first["fetched"], first["changed"], first["issues"]) == (231, 231, 231)
+            assert sum(1 for method, path in jira.requests if path == "/rest/api/2/search") == 3
+
+            # The 2020 issue is outside the incremental window
+            second = run(client, index.sync(client, "PROJ"))
+            assert (second["fetched"], second["changed"]) == (230, 0)
+
+            jira.issues["PROJ-5"]["fields"]["summary"] = "Backlog item renamed"
+            jira.issues["PROJ-5"]["fields"]["updated"] = "2099-01-01T00:00:00.000+0000"
+            assert run(client, index.sync(client, "PROJ"))["changed"] == 1
+
+            del jira.issues["PROJ-6"]
+            assert run(client, index.sync(client, "PROJ", full=True))["issues"] == 230
+    print("✓ Test 3: Incremental sync from JIRA")
+
+
+def test_creation_flags_duplicates():
+    """Likely duplicates are reported before anything is created."""
+    with FakeJiraServer() as jira, tempfile.TemporaryDirectory() as tmp:
+        epic = jira.add_issue("PROJ", {"summary": "Checkout revamp"})
+        for summary, description in BACKLOG:
+            jira.add_issue("PROJ", {"summary": summary, "description": description})
+        client = make_client(jira)
+        stories = [
+            {"title": "Checkout as a guest without an account", "description": "Shoppers pay without signing up"},
+            {"title": "Save cards for later", "description": "Returning shoppers reuse a stored card"},
+        ]
+
+        with DuplicateIndex(Path(tmp) / "dup.db") as index:
+            creator = StoryCreator(client=client, duplicates=index)
+
+            # A project never synced is not synced inline (nor checked)
+            shop_epic = jira.add_issue("SHOP", {"summary": "Storefront"})
+            jira.add_issue("SHOP", {"summary": BACKLOG[0][0], "description": BACKLOG[0][1]})
+            searches = len(jira.requests)
+            unchecked = run(client, creator.create("SHOP", shop_epic["key"], [{"title": BACKLOG[0][0]}]))
+            assert len(unchecked.created) == 1 and not unchecked.duplicates
+            assert index.count("SHOP") == 1  # only the created story
+            assert len(jira.requests) - searches == 2  # label lookup and bulk create
+
+            run(client, index.sync(client, "PROJ"))
+            result = run(client, creator.create("PROJ", epic["key"], stories))
+            assert [story.title for story in result.created] == ["Save cards for later"]
+            assert [story.title for story in result.duplicates] == [stories[0]["title"]]
+            assert result.duplicates[0].matches[0].key == "PROJ-2"
+            assert len(jira.issues) == 9
+
+            # Created stories join the index right away
+            again = run(client, creator.create("PROJ", "PROJ-3", [
+                {"title": "Save cards for later use", "description": "Returning shoppers reuse a stored card"},
+            ]))
+            assert again.duplicates[0].matches[0].key == result.created[0].key
+
+            forced = run(client, creator.create("PROJ", epic["key"], stories, allow_duplicates=True))
+            assert [story.title for story in forced.created] == [stories[0]["title"]]
+            assert [story.title for story in forced.existing] == ["Save cards for later"]
+    print("✓ Test 4: Story creation flags likely duplicates")
+
+
+def test_tool_reports_duplicates():
+    """The tool reports likely duplicates unless detection is disabled."""
+    names = (
+        "ATLASSIAN_SITE_URL", "ATLASSIAN_USER_EMAIL", "ATLASSIAN_API_TOKEN",
+        "DUPLICATE_INDEX_DB", "DUPLICATE_DETECTION_ENABLED",
+    )
+    saved = {name: os.environ.get(name) for name in names}
+    args = {
+        "epic_key": "PROJ-1",
+        "project_key": "PROJ",
+        "stories_json": json.dumps([{"title": "Refund a card payment to the customer"}]),
+    }
+    try:
+        with FakeJiraServer() as jira, tempfile.TemporaryDirectory() as tmp:
+            jira.add_issue("PROJ", {"summary": "Payments"})
+            jira.add_issue("PROJ", {"summary": BACKLOG[1][0], "description": BACKLOG[1][1]})
+            os.environ.update({
+                "ATLASSIAN_SITE_URL": jira.url,
+                "ATLASSIAN_USER_EMAIL": "po@example.com",
+                "ATLASSIAN_API_TOKEN": "token",
+                "DUPLICATE_INDEX_DB": str(Path(tmp) / "dup.db"),
+                "DUPLICATE_DETECTION_ENABLED": "true",
+            })
+            reload_settings()
+            client = AsyncJiraClient()
+            with DuplicateIndex() as index:
+                run(client, index.sync(client, "PROJ"))
+
+            with collect_results() as results:
+                response = asyncio.run(create_stories_from_spec.handler(args))
+            text = response["content"][0]["text"]
+            assert "Likely duplicate, not created: Refund a card payment to the customer ~ PROJ-2" in text
+            assert "allow_duplicates=true" in text
+            [result] = results
+            assert isinstance(result, StoryCreationResult) and len(result.duplicates) == 1
+
+            os.environ["DUPLICATE_DETECTION_ENABLED"] = "false"
+            reload_settings()
+            response = asyncio.run(create_stories_from_spec.handler(args))
+            assert "Created 1: PROJ-3" in response["content"][0]["text"]
+    finally:
+        for name, value in saved.items():
+            if value is None:
+                os.environ.pop(name, None)
+            else:
+                os.environ[name] = value
+        reload_settings()
+    print("✓ Test 5: Tool reports likely duplicates")
+
+
+def test_lookup_scales():
+    """Lookups stay sub-millisecond with tens of thousands of indexed issues."""
+    rng = random.Random(3)
+    vocabulary = [f"term{n}" for n in range(4000)]
+    issues = [
+        issue(
+            f"BIG-{n}",
+            " ".join(rng.choices(vocabulary, k=6)),
+            " ".join(rng.choices(vocabulary, k=25)),
+        )
+        for n in range(20000)
+    ]
+    with tempfile.TemporaryDirectory() as tmp:
+        with DuplicateIndex(Path(tmp) / "dup.db") as index:
+            index.update(issues, "BIG")
+            probes = issues[:200]
+            started = time.perf_counter()
+            found = [
+                index.find_similar(probe["fields"]["summary"], probe["fields"]["description"], "BIG")
+                for probe in probes
+            ]
+            per_lookup_ms = (time.perf_counter() - started) * 1000 / len(probes)
+    assert all(matches and matches[0]["key"] == probe["key"] for matches, probe in zip(found, probes))
+    assert per_lookup_ms < 2.0, per_lookup_ms
+    print(f"✓ Test 6: Lookups over 20k issues ({per_lookup_ms:.2f} ms each)")
+
+
+if __name__ == "__main__":
+    test_signatures()
+    test_incremental_index()
+    test_sync_from_jira()
+    test_creation_flags_duplicates()
+    test_tool_reports_duplicates()
+    test_lookup_scales()
+
+    print("\n" + "=" * 60)
+    print("✓ All duplicate detection tests passed!")
+    print("=" * 60)
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""Test the per-analysis JIRA field profiles."""
+
+import asyncio
+import json
+import os
+import time
+
+os.environ.setdefault("ATLASSIAN_SITE_URL", "https://example.atlassian.net")
+
+from agent.config import reload_settings
+from agent.field_profiles import field_profile, field_profiles, resolve_fields
+from agent.tools.jira_tools import AsyncJiraClient, JiraClient
+from fake_jira_server import FakeJiraServer
+
+
+def test_profiles_follow_settings():
+    """Profiles pick up the configured team field; explicit fields win."""
+    saved = os.environ.get("JIRA_FIELD_TEAM_ASSIGNMENT")
+    try:
+        os.environ["JIRA_FIELD_TEAM_ASSIGNMENT"] = "customfield_12345"
+        reload_settings()
+        assert "customfield_12345" in field_profile("dependency")
+        assert "customfield_12345" in field_profile("gantt")
+        assert set(field_profile("gantt")) <= set(field_profile("dependency"))
+    finally:
+        if saved is None:
+            os.environ.pop("JIRA_FIELD_TEAM_ASSIGNMENT", None)
+        else:
+            os.environ["JIRA_FIELD_TEAM_ASSIGNMENT"] = saved
+        reload_settings()
+
+    assert set(field_profiles()) >= {"dependency", "gantt", "sprint-report", "translation"}
+    assert resolve_fields(["summary"], "dependency") == ["summary"]
+    assert resolve_fields(None, "translation") == ["summary", "description"]
+    assert resolve_fields() is None
+    try:
+        field_profile("everything")
+        raise AssertionError("unknown profiles are rejected")
+    except ValueError as e:
+        assert "sprint-report" in str(e)
+    print("✓ Test 1: Profiles resolve from settings")
+
+
+def test_sprint_data_is_projected():
+    """Sprint issues come back with only the sprint-report fields."""
+    with FakeJiraServer() as jira:
+        sprint = jira.add_sprint(42, "Sprint 7")
+        noise = {f"customfield_{n}": "x" * 200 for n in range(20000, 20120)}
+        for n in range(200):
+            jira.add_issue("PROJ", {
+                "summary": f"Story {n}",
+                "status": {"name": "In Progress"},
+                "customfield_10016": 3,
+                "description": "Long description " * 100,
+                "sprint": sprint["id"],
+                **noise,
+            })
+        client = AsyncJiraClient(base_url=jira.url, user_email="po@example.com", api_token="token")
+
+        async def run():
+            async with client:
+                projected = await client.get_sprint_data(42)
+                everything = await client.get_sprint_data(42, fields=["*all"])
+                return projected, everything
+
+        projected, everything = asyncio.run(run())
+
+    issues = projected["issues"]["issues"]
+    assert len(issues) == 200
+    assert set(issues[0]["fields"]) == {"summary", "status", "customfield_10016"}
+    projected_body, full_body = json.dumps(projected), json.dumps(everything)
+    projected_size, full_size = len(projected_body), len(full_body)
+    assert full_size > 10 * projected_size
+
+    started = time.perf_counter()
+    json.loads(full_body)
+    full_parse = time.perf_counter() - started
+    started = time.perf_counter()
+    json.loads(projected_body)
+    projected_parse = time.perf_counter() - started
+    print(
+        f"✓ Test 2: Sprint issues projected ({full_size // 1024} KB -> {projected_size // 1024} KB, "
+        f"parse {full_parse * 1000:.1f} ms -> {projected_parse * 1000:.1f} ms)"
+    )
+
+def test_client_fetches_take_a_profile():
+    """search_issues and get_issue project to a named profile on both clients."""
+    gantt = {"summary", "status", field_profile("gantt")[-1]}
+    with FakeJiraServer() as jira:
+        jira.add_issue("PROJ", {
+            "summary": "Story",
+            "status": {"name": "To Do"},
+            "description": "Long description " * 100,
+            "customfield_10016": 5,
+        })
+        credentials = {"base_url": jira.url, "user_email": "po@example.com", "api_token": "token"}
+
+        with JiraClient(**credentials) as client:
+            found = client.search_issues("project = PROJ", profile="gantt")["issues"][0]
+            issue = client.get_issue("PROJ-1", profile="gantt")
+            explicit = client.get_issue("PROJ-1", fields=["description"], profile="gantt")
+
+        async def run():
+            async with AsyncJiraClient(**credentials) as client:
+                return (
+                    (await client.search_issues("project = PROJ", profile="gantt"))["issues"][0],
+                    await client.get_issue("PROJ-1", profile="gantt"),
+                )
+
+        async_found, async_issue = asyncio.run(run())
+
+    for fetched in (found, issue, async_found, async_issue):
+        assert set(fetched["fields"]) <= gantt
+        assert "description" not in fetched["fields"]
+    assert set(explicit["fields"]) == {"description"}
+    print("✓ Test 3: Client fetches project to a profile")
+
+
+if __name__ == "__main__":
+    test_profiles_follow_settings()
+    test_sprint_data_is_projected()
+    test_client_fetches_take_a_profile()
+
+    print("\n" + "=" * 60)
+    print("✓ All field profile tests passed!")
+    print("=" * 60)
@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""Test the conditional-request response cache of the JIRA REST clients."""
+
+import asyncio
+import os
+import tempfile
+from pathlib import Path
+from unittest import mock
+
+os.environ.setdefault("ATLASSIAN_SITE_URL", "https://example.atlassian.net")
+
+from agent.config import reload_settings
+from agent.http_cache import ResponseCache, metadata_ttl
+from agent.tools import jira_tools
+from agent.tools.jira_tools import AsyncJiraClient, JiraClient
+from fake_jira_server import FakeJiraServer
+
+CREDENTIALS = {"user_email": "po@example.com", "api_token": "token"}
+
+
+def test_revalidation():
+    """Unchanged issues and pages cost a 304; changed ones are downloaded again."""
+    with FakeJiraServer() as jira, tempfile.TemporaryDirectory() as tmp:
+        jira.add_issue("PROJ", {"summary": "Checkout", "description": "Guest checkout " * 200})
+        page = jira.add_page("Payments architecture", "<p>Gateway</p>" * 500)
+
+        with ResponseCache(Path(tmp) / "http.db") as cache:
+            client = AsyncJiraClient(base_url=jira.url, cache=cache, **CREDENTIALS)
+
+            async def run():
+                async with client:
+                    first = await client.get_issue("PROJ-1")
+                    again = await client.get_issue("PROJ-1")
+                    await client.get_confluence_page(page["id"])
+                    await client.get_confluence_page(page["id"])
+                    await client.update_issue("PROJ-1", {"summary": "Guest checkout"})
+                    changed = await client.get_issue("PROJ-1")
+                    return first, again, changed
+
+            first, again, changed = asyncio.run(run())
+            assert again == first
+            assert changed["fields"]["summary"] == "Guest checkout"
+            assert jira.not_modified == 2
+
+            # The synchronous client shares the store
+            sync_client = JiraClient(base_url=jira.url, cache=cache, **CREDENTIALS)
+            assert sync_client.get_issue("PROJ-1") == changed
+            assert jira.not_modified == 3
+
+            stats = cache.stats()
+            assert (stats["misses"], stats["revalidated"], stats["fresh_hits"]) == (3, 3, 0)
+            assert stats["hit_rate"] == 50.0
+            assert stats["bytes_saved"] > 2 * 3000
+    print(f"✓ Test 1: Conditional revalidation ({stats['bytes_saved'] // 1024} KiB saved)")
+
+
+def test_metadata_ttl():
+    """Metadata is reused without a request until its TTL expires."""
+    assert metadata_ttl("/rest/api/2/issuetype") > 0
+    assert metadata_ttl("/rest/agile/1.0/sprint/7") > 0
+    assert metadata_ttl("/rest/agile/1.0/sprint/7/issue") == 0
+    assert metadata_ttl("/rest/api/2/issue/PROJ-1") == 0
+
+    with FakeJiraServer() as jira, tempfile.TemporaryDirectory() as tmp:
+        jira.add_issue("PROJ", {"summary": "Checkout"})
+        sprint = jira.add_sprint(42, "Sprint 7")
+
+        with ResponseCache(Path(tmp) / "http.db") as cache:
+            client = AsyncJiraClient(base_url=jira.url, cache=cache, **CREDENTIALS)
+
+            async def read_metadata():
+                async with client:
+                    return (
+                        await client.get_project("PROJ"),
+                        await client.get_issue_types(),
+                        await client.get_issue_link_types(),
+                        await client.get_sprint(sprint["id"]),
+                    )
+
+            first = asyncio.run(read_metadata())
+            requests = len(jira.requests)
+            assert asyncio.run(read_metadata()) == first
+            assert len(jira.requests) == requests
+            assert cache.stats()["fresh_hits"] == 4
+
+            cache.conn.execute("UPDATE responses SET fresh_until = 0")
+            assert asyncio.run(read_metadata()) == first
+            assert len(jira.requests) == requests + 4
+            assert jira.not_modified == 4
+    print("✓ Test 2: TTL freshness for metadata")
+
+
+def test_scope_and_size_bound():
+    """Accounts never share bodies, writes bypass the cache and the store stays bounded."""
+    with FakeJiraServer() as jira, tempfile.TemporaryDirectory() as tmp:
+        for n in range(40):
+            jira.add_issue("PROJ", {"summary": f"Story {n}", "description": os.urandom(2000).hex()})
+
+        with ResponseCache(Path(tmp) / "http.db", max_bytes=20_000) as cache:
+            ana = JiraClient(base_url=jira.url, cache=cache, user_email="ana@example.com", api_token="t")
+            bo = JiraClient(base_url=jira.url, cache=cache, user_email="bo@example.com", api_token="t")
+            ana.get_issue("PROJ-1")
+            bo.get_issue("PROJ-1")
+            assert jira.not_modified == 0
+
+            ana.add_comment("PROJ-1", "Looks good")
+            with mock.patch.object(cache, "evict", wraps=cache.evict) as evict:
+                for n in range(40):
+                    ana.get_issue(f"PROJ-{n + 1}")
+            # Only stores that overflow the bound evict, and they leave headroom
+            assert 0 < evict.call_count < 20, evict.call_count
+
+            stats = cache.stats()
+            assert stats["size_bytes"] <= 20_000
+            assert 0 < stats["entries"] < 40
+            ana.get_issue("PROJ-40")  # most recently used survives
+            assert jira.not_modified == 1
+            assert cache.clear(reset_stats=True) == stats["entries"]
+            assert cache.stats()["misses"] == 0
+    print("✓ Test 3: Per-account keys and size-bounded eviction")
+
+
+def test_disabled_by_default():
+    """Without JIRA_HTTP_CACHE_ENABLED the clients make plain requests."""
+    if os.environ.get("JIRA_HTTP_CACHE_ENABLED", "").lower() in ("1", "true"):
+        return
+    assert AsyncJiraClient(**CREDENTIALS).cache is None
+    assert JiraClient(**CREDENTIALS).cache is None
+    print("✓ Test 4: Cache is opt-in")
+
+
+def test_clients_close_their_cache():
+    """A client closes the cache it opened; a reused client reopens it."""
+    names = (
+        "JIRA_HTTP_CACHE_ENABLED", "JIRA_HTTP_CACHE_DB",
+        "ATLASSIAN_SITE_URL", "ATLASSIAN_USER_EMAIL", "ATLASSIAN_API_TOKEN",
+    )
+    saved = {name: os.environ.get(name) for name in names}
+    with FakeJiraServer() as jira, tempfile.TemporaryDirectory() as tmp:
+        jira.add_issue("PROJ", {"summary": "Checkout"})
+        jira.add_sprint(42, "Sprint 7")
+        try:
+            os.environ.update({"JIRA_HTTP_CACHE_ENABLED": "true", "JIRA_HTTP_CACHE_DB": str(Path(tmp) / "http.db")})
+            reload_settings()
+            client = AsyncJiraClient(base_url=jira.url, **CREDENTIALS)
+
+            async def fetch():
+                async with client:
+                    return await client.get_issue("PROJ-1")
+
+            first = asyncio.run(fetch())
+            assert client.cache._conn is None
+            assert asyncio.run(fetch()) == first
+            assert jira.not_modified == 1 and client.cache._conn is None
+
+            with JiraClient(base_url=jira.url, **CREDENTIALS) as sync_client:
+                sync_client.get_issue("PROJ-1")
+            assert sync_client.cache._conn is None
+
+            # A cache passed in belongs to the caller and stays open
+            with ResponseCache(Path(tmp) / "http.db") as shared:
+                JiraClient(base_url=jira.url, cache=shared, **CREDENTIALS).close()
+                assert shared.stats()["revalidated"] == 2
+
+            # The module's convenience functions close the client they create
+            os.environ.update({
+                "ATLASSIAN_SITE_URL": jira.url,
+                "ATLASSIAN_USER_EMAIL": CREDENTIALS["user_email"],
+                "ATLASSIAN_API_TOKEN": CREDENTIALS["api_token"],
+            })
+            reload_settings()
+            with mock.patch.object(JiraClient, "close", autospec=True, side_effect=JiraClient.close) as close:
+                assert jira_tools.get_sprint_data(42)["sprint"]["name"] == "Sprint 7"
+            assert close.call_count == 1
+        finally:
+            for name, value in saved.items():
+                if value is None:
+                    os.environ.pop(name, None)
+                else:
+                    os.environ[name] = value
+            reload_settings()
+    print("✓ Test 5: Clients close the cache they opened")
+
+
+if __name__ == "__main__":
+    test_revalidation()
+    test_metadata_ttl()
+    test_scope_and_size_bound()
+    test_disabled_by_default()
+    test_clients_close_their_cache()
+
+    print("\n" + "=" * 60)
+    print("✓ All HTTP cache tests passed!")
+    print("=" * 60)
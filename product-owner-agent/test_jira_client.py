@@ -0,0 +1,458 @@
+#!/usr/bin/env python3
+"""Test the pooled async JIRA REST client against a local fake JIRA server."""
+
+import asyncio
+import hashlib
+import os
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+os.environ.setdefault("ATLASSIAN_SITE_URL", "https://example.atlassian.net")
+
+from agent.resilience import JiraAPIError, RequestGuard
+from agent.tools.jira_tools import (
+    AsyncJiraClient,
+    JiraClient,
+    _key_chunks,
+    collect,
+    iter_search,
+    iter_sprint_issues,
+    search_all,
+    walk_issue_links,
+)
+from fake_jira_server import FakeJiraServer
+from jira_test_helpers import CREDENTIALS, make_client
+
+
+def test_methods():
+    """Every client method round-trips through the REST API."""
+    with FakeJiraServer() as jira:
+        sprint = jira.add_sprint(42, "Sprint 7")
+        jira.add_sprint(42, "Sprint 6", state="closed")
+        jira.add_issue("PROJ", {"summary": "Checkout", "sprint": sprint["id"]})
+
+        async def run():
+            async with make_client(jira) as client:
+                created = await client.create_issue("PROJ", "Refunds", "Card refunds", risk_score=0.4)
+                await client.update_issue(created["key"], {"summary": "Card refunds"})
+                comment = await client.add_comment(created["key"], "Estimated")
+                await client.create_issue_link(created["key"], "PROJ-1")
+                issue = await client.get_issue(created["key"], fields=["summary"])
+                found = await client.search_issues("project = PROJ", fields=["summary"])
+                sprint_data = await client.get_sprint_data(42)
+                return created, comment, issue, found, sprint_data
+
+        created, comment, issue, found, sprint_data = asyncio.run(run())
+        assert created["key"] == "PROJ-2"
+        assert jira.issues["PROJ-2"]["fields"]["customfield_10003"] == 0.4
+        assert issue["fields"]["summary"] == "Card refunds"
+        assert comment["body"] == "Estimated"
+        assert jira.links[0]["type"] == {"name": "Blocks"}
+        assert found["total"] == 2
+        assert sprint_data["sprint"]["name"] == "Sprint 7"
+        assert [i["key"] for i in sprint_data["issues"]["issues"]] == ["PROJ-1"]
+    print("✓ Test 1: Client methods")
+
+
+def test_pooling():
+    """Concurrent calls reuse a bounded set of keep-alive connections."""
+    with FakeJiraServer(latency=0.02) as jira:
+        for n in range(20):
+            jira.add_issue("PROJ", {"summary": f"Story {n}"})
+
+        async def run():
+            async with make_client(jira, limit_per_host=4) as client:
+                await asyncio.gather(*(client.get_issue(f"PROJ-{n + 1}") for n in range(20)))
+                await asyncio.gather(*(client.get_issue(f"PROJ-{n + 1}") for n in range(20)))
+
+        asyncio.run(run())
+        assert len(jira.requests) == 40
+        assert jira.peak_in_flight == 4
+        assert len(jira.connections) == 4
+    print("✓ Test 2: Connection pool and keep-alive")
+
+
+def test_errors_and_reuse():
+    """Errors keep the client's message format; a closed client reopens its session."""
+    with FakeJiraServer() as jira:
+        client = make_client(jira)
+
+        async def missing():
+            async with client:
+                try:
+                    await client.get_issue("PROJ-404")
+                except Exception as e:
+                    return str(e)
+
+        assert asyncio.run(missing()).startswith("JIRA API error: 404")
+        assert asyncio.run(missing()).startswith("JIRA API error: 404")  # new event loop
+
+        # A client left open in one loop is refused by another instead of leaking its pool
+        loop = asyncio.new_event_loop()
+        try:
+            loop.run_until_complete(client.search_issues("project = PROJ"))
+            try:
+                asyncio.run(client.search_issues("project = PROJ"))
+                raise AssertionError("reuse from another loop should fail")
+            except RuntimeError as e:
+                assert "still open in another event loop" in str(e)
+            loop.run_until_complete(client.close())
+        finally:
+            loop.close()
+        assert asyncio.run(missing()).startswith("JIRA API error: 404")  # reopens once closed
+
+        async def unreachable():
+            async with AsyncJiraClient(base_url="http://127.0.0.1:9", user_email="a", api_token="b") as down:
+                await down.get_issue("PROJ-1")
+
+        try:
+            asyncio.run(unreachable())
+            raise AssertionError("connection errors are raised")
+        except Exception as e:
+            assert str(e).startswith("JIRA connection error")
+
+    try:
+        AsyncJiraClient(user_email="", api_token="")
+        raise AssertionError("credentials are required")
+    except ValueError:
+        pass
+    print("✓ Test 3: Errors and session reuse")
+
+
+def test_sync_client_keeps_alive():
+    """The synchronous client reuses one connection across calls."""
+    with FakeJiraServer() as jira:
+        jira.add_issue("PROJ", {"summary": "Checkout"})
+        client = JiraClient(base_url=jira.url, **CREDENTIALS)
+        for _ in range(5):
+            client.get_issue("PROJ-1")
+        assert len(jira.connections) == 1
+    print("✓ Test 4: Synchronous client keep-alive")
+
+
+def search_pages(jira):
+    return [path for method, path in jira.requests if "/search" in path]
+
+
+def test_parallel_search():
+    """Pages after the first are fetched concurrently at the server's page size."""
+    with FakeJiraServer(latency=0.02) as jira:
+        jira.max_page_size = 50
+        for n in range(1000):
+            jira.add_issue("PROJ", {"summary": f"Story {n}"})
+        client = make_client(jira)
+
+        async def run():
+            async with client:
+                ordered = await search_all(client, "project = PROJ", fields=["summary"], concurrency=5)
+                peak = jira.peak_in_flight
+                arrived = await search_all(client, "project = PROJ", concurrency=5, ordered=False)
+                return ordered, peak, arrived
+
+        ordered, peak, arrived = asyncio.run(run())
+        assert [issue["key"] for issue in ordered] == [f"PROJ-{n + 1}" for n in range(1000)]
+        assert sorted(issue["key"] for issue in arrived) == sorted(issue["key"] for issue in ordered)
+        assert len(search_pages(jira)) == 40  # 20 pages of 50 per search
+        assert peak == 5
+    print("✓ Test 5: Parallel paginated search")
+
+
+def test_search_speedup():
+    """Wall time is about page latency x pages / concurrency."""
+    with FakeJiraServer(latency=0.05) as jira:
+        for n in range(2000):
+            jira.add_issue("PROJ", {"summary": f"Story {n}"})
+        client = make_client(jira)
+
+        async def timed(concurrency):
+            async with client:
+                started = time.perf_counter()
+                issues = await search_all(client, "project = PROJ", concurrency=concurrency)
+                return len(issues), time.perf_counter() - started
+
+        count, sequential = asyncio.run(timed(1))
+        count, parallel = asyncio.run(timed(5))
+        assert count == 2000
+        assert sequential >= 20 * 0.05
+        assert parallel < sequential / 2.5, (sequential, parallel)
+    print(f"✓ Test 6: 20 pages in {sequential:.2f}s sequential, {parallel:.2f}s with 5 in flight")
+
+
+def test_token_search_and_early_exit():
+    """Token pagination walks every page; stopping early cancels pending pages."""
+    with FakeJiraServer() as jira:
+        for n in range(250):
+            jira.add_issue("PROJ", {"summary": f"Story {n}"})
+        client = make_client(jira)
+
+        async def run():
+            async with client:
+                by_token = await search_all(client, "project = PROJ", token_paging=True)
+                token_pages = len(search_pages(jira))
+                jira.requests.clear()
+                first = []
+                async for issue in iter_search(client, "project = PROJ", page_size=10, concurrency=4):
+                    first.append(issue["key"])
+                    if len(first) == 15:
+                        break
+                await asyncio.sleep(0.05)
+                return by_token, token_pages, first
+
+        by_token, token_pages, first = asyncio.run(run())
+        assert [issue["key"] for issue in by_token] == [f"PROJ-{n + 1}" for n in range(250)]
+        assert token_pages == 3
+        assert first == [f"PROJ-{n + 1}" for n in range(15)]
+        assert len(search_pages(jira)) <= 6  # first page, then a window of 4 (plus one refill)
+    print("✓ Test 7: Token pagination and early exit")
+
+
+def test_bulk_fetch_and_coalescing():
+    """Per-issue link lookups collapse into a few concurrent key-in searches."""
+    with FakeJiraServer(latency=0.01) as jira:
+        for n in range(2000):
+            links = [{"type": {"name": "Blocks"}, "outwardIssue": {"key": f"PROJ-{(n + 1) % 2000 + 1}"}}]
+            jira.add_issue("PROJ", {"summary": f"Story {n}", "issuelinks": links})
+        keys = [f"PROJ-{n + 1}" for n in range(2000)]
+        client = make_client(jira)
+
+        async def run():
+            async with client:
+                started = time.perf_counter()
+                # Every key twice, as when several analyses walk the same graph
+                links = await asyncio.gather(*(client.get_issue_links(key) for key in keys + keys))
+                elapsed = time.perf_counter() - started
+                bulk = await client.get_links_bulk(keys[:250] + ["proj-1", "PROJ-9999"])
+                return links, elapsed, bulk
+
+        links, elapsed, bulk = asyncio.run(run())
+        assert links[0][0]["outwardIssue"]["key"] == "PROJ-2"
+        assert links[2000] == links[0]
+        assert sorted(bulk) == sorted(keys[:250])
+        issue_requests = [path for method, path in jira.requests if path.startswith("/rest/api/2/issue/")]
+        assert issue_requests == []
+        assert len(search_pages(jira)) == 20 + 3
+        sync_client = JiraClient(base_url=jira.url, **CREDENTIALS)
+        assert len(sync_client.get_links_bulk(keys[:150])) == 150
+
+        # A server applying a lower maxResults than asked is paged, not truncated
+        jira.max_page_size = 30
+
+        async def capped():
+            async with make_client(jira) as capped_client:
+                return await capped_client.get_issues_bulk(keys[:100], fields=["summary"])
+
+        assert len(asyncio.run(capped())) == 100
+        assert len(sync_client.get_issues_bulk(keys[:100], fields=["summary"])) == 100
+
+        # Chunks also stay within the URL budget when keys are long
+        long_keys = [f"PLATFORMTEAM{n % 7}-{100000 + n}" for n in range(500)]
+        chunks = _key_chunks(long_keys + long_keys)
+        assert sum(len(chunk) for chunk in chunks) == 500
+        assert all(len(chunk) <= 100 for chunk in chunks)
+    print(f"✓ Test 8: 4000 link lookups in 20 searches ({elapsed:.2f}s)")
+
+
+def test_link_walk():
+    """The link graph is walked one bulk fetch per level, up to the depth."""
+    with FakeJiraServer() as jira:
+        for n in range(5):
+            links = [{"type": {"name": "Blocks"}, "outwardIssue": {"key": f"PROJ-{n + 2}"}}] if n < 4 else []
+            jira.add_issue("PROJ", {"summary": f"Story {n}", "issuelinks": links})
+        client = make_client(jira)
+
+        async def run():
+            async with client:
+                return await walk_issue_links(client, ["PROJ-1"], depth=2)
+
+        graph = asyncio.run(run())
+        assert sorted(graph) == ["PROJ-1", "PROJ-2", "PROJ-3"]
+        assert len(search_pages(jira)) == 3
+    print("✓ Test 9: Link graph walk")
+
+
+def test_sprint_data_pages():
+    """Large sprints come back whole; active sprints resolve in one call and are cached."""
+    with FakeJiraServer(latency=0.03) as jira:
+        sprint = jira.add_sprint(42, "Sprint 7")
+        jira.add_sprint(43, "Sprint 3")
+        for n in range(450):
+            jira.add_issue("PROJ", {"summary": f"Story {n}", "status": {"name": "To Do"}, "sprint": sprint["id"]})
+        client = make_client(jira)
+
+        async def run():
+            async with client:
+                started = time.perf_counter()
+                data = await client.get_sprint_data(42)
+                elapsed = time.perf_counter() - started
+                sprints = await client.get_active_sprints([42, 43, 44, 42], return_exceptions=True)
+                board_lookups = len([path for method, path in jira.requests if path.endswith("/sprint")])
+                return data, elapsed, sprints, board_lookups
+
+        data, elapsed, sprints, board_lookups = asyncio.run(run())
+        keys = [issue["key"] for issue in data["issues"]["issues"]]
+        assert keys == [f"PROJ-{n + 1}" for n in range(450)]
+        assert data["issues"]["total"] == 450 and data["sprint"]["name"] == "Sprint 7"
+        # Board lookup, sprint + first page together, then the other 4 pages at once:
+        # 3 round trips where fetching one after another takes 7
+        assert elapsed < 6 * 0.03, elapsed
+        assert sprints[42]["name"] == "Sprint 7" and sprints[43]["name"] == "Sprint 3"
+        assert "No active sprint" in str(sprints[44])
+        assert board_lookups == 3  # board 42 was still cached from get_sprint_data
+
+        sync_client = JiraClient(base_url=jira.url, **CREDENTIALS)
+        assert len(sync_client.get_sprint_data(42)["issues"]["issues"]) == 450
+    print(f"✓ Test 10: 450-issue sprint in {elapsed:.2f}s, active sprints resolved together")
+
+
+def test_attachment_upload():
+    """Uploads stream from disk, run concurrently within the limit and are retried."""
+    with FakeJiraServer(latency=0.05) as jira, tempfile.TemporaryDirectory() as tmp:
+        for n in range(6):
+            jira.add_issue("PROJ", {"summary": f"Story {n}"})
+        big = Path(tmp) / "burndown.png"
+        with open(big, "wb") as f:
+            for _ in range(24):
+                f.write(os.urandom(1 << 20))
+        reports = []
+        for n in range(12):
+            report = Path(tmp) / f"report_{n}.md"
+            report.write_text(f"# Sprint report {n}\n" * 500)
+            reports.append(report)
+        client = make_client(jira, guard=RequestGuard(max_retries=3, backoff=0.01))
+
+        async def run():
+            async with client:
+                tracemalloc.start()
+                [attachment] = await client.upload_attachment("PROJ-1", big)
+                _, peak = tracemalloc.get_traced_memory()
+                tracemalloc.stop()
+
+                jira.peak_in_flight = 0
+                jira.fail_requests = 2
+                uploads = [(f"PROJ-{n % 6 + 1}", report) for n, report in enumerate(reports)]
+                results = await client.upload_attachments(
+                    uploads + [("PROJ-99", reports[0])], concurrency=4, return_exceptions=True
+                )
+                return attachment, peak, results
+
+        attachment, peak, results = asyncio.run(run())
+        assert attachment["size"] == big.stat().st_size
+        assert attachment["sha1"] == hashlib.sha1(big.read_bytes()).hexdigest()
+        assert attachment["mimeType"] == "image/png"
+        # The 24 MiB file never sits in memory as a whole
+        assert peak < 4 << 20, peak
+
+        assert [result[0]["filename"] for result in results[:12]] == [report.name for report in reports]
+        assert isinstance(results[12], JiraAPIError) and results[12].status == 404
+        assert jira.peak_in_flight <= 4
+        assert sum(len(files) for files in jira.attachments.values()) == 13
+        assert all(
+            uploaded["sha1"] == hashlib.sha1(report.read_bytes()).hexdigest()
+            for report, [uploaded] in zip(reports, results[:12])
+        )
+    print(f"✓ Test 11: Streamed upload ({peak / (1 << 20):.1f} MiB peak for 24 MiB), 12 uploads 4 at a time")
+
+
+def test_report_attachment_tools():
+    """save_report_to_jira attaches the saved report; attach_files_to_jira reports each file."""
+    from agent.config import reload_settings
+    from agent.tools.reporting import attach_files_to_jira, save_report_to_jira
+
+    with FakeJiraServer() as jira, tempfile.TemporaryDirectory() as tmp:
+        jira.add_issue("PROJ", {"summary": "Sprint 7 review"})
+        chart = Path(tmp) / "gantt.md"
+        chart.write_text("gantt\n")
+        env = {
+            "ATLASSIAN_SITE_URL": jira.url,
+            "ATLASSIAN_USER_EMAIL": "po@example.com",
+            "ATLASSIAN_API_TOKEN": "token",
+            "REPORT_OUTPUT_DIR": str(Path(tmp) / "reports"),
+            "REPORT_ARCHIVE_DB": str(Path(tmp) / "reports" / "archive.db"),
+        }
+        saved = {name: os.environ.get(name) for name in env}
+        os.environ.update(env)
+        reload_settings()
+        try:
+            result = asyncio.run(save_report_to_jira.handler({
+                "issue_key": "PROJ-1",
+                "report_content": "# Sprint 7\nAll done.",
+                "report_name": "sprint_7",
+            }))
+            assert "Attached to: PROJ-1" in result["content"][0]["text"]
+            [uploaded] = jira.attachments["PROJ-1"]
+            assert uploaded["filename"].startswith("sprint_7_") and uploaded["mimeType"] == "text/markdown"
+            assert f"(attachment {uploaded['id']})" in result["content"][0]["text"]
+
+            result = asyncio.run(attach_files_to_jira.handler({"attachments": [
+                {"issue_key": "PROJ-1", "file_path": str(chart)},
+                {"issue_key": "NOPE-1", "file_path": str(chart)},
+            ]}))
+            assert not result.get("isError")
+            assert result["content"][0]["text"].startswith("Attached 1 of 2 files")
+            assert f"{chart.name} → NOPE-1: failed" in result["content"][0]["text"]
+            assert "404" in result["content"][0]["text"]
+            assert len(jira.attachments["PROJ-1"]) == 2
+        finally:
+            for name, value in saved.items():
+                if value is None:
+                    os.environ.pop(name, None)
+                else:
+                    os.environ[name] = value
+            reload_settings()
+    print("✓ Test 12: Report and chart attachment tools")
+
+
+def test_generated_dataset():
+    """The seeded dataset is reproducible and feeds the clients like a real site."""
+    def snapshot(jira):
+        return {key: (issue["fields"], issue["changelog"]) for key, issue in jira.issues.items()}
+
+    with FakeJiraServer(seed=3) as first, FakeJiraServer(seed=3) as second:
+        dataset = first.generate(projects=2, issues_per_project=120)
+        assert second.generate(projects=2, issues_per_project=120) == dataset
+        assert snapshot(first) == snapshot(second)
+        assert dataset["issues"] == 240 and dataset["links"] > 0 and len(first.pages) == 10
+
+        client = make_client(first, guard=RequestGuard(max_retries=5, backoff=0.01))
+
+        async def run():
+            async with client:
+                sprint = await client.get_active_sprint(dataset["boards"][0])
+                plain = await client.get_sprint_issues(sprint["id"], fields=["status"])
+                expanded = await collect(iter_sprint_issues(client, sprint["id"], expand=["changelog"]))
+                graph = await walk_issue_links(client, [first.links[0]["outwardIssue"]["key"]], depth=1)
+                first.error_rate = 0.3
+                pages = [await client.get_confluence_page(page_id) for page_id in first.pages]
+                return sprint, plain, expanded, graph, pages
+
+        sprint, plain, expanded, graph, pages = asyncio.run(run())
+        assert sprint["id"] == dataset["active_sprints"][0] and sprint["state"] == "active"
+        assert "changelog" not in plain["issues"][0]
+        assert all("changelog" in issue for issue in expanded)
+        assert len(graph) == 2
+        assert [page["id"] for page in pages] == list(first.pages)
+        assert first.errors > 0
+    print(f"✓ Test 13: Seeded dataset ({dataset['issues']} issues, {dataset['links']} links), "
+          f"{first.errors} random 503s retried")
+
+
+if __name__ == "__main__":
+    test_methods()
+    test_pooling()
+    test_errors_and_reuse()
+    test_sync_client_keeps_alive()
+    test_parallel_search()
+    test_search_speedup()
+    test_token_search_and_early_exit()
+    test_bulk_fetch_and_coalescing()
+    test_link_walk()
+    test_sprint_data_pages()
+    test_attachment_upload()
+    test_report_attachment_tools()
+    test_generated_dataset()
+
+    print("\n" + "=" * 60)
+    print("✓ All JIRA client tests passed!")
+    print("=" * 60)
@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+"""Test the incremental local JIRA mirror."""
+
+import asyncio
+import json
+import os
+import tempfile
+from pathlib import Path
+
+os.environ.setdefault("ATLASSIAN_SITE_URL", "https://example.atlassian.net")
+
+from agent.config import reload_settings
+from agent.jira_mirror import JiraMirror, sync_mirror
+from agent.multi_board import BoardSpec, MultiBoardReporter
+from agent.results import collect_results
+from agent.scheduler import ScheduledJob
+from agent.tools.dependency import analyze_dependencies
+from fake_jira_server import FakeJiraServer
+from jira_test_helpers import make_client, run
+
+HISTORY = {
+    "histories": [
+        {
+            "id": "1",
+            "created": "2025-10-02T10:00:00.000+0000",
+            "author": {"displayName": "Ana"},
+            "items": [
+                {"field": "status", "fieldId": "status", "fromString": "To Do", "toString": "In Progress"},
+                {"field": "Story Points", "fieldId": "customfield_10016", "fromString": "3", "toString": "5"},
+            ],
+        }
+    ]
+}
+
+
+def test_round_trip():
+    """Issues, links and changelogs come back in the REST shape they were stored in."""
+    with tempfile.TemporaryDirectory() as tmp:
+        with JiraMirror(Path(tmp) / "mirror.db") as mirror:
+            issue = {
+                "key": "PROJ-2",
+                "fields": {
+                    "summary": "Refunds",
+                    "status": {"name": "In Progress"},
+                    "assignee": {"displayName": "Ana"},
+                    "customfield_10004": {"value": "Payments"},
+                    "customfield_10016": 5,
+                    "updated": "2025-10-02T10:00:00.000+0000",
+                    "project": {"key": "PROJ"},
+                    "issuelinks": [
+                        {"id": "9", "type": {"name": "Blocks"}, "outwardIssue": {"key": "PROJ-10"}},
+                    ],
+                },
+                "changelog": HISTORY,
+            }
+            assert mirror.upsert([issue]) == 1
+            assert mirror.upsert([issue]) == 0  # same "updated"
+
+            [stored] = mirror.issues(project_key="proj")
+            assert stored["fields"]["summary"] == "Refunds"
+            assert stored["fields"]["issuelinks"][0]["outwardIssue"]["key"] == "PROJ-10"
+            items = stored["changelog"]["histories"][0]["items"]
+            assert [item["toString"] for item in items] == ["In Progress", "5"]
+            row = mirror.conn.execute("SELECT team, story_points, status FROM issues").fetchone()
+            assert tuple(row) == ("Payments", 5.0, "In Progress")
+            assert mirror.links("PROJ-10") == [
+                {"direction": "inward", "other_key": "PROJ-2", "link_type": "Blocks"},
+            ]
+
+            assert mirror.remove(["PROJ-2"]) == 1
+            assert mirror.stats()["links"] == 0
+    print("✓ Test 1: Issues, links and changelogs round-trip")
+
+
+def test_project_sync_is_incremental():
+    """Later syncs fetch only recently updated issues; full syncs drop deleted ones."""
+    with FakeJiraServer() as jira, tempfile.TemporaryDirectory() as tmp:
+        for n in range(150):
+            jira.add_issue("PROJ", {"summary": f"Story {n}", "status": {"name": "To Do"}})
+        old = jira.add_issue("PROJ", {"summary": "Legacy"})
+        old["fields"]["updated"] = "2020-01-01T09:00:00.000+0000"
+        client = make_client(jira)
+
+        with JiraMirror(Path(tmp) / "mirror.db") as mirror:
+            first = run(client, mirror.sync_project(client, "PROJ"))
+            assert (first["fetched"], first["changed"], first["issues"]) == (151, 151, 151)
+
+            second = run(client, mirror.sync_project(client, "PROJ"))
+            assert (second["fetched"], second["changed"]) == (150, 0)
+
+            jira.issues["PROJ-3"]["fields"]["status"] = {"name": "Done"}
+            jira.issues["PROJ-3"]["fields"]["updated"] = "2099-01-01T00:00:00.000+0000"
+            assert run(client, mirror.sync_project(client, "PROJ"))["changed"] == 1
+            assert mirror.issues(keys=["PROJ-3"])[0]["fields"]["status"]["name"] == "Done"
+
+            del jira.issues["PROJ-4"]
+            full = run(client, mirror.sync_project(client, "PROJ", full=True))
+            assert (full["removed"], full["issues"]) == (1, 150)
+            assert mirror.is_fresh("project:PROJ", max_staleness=60)
+            assert not mirror.is_fresh("project:OTHER", max_staleness=60)
+    print("✓ Test 2: Incremental project sync")
+
+
+def test_reports_run_from_the_mirror():
+    """Within the staleness window a multi-board report makes no JIRA requests."""
+    class Agent:
+        async def text_query(self, prompt):
+            return "summary" if "Board Metrics" in prompt else "### Executive Summary\nOn track"
+
+    saved = os.environ.get("BURNDOWN_DIR")
+    try:
+        with FakeJiraServer() as jira, tempfile.TemporaryDirectory() as tmp:
+            os.environ["BURNDOWN_DIR"] = str(Path(tmp) / "burndown")
+            reload_settings()
+            sprint = jira.add_sprint(42, "Sprint 7", startDate="2025-10-01", endDate="2025-10-14")
+            for n in range(30):
+                jira.add_issue("PROJ", {
+                    "summary": f"Story {n}",
+                    "status": {"name": "Done" if n % 3 == 0 else "In Progress"},
+                    "customfield_10016": 2,
+                    "sprint": sprint["id"],
+                })
+            client = make_client(jira)
+
+            with JiraMirror(Path(tmp) / "mirror.db") as mirror:
+                def report():
+                    reporter = MultiBoardReporter(Agent(), client=client, mirror=mirror, max_staleness=300)
+                    return run(client, reporter.collect([BoardSpec(42, "Alpha")]))
+
+                [first] = report()
+                assert first.metrics["total_issues"] == 30
+                fetched = len(jira.requests)
+                assert fetched > 0
+
+                [cached] = report()
+                assert len(jira.requests) == fetched  # served from disk
+                assert cached.metrics == first.metrics
+
+                # Past the window only the membership and changed issues are refetched
+                jira.issues["PROJ-2"]["fields"]["status"] = {"name": "Done"}
+                jira.issues["PROJ-2"]["fields"]["updated"] = "2099-01-01T00:00:00.000+0000"
+                result = run(client, mirror.sync_sprint(client, sprint["id"]))
+                assert (result["fetched"], result["changed"]) == (30, 1)
+                assert len(report()[0].metrics["completed"]) == len(first.metrics["completed"]) + 1
+    finally:
+        if saved is None:
+            os.environ.pop("BURNDOWN_DIR", None)
+        else:
+            os.environ["BURNDOWN_DIR"] = saved
+        reload_settings()
+    print("✓ Test 3: Reports read the mirror within the staleness window")
+
+
+def test_dependency_tool_reads_the_mirror():
+    """analyze_dependencies accepts a project_key instead of issues_json."""
+    names = ("ATLASSIAN_SITE_URL", "ATLASSIAN_USER_EMAIL", "ATLASSIAN_API_TOKEN", "JIRA_MIRROR_DB")
+    saved = {name: os.environ.get(name) for name in names}
+    try:
+        with FakeJiraServer() as jira, tempfile.TemporaryDirectory() as tmp:
+            jira.add_issue("PROJ", {
+                "summary": "API", "status": {"name": "Blocked"}, "customfield_10004": "Core",
+            })
+            jira.add_issue("PROJ", {
+                "summary": "UI",
+                "status": {"name": "To Do"},
+                "customfield_10004": "Web",
+                "issuelinks": [{"type": {"name": "Blocks"}, "inwardIssue": {"key": "PROJ-1"}}],
+            })
+            os.environ.update({
+                "ATLASSIAN_SITE_URL": jira.url,
+                "ATLASSIAN_USER_EMAIL": "po@example.com",
+                "ATLASSIAN_API_TOKEN": "token",
+                "JIRA_MIRROR_DB": str(Path(tmp) / "mirror.db"),
+            })
+            reload_settings()
+
+            args = {"initiative_name": "Checkout", "target_date": "2099-01-01", "project_key": "PROJ"}
+            with collect_results() as results:
+                response = asyncio.run(analyze_dependencies.handler(args))
+            assert not response.get("isError"), response
+            [result] = results
+            assert (result.total_issues, result.dependency_count) == (2, 1)
+            assert sorted(result.teams) == ["Core", "Web"]
+
+            requests_before = len(jira.requests)
+            asyncio.run(analyze_dependencies.handler(args))
+            assert len(jira.requests) == requests_before  # fresh mirror, no round trips
+    finally:
+        for name, value in saved.items():
+            if value is None:
+                os.environ.pop(name, None)
+            else:
+                os.environ[name] = value
+        reload_settings()
+    print("✓ Test 4: Dependency analysis from the mirror")
+
+
+def test_background_sync_job():
+    """Scheduler sync jobs refresh mirror scopes concurrently."""
+    job = ScheduledJob.from_dict({"type": "sync", "projects": ["PROJ"], "boards": [42]}, "0 * * * *")
+    assert job.name == "sync_jira_mirror"
+    try:
+        ScheduledJob.from_dict({"type": "sync"}, "0 * * * *")
+        raise AssertionError("sync jobs need a scope")
+    except ValueError:
+        pass
+
+    with FakeJiraServer() as jira, tempfile.TemporaryDirectory() as tmp:
+        sprint = jira.add_sprint(42, "Sprint 7")
+        jira.add_issue("PROJ", {"summary": "Checkout", "sprint": sprint["id"]})
+        jira.add_issue("OPS", {"summary": "Backups"})
+        client = make_client(jira)
+        with JiraMirror(Path(tmp) / "mirror.db") as mirror:
+            results = run(client, sync_mirror(["OPS"], [42], client=client, mirror=mirror))
+            assert [result["scope"] for result in results] == ["project:OPS", "board:42"]
+            assert set(mirror.stats()["scopes"]) == {"project:OPS", "board:42", "sprint:1"}
+            assert mirror.active_sprint(42)["name"] == "Sprint 7"
+            assert json.loads(json.dumps(mirror.issues(sprint_id=sprint["id"])))[0]["key"] == "PROJ-1"
+    print("✓ Test 5: Background sync jobs")
+
+
+if __name__ == "__main__":
+    test_round_trip()
+    test_project_sync_is_incremental()
+    test_reports_run_from_the_mirror()
+    test_dependency_tool_reads_the_mirror()
+    test_background_sync_job()
+
+    print("\n" + "=" * 60)
+    print("✓ All JIRA mirror tests passed!")
+    print("=" * 60)
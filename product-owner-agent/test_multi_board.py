@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""Test multi-board report fan-out."""
+
+import asyncio
+import os
+import threading
+
+os.environ.setdefault("ATLASSIAN_SITE_URL", "https://example.atlassian.net")
+
+from agent.multi_board import BoardSpec, MultiBoardReporter
+
+
+class FakeJiraClient:
+    """Serves fixed active sprints and counts JQL searches."""
+
+    SPRINTS = {
+        1: {"id": 100, "name": "Sprint A"},
+        2: {"id": 100, "name": "Sprint A"},
+        3: {"id": 200, "name": "Sprint B"},
+    }
+
+    def __init__(self):
+        self.searches = []
+        self._lock = threading.Lock()
+
+    async def get_active_sprint(self, board_id):
+        if board_id not in self.SPRINTS:
+            raise Exception(f"No active sprint found for board {board_id}")
+        return self.SPRINTS[board_id]
+
+    async def search_issues(self, jql, fields=None, max_results=100, expand=None):
+        with self._lock:
+            self.searches.append(jql)
+        sprint_id = int(jql.split("=")[1])
+        done = {"name": "Done"}
+        doing = {"name": "In Progress"}
+        return {
+            "issues": [
+                {"key": f"S{sprint_id}-1", "fields": {"summary": "a", "status": done, "customfield_10016": 5}},
+                {"key": f"S{sprint_id}-2", "fields": {"summary": "b", "status": doing, "customfield_10016": 3}},
+            ]
+        }
+
+
+class FakeAgent:
+    """Records prompts and tracks narrative concurrency."""
+
+    def __init__(self):
+        self.prompts = []
+        self.active = 0
+        self.peak = 0
+
+    async def text_query(self, prompt):
+        self.prompts.append(prompt)
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        await asyncio.sleep(0.02)
+        self.active -= 1
+        return "summary" if "Board Metrics" in prompt else "### Executive Summary\nOn track"
+
+
+def test_board_spec_parsing():
+    """Board arguments accept an optional team name."""
+    assert BoardSpec.parse("42") == BoardSpec(42, "Board 42")
+    assert BoardSpec.parse("42:Alpha Team") == BoardSpec(42, "Alpha Team")
+    try:
+        BoardSpec.parse("abc")
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("Expected ValueError for non-numeric board")
+    print("✓ Test 1: Board spec parsing")
+
+
+def test_fan_out_shares_sprint_fetches():
+    """Boards on the same sprint share one search and one metrics computation."""
+    client = FakeJiraClient()
+    agent = FakeAgent()
+    reporter = MultiBoardReporter(agent, client=client, concurrency=2)
+    boards = [BoardSpec(1, "Alpha"), BoardSpec(2, "Beta"), BoardSpec(3, "Gamma"), BoardSpec(4, "Delta")]
+
+    result = asyncio.run(reporter.run(boards))
+
+    assert sorted(client.searches) == ["sprint = 100", "sprint = 200"]
+    assert result.stats == {"boards": 4, "distinct_sprints": 2, "issues_fetched": 4, "requests_coalesced": 0}
+
+    by_board = {r.board.board_id: r for r in result.reports}
+    assert by_board[1].metrics is by_board[2].metrics
+    assert by_board[1].metrics["completion_rate"] == 50.0
+    assert "No active sprint" in by_board[4].error
+    assert all(by_board[b].report.startswith("### Executive Summary") for b in (1, 2, 3))
+
+    # Three narratives at most two at a time, then one combined summary
+    assert len(agent.prompts) == 4
+    assert agent.peak == 2
+    assert "| 4 | Delta | - | error:" in agent.prompts[-1]
+    assert result.summary == "summary"
+    print("✓ Test 2: Fan-out shares sprint fetches and bounds concurrency")
+
+
+if __name__ == "__main__":
+    test_board_spec_parsing()
+    test_fan_out_shares_sprint_fetches()
+
+    print("\n" + "=" * 60)
+    print("✓ All multi-board report tests passed!")
+    print("=" * 60)
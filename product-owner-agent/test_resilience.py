@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+"""Test retries, client-side rate limiting and circuit breakers of the JIRA clients."""
+
+import asyncio
+import os
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from pathlib import Path
+from unittest import mock
+
+os.environ.setdefault("ATLASSIAN_SITE_URL", "https://example.atlassian.net")
+
+from agent.resilience import (
+    CircuitOpenError,
+    JiraAPIError,
+    RequestGuard,
+    endpoint_key,
+    parse_retry_after,
+)
+from agent.tools.jira_tools import AsyncJiraClient, JiraClient
+from fake_jira_server import FakeJiraServer
+from jira_test_helpers import CREDENTIALS
+
+
+def test_helpers():
+    """Retry-After parsing, endpoint names and backoff bounds."""
+    assert parse_retry_after("3") == 3.0
+    assert parse_retry_after("garbage") is None
+    future = format_datetime(datetime.now(timezone.utc) + timedelta(seconds=30), usegmt=True)
+    assert 25 < parse_retry_after(future) <= 30
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+
+    assert endpoint_key("GET", "/rest/api/2/issue/PROJ-12") == "GET /rest/api/2/issue/{id}"
+    assert endpoint_key("GET", "/rest/agile/1.0/sprint/7/issue") == "GET /rest/agile/1.0/sprint/{id}/issue"
+
+    guard = RequestGuard(max_retries=8, backoff=0.5, max_backoff=4, failure_threshold=100)
+    server_error = JiraAPIError("JIRA API error: 503", status=503)
+    delays = [guard.failed("GET", "GET /x", server_error, attempt) for attempt in range(8)]
+    assert all(0 <= delay <= min(4, 0.5 * 2 ** n) for n, delay in enumerate(delays))
+    assert guard.failed("GET", "GET /x", server_error, 8) is None
+    assert guard.failed("GET", "GET /y", JiraAPIError("404", status=404), 0) is None
+    assert guard.failed("POST", "POST /z", server_error, 0) is None
+    throttled = JiraAPIError("429", status=429, retry_after=2)
+    assert 2 <= guard.failed("POST", "POST /z", throttled, 0) <= 2.5
+    print("✓ Test 1: Retry-After, endpoint keys and jittered backoff")
+
+
+def test_throttling_is_absorbed():
+    """A rate-limited fan-out completes; the shared bucket keeps 429s rare."""
+    with FakeJiraServer() as jira:
+        for n in range(300):
+            jira.add_issue("PROJ", {"summary": f"Story {n}"})
+        jira.rate_limit = 200
+
+        def fetch_all(guard):
+            async def run():
+                client = AsyncJiraClient(base_url=jira.url, limit_per_host=20, guard=guard, **CREDENTIALS)
+                async with client:
+                    started = time.perf_counter()
+                    issues = await asyncio.gather(*(client.get_issue(f"PROJ-{n + 1}") for n in range(300)))
+                    return issues, time.perf_counter() - started
+            return asyncio.run(run())
+
+        # Without a client-side limit every excess request is answered 429 and retried
+        issues, _ = fetch_all(RequestGuard(rate=0, max_retries=10, backoff=0.05))
+        assert [issue["key"] for issue in issues] == [f"PROJ-{n + 1}" for n in range(300)]
+        unlimited_429s = jira.throttled
+        assert unlimited_429s > 0
+
+        # Pacing at the server's limit needs hardly any retries (once its allowance refilled)
+        time.sleep(1)
+        jira.throttled = 0
+        issues, elapsed = fetch_all(RequestGuard(rate=200, burst=20, max_retries=10, backoff=0.05))
+        assert len(issues) == 300
+        assert jira.throttled < unlimited_429s / 4
+        throughput = 300 / elapsed
+        assert throughput > 0.7 * 200, throughput
+    print(
+        f"✓ Test 2: Throttling absorbed ({unlimited_429s} 429s unpaced, {jira.throttled} paced, "
+        f"{throughput:.0f} req/s against a 200 req/s limit)"
+    )
+
+
+def test_server_errors():
+    """Idempotent requests are retried after 5xx; creates are not resent."""
+    with FakeJiraServer() as jira:
+        jira.add_issue("PROJ", {"summary": "Checkout"})
+        guard = RequestGuard(max_retries=3, backoff=0.01)
+
+        async def run():
+            async with AsyncJiraClient(base_url=jira.url, guard=guard, **CREDENTIALS) as client:
+                jira.fail_requests = 2
+                issue = await client.get_issue("PROJ-1")
+                jira.fail_requests = 1
+                try:
+                    await client.create_issue("PROJ", "Refunds", "Card refunds")
+                except JiraAPIError as e:
+                    return issue, e
+
+        issue, error = asyncio.run(run())
+        assert issue["key"] == "PROJ-1"
+        assert error.status == 503 and str(error).startswith("JIRA API error: 503")
+        assert len(jira.issues) == 1
+
+        jira.fail_requests = 3
+        sync_client = JiraClient(base_url=jira.url, guard=guard, **CREDENTIALS)
+        assert sync_client.get_issue("PROJ-1")["key"] == "PROJ-1"
+        assert guard.retries == 5
+
+        # Uploads reopen the file for each attempt and fail as JiraAPIError
+        with tempfile.TemporaryDirectory() as tmp:
+            chart = Path(tmp) / "chart.md"
+            chart.write_text("gantt\n")
+            jira.fail_requests = 2
+            [attachment] = sync_client.upload_attachment("PROJ-1", chart)
+            assert attachment["filename"] == "chart.md"
+            assert len(jira.attachments["PROJ-1"]) == 1
+            assert guard.retries == 7
+            try:
+                sync_client.upload_attachment("NOPE-1", chart)
+                raise AssertionError("upload to a missing issue should fail")
+            except JiraAPIError as e:
+                assert e.status == 404
+        sync_client.close()
+    print("✓ Test 3: Server errors retried for idempotent requests only")
+
+
+def test_circuit_breaker():
+    """A failing endpoint is cut off, other endpoints keep working, and it recovers."""
+    with FakeJiraServer() as jira:
+        jira.add_issue("PROJ", {"summary": "Checkout"})
+        guard = RequestGuard(max_retries=0, failure_threshold=3, reset_seconds=0.3)
+        client = JiraClient(base_url=jira.url, guard=guard, **CREDENTIALS)
+
+        jira.fail_requests = 3
+        for _ in range(3):
+            try:
+                client.get_issue("PROJ-1")
+                raise AssertionError("503 expected")
+            except JiraAPIError as e:
+                assert e.status == 503
+        sent = len(jira.requests)
+        try:
+            client.get_issue("PROJ-1")
+            raise AssertionError("circuit should be open")
+        except CircuitOpenError:
+            pass
+        assert len(jira.requests) == sent
+        assert guard.breaker("GET /rest/api/2/issue/{id}").state == "open"
+        assert client.search_issues("project = PROJ")["total"] == 1
+
+        time.sleep(0.35)
+        assert client.get_issue("PROJ-1")["key"] == "PROJ-1"
+        assert guard.breaker("GET /rest/api/2/issue/{id}").state == "closed"
+    print("✓ Test 4: Circuit breaker opens, isolates and recovers")
+
+
+def test_probe_released():
+    """A throttled, failed-to-parse or cancelled probe does not wedge the circuit half-open."""
+    route = endpoint_key("GET", "/rest/api/2/issue/PROJ-1")
+    comment_route = endpoint_key("POST", "/rest/api/2/issue/PROJ-1/comment")
+
+    def trip(guard, key):
+        guard.breaker(key).record_failure()
+        time.sleep(0.06)
+
+    guard = RequestGuard(rate=0, max_retries=0, failure_threshold=1, reset_seconds=0.05)
+    trip(guard, route)
+    guard.before(route)
+    assert guard.failed("GET", route, JiraAPIError("429", status=429), 0) is None
+    guard.before(route)  # the next request may probe
+
+    with FakeJiraServer(latency=0.2) as jira:
+        jira.add_issue("PROJ", {"summary": "Checkout"})
+        client = JiraClient(base_url=jira.url, guard=guard, **CREDENTIALS)
+        with mock.patch.object(client.session, "request", side_effect=ValueError("bad body")):
+            try:
+                client.get_issue("PROJ-1")
+                raise AssertionError("unexpected errors are raised")
+            except ValueError:
+                pass
+        assert guard.breaker(route).state == "half-open"
+        assert client.get_issue("PROJ-1")["key"] == "PROJ-1"
+        assert guard.breaker(route).state == "closed"
+        client.close()
+
+        trip(guard, comment_route)
+
+        async def run():
+            async with AsyncJiraClient(base_url=jira.url, guard=guard, **CREDENTIALS) as client:
+                try:
+                    await asyncio.wait_for(client.add_comment("PROJ-1", "Estimated"), timeout=0.05)
+                    raise AssertionError("the probe should time out")
+                except asyncio.TimeoutError:
+                    pass
+                return await client.add_comment("PROJ-1", "Estimated")
+
+        assert asyncio.run(run())["body"] == "Estimated"
+        assert guard.breaker(comment_route).state == "closed"
+    print("✓ Test 5: Abandoned probes free the half-open circuit")
+
+
+if __name__ == "__main__":
+    test_helpers()
+    test_throttling_is_absorbed()
+    test_server_errors()
+    test_circuit_breaker()
+    test_probe_released()
+
+    print("\n" + "=" * 60)
+    print("✓ All resilience tests passed!")
+    print("=" * 60)
@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""Test structured results returned alongside tool text."""
+
+import asyncio
+import json
+import os
+import tempfile
+from datetime import datetime
+from pathlib import Path
+
+os.environ.setdefault("ATLASSIAN_SITE_URL", "https://example.atlassian.net")
+
+from agent.archive import ReportArchive
+from agent.results import (
+    DependencyAnalysisResult,
+    SprintReportResult,
+    collect_results,
+    publish_result,
+)
+from agent.tools.dependency import analyze_dependencies
+from agent.tools.reporting import generate_report_summary, generate_sprint_report
+
+
+SPRINT_ISSUES = [
+    {"key": "P-1", "fields": {"summary": "Login", "status": {"name": "Done"}, "customfield_10016": 5}},
+    {"key": "P-2", "fields": {"summary": "Cart", "status": {"name": "In Progress"}, "customfield_10016": 3}},
+    {"key": "P-3", "fields": {
+        "summary": "Payments", "status": {"name": "Blocked"}, "customfield_10016": 2,
+        "assignee": {"displayName": "Ana"},
+    }},
+]
+
+
+def test_sprint_report_structured():
+    """The sprint report tool returns typed metrics and publishes them."""
+    args = {
+        "sprint_name": "Sprint 7",
+        "sprint_start": "2025-10-01",
+        "sprint_end": "2025-10-14",
+        "team_name": "Alpha",
+        "issues_json": json.dumps(SPRINT_ISSUES),
+    }
+
+    async def run():
+        with collect_results() as results:
+            response = await generate_sprint_report.handler(args)
+        return response, results
+
+    response, results = asyncio.run(run())
+
+    assert "isError" not in response
+    assert len(results) == 1 and isinstance(results[0], SprintReportResult)
+    structured = results[0].model_dump(mode="json")
+    assert structured["kind"] == "sprint_report"
+    assert structured["metrics"]["completed"] == 1
+    assert structured["metrics"]["completion_rate"] == 33.3
+    assert structured["metrics"]["blocked_keys"] == ["P-3"]
+    assert structured["blockers"][0]["assignee"] == "Ana"
+    assert structured["burndown"] is None  # fetched without changelog
+
+    assert SprintReportResult.model_validate(structured) == results[0]
+    print("✓ Test 1: Sprint report returns structured metrics")
+
+
+def test_dependency_analysis_structured():
+    """Dependency analysis returns the critical path, blockers and forecast."""
+    issues = [
+        {"key": "A-1", "fields": {
+            "summary": "API", "status": {"name": "In Progress"}, "customfield_10016": 5,
+            "issuelinks": [{"type": {"name": "Blocks"}, "outwardIssue": {"key": "A-2"}}],
+        }},
+        {"key": "A-2", "fields": {"summary": "UI", "status": {"name": "To Do"}, "customfield_10016": 3}},
+    ]
+
+    async def run():
+        with collect_results() as results:
+            response = await analyze_dependencies.handler({
+                "initiative_name": "Version 2.0",
+                "target_date": "2099-12-31",
+                "issues_json": json.dumps(issues),
+            })
+        return response, results
+
+    response, results = asyncio.run(run())
+
+    assert "isError" not in response
+    [result] = results
+    assert isinstance(result, DependencyAnalysisResult)
+    assert result.critical_path == ["A-1", "A-2"]
+    assert [blocker.key for blocker in result.blockers] == ["A-1"]
+    assert result.blockers[0].blocked_issues == ["A-2"]
+    assert result.forecast.risk_level == "LOW"
+    assert result.forecast.remaining_points == 8
+    print("✓ Test 2: Dependency analysis returns structured forecast")
+
+
+def test_publish_without_collector():
+    """Publishing outside collect_results() is a no-op, and blocks do not leak."""
+    result = SprintReportResult.model_validate({
+        "sprint_name": "S", "team_name": "T",
+        "metrics": {
+            "total_issues": 0, "completed": 0, "in_progress": 0, "blocked": 0,
+            "not_started": 0, "completion_rate": 0, "total_story_points": 0,
+            "completed_story_points": 0, "velocity": 0,
+        },
+    })
+    publish_result(result)
+    with collect_results() as outer:
+        with collect_results() as inner:
+            publish_result(result)
+        publish_result(result)
+    assert len(inner) == 1 and len(outer) == 1
+    print("✓ Test 3: Collectors are scoped")
+
+
+def test_summary_from_result():
+    """Notification summaries are built from the result, not the report text."""
+    async def run():
+        with collect_results() as results:
+            await generate_sprint_report.handler({
+                "sprint_name": "Sprint 7",
+                "sprint_start": "2025-10-01",
+                "sprint_end": "2025-10-14",
+                "team_name": "Alpha",
+                "issues_json": json.dumps(SPRINT_ISSUES),
+            })
+        return results[0]
+
+    result = asyncio.run(run())
+    summary = generate_report_summary("No keywords here", result)
+    assert "Completion: 33.3% (1/3 issues)" in summary
+    assert "Velocity: 5 of 10 points" in summary
+    assert "Blocked: P-3" in summary
+    # Without a result the text fallback still applies
+    assert generate_report_summary("No keywords here") == "Report generated successfully"
+    print("✓ Test 4: Summary built from structured result")
+
+
+def test_archive_payload():
+    """The archive stores payloads and returns them decoded."""
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp_path = Path(tmp)
+        report = tmp_path / "alpha_20251001_090000.md"
+        report.write_text("Sprint report")
+        with ReportArchive(tmp_path / "archive.db") as archive:
+            archive.add(
+                report,
+                kind="report",
+                title="alpha",
+                content="Sprint report",
+                created_at=datetime(2025, 10, 1, 9, 0, 0),
+                payload={"results": [{"kind": "sprint_report", "metrics": {"velocity": 5}}]},
+            )
+            match = archive.search("sprint")[0]
+        assert match["payload"]["results"][0]["metrics"]["velocity"] == 5
+    print("✓ Test 5: Archive stores structured payloads")
+
+
+if __name__ == "__main__":
+    test_sprint_report_structured()
+    test_dependency_analysis_structured()
+    test_publish_without_collector()
+    test_summary_from_result()
+    test_archive_payload()
+
+    print("\n" + "=" * 60)
+    print("✓ All structured result tests passed!")
+    print("=" * 60)
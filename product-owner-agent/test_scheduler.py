@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""Test the cron parser and scheduler daemon."""
+
+import asyncio
+import os
+import tempfile
+from datetime import datetime
+from pathlib import Path
+
+os.environ.setdefault("ATLASSIAN_SITE_URL", "https://example.atlassian.net")
+
+from agent.scheduler import CronSchedule, ScheduledJob, Scheduler, SchedulerState
+
+
+def test_cron_parsing():
+    """Cron fields expand ranges, steps, lists and names."""
+    schedule = CronSchedule("0 9 * * 1-5")
+    assert schedule.minutes == {0}
+    assert schedule.hours == {9}
+    assert schedule.weekdays == {1, 2, 3, 4, 5}
+
+    assert CronSchedule("*/15 * * * *").minutes == {0, 15, 30, 45}
+    assert CronSchedule("0 8 * * mon,fri").weekdays == {1, 5}
+    assert CronSchedule("0 0 * * 7").weekdays == {0}
+    assert CronSchedule("0 0 1 jan-mar *").months == {1, 2, 3}
+
+    for bad in ["0 9 * *", "60 * * * *", "* * * * 8", "*/0 * * * *"]:
+        try:
+            CronSchedule(bad)
+        except ValueError:
+            continue
+        raise AssertionError(f"Expected ValueError for '{bad}'")
+    print("✓ Test 1: Cron parsing")
+
+
+def test_cron_next_and_previous():
+    """Fire times skip weekends and honour day-of-month/day-of-week OR semantics."""
+    weekdays = CronSchedule("0 9 * * 1-5")
+    friday_evening = datetime(2025, 10, 3, 18, 0)
+    assert weekdays.next_after(friday_evening) == datetime(2025, 10, 6, 9, 0)
+    assert weekdays.previous_before(datetime(2025, 10, 5, 12, 0)) == datetime(2025, 10, 3, 9, 0)
+    assert weekdays.next_after(datetime(2025, 10, 6, 9, 0)) == datetime(2025, 10, 7, 9, 0)
+    assert weekdays.matches(datetime(2025, 10, 6, 9, 0))
+
+    # 1st of the month OR any Sunday
+    either = CronSchedule("0 0 1 * 0")
+    assert either.next_after(datetime(2025, 10, 2)) == datetime(2025, 10, 5)
+    assert either.next_after(datetime(2025, 10, 27)) == datetime(2025, 11, 1)
+
+    # A field starting with "*" is unrestricted even with a step: odd days that are Mondays
+    stepped = CronSchedule("0 9 */2 * 1")
+    assert stepped.next_after(datetime(2025, 10, 2)) == datetime(2025, 10, 13, 9, 0)
+    print("✓ Test 2: Next and previous fire times")
+
+
+def test_job_definitions():
+    """Job entries are validated and get stable default names."""
+    job = ScheduledJob.from_dict({"board_id": 42, "team": "Alpha"}, "0 9 * * 1-5")
+    assert job.name == "report_board_42"
+    assert job.kind == "report"
+
+    job = ScheduledJob.from_dict(
+        {"type": "analyze", "jql": "project=P", "initiative": "Version 2", "target_date": "2025-12-31",
+         "schedule": "0 8 * * 1"},
+        "0 9 * * 1-5",
+    )
+    assert job.name == "risk_Version_2"
+    assert job.schedule.expression == "0 8 * * 1"
+
+    try:
+        ScheduledJob.from_dict({"type": "analyze", "jql": "project=P"}, "0 9 * * 1-5")
+    except ValueError as e:
+        assert "initiative" in str(e)
+    else:
+        raise AssertionError("Expected ValueError for incomplete job")
+    print("✓ Test 3: Job definitions")
+
+
+class FakeAgent:
+    """Stands in for ProductOwnerAgent and tracks concurrency."""
+
+    def __init__(self, delay: float = 0.05):
+        self.delay = delay
+        self.calls = []
+        self.active = 0
+        self.peak = 0
+
+    async def generate_report(self, board_id, sprint_id, team):
+        self.calls.append(board_id)
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        await asyncio.sleep(self.delay)
+        self.active -= 1
+        return f"# Report for board {board_id}"
+
+
+def test_missed_runs_overlap_and_concurrency():
+    """Missed runs are detected from state, overlaps skipped, concurrency bounded."""
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp_path = Path(tmp)
+        os.environ["REPORT_OUTPUT_DIR"] = str(tmp_path / "reports")
+        os.environ["REPORT_ARCHIVE_DB"] = str(tmp_path / "reports" / "archive.db")
+        from agent.config import reload_settings
+
+        reload_settings()
+        try:
+            jobs = [
+                ScheduledJob.from_dict({"board_id": board, "team": f"T{board}"}, "0 9 * * 1-5")
+                for board in range(1, 6)
+            ]
+            state_path = tmp_path / "state.json"
+            state = SchedulerState(state_path)
+            state.record("report_board_1", datetime(2025, 10, 2, 9, 0), "ok", 1.0)
+            state.record("report_board_2", datetime(2025, 10, 3, 9, 0), "ok", 1.0)
+
+            agent = FakeAgent()
+            finished = []
+            daemon = Scheduler(
+                jobs, agent=agent, state_path=state_path, max_concurrency=2, jitter_seconds=0,
+                on_run=lambda name, run: finished.append((name, run["status"])),
+            )
+            missed = daemon.missed_jobs(datetime(2025, 10, 4, 12, 0))
+            assert [(job.name, when) for job, when in missed] == [
+                ("report_board_1", datetime(2025, 10, 3, 9, 0))
+            ]
+
+            async def run():
+                fire = datetime(2025, 10, 6, 9, 0)
+                tasks = [daemon.trigger(job, fire) for job in jobs]
+                # Second trigger while the first run is in flight is skipped
+                assert daemon.trigger(jobs[0], fire) is None
+                await asyncio.gather(*tasks)
+
+            asyncio.run(run())
+
+            assert sorted(agent.calls) == [1, 2, 3, 4, 5]
+            assert agent.peak == 2
+            assert sorted(finished) == [(f"report_board_{board}", "ok") for board in range(1, 6)]
+            reloaded = SchedulerState(state_path)
+            assert reloaded.last_run("report_board_5") == datetime(2025, 10, 6, 9, 0)
+            assert reloaded.jobs["report_board_5"]["status"] == "ok"
+            assert len(list((tmp_path / "reports").glob("report_board_*.md"))) == 5
+        finally:
+            del os.environ["REPORT_OUTPUT_DIR"]
+            del os.environ["REPORT_ARCHIVE_DB"]
+            reload_settings()
+    print("✓ Test 4: Missed runs, overlap skipping and bounded concurrency")
+
+
+if __name__ == "__main__":
+    test_cron_parsing()
+    test_cron_next_and_previous()
+    test_job_definitions()
+    test_missed_runs_overlap_and_concurrency()
+
+    print("\n" + "=" * 60)
+    print("✓ All scheduler tests passed!")
+    print("=" * 60)
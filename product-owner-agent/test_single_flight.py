@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""Test single-flight coalescing of identical concurrent JIRA reads."""
+
+import asyncio
+import os
+
+os.environ.setdefault("ATLASSIAN_SITE_URL", "https://example.atlassian.net")
+
+from agent.config import reload_settings
+from agent.resilience import JiraAPIError
+from agent.single_flight import SingleFlight, request_key
+from agent.tools.jira_tools import AsyncJiraClient
+from fake_jira_server import FakeJiraServer
+
+CREDENTIALS = {"user_email": "po@example.com", "api_token": "token"}
+
+
+def test_single_flight():
+    """Concurrent calls share one fetch, its result and its error; later calls fetch again."""
+    flights = SingleFlight()
+    fetches = []
+
+    async def fetch(value):
+        fetches.append(value)
+        await asyncio.sleep(0.02)
+        if value == "boom":
+            raise JiraAPIError("JIRA API error: 503", status=503)
+        return {"value": value}
+
+    async def run():
+        shared = await asyncio.gather(*(flights.do("a", lambda: fetch("a")) for _ in range(5)))
+        other = await flights.do("b", lambda: fetch("b"))
+        again = await flights.do("a", lambda: fetch("a"))
+        errors = await asyncio.gather(
+            *(flights.do("c", lambda: fetch("boom")) for _ in range(3)), return_exceptions=True
+        )
+
+        # A cancelled caller leaves the fetch running for the others
+        first = asyncio.ensure_future(flights.do("d", lambda: fetch("d")))
+        second = asyncio.ensure_future(flights.do("d", lambda: fetch("d")))
+        await asyncio.sleep(0)
+        first.cancel()
+        return shared, other, again, errors, await second
+
+    shared, other, again, errors, survivor = asyncio.run(run())
+    assert all(result is shared[0] for result in shared)
+    assert other == {"value": "b"} and again == {"value": "a"} and again is not shared[0]
+    assert all(isinstance(error, JiraAPIError) for error in errors) and errors[0] is errors[2]
+    assert survivor == {"value": "d"}
+    assert fetches == ["a", "b", "a", "boom", "d"]
+    assert flights.stats() == {
+        "calls": 12, "deduplicated": 7, "requests": 5, "in_flight": 0, "dedup_rate": 58.3,
+    }
+
+    assert request_key("ana", "u", {"b": 1, "a": "x"}) == request_key("ana", "u", {"a": "x", "b": "1"})
+    assert request_key("ana", "u") != request_key("bo", "u")
+    print("✓ Test 1: Shared results, shared errors and cancellation")
+
+
+def test_clients_share_requests():
+    """Overlapping reads of several clients reach the server once."""
+    with FakeJiraServer(latency=0.05) as jira:
+        sprint = jira.add_sprint(42, "Sprint 7")
+        for n in range(30):
+            jira.add_issue("PROJ", {"summary": f"Story {n}", "sprint": sprint["id"]})
+        flights = SingleFlight()
+        clients = [AsyncJiraClient(base_url=jira.url, flights=flights, **CREDENTIALS) for _ in range(3)]
+
+        async def report(client):
+            return await asyncio.gather(
+                client.get_sprint_data(42),
+                client.search_issues("project = PROJ", fields=["summary"]),
+                client.get_issue("PROJ-1"),
+            )
+
+        async def run():
+            results = await asyncio.gather(*(report(client) for client in clients * 2))
+            for client in clients:
+                await client.close()
+            return results
+
+        results = asyncio.run(run())
+        assert all(result == results[0] for result in results)
+        assert len(results[0][0]["issues"]["issues"]) == 30
+        # Board lookup, sprint, sprint issues, search and issue: once each
+        assert len(jira.requests) == 5, jira.requests
+        stats = flights.stats()
+        assert stats["requests"] == 5 and stats["deduplicated"] == 25
+    print(f"✓ Test 2: 6 overlapping reports, {len(jira.requests)} requests ({stats['dedup_rate']}% coalesced)")
+
+
+def test_writes_and_opt_out():
+    """Writes are never coalesced, and JIRA_COALESCE_REQUESTS=false turns it off."""
+    with FakeJiraServer(latency=0.02) as jira:
+        jira.add_issue("PROJ", {"summary": "Checkout"})
+        client = AsyncJiraClient(base_url=jira.url, flights=SingleFlight(), **CREDENTIALS)
+
+        async def run():
+            async with client:
+                await asyncio.gather(*(client.add_comment("PROJ-1", "Same text") for _ in range(3)))
+
+        asyncio.run(run())
+        assert len(jira.issues["PROJ-1"]["fields"]["comment"]["comments"]) == 3
+        assert client.flights.calls == 0
+
+    saved = os.environ.get("JIRA_COALESCE_REQUESTS")
+    os.environ["JIRA_COALESCE_REQUESTS"] = "false"
+    reload_settings()
+    try:
+        assert AsyncJiraClient(**CREDENTIALS).flights is None
+    finally:
+        if saved is None:
+            del os.environ["JIRA_COALESCE_REQUESTS"]
+        else:
+            os.environ["JIRA_COALESCE_REQUESTS"] = saved
+        reload_settings()
+    assert AsyncJiraClient(**CREDENTIALS).flights is AsyncJiraClient(**CREDENTIALS).flights
+    print("✓ Test 3: Writes bypass coalescing; opt-out setting")
+
+
+if __name__ == "__main__":
+    test_single_flight()
+    test_clients_share_requests()
+    test_writes_and_opt_out()
+
+    print("\n" + "=" * 60)
+    print("✓ All single-flight tests passed!")
+    print("=" * 60)
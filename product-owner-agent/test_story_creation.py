@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+"""Test bulk story creation against a local fake JIRA server."""
+
+import asyncio
+import json
+import os
+import tempfile
+from pathlib import Path
+
+os.environ.setdefault("ATLASSIAN_SITE_URL", "https://example.atlassian.net")
+
+from agent.config import reload_settings
+from agent.results import StoryCreationResult, collect_results
+from agent.story_creation import StoryCreator, idempotency_label, story_fields
+from agent.tools.jira_tools import AsyncJiraClient
+from agent.tools.translation import create_stories_from_spec
+from fake_jira_server import FakeJiraServer
+from jira_test_helpers import CREDENTIALS, make_client, run
+
+
+class CountingClient(AsyncJiraClient):
+    """AsyncJiraClient that tracks how many bulk requests are in flight."""
+
+    def __init__(self, url):
+        super().__init__(base_url=url, **CREDENTIALS)
+        self.active = 0
+        self.peak = 0
+
+    async def create_issues_bulk(self, issue_updates):
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            return await super().create_issues_bulk(issue_updates)
+        finally:
+            self.active -= 1
+
+
+def bulk_requests(jira):
+    return sum(1 for request in jira.requests if request == ("POST", "/rest/api/2/issue/bulk"))
+
+
+def test_story_fields():
+    """Labels ignore case and spacing; fields link the epic and carry criteria."""
+    label = idempotency_label("PROJ", "EPIC-1", "  Guest  Checkout ")
+    assert label == idempotency_label("proj", "epic-1", "guest checkout")
+    assert label != idempotency_label("PROJ", "EPIC-2", "Guest checkout")
+    assert label.startswith("po-agent-")
+
+    fields = story_fields(
+        {
+            "title": "Guest checkout",
+            "description": "Pay without an account",
+            "acceptance_criteria": ["Card payments work", "Receipt is emailed"],
+            "story_points": 5,
+            "labels": ["checkout"],
+        },
+        "PROJ", "EPIC-1", label,
+    )
+    assert fields["parent"] == {"key": "EPIC-1"}
+    assert fields["issuetype"] == {"name": "Story"}
+    assert fields["labels"] == [label, "checkout"]
+    assert fields["customfield_10016"] == 5
+    assert fields["description"].endswith("* Card payments work\n* Receipt is emailed")
+    print("✓ Test 1: Story fields and idempotency labels")
+
+
+def test_bulk_creation():
+    """Stories are created 50 per request, concurrently, and never twice."""
+    with FakeJiraServer() as jira:
+        epic = jira.add_issue("PROJ", {"summary": "Checkout", "issuetype": {"name": "Epic"}})
+        client = CountingClient(jira.url)
+        creator = StoryCreator(client=client, concurrency=2)
+        stories = [{"title": f"Story {n}", "description": f"Do {n}"} for n in range(120)]
+
+        result = run(client, creator.create("PROJ", epic["key"], stories + stories[:3]))
+
+        assert bulk_requests(jira) == 3 and result.requests == 3
+        assert client.peak == 2
+        assert len(result.created) == 120 and not result.existing and not result.failed
+        assert [story.title for story in result.created] == [s["title"] for s in stories]
+        for story in result.created:
+            fields = jira.issues[story.key]["fields"]
+            assert fields["parent"] == {"key": epic["key"]}
+            assert fields["summary"] == story.title
+
+        # A rerun finds every story by its label and sends no bulk requests,
+        # even when JIRA returns fewer issues per page than asked
+        jira.max_page_size = 20
+        rerun = run(client, creator.create("PROJ", epic["key"], stories))
+        assert bulk_requests(jira) == 3
+        assert not rerun.created and len(rerun.existing) == 120
+        assert rerun.keys == result.keys
+        assert len(jira.issues) == 121
+    print("✓ Test 2: Bulk creation in batches of 50")
+
+
+def test_lost_response_and_rejections():
+    """Stories created before a lost response are not resent; rejections are reported."""
+    with FakeJiraServer() as jira:
+        epic = jira.add_issue("PROJ", {"summary": "Checkout"})
+        client = make_client(jira)
+        creator = StoryCreator(client=client, retry_delay=0)
+        jira.fail_bulk = 1
+
+        result = run(client, creator.create("PROJ", epic["key"], [
+            {"title": "Cart"},
+            {"title": "x" * 300},
+            {"title": "   "},
+            {"title": "Payments"},
+        ]))
+
+        # Cart and Payments were created before the 500 and found by the retry
+        # check, so only the rejected story is resent
+        assert bulk_requests(jira) == 2
+        assert [story.title for story in result.created] == ["Cart", "Payments"]
+        assert len(jira.issues) == 3
+        errors = sorted(story.error for story in result.failed)
+        assert errors == ["Story has no title", "summary: Summary must be less than 255 characters."]
+
+        # Later attempts only resend what is still missing
+        jira.fail_bulk = 1
+        retried = run(client, creator.create("PROJ", epic["key"], [{"title": "Refunds"}]))
+        assert [story.title for story in retried.created] == ["Refunds"]
+        assert len(jira.issues) == 4
+
+        # A response listing fewer issues than were accepted fails only the unlisted ones
+        class ShortResponseClient(AsyncJiraClient):
+            async def create_issues_bulk(self, issue_updates):
+                response = await super().create_issues_bulk(issue_updates)
+                return {**response, "issues": response["issues"][:1]}
+
+        short_client = ShortResponseClient(base_url=jira.url, **CREDENTIALS)
+        short = run(short_client, StoryCreator(client=short_client).create(
+            "PROJ", epic["key"], [{"title": "Invoices"}, {"title": "Receipts"}]
+        ))
+        assert [story.title for story in short.created] == ["Invoices"]
+        assert [story.title for story in short.failed] == ["Receipts"]
+    print("✓ Test 3: Lost responses and rejected stories")
+
+
+def test_tool_returns_created_keys():
+    """The tool creates the stories itself and returns their keys in one result."""
+    saved = {name: os.environ.get(name) for name in (
+        "ATLASSIAN_SITE_URL", "ATLASSIAN_USER_EMAIL", "ATLASSIAN_API_TOKEN", "DUPLICATE_INDEX_DB"
+    )}
+    args = {
+        "epic_key": "PROJ-1",
+        "project_key": "PROJ",
+        "stories_json": json.dumps([{"title": "Cart"}, {"title": "Payments"}]),
+    }
+    try:
+        with FakeJiraServer() as jira, tempfile.TemporaryDirectory() as tmp:
+            jira.add_issue("PROJ", {"summary": "Checkout"})
+            os.environ.update({
+                "ATLASSIAN_SITE_URL": jira.url,
+                "ATLASSIAN_USER_EMAIL": "po@example.com",
+                "ATLASSIAN_API_TOKEN": "token",
+                "DUPLICATE_INDEX_DB": str(Path(tmp) / "duplicates.db"),
+            })
+            reload_settings()
+
+            async def run():
+                with collect_results() as results:
+                    response = await create_stories_from_spec.handler(args)
+                return response, results
+
+            response, results = asyncio.run(run())
+            assert "isError" not in response
+            assert "Created 2: PROJ-2, PROJ-3" in response["content"][0]["text"]
+            [result] = results
+            assert isinstance(result, StoryCreationResult)
+            assert result.keys == ["PROJ-2", "PROJ-3"]
+
+        # Without direct credentials the tool falls back to MCP instructions
+        os.environ["ATLASSIAN_API_TOKEN"] = ""
+        reload_settings()
+        with collect_results() as results:
+            response = asyncio.run(create_stories_from_spec.handler(args))
+        assert "jira_create_issue" in response["content"][0]["text"]
+        assert results == []
+    finally:
+        for name, value in saved.items():
+            if value is None:
+                os.environ.pop(name, None)
+            else:
+                os.environ[name] = value
+        reload_settings()
+    print("✓ Test 4: Tool returns created story keys")
+
+
+if __name__ == "__main__":
+    test_story_fields()
+    test_bulk_creation()
+    test_lost_response_and_rejections()
+    test_tool_returns_created_keys()
+
+    print("\n" + "=" * 60)
+    print("✓ All story creation tests passed!")
+    print("=" * 60)
@@ -0,0 +1,277 @@
+#!/usr/bin/env python3
+"""Test the translation result cache."""
+
+import asyncio
+import os
+import sqlite3
+import tempfile
+from pathlib import Path
+from unittest import mock
+
+os.environ.setdefault("ATLASSIAN_SITE_URL", "https://example.atlassian.net")
+
+from agent import product_owner
+from agent.batch_translation import BatchTranslator
+from agent.config import reload_settings
+from agent.results import TranslationResult, collect_results, publish_result
+from agent.tools.translation import translate_epic_to_stories
+from agent.translation_cache import TranslationCache, store_translation, translation_cache_key
+
+
+def key(summary="Checkout", description="Guests can pay", **context):
+    args = {
+        "architecture_type": "microservices",
+        "component_list": "Cart",
+        "team_skills": "Outsystems",
+        "version": "11",
+        "template": "abc",
+    }
+    args.update(context)
+    return translation_cache_key(summary, description, **args)
+
+
+def test_cache_key_inputs():
+    """Any input a translation depends on changes the key."""
+    base = key()
+    assert key() == base
+    assert key(description="Guests can pay  \n") == base  # trailing whitespace only
+    for changed in (
+        key(summary="Checkout v2"),
+        key(description="Guests and members can pay"),
+        key(architecture_type="monolithic"),
+        key(component_list="Cart, Payments"),
+        key(team_skills="React"),
+        key(version="10"),
+        key(template="def"),
+    ):
+        assert changed != base
+    # Blank context means the defaults the prompt shows, whichever path built the key
+    assert key(component_list="", team_skills=" ") == key(
+        component_list="None specified", team_skills="General development"
+    )
+    print("✓ Test 1: Cache key covers every input")
+
+
+def test_hits_misses_and_invalidation():
+    """Lookups are counted; new content replaces the epic's old entry."""
+    with tempfile.TemporaryDirectory() as tmp:
+        with TranslationCache(Path(tmp) / "cache.db") as cache:
+            assert cache.get(key()) is None
+            cache.put(key(), "EPIC-1", "## Stories")
+            assert cache.get(key())["output"] == "## Stories"
+
+            # Changed epic content: old translation is dropped on store
+            cache.put(key(description="Members too"), "EPIC-1", "## Stories v2")
+            assert cache.get(key()) is None
+            cache.put(key(summary="Search"), "EPIC-2", "## Search stories")
+
+            stats = cache.stats()
+            assert (stats["entries"], stats["hits"], stats["misses"]) == (2, 1, 2)
+            assert stats["hit_rate"] == 33.3
+
+            assert cache.invalidate(["epic-2"]) == 1
+            assert cache.invalidate() == 1
+            assert cache.stats()["entries"] == 0
+            cache.reset_stats()
+            assert cache.stats()["hits"] == 0
+    print("✓ Test 2: Hits, misses and invalidation")
+
+
+def test_eviction():
+    """Least recently used entries beyond the limit and expired entries are evicted."""
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = Path(tmp) / "cache.db"
+        with TranslationCache(db_path, max_entries=3, ttl_days=30) as cache:
+            for n in range(3):
+                cache.put(key(summary=f"Epic {n}"), f"EPIC-{n}", "out")
+                # Spread usage times so LRU order is deterministic
+                cache.conn.execute(
+                    "UPDATE translations SET last_used_at = ? WHERE epic_key = ?",
+                    (f"2099-01-0{n + 1}T00:00:00", f"EPIC-{n}"),
+                )
+                cache.conn.commit()
+            cache.max_entries = 2
+            assert cache.evict() == 1
+            assert cache.get(key(summary="Epic 0")) is None
+            assert cache.get(key(summary="Epic 2")) is not None
+
+            with sqlite3.connect(str(db_path)) as conn:
+                conn.execute("UPDATE translations SET created_at = '2000-01-01T00:00:00'")
+            assert cache.get(key(summary="Epic 2")) is None  # expired entries never hit
+            assert cache.evict() == 2
+
+        # Explicit zeros are limits, not "use the default"
+        with TranslationCache(db_path, max_entries=0, ttl_days=0) as cache:
+            assert (cache.max_entries, cache.ttl_days) == (0, 0)
+    print("✓ Test 3: LRU and TTL eviction")
+
+
+class FakeJiraClient:
+    def __init__(self, description):
+        self.description = description
+
+    async def get_issues_bulk(self, issue_keys, fields=None, expand=None):
+        return {"EPIC-1": {"key": "EPIC-1", "fields": {"summary": "Checkout", "description": self.description}}}
+
+
+class FakeAgent:
+    def __init__(self):
+        self.calls = 0
+
+    async def text_query(self, prompt):
+        self.calls += 1
+        return f"translation {self.calls}"
+
+
+def test_batch_serves_unchanged_epics():
+    """Unchanged epics are served from the cache; edited epics are retranslated."""
+    with tempfile.TemporaryDirectory() as tmp:
+        client = FakeJiraClient("Guests can pay")
+        agent = FakeAgent()
+        with TranslationCache(Path(tmp) / "cache.db") as cache:
+            translator = BatchTranslator(agent, client=client, cache=cache)
+
+            def run(**kwargs):
+                return asyncio.run(translator.run(["EPIC-1"], output_dir=Path(tmp), **kwargs))
+
+            first = run()
+            assert agent.calls == 1 and not first.translations[0].cached
+
+            second = run()
+            assert agent.calls == 1
+            assert second.translations[0].cached
+            assert second.translations[0].output == "translation 1"
+            assert (second.stats["cache_hits"], second.stats["cache_misses"]) == (1, 0)
+            assert "latency_p50" not in second.stats  # cache hits are not model latency
+
+            assert run(use_cache=False).translations[0].output == "translation 2"
+
+            client.description = "Guests and members can pay"
+            edited = run()
+            assert agent.calls == 3 and not edited.translations[0].cached
+            assert cache.stats()["entries"] == 1
+    print("✓ Test 4: Batch translation reuses unchanged epics")
+
+
+def test_batch_closes_its_own_cache():
+    """A translator without a cache opens the default one per run and closes it."""
+    names = ("TRANSLATION_CACHE_ENABLED", "TRANSLATION_CACHE_DB")
+    saved = {name: os.environ.get(name) for name in names}
+    closed = []
+    close = TranslationCache.close
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            os.environ.update({
+                "TRANSLATION_CACHE_ENABLED": "true",
+                "TRANSLATION_CACHE_DB": str(Path(tmp) / "cache.db"),
+            })
+            reload_settings()
+            agent = FakeAgent()
+            translator = BatchTranslator(agent, client=FakeJiraClient("Guests can pay"))
+            with mock.patch.object(TranslationCache, "close", lambda cache: (closed.append(cache), close(cache))):
+                first = asyncio.run(translator.run(["EPIC-1"], output_dir=Path(tmp)))
+                second = asyncio.run(translator.run(["EPIC-1"], output_dir=Path(tmp)))
+            assert not first.translations[0].cached and second.translations[0].cached
+            assert agent.calls == 1
+            assert len(closed) == 2 and translator.cache is None
+    finally:
+        for name, value in saved.items():
+            if value is None:
+                os.environ.pop(name, None)
+            else:
+                os.environ[name] = value
+        reload_settings()
+    print("✓ Test 5: Batch translation closes the cache it opens")
+
+
+def test_translate_hit_serves_batch():
+    """A translation stored by "translate" is a hit for "translate-batch"."""
+    names = ("TRANSLATION_CACHE_ENABLED", "TRANSLATION_CACHE_DB")
+    saved = {name: os.environ.get(name) for name in names}
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            os.environ.update({
+                "TRANSLATION_CACHE_ENABLED": "true",
+                "TRANSLATION_CACHE_DB": str(Path(tmp) / "cache.db"),
+            })
+            reload_settings()
+            with collect_results() as results:
+                asyncio.run(translate_epic_to_stories.handler({
+                    "epic_key": "EPIC-1",
+                    "epic_summary": "Checkout",
+                    "epic_description": "Guests can pay",
+                    "architecture_type": "microservices",
+                    "component_list": "",
+                    "team_skills": "",
+                }))
+            store_translation(results[0].cache_key, "EPIC-1", "translation from translate")
+
+            agent = FakeAgent()
+            translator = BatchTranslator(agent, client=FakeJiraClient("Guests can pay"))
+            result = asyncio.run(translator.run(["EPIC-1"], output_dir=Path(tmp)))
+            assert agent.calls == 0
+            assert result.translations[0].cached
+            assert result.translations[0].output == "translation from translate"
+    finally:
+        for name, value in saved.items():
+            if value is None:
+                os.environ.pop(name, None)
+            else:
+                os.environ[name] = value
+        reload_settings()
+    print("✓ Test 6: translate and translate-batch share cache entries")
+
+
+class FakeSDKClient:
+    """Replays a session: narration and a tool call, then the final answer."""
+
+    def __init__(self, options=None):
+        pass
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        pass
+
+    async def query(self, prompt):
+        publish_result(TranslationResult(epic_key="EPIC-1", cache_key="abc"))
+
+    async def receive_response(self):
+        from claude_agent_sdk import AssistantMessage, ResultMessage, TextBlock, ToolUseBlock
+
+        yield AssistantMessage(
+            content=[TextBlock("I'll fetch the epic first."),
+                     ToolUseBlock("1", "translate_epic_to_stories", {})],
+            model="model",
+        )
+        yield AssistantMessage(content=[TextBlock("## Stories\n1. Pay as guest")], model="model")
+        yield ResultMessage(
+            subtype="success", duration_ms=1, duration_api_ms=1, is_error=False,
+            num_turns=2, session_id="session", result="## Stories\n1. Pay as guest",
+        )
+
+
+def test_translate_epic_caches_final_answer():
+    """Only the final answer is cached, not the narration around tool calls."""
+    agent = product_owner.ProductOwnerAgent()
+    with mock.patch.object(product_owner, "ClaudeSDKClient", FakeSDKClient), \
+            mock.patch.object(product_owner, "store_translation") as store:
+        output = asyncio.run(agent.translate_epic("EPIC-1"))
+    assert output.startswith("I'll fetch the epic first.")
+    store.assert_called_once_with("abc", "EPIC-1", "## Stories\n1. Pay as guest")
+    print("✓ Test 7: translate_epic caches only the final answer")
+
+
+if __name__ == "__main__":
+    test_cache_key_inputs()
+    test_hits_misses_and_invalidation()
+    test_eviction()
+    test_batch_serves_unchanged_epics()
+    test_batch_closes_its_own_cache()
+    test_translate_hit_serves_batch()
+    test_translate_epic_caches_final_answer()
+
+    print("\n" + "=" * 60)
+    print("✓ All translation cache tests passed!")
+    print("=" * 60)
@@ -0,0 +1,289 @@
+#!/usr/bin/env python3
+"""Test the embedded vector index and retrieval context."""
+
+import asyncio
+import json
+import os
+import random
+import shutil
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from unittest import mock
+
+os.environ.setdefault("ATLASSIAN_SITE_URL", "https://example.atlassian.net")
+
+import numpy as np
+
+from agent.archive import ReportArchive, archive_file
+from agent.config import reload_settings
+from agent.tools.dependency import analyze_dependencies
+from agent.tools.translation import translate_epic_to_stories
+from agent.vector_index import (
+    HashingEmbedder,
+    VectorIndex,
+    chunk_text,
+    html_to_text,
+    index_documents,
+    index_path,
+    ingest_sources,
+)
+
+TOPICS = {
+    "payments": "payment card refund gateway capture invoice billing checkout wallet",
+    "identity": "login password oauth token session identity signup account mfa",
+    "search": "search index query ranking filter facet autocomplete catalog results",
+    "shipping": "shipping carrier parcel tracking delivery warehouse label dispatch",
+}
+
+
+def test_embeddings_and_chunking():
+    """Embeddings are deterministic unit vectors; related texts score higher."""
+    embedder = HashingEmbedder(256)
+    vectors = embedder.embed([
+        "Refund a card payment through the gateway",
+        "Card payment refunds via the payment gateway",
+        "Reset the login password with MFA",
+        "",
+    ])
+    assert vectors.shape == (4, 256) and vectors.dtype == np.float32
+    assert np.allclose(np.linalg.norm(vectors[:3], axis=1), 1.0)
+    assert not vectors[3].any()
+    assert vectors[0] @ vectors[1] > vectors[0] @ vectors[2]
+    assert np.array_equal(vectors, embedder.embed([
+        "Refund a card payment through the gateway",
+        "Card payment refunds via the payment gateway",
+        "Reset the login password with MFA",
+        "",
+    ]))
+
+    text = "\n\n".join(f"Paragraph {n}. " + "word " * 60 for n in range(10))
+    chunks = chunk_text(text, max_chars=700)
+    assert all(len(chunk) <= 700 for chunk in chunks)
+    assert "Paragraph 0." in chunks[0] and "Paragraph 9." in chunks[-1]
+    assert chunk_text("x" * 2500, max_chars=1000) == ["x" * 1000, "x" * 1000, "x" * 500]
+
+    title, body = html_to_text(
+        "<html><head><title>Payments &amp; Refunds</title><style>p{}</style></head>"
+        "<body><h1>Refunds</h1><p>Refunds go back to the card.</p></body></html>"
+    )
+    assert title == "Payments & Refunds"
+    assert "Refunds go back to the card." in body and "p{}" not in body
+
+    assert index_path("file:///tmp/vectors") == Path("/tmp/vectors")
+    try:
+        index_path("postgresql://user@localhost/vectors")
+        raise AssertionError("server connections are rejected")
+    except ValueError:
+        pass
+    print("✓ Test 1: Embeddings, chunking and HTML export parsing")
+
+
+def test_add_replace_and_persist():
+    """Sources are replaced on re-add, removable, filterable and persisted."""
+    with tempfile.TemporaryDirectory() as tmp:
+        index = VectorIndex(Path(tmp) / "index")
+        index.add("spec-1", "Card refunds are issued through the payment gateway.", "spec", "EPIC-1")
+        index.add("page-1", "Login requires MFA for administrators.", "confluence", "Security")
+        index.add("spec-1", "Refunds are issued as store credit.", "spec", "EPIC-1", signature="v2")
+
+        assert len(index) == 2
+        assert index.search("refund", k=1)[0]["text"] == "Refunds are issued as store credit."
+        assert index.search("refund", kinds=["confluence"])[0]["source"] == "page-1"
+        assert index.is_current("spec-1", "v2") and not index.is_current("spec-1", "v1")
+        index.save()
+
+        reopened = VectorIndex(Path(tmp) / "index")
+        assert len(reopened) == 2 and reopened.sources == index.sources
+        assert reopened.remove("page-1") == 1
+        assert reopened.search("MFA login")[0]["source"] == "spec-1"
+        assert reopened.stats()["by_kind"] == {"spec": 1}
+    print("✓ Test 2: Add, replace, remove and persist")
+
+
+def test_approximate_search():
+    """Past the threshold an IVF index is trained and matches exact search closely."""
+    rng = random.Random(7)
+    words = {topic: vocabulary.split() for topic, vocabulary in TOPICS.items()}
+    with tempfile.TemporaryDirectory() as tmp:
+        index = VectorIndex(Path(tmp) / "index", embedder=HashingEmbedder(128), ann_threshold=1000)
+        for n in range(1600):
+            topic = rng.choice(list(TOPICS))
+            text = " ".join(rng.choice(words[topic]) for _ in range(12)) + f" ticket{n}"
+            index.add(f"doc-{n}", text, "report", f"{topic} {n}")
+        index.save()
+
+        stats = index.stats()
+        assert stats["approximate"] and stats["clusters"] == 40
+
+        reopened = VectorIndex(Path(tmp) / "index", embedder=HashingEmbedder(128), ann_threshold=1000)
+        recall = []
+        for topic in TOPICS:
+            query = " ".join(words[topic][:4])
+            exact = {m["source"] for m in reopened.search(query, k=10, exact=True)}
+            approximate = reopened.search(query, k=10)
+            assert all(m["title"].startswith(topic) for m in approximate)
+            recall.append(len(exact & {m["source"] for m in approximate}) / 10)
+        assert sum(recall) / len(recall) >= 0.8
+
+        # Chunks added after training are assigned to clusters immediately
+        reopened.add("late", "parcel carrier tracking delivery label", "report", "shipping late")
+        assert len(reopened.assignments) == len(reopened)
+    print("✓ Test 3: Approximate nearest-neighbour search")
+
+
+def test_dimension_change():
+    """Changing VECTOR_DB_DIMENSIONS starts a fresh index without the old ANN file."""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "index"
+        index = VectorIndex(path, embedder=HashingEmbedder(64), ann_threshold=20)
+        for n in range(30):
+            index.add(f"doc-{n}", f"payment card refund ticket{n}", "report", f"doc {n}")
+        index.save()
+        stale_ann = Path(tmp) / "stale.npz"
+        shutil.copy(path / "ann.npz", stale_ann)
+
+        resized = VectorIndex(path, embedder=HashingEmbedder(32), ann_threshold=20)
+        assert len(resized) == 0 and resized.centroids is None
+        resized.add("doc-new", "login password reset", "report", "new")
+        resized.save()
+        assert not (path / "ann.npz").exists()
+
+        reopened = VectorIndex(path, embedder=HashingEmbedder(32), ann_threshold=20)
+        reopened.add("doc-late", "parcel carrier tracking", "report", "late")
+        assert reopened.search("parcel tracking")[0]["source"] == "doc-late"
+
+        # An ANN file that does not fit the vectors is ignored, not used
+        shutil.copy(stale_ann, path / "ann.npz")
+        again = VectorIndex(path, embedder=HashingEmbedder(32), ann_threshold=20)
+        assert again.centroids is None and again.assignments is None
+        again.add("doc-again", "warehouse dispatch label", "report", "again")
+        assert len(again) == 2
+    print("✓ Test 4: Dimension change drops the stale ANN index")
+
+
+def test_ingest_sources():
+    """Reports, specs and Confluence exports are ingested incrementally."""
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp_path = Path(tmp)
+        report = tmp_path / "reports" / "alpha_20251001_090000.md"
+        report.parent.mkdir()
+        report.write_text("Sprint risk: the payment gateway migration is blocked.")
+        with ReportArchive(tmp_path / "archive.db") as archive:
+            archive.add(report, kind="report", title="alpha", content=report.read_text())
+
+        specs = tmp_path / "specs"
+        specs.mkdir()
+        (specs / "EPIC-1.md").write_text("# EPIC-1: Refunds\n\nRefund server action.")
+        pages = tmp_path / "confluence" / "ENG"
+        pages.mkdir(parents=True)
+        (pages / "gateway.html").write_text(
+            "<html><title>Gateway runbook</title><body><p>Gateway timeouts: retry.</p></body></html>"
+        )
+        (pages / "logo.png").write_bytes(b"\x89PNG")
+
+        index = VectorIndex(tmp_path / "index")
+        sources = {"archive_db": tmp_path / "archive.db", "spec_dir": specs,
+                   "confluence_dir": tmp_path / "confluence"}
+        counts = ingest_sources(index, **sources)
+        assert (counts["report"], counts["spec"], counts["confluence"]) == (1, 1, 1)
+        assert index.search("gateway timeouts", k=1)[0]["title"] == "Gateway runbook"
+
+        assert ingest_sources(index, **sources)["unchanged"] == 3
+        (specs / "EPIC-1.md").unlink()
+        assert ingest_sources(index, **sources)["removed"] == 1
+        assert index.stats()["by_kind"] == {"confluence": 1, "report": 1}
+    print("✓ Test 5: Ingestion from archive, specs and Confluence exports")
+
+
+def test_tools_retrieve_context():
+    """Translation and risk tools append retrieved snippets when enabled."""
+    names = ("VECTOR_DB_ENABLED", "VECTOR_DB_CONNECTION", "TRANSLATION_CACHE_ENABLED", "REPORT_ARCHIVE_DB")
+    saved = {name: os.environ.get(name) for name in names}
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp_path = Path(tmp)
+        try:
+            os.environ.update({
+                "VECTOR_DB_ENABLED": "true",
+                "VECTOR_DB_CONNECTION": str(tmp_path / "index"),
+                "TRANSLATION_CACHE_ENABLED": "false",
+                "REPORT_ARCHIVE_DB": str(tmp_path / "archive.db"),
+            })
+            reload_settings()
+
+            # Archived documents are indexed as they are saved
+            report = tmp_path / "risk_20251001_090000.md"
+            report.write_text("Checkout Revamp risk: the payment gateway vendor delays card refunds.")
+            archive_file(report, kind="report", title="Checkout Revamp risk", content=report.read_text())
+
+            response = asyncio.run(translate_epic_to_stories.handler({
+                "epic_key": "EPIC-1",
+                "epic_summary": "Card refunds",
+                "epic_description": "Customers get card refunds through the payment gateway.",
+                "architecture_type": "microservices",
+                "component_list": "",
+                "team_skills": "",
+            }))
+            text = response["content"][0]["text"]
+            assert "Related context from past specifications" in text
+            assert "[report] Checkout Revamp risk" in text
+
+            response = asyncio.run(analyze_dependencies.handler({
+                "initiative_name": "Checkout Revamp",
+                "target_date": "2099-12-31",
+                "issues_json": json.dumps([
+                    {"key": "A-1", "fields": {"summary": "Payment gateway refunds", "status": {"name": "To Do"}}},
+                ]),
+            }))
+            assert "payment gateway vendor delays" in response["content"][0]["text"]
+        finally:
+            for name, value in saved.items():
+                if value is None:
+                    os.environ.pop(name, None)
+                else:
+                    os.environ[name] = value
+            reload_settings()
+    print("✓ Test 6: Tools retrieve context from the index")
+
+
+def test_concurrent_appends():
+    """Concurrent writers keep each other's documents; saves reuse the loaded index."""
+    names = ("VECTOR_DB_ENABLED", "VECTOR_DB_CONNECTION")
+    saved = {name: os.environ.get(name) for name in names}
+    with tempfile.TemporaryDirectory() as tmp:
+        try:
+            os.environ.update({"VECTOR_DB_ENABLED": "true", "VECTOR_DB_CONNECTION": str(Path(tmp) / "index")})
+            reload_settings()
+            documents = [
+                {"source": f"doc-{n}", "text": f"{TOPICS['payments']} note {n}", "kind": "spec", "title": f"Doc {n}"}
+                for n in range(16)
+            ]
+            with mock.patch.object(VectorIndex, "_load", autospec=True, side_effect=VectorIndex._load) as load:
+                with ThreadPoolExecutor(max_workers=8) as pool:
+                    list(pool.map(lambda document: index_documents([document]), documents))
+            assert load.call_count == 1
+
+            index = VectorIndex(Path(tmp) / "index")
+            assert sorted(index.sources) == sorted(document["source"] for document in documents)
+        finally:
+            for name, value in saved.items():
+                if value is None:
+                    os.environ.pop(name, None)
+                else:
+                    os.environ[name] = value
+            reload_settings()
+    print("✓ Test 7: Concurrent appends are kept and reuse the loaded index")
+
+
+if __name__ == "__main__":
+    test_embeddings_and_chunking()
+    test_add_replace_and_persist()
+    test_approximate_search()
+    test_dimension_change()
+    test_ingest_sources()
+    test_tools_retrieve_context()
+    test_concurrent_appends()
+
+    print("\n" + "=" * 60)
+    print("✓ All vector index tests passed!")
+    print("=" * 60)